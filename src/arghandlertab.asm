@@ -1,13 +1,18 @@
 ;-----------------------------------------------------------------------------
-; MIT License
-; Copyright (c) 2023 Brian T. Park
+; Key code dispatch table 'argKeyCodeHandlerTable', generated from arghandlertab.txt
+; using the 'linear' layout.
 ;
-; List of keyCodes from GetKey() and their handlers within the context of the
-; argument dialog box (e.g. "FIX _ _").
-;------------------------------------------------------------------------------
+; DO NOT EDIT: This file was autogenerated.
+;-----------------------------------------------------------------------------
+
+; Description: Dispatch the keyCode in A to its handler using a linear scan.
+; Destroys: A, B, DE, HL (and any other registers destroyed by the handler)
+argKeyCodeHandlerTableDispatch:
+    ld hl, argKeyCodeHandlerTable
+    ld b, argKeyCodeTableSize
+    jp dispatchHandler
 
 argKeyCodeHandlerTable:
-    ; number entry
     .db k0
     .dw handleArgKey0
     .db k1
@@ -28,8 +33,6 @@ argKeyCodeHandlerTable:
     .dw handleArgKey8
     .db k9
     .dw handleArgKey9
-
-    ; letter entry (A-Z, Theta)
     .db kCapA
     .dw handleArgKeyA
     .db kCapB
@@ -84,22 +87,16 @@ argKeyCodeHandlerTable:
     .dw handleArgKeyZ
     .db kTheta
     .dw handleArgKeyTheta
-
-    ; editing
     .db kDel
     .dw handleArgKeyDel
     .db kClear
     .dw handleArgKeyClear
     .db kEnter
     .dw handleArgKeyEnter
-
-    ; on/exit
-    .db kOnExit ; ON button on real calculator, F12 on Tilem USB keyboard
+    .db kOnExit
     .dw handleArgKeyExit
-    .db kQuit ; 2ND QUIT
+    .db kQuit
     .dw handleArgKeyQuit
-
-    ; arithmetic
     .db kAdd
     .dw handleArgKeyAdd
     .db kSub
@@ -109,9 +106,6 @@ argKeyCodeHandlerTable:
     .db kDiv
     .dw handleArgKeyDiv
 
-;-----------------------------------------------------------------------------
-
 ; Auto-calculate the number of entries in the table.
 argKeyCodeHandlerTableEnd:
 argKeyCodeTableSize equ (argKeyCodeHandlerTableEnd-argKeyCodeHandlerTable)/3
-
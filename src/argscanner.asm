@@ -103,9 +103,7 @@ processArgCommands:
     bcall(_GetRpnKeyCode) ; A=keyCode
 
     ; Handle the button press.
-    ld hl, argKeyCodeHandlerTable
-    ld b, argKeyCodeTableSize
-    call dispatchHandler
+    call argKeyCodeHandlerTableDispatch
 
     ; Check for terminate flag.
     bit inputBufFlagsArgExit, (iy + inputBufFlags)
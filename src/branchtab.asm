@@ -1,26 +1,20 @@
 ;-----------------------------------------------------------------------------
-; MIT License
-; Copyright (c) 2025 Brian T. Park
-;
 ; Branch table entries are placed on Flash Page 0. They can be called from any
-; other flash page using the bcall() macro. It is possible to put routines on
-; Flash Page 0 in the branch table as well, and make them available to other
-; flash pages. However, we don't do that in this project. The dependencies are
-; maintained so that Flash Page 0 contains the main event handler loop and the
-; various handlers. Those handlers depend on other flash pages, but code on
-; other flash pages does not depend on code on Flash Page 0.
+; other flash page using the bcall() macro. The dependencies are maintained so
+; that Flash Page 0 contains the main event handler loop and the various
+; handlers. Those handlers depend on other flash pages, but code on other flash
+; pages does not depend on code on Flash Page 0.
+;
+; The bcall() labels are defined as offsets from start of flash page, $4000,
+; instead of the `(44+n)*3` expression recommended by the spasm-ng
+; documentation, so that the labels are automatically updated when entries are
+; added or removed. Warning: spasm-ng cannot handle forward references in `equ`
+; statements, so the bcall() label is defined *after* the XxxLabel label.
 ;
-; The spasm-ng documentation in Appendix A mentioned above recommends that each
-; bcall() entry is defined by the expression `(44+n)*3` where `n` starts at 0
-; and increments by one for each entry. The problem with that method is that it
-; becomes a chore to maintain the correct `n` index when entries are added or
-; removed.
+; Generated by genbranchtab.py from the files included by rpn83p.asm.
+; Only the routines which are called by a bcall() are included.
 ;
-; Instead, let's define the bcall() labels as offsets from start of flash page,
-; $4000. When entries are added or removed, all the labels are automatically
-; updated. Warning: spasm-ng cannot handle forward references in `equ`
-; statements, so we have to define the bcall() label *after* the XxxLabel
-; label.
+; DO NOT EDIT: This file was autogenerated.
 ;-----------------------------------------------------------------------------
 
 branchTableBase equ $4000
@@ -34,6 +28,8 @@ _printOP1Label:
 _printOP1 equ _printOP1Label-branchTableBase
     .dw printOP1
     .db 0
+
+; print.asm
 _vEraseEOLLabel:
 _vEraseEOL equ _vEraseEOLLabel-branchTableBase
     .dw vEraseEOL
@@ -57,6 +53,40 @@ _ClearRpnKeyCode equ _ClearRpnKeyCodeLabel-branchTableBase
     .dw ClearRpnKeyCode
     .db 1
 
+; varsreg1.asm
+_InitRegsLabel:
+_InitRegs equ _InitRegsLabel-branchTableBase
+    .dw InitRegs
+    .db 1
+_ClearRegsLabel:
+_ClearRegs equ _ClearRegsLabel-branchTableBase
+    .dw ClearRegs
+    .db 1
+_CloseRegsLabel:
+_CloseRegs equ _CloseRegsLabel-branchTableBase
+    .dw CloseRegs
+    .db 1
+_LenRegsLabel:
+_LenRegs equ _LenRegsLabel-branchTableBase
+    .dw LenRegs
+    .db 1
+_ResizeRegsLabel:
+_ResizeRegs equ _ResizeRegsLabel-branchTableBase
+    .dw ResizeRegs
+    .db 1
+_RclGenericLabel:
+_RclGeneric equ _RclGenericLabel-branchTableBase
+    .dw RclGeneric
+    .db 1
+_StoOpGenericLabel:
+_StoOpGeneric equ _StoOpGenericLabel-branchTableBase
+    .dw StoOpGeneric
+    .db 1
+_RclOpGenericLabel:
+_RclOpGeneric equ _RclOpGenericLabel-branchTableBase
+    .dw RclOpGeneric
+    .db 1
+
 ; varsstack1.asm
 _InitStackLabel:
 _InitStack equ _InitStackLabel-branchTableBase
@@ -82,7 +112,6 @@ _ResizeStackLabel:
 _ResizeStack equ _ResizeStackLabel-branchTableBase
     .dw ResizeStack
     .db 1
-;
 _StoStackXLabel:
 _StoStackX equ _StoStackXLabel-branchTableBase
     .dw StoStackX
@@ -91,44 +120,26 @@ _RclStackXLabel:
 _RclStackX equ _RclStackXLabel-branchTableBase
     .dw RclStackX
     .db 1
-_StoStackYLabel:
-_StoStackY equ _StoStackYLabel-branchTableBase
-    .dw StoStackY
-    .db 1
 _RclStackYLabel:
 _RclStackY equ _RclStackYLabel-branchTableBase
     .dw RclStackY
     .db 1
-_StoStackZLabel:
-_StoStackZ equ _StoStackZLabel-branchTableBase
-    .dw StoStackZ
-    .db 1
 _RclStackZLabel:
 _RclStackZ equ _RclStackZLabel-branchTableBase
     .dw RclStackZ
     .db 1
-_StoStackTLabel:
-_StoStackT equ _StoStackTLabel-branchTableBase
-    .dw StoStackT
-    .db 1
 _RclStackTLabel:
 _RclStackT equ _RclStackTLabel-branchTableBase
     .dw RclStackT
     .db 1
-_StoStackLLabel:
-_StoStackL equ _StoStackLLabel-branchTableBase
-    .dw StoStackL
-    .db 1
 _RclStackLLabel:
 _RclStackL equ _RclStackLLabel-branchTableBase
     .dw RclStackL
     .db 1
-;
 _RclStackXYLabel:
 _RclStackXY equ _RclStackXYLabel-branchTableBase
     .dw RclStackXY
     .db 1
-;
 _ReplaceStackXLabel:
 _ReplaceStackX equ _ReplaceStackXLabel-branchTableBase
     .dw ReplaceStackX
@@ -149,7 +160,6 @@ _ReplaceStackXWithCP1CP3Label:
 _ReplaceStackXWithCP1CP3 equ _ReplaceStackXWithCP1CP3Label-branchTableBase
     .dw ReplaceStackXWithCP1CP3
     .db 1
-;
 _PushToStackXLabel:
 _PushToStackX equ _PushToStackXLabel-branchTableBase
     .dw PushToStackX
@@ -158,7 +168,6 @@ _PushOp1Op2ToStackXYLabel:
 _PushOp1Op2ToStackXY equ _PushOp1Op2ToStackXYLabel-branchTableBase
     .dw PushOp1Op2ToStackXY
     .db 1
-;
 _LiftStackIfEnabledLabel:
 _LiftStackIfEnabled equ _LiftStackIfEnabledLabel-branchTableBase
     .dw LiftStackIfEnabled
@@ -184,40 +193,6 @@ _ExchangeStackXY equ _ExchangeStackXYLabel-branchTableBase
     .dw ExchangeStackXY
     .db 1
 
-; varsregs1.asm
-_InitRegsLabel:
-_InitRegs equ _InitRegsLabel-branchTableBase
-    .dw InitRegs
-    .db 1
-_ClearRegsLabel:
-_ClearRegs equ _ClearRegsLabel-branchTableBase
-    .dw ClearRegs
-    .db 1
-_CloseRegsLabel:
-_CloseRegs equ _CloseRegsLabel-branchTableBase
-    .dw CloseRegs
-    .db 1
-_LenRegsLabel:
-_LenRegs equ _LenRegsLabel-branchTableBase
-    .dw LenRegs
-    .db 1
-_ResizeRegsLabel:
-_ResizeRegs equ _ResizeRegsLabel-branchTableBase
-    .dw ResizeRegs
-    .db 1
-_RclGenericLabel:
-_RclGeneric equ _RclGenericLabel-branchTableBase
-    .dw RclGeneric
-    .db 1
-_StoOpGenericLabel:
-_StoOpGeneric equ _StoOpGenericLabel-branchTableBase
-    .dw StoOpGeneric
-    .db 1
-_RclOpGenericLabel:
-_RclOpGeneric equ _RclOpGenericLabel-branchTableBase
-    .dw RclOpGeneric
-    .db 1
-
 ; varsstat1.asm
 _InitStatRegsLabel:
 _InitStatRegs equ _InitStatRegsLabel-branchTableBase
@@ -272,7 +247,7 @@ _RestoreOSState equ _RestoreOSStateLabel-branchTableBase
     .dw RestoreOSState
     .db 1
 
-; modes2.asm
+; modes1.asm
 _ColdInitModesLabel:
 _ColdInitModes equ _ColdInitModesLabel-branchTableBase
     .dw ColdInitModes
@@ -295,17 +270,17 @@ _ColdInitErrorCodeLabel:
 _ColdInitErrorCode equ _ColdInitErrorCodeLabel-branchTableBase
     .dw ColdInitErrorCode
     .db 1
-_PrintErrorStringLabel:
-_PrintErrorString equ _PrintErrorStringLabel-branchTableBase
-    .dw PrintErrorString
+_SetHandlerCodeFromSystemCodeLabel:
+_SetHandlerCodeFromSystemCode equ _SetHandlerCodeFromSystemCodeLabel-branchTableBase
+    .dw SetHandlerCodeFromSystemCode
     .db 1
 _SetErrorCodeLabel:
 _SetErrorCode equ _SetErrorCodeLabel-branchTableBase
     .dw SetErrorCode
     .db 1
-_SetHandlerCodeFromSystemCodeLabel:
-_SetHandlerCodeFromSystemCode equ _SetHandlerCodeFromSystemCodeLabel-branchTableBase
-    .dw SetHandlerCodeFromSystemCode
+_PrintErrorStringLabel:
+_PrintErrorString equ _PrintErrorStringLabel-branchTableBase
+    .dw PrintErrorString
     .db 1
 
 ; input1.asm
@@ -325,10 +300,6 @@ _DeleteCharInputBufLabel:
 _DeleteCharInputBuf equ _DeleteCharInputBufLabel-branchTableBase
     .dw DeleteCharInputBuf
     .db 1
-_DeleteCharAtInputBufLabel:
-_DeleteCharAtInputBuf equ _DeleteCharAtInputBufLabel-branchTableBase
-    .dw DeleteCharAtInputBuf
-    .db 1
 _ChangeSignInputBufLabel:
 _ChangeSignInputBuf equ _ChangeSignInputBufLabel-branchTableBase
     .dw ChangeSignInputBuf
@@ -354,12 +325,6 @@ _SetComplexDelimiter equ _SetComplexDelimiterLabel-branchTableBase
     .dw SetComplexDelimiter
     .db 1
 
-; parse1.asm
-_ParseAndClearInputBufLabel:
-_ParseAndClearInputBuf equ _ParseAndClearInputBufLabel-branchTableBase
-    .dw ParseAndClearInputBuf
-    .db 1
-
 ; arg1.asm
 _ClearArgBufLabel:
 _ClearArgBuf equ _ClearArgBufLabel-branchTableBase
@@ -378,20 +343,11 @@ _ParseArgBuf equ _ParseArgBufLabel-branchTableBase
     .dw ParseArgBuf
     .db 1
 
-; pstring1.asm. Commented out because they are currently always called from
-; Flash Page 1, never from another Flash Page.
-; _AppendStringLabel:
-; _AppendString equ _AppendStringLabel-branchTableBase
-;     .dw AppendString
-;     .db 1
-; _InsertAtPosLabel:
-; _InsertAtPos equ _InsertAtPosLabel-branchTableBase
-;     .dw InsertAtPos
-;     .db 1
-; _DeleteAtPosLabel:
-; _DeleteAtPos equ _DeleteAtPosLabel-branchTableBase
-;     .dw DeleteAtPos
-;     .db 1
+; parse1.asm
+_ParseAndClearInputBufLabel:
+_ParseAndClearInputBuf equ _ParseAndClearInputBufLabel-branchTableBase
+    .dw ParseAndClearInputBuf
+    .db 1
 
 ; integerconv1.asm
 _ConvertAToOP1Label:
@@ -403,62 +359,82 @@ _AddAToOP1 equ _AddAToOP1Label-branchTableBase
     .dw AddAToOP1
     .db 1
 
-; num1.asm
-_SignFunctionLabel:
-_SignFunction equ _SignFunctionLabel-branchTableBase
-    .dw SignFunction
+; universal1.asm
+_UniversalAddLabel:
+_UniversalAdd equ _UniversalAddLabel-branchTableBase
+    .dw UniversalAdd
     .db 1
-_ModFunctionLabel:
-_ModFunction equ _ModFunctionLabel-branchTableBase
-    .dw ModFunction
+_UniversalSubLabel:
+_UniversalSub equ _UniversalSubLabel-branchTableBase
+    .dw UniversalSub
     .db 1
-_GcdFunctionLabel:
-_GcdFunction equ _GcdFunctionLabel-branchTableBase
-    .dw GcdFunction
+_UniversalMultLabel:
+_UniversalMult equ _UniversalMultLabel-branchTableBase
+    .dw UniversalMult
     .db 1
-_LcdFunctionLabel:
-_LcdFunction equ _LcdFunctionLabel-branchTableBase
-    .dw LcdFunction
+_UniversalDivLabel:
+_UniversalDiv equ _UniversalDivLabel-branchTableBase
+    .dw UniversalDiv
     .db 1
-_PercentFunctionLabel:
-_PercentFunction equ _PercentFunctionLabel-branchTableBase
-    .dw PercentFunction
+_UniversalChsLabel:
+_UniversalChs equ _UniversalChsLabel-branchTableBase
+    .dw UniversalChs
     .db 1
-_PercentChangeFunctionLabel:
-_PercentChangeFunction equ _PercentChangeFunctionLabel-branchTableBase
-    .dw PercentChangeFunction
+_UniversalRecipLabel:
+_UniversalRecip equ _UniversalRecipLabel-branchTableBase
+    .dw UniversalRecip
     .db 1
-_CeilFunctionLabel:
-_CeilFunction equ _CeilFunctionLabel-branchTableBase
-    .dw CeilFunction
+_UniversalSquareLabel:
+_UniversalSquare equ _UniversalSquareLabel-branchTableBase
+    .dw UniversalSquare
     .db 1
-
-; hms1.asm
-_HmsToHrLabel:
-_HmsToHr equ _HmsToHrLabel-branchTableBase
-    .dw HmsToHr
+_UniversalSqRootLabel:
+_UniversalSqRoot equ _UniversalSqRootLabel-branchTableBase
+    .dw UniversalSqRoot
     .db 1
-_HmsFromHrLabel:
-_HmsFromHr equ _HmsFromHrLabel-branchTableBase
-    .dw HmsFromHr
+_UniversalCubeLabel:
+_UniversalCube equ _UniversalCubeLabel-branchTableBase
+    .dw UniversalCube
     .db 1
-_HmsPlusLabel:
-_HmsPlus equ _HmsPlusLabel-branchTableBase
-    .dw HmsPlus
+_UniversalCubeRootLabel:
+_UniversalCubeRoot equ _UniversalCubeRootLabel-branchTableBase
+    .dw UniversalCubeRoot
     .db 1
-_HmsMinusLabel:
-_HmsMinus equ _HmsMinusLabel-branchTableBase
-    .dw HmsMinus
+_UniversalPowLabel:
+_UniversalPow equ _UniversalPowLabel-branchTableBase
+    .dw UniversalPow
     .db 1
-
-; prob1.asm
-_ProbPermLabel:
-_ProbPerm equ _ProbPermLabel-branchTableBase
-    .dw ProbPerm
+_UniversalXRootYLabel:
+_UniversalXRootY equ _UniversalXRootYLabel-branchTableBase
+    .dw UniversalXRootY
     .db 1
-_ProbCombLabel:
-_ProbComb equ _ProbCombLabel-branchTableBase
-    .dw ProbComb
+_UniversalLogLabel:
+_UniversalLog equ _UniversalLogLabel-branchTableBase
+    .dw UniversalLog
+    .db 1
+_UniversalTenPowLabel:
+_UniversalTenPow equ _UniversalTenPowLabel-branchTableBase
+    .dw UniversalTenPow
+    .db 1
+_UniversalLnLabel:
+_UniversalLn equ _UniversalLnLabel-branchTableBase
+    .dw UniversalLn
+    .db 1
+_UniversalExpLabel:
+_UniversalExp equ _UniversalExpLabel-branchTableBase
+    .dw UniversalExp
+    .db 1
+_UniversalTwoPowLabel:
+_UniversalTwoPow equ _UniversalTwoPowLabel-branchTableBase
+    .dw UniversalTwoPow
+    .db 1
+_UniversalLog2Label:
+_UniversalLog2 equ _UniversalLog2Label-branchTableBase
+    .dw UniversalLog2
+    .db 1
+_UniversalLogBaseLabel:
+_UniversalLogBase equ _UniversalLogBaseLabel-branchTableBase
+    .dw UniversalLogBase
     .db 1
 
 ; complex1.asm
@@ -482,22 +458,10 @@ _Rect3ToComplex3Label:
 _Rect3ToComplex3 equ _Rect3ToComplex3Label-branchTableBase
     .dw Rect3ToComplex3
     .db 1
-_PolarRadToComplexLabel:
-_PolarRadToComplex equ _PolarRadToComplexLabel-branchTableBase
-    .dw PolarRadToComplex
-    .db 1
-_PolarDegToComplexLabel:
-_PolarDegToComplex equ _PolarDegToComplexLabel-branchTableBase
-    .dw PolarDegToComplex
-    .db 1
 _ComplexToRectLabel:
 _ComplexToRect equ _ComplexToRectLabel-branchTableBase
     .dw ComplexToRect
     .db 1
-_Complex3ToRect3Label:
-_Complex3ToRect3 equ _Complex3ToRect3Label-branchTableBase
-    .dw Complex3ToRect3
-    .db 1
 _ComplexToPolarRadLabel:
 _ComplexToPolarRad equ _ComplexToPolarRadLabel-branchTableBase
     .dw ComplexToPolarRad
@@ -506,7 +470,6 @@ _ComplexToPolarDegLabel:
 _ComplexToPolarDeg equ _ComplexToPolarDegLabel-branchTableBase
     .dw ComplexToPolarDeg
     .db 1
-;
 _ComplexToRealsLabel:
 _ComplexToReals equ _ComplexToRealsLabel-branchTableBase
     .dw ComplexToReals
@@ -550,88 +513,66 @@ _FormatComplexPolarDeg equ _FormatComplexPolarDegLabel-branchTableBase
     .dw FormatComplexPolarDeg
     .db 1
 
-; universal.asm
-_UniversalAddLabel:
-_UniversalAdd equ _UniversalAddLabel-branchTableBase
-    .dw UniversalAdd
-    .db 1
-_UniversalSubLabel:
-_UniversalSub equ _UniversalSubLabel-branchTableBase
-    .dw UniversalSub
-    .db 1
-_UniversalMultLabel:
-_UniversalMult equ _UniversalMultLabel-branchTableBase
-    .dw UniversalMult
-    .db 1
-_UniversalDivLabel:
-_UniversalDiv equ _UniversalDivLabel-branchTableBase
-    .dw UniversalDiv
-    .db 1
-_UniversalChsLabel:
-_UniversalChs equ _UniversalChsLabel-branchTableBase
-    .dw UniversalChs
-    .db 1
-_UniversalRecipLabel:
-_UniversalRecip equ _UniversalRecipLabel-branchTableBase
-    .dw UniversalRecip
-    .db 1
-_UniversalSquareLabel:
-_UniversalSquare equ _UniversalSquareLabel-branchTableBase
-    .dw UniversalSquare
+; num1.asm
+_PercentFunctionLabel:
+_PercentFunction equ _PercentFunctionLabel-branchTableBase
+    .dw PercentFunction
     .db 1
-_UniversalSqRootLabel:
-_UniversalSqRoot equ _UniversalSqRootLabel-branchTableBase
-    .dw UniversalSqRoot
+_PercentChangeFunctionLabel:
+_PercentChangeFunction equ _PercentChangeFunctionLabel-branchTableBase
+    .dw PercentChangeFunction
     .db 1
-_UniversalCubeLabel:
-_UniversalCube equ _UniversalCubeLabel-branchTableBase
-    .dw UniversalCube
+_SignFunctionLabel:
+_SignFunction equ _SignFunctionLabel-branchTableBase
+    .dw SignFunction
     .db 1
-_UniversalCubeRootLabel:
-_UniversalCubeRoot equ _UniversalCubeRootLabel-branchTableBase
-    .dw UniversalCubeRoot
+_ModFunctionLabel:
+_ModFunction equ _ModFunctionLabel-branchTableBase
+    .dw ModFunction
     .db 1
-_UniversalPowLabel:
-_UniversalPow equ _UniversalPowLabel-branchTableBase
-    .dw UniversalPow
+_GcdFunctionLabel:
+_GcdFunction equ _GcdFunctionLabel-branchTableBase
+    .dw GcdFunction
     .db 1
-_UniversalXRootYLabel:
-_UniversalXRootY equ _UniversalXRootYLabel-branchTableBase
-    .dw UniversalXRootY
+_LcdFunctionLabel:
+_LcdFunction equ _LcdFunctionLabel-branchTableBase
+    .dw LcdFunction
     .db 1
-_UniversalLogLabel:
-_UniversalLog equ _UniversalLogLabel-branchTableBase
-    .dw UniversalLog
+_CeilFunctionLabel:
+_CeilFunction equ _CeilFunctionLabel-branchTableBase
+    .dw CeilFunction
     .db 1
-_UniversalTenPowLabel:
-_UniversalTenPow equ _UniversalTenPowLabel-branchTableBase
-    .dw UniversalTenPow
+
+; hms1.asm
+_HmsToHrLabel:
+_HmsToHr equ _HmsToHrLabel-branchTableBase
+    .dw HmsToHr
     .db 1
-_UniversalLnLabel:
-_UniversalLn equ _UniversalLnLabel-branchTableBase
-    .dw UniversalLn
+_HmsFromHrLabel:
+_HmsFromHr equ _HmsFromHrLabel-branchTableBase
+    .dw HmsFromHr
     .db 1
-_UniversalExpLabel:
-_UniversalExp equ _UniversalExpLabel-branchTableBase
-    .dw UniversalExp
+_HmsPlusLabel:
+_HmsPlus equ _HmsPlusLabel-branchTableBase
+    .dw HmsPlus
     .db 1
-_UniversalTwoPowLabel:
-_UniversalTwoPow equ _UniversalTwoPowLabel-branchTableBase
-    .dw UniversalTwoPow
+_HmsMinusLabel:
+_HmsMinus equ _HmsMinusLabel-branchTableBase
+    .dw HmsMinus
     .db 1
-_UniversalLog2Label:
-_UniversalLog2 equ _UniversalLog2Label-branchTableBase
-    .dw UniversalLog2
+
+; prob1.asm
+_ProbPermLabel:
+_ProbPerm equ _ProbPermLabel-branchTableBase
+    .dw ProbPerm
     .db 1
-_UniversalLogBaseLabel:
-_UniversalLogBase equ _UniversalLogBaseLabel-branchTableBase
-    .dw UniversalLogBase
+_ProbCombLabel:
+_ProbComb equ _ProbCombLabel-branchTableBase
+    .dw ProbComb
     .db 1
 
-;-----------------------------------------------------------------------------
-
-#ifdef DEBUG
 ; debug1.asm
+#ifdef DEBUG
 _DebugInputBufLabel:
 _DebugInputBuf equ _DebugInputBufLabel-branchTableBase
     .dw DebugInputBuf
@@ -676,6 +617,10 @@ _DebugU32AsHexLabel:
 _DebugU32AsHex equ _DebugU32AsHexLabel-branchTableBase
     .dw DebugU32AsHex
     .db 1
+_DebugU32DEAsHexLabel:
+_DebugU32DEAsHex equ _DebugU32DEAsHexLabel-branchTableBase
+    .dw DebugU32DEAsHex
+    .db 1
 _DebugU40AsHexLabel:
 _DebugU40AsHex equ _DebugU40AsHexLabel-branchTableBase
     .dw DebugU40AsHex
@@ -688,13 +633,29 @@ _DebugHLAsHexLabel:
 _DebugHLAsHex equ _DebugHLAsHexLabel-branchTableBase
     .dw DebugHLAsHex
     .db 1
+_DebugDEHLAsHexLabel:
+_DebugDEHLAsHex equ _DebugDEHLAsHexLabel-branchTableBase
+    .dw DebugDEHLAsHex
+    .db 1
 _DebugPauseLabel:
 _DebugPause equ _DebugPauseLabel-branchTableBase
     .dw DebugPause
     .db 1
-_DebugU32DEAsHexLabel:
-_DebugU32DEAsHex equ _DebugU32DEAsHexLabel-branchTableBase
-    .dw DebugU32DEAsHex
+#endif
+
+; profile1.asm
+#ifdef USE_MENU_PROFILE
+_OpenMenuProfileLabel:
+_OpenMenuProfile equ _OpenMenuProfileLabel-branchTableBase
+    .dw OpenMenuProfile
+    .db 1
+_CountMenuNodeLabel:
+_CountMenuNode equ _CountMenuNodeLabel-branchTableBase
+    .dw CountMenuNode
+    .db 1
+_StoreMenuProfileLabel:
+_StoreMenuProfile equ _StoreMenuProfileLabel-branchTableBase
+    .dw StoreMenuProfile
     .db 1
 #endif
 
@@ -739,10 +700,6 @@ _StatSampleCovarianceLabel:
 _StatSampleCovariance equ _StatSampleCovarianceLabel-branchTableBase
     .dw StatSampleCovariance
     .db 2
-_StatCorrelationLabel:
-_StatCorrelation equ _StatCorrelationLabel-branchTableBase
-    .dw StatCorrelation
-    .db 2
 
 ; cfit2.asm
 _CfitForecastYLabel:
@@ -779,42 +736,6 @@ _InitTvmSolverLabel:
 _InitTvmSolver equ _InitTvmSolverLabel-branchTableBase
     .dw InitTvmSolver
     .db 2
-_TvmCalculateNLabel:
-_TvmCalculateN equ _TvmCalculateNLabel-branchTableBase
-    .dw TvmCalculateN
-    .db 2
-_TvmSolveLabel:
-_TvmSolve equ _TvmSolveLabel-branchTableBase
-    .dw TvmSolve
-    .db 2
-_TvmSolveCheckDebugEnabledLabel:
-_TvmSolveCheckDebugEnabled equ _TvmSolveCheckDebugEnabledLabel-branchTableBase
-    .dw TvmSolveCheckDebugEnabled
-    .db 2
-_TvmCalculatePVLabel:
-_TvmCalculatePV equ _TvmCalculatePVLabel-branchTableBase
-    .dw TvmCalculatePV
-    .db 2
-_TvmCalculatePMTLabel:
-_TvmCalculatePMT equ _TvmCalculatePMTLabel-branchTableBase
-    .dw TvmCalculatePMT
-    .db 2
-_TvmCalculateFVLabel:
-_TvmCalculateFV equ _TvmCalculateFVLabel-branchTableBase
-    .dw TvmCalculateFV
-    .db 2
-_TvmCalcIPPFromIYRLabel:
-_TvmCalcIPPFromIYR equ _TvmCalcIPPFromIYRLabel-branchTableBase
-    .dw TvmCalcIPPFromIYR
-    .db 2
-_TvmClearLabel:
-_TvmClear equ _TvmClearLabel-branchTableBase
-    .dw TvmClear
-    .db 2
-_TvmSolverResetLabel:
-_TvmSolverReset equ _TvmSolverResetLabel-branchTableBase
-    .dw TvmSolverReset
-    .db 2
 _RclTvmNLabel:
 _RclTvmN equ _RclTvmNLabel-branchTableBase
     .dw RclTvmN
@@ -871,7 +792,6 @@ _StoTvmCYRLabel:
 _StoTvmCYR equ _StoTvmCYRLabel-branchTableBase
     .dw StoTvmCYR
     .db 2
-;
 _RclTvmIYR0Label:
 _RclTvmIYR0 equ _RclTvmIYR0Label-branchTableBase
     .dw RclTvmIYR0
@@ -896,159 +816,103 @@ _StoTvmIterMaxLabel:
 _StoTvmIterMax equ _StoTvmIterMaxLabel-branchTableBase
     .dw StoTvmIterMax
     .db 2
+_RclTvmIYR0DefaultLabel:
+_RclTvmIYR0Default equ _RclTvmIYR0DefaultLabel-branchTableBase
+    .dw RclTvmIYR0Default
+    .db 2
+_RclTvmIYR1DefaultLabel:
+_RclTvmIYR1Default equ _RclTvmIYR1DefaultLabel-branchTableBase
+    .dw RclTvmIYR1Default
+    .db 2
 _RclTvmI0Label:
 _RclTvmI0 equ _RclTvmI0Label-branchTableBase
     .dw RclTvmI0
     .db 2
-_StoTvmI0Label:
-_StoTvmI0 equ _StoTvmI0Label-branchTableBase
-    .dw StoTvmI0
-    .db 2
-_RclTvmI1Label:
-_RclTvmI1 equ _RclTvmI1Label-branchTableBase
-    .dw RclTvmI1
-    .db 2
-_StoTvmI1Label:
-_StoTvmI1 equ _StoTvmI1Label-branchTableBase
-    .dw StoTvmI1
-    .db 2
 _RclTvmNPMT0Label:
 _RclTvmNPMT0 equ _RclTvmNPMT0Label-branchTableBase
     .dw RclTvmNPMT0
     .db 2
-_StoTvmNPMT0Label:
-_StoTvmNPMT0 equ _StoTvmNPMT0Label-branchTableBase
-    .dw StoTvmNPMT0
+_RclTvmI1Label:
+_RclTvmI1 equ _RclTvmI1Label-branchTableBase
+    .dw RclTvmI1
     .db 2
 _RclTvmNPMT1Label:
 _RclTvmNPMT1 equ _RclTvmNPMT1Label-branchTableBase
     .dw RclTvmNPMT1
     .db 2
-_StoTvmNPMT1Label:
-_StoTvmNPMT1 equ _StoTvmNPMT1Label-branchTableBase
-    .dw StoTvmNPMT1
-    .db 2
 _RclTvmSolverCountLabel:
 _RclTvmSolverCount equ _RclTvmSolverCountLabel-branchTableBase
     .dw RclTvmSolverCount
     .db 2
-;
-_RclTvmIYR0DefaultLabel:
-_RclTvmIYR0Default equ _RclTvmIYR0DefaultLabel-branchTableBase
-    .dw RclTvmIYR0Default
-    .db 2
-_RclTvmIYR1DefaultLabel:
-_RclTvmIYR1Default equ _RclTvmIYR1DefaultLabel-branchTableBase
-    .dw RclTvmIYR1Default
-    .db 2
-
-; float2.asm
-_LnOnePlusLabel:
-_LnOnePlus equ _LnOnePlusLabel-branchTableBase
-    .dw LnOnePlus
-    .db 2
-_ExpMinusOneLabel:
-_ExpMinusOne equ _ExpMinusOneLabel-branchTableBase
-    .dw ExpMinusOne
-    .db 2
-
-; selectepoch2.asm
-_SelectUnixEpochDateLabel:
-_SelectUnixEpochDate equ _SelectUnixEpochDateLabel-branchTableBase
-    .dw SelectUnixEpochDate
-    .db 2
-_SelectNtpEpochDateLabel:
-_SelectNtpEpochDate equ _SelectNtpEpochDateLabel-branchTableBase
-    .dw SelectNtpEpochDate
-    .db 2
-_SelectGpsEpochDateLabel:
-_SelectGpsEpochDate equ _SelectGpsEpochDateLabel-branchTableBase
-    .dw SelectGpsEpochDate
-    .db 2
-_SelectTiosEpochDateLabel:
-_SelectTiosEpochDate equ _SelectTiosEpochDateLabel-branchTableBase
-    .dw SelectTiosEpochDate
-    .db 2
-_SelectY2kEpochDateLabel:
-_SelectY2kEpochDate equ _SelectY2kEpochDateLabel-branchTableBase
-    .dw SelectY2kEpochDate
-    .db 2
-_SelectCustomEpochDateLabel:
-_SelectCustomEpochDate equ _SelectCustomEpochDateLabel-branchTableBase
-    .dw SelectCustomEpochDate
-    .db 2
-; Set and get custom epoch date.
-_SetCustomEpochDateLabel:
-_SetCustomEpochDate equ _SetCustomEpochDateLabel-branchTableBase
-    .dw SetCustomEpochDate
-    .db 2
-_GetCustomEpochDateLabel:
-_GetCustomEpochDate equ _GetCustomEpochDateLabel-branchTableBase
-    .dw GetCustomEpochDate
-    .db 2
-
-; fps2.asm
-_ReserveRpnObjectLabel:
-_ReserveRpnObject equ _ReserveRpnObjectLabel-branchTableBase
-    .dw ReserveRpnObject
+_TvmCalcIPPFromIYRLabel:
+_TvmCalcIPPFromIYR equ _TvmCalcIPPFromIYRLabel-branchTableBase
+    .dw TvmCalcIPPFromIYR
     .db 2
-_PushRpnObject1Label:
-_PushRpnObject1 equ _PushRpnObject1Label-branchTableBase
-    .dw PushRpnObject1
+_TvmSolveCheckDebugEnabledLabel:
+_TvmSolveCheckDebugEnabled equ _TvmSolveCheckDebugEnabledLabel-branchTableBase
+    .dw TvmSolveCheckDebugEnabled
     .db 2
-_PopRpnObject1Label:
-_PopRpnObject1 equ _PopRpnObject1Label-branchTableBase
-    .dw PopRpnObject1
+_TvmSolveLabel:
+_TvmSolve equ _TvmSolveLabel-branchTableBase
+    .dw TvmSolve
     .db 2
-_PushRpnObject3Label:
-_PushRpnObject3 equ _PushRpnObject3Label-branchTableBase
-    .dw PushRpnObject3
+_TvmCalculateNLabel:
+_TvmCalculateN equ _TvmCalculateNLabel-branchTableBase
+    .dw TvmCalculateN
     .db 2
-_PopRpnObject3Label:
-_PopRpnObject3 equ _PopRpnObject3Label-branchTableBase
-    .dw PopRpnObject3
+_TvmCalculatePVLabel:
+_TvmCalculatePV equ _TvmCalculatePVLabel-branchTableBase
+    .dw TvmCalculatePV
     .db 2
-_PushRpnObject5Label:
-_PushRpnObject5 equ _PushRpnObject5Label-branchTableBase
-    .dw PushRpnObject5
+_TvmCalculatePMTLabel:
+_TvmCalculatePMT equ _TvmCalculatePMTLabel-branchTableBase
+    .dw TvmCalculatePMT
     .db 2
-_PopRpnObject5Label:
-_PopRpnObject5 equ _PopRpnObject5Label-branchTableBase
-    .dw PopRpnObject5
+_TvmCalculateFVLabel:
+_TvmCalculateFV equ _TvmCalculateFVLabel-branchTableBase
+    .dw TvmCalculateFV
     .db 2
-_DropRpnObjectLabel:
-_DropRpnObject equ _DropRpnObjectLabel-branchTableBase
-    .dw DropRpnObject
+_TvmClearLabel:
+_TvmClear equ _TvmClearLabel-branchTableBase
+    .dw TvmClear
+    .db 2
+_TvmSolverResetLabel:
+_TvmSolverReset equ _TvmSolverResetLabel-branchTableBase
+    .dw TvmSolverReset
     .db 2
 
-; formatdate2.asm
-_FormatDateLabel:
-_FormatDate equ _FormatDateLabel-branchTableBase
-    .dw FormatDate
+; selectepoch2.asm
+_SelectUnixEpochDateLabel:
+_SelectUnixEpochDate equ _SelectUnixEpochDateLabel-branchTableBase
+    .dw SelectUnixEpochDate
     .db 2
-_FormatTimeLabel:
-_FormatTime equ _FormatTimeLabel-branchTableBase
-    .dw FormatTime
+_SelectNtpEpochDateLabel:
+_SelectNtpEpochDate equ _SelectNtpEpochDateLabel-branchTableBase
+    .dw SelectNtpEpochDate
     .db 2
-_FormatDateTimeLabel:
-_FormatDateTime equ _FormatDateTimeLabel-branchTableBase
-    .dw FormatDateTime
+_SelectGpsEpochDateLabel:
+_SelectGpsEpochDate equ _SelectGpsEpochDateLabel-branchTableBase
+    .dw SelectGpsEpochDate
     .db 2
-_FormatOffsetLabel:
-_FormatOffset equ _FormatOffsetLabel-branchTableBase
-    .dw FormatOffset
+_SelectTiosEpochDateLabel:
+_SelectTiosEpochDate equ _SelectTiosEpochDateLabel-branchTableBase
+    .dw SelectTiosEpochDate
     .db 2
-_FormatOffsetDateTimeLabel:
-_FormatOffsetDateTime equ _FormatOffsetDateTimeLabel-branchTableBase
-    .dw FormatOffsetDateTime
+_SelectY2kEpochDateLabel:
+_SelectY2kEpochDate equ _SelectY2kEpochDateLabel-branchTableBase
+    .dw SelectY2kEpochDate
     .db 2
-_FormatDayOfWeekLabel:
-_FormatDayOfWeek equ _FormatDayOfWeekLabel-branchTableBase
-    .dw FormatDayOfWeek
+_SelectCustomEpochDateLabel:
+_SelectCustomEpochDate equ _SelectCustomEpochDateLabel-branchTableBase
+    .dw SelectCustomEpochDate
     .db 2
-_FormatDurationLabel:
-_FormatDuration equ _FormatDurationLabel-branchTableBase
-    .dw FormatDuration
+_SetCustomEpochDateLabel:
+_SetCustomEpochDate equ _SetCustomEpochDateLabel-branchTableBase
+    .dw SetCustomEpochDate
+    .db 2
+_GetCustomEpochDateLabel:
+_GetCustomEpochDate equ _GetCustomEpochDateLabel-branchTableBase
+    .dw GetCustomEpochDate
     .db 2
 
 ; datevalidation2.asm
@@ -1086,16 +950,6 @@ _ColdInitDateLabel:
 _ColdInitDate equ _ColdInitDateLabel-branchTableBase
     .dw ColdInitDate
     .db 2
-; Leap year functions
-_IsYearLeapLabel:
-_IsYearLeap equ _IsYearLeapLabel-branchTableBase
-    .dw IsYearLeap
-    .db 2
-_IsDateLeapLabel:
-_IsDateLeap equ _IsDateLeapLabel-branchTableBase
-    .dw IsDateLeap
-    .db 2
-; RpnDate and days functions
 _RpnDateToEpochDaysLabel:
 _RpnDateToEpochDays equ _RpnDateToEpochDaysLabel-branchTableBase
     .dw RpnDateToEpochDays
@@ -1112,7 +966,6 @@ _EpochSecondsToRpnDateLabel:
 _EpochSecondsToRpnDate equ _EpochSecondsToRpnDateLabel-branchTableBase
     .dw EpochSecondsToRpnDate
     .db 2
-; arithmetics
 _AddRpnDateByDaysLabel:
 _AddRpnDateByDays equ _AddRpnDateByDaysLabel-branchTableBase
     .dw AddRpnDateByDays
@@ -1125,7 +978,6 @@ _SubRpnDateByObjectLabel:
 _SubRpnDateByObject equ _SubRpnDateByObjectLabel-branchTableBase
     .dw SubRpnDateByObject
     .db 2
-; extractors
 _RpnDateExtractYearLabel:
 _RpnDateExtractYear equ _RpnDateExtractYearLabel-branchTableBase
     .dw RpnDateExtractYear
@@ -1148,7 +1000,6 @@ _SecondsToRpnTimeLabel:
 _SecondsToRpnTime equ _SecondsToRpnTimeLabel-branchTableBase
     .dw SecondsToRpnTime
     .db 2
-; arithmetics
 _AddRpnTimeBySecondsLabel:
 _AddRpnTimeBySeconds equ _AddRpnTimeBySecondsLabel-branchTableBase
     .dw AddRpnTimeBySeconds
@@ -1161,7 +1012,6 @@ _SubRpnTimeByObjectLabel:
 _SubRpnTimeByObject equ _SubRpnTimeByObjectLabel-branchTableBase
     .dw SubRpnTimeByObject
     .db 2
-; extractors
 _RpnTimeExtractHourLabel:
 _RpnTimeExtractHour equ _RpnTimeExtractHourLabel-branchTableBase
     .dw RpnTimeExtractHour
@@ -1180,7 +1030,6 @@ _RpnDateToDayOfWeekLabel:
 _RpnDateToDayOfWeek equ _RpnDateToDayOfWeekLabel-branchTableBase
     .dw RpnDateToDayOfWeek
     .db 2
-;
 _RpnDayOfWeekToIsoDowNumberLabel:
 _RpnDayOfWeekToIsoDowNumber equ _RpnDayOfWeekToIsoDowNumberLabel-branchTableBase
     .dw RpnDayOfWeekToIsoDowNumber
@@ -1189,7 +1038,6 @@ _IsoDowNumberToRpnDayOfWeekLabel:
 _IsoDowNumberToRpnDayOfWeek equ _IsoDowNumberToRpnDayOfWeekLabel-branchTableBase
     .dw IsoDowNumberToRpnDayOfWeek
     .db 2
-;
 _RpnDayOfWeekToUnixDowNumberLabel:
 _RpnDayOfWeekToUnixDowNumber equ _RpnDayOfWeekToUnixDowNumberLabel-branchTableBase
     .dw RpnDayOfWeekToUnixDowNumber
@@ -1198,7 +1046,6 @@ _UnixDowNumberToRpnDayOfWeekLabel:
 _UnixDowNumberToRpnDayOfWeek equ _UnixDowNumberToRpnDayOfWeekLabel-branchTableBase
     .dw UnixDowNumberToRpnDayOfWeek
     .db 2
-; arithmetics
 _AddRpnDayOfWeekByDaysLabel:
 _AddRpnDayOfWeekByDays equ _AddRpnDayOfWeekByDaysLabel-branchTableBase
     .dw AddRpnDayOfWeekByDays
@@ -1217,15 +1064,10 @@ _EpochSecondsToRpnDateTimeLabel:
 _EpochSecondsToRpnDateTime equ _EpochSecondsToRpnDateTimeLabel-branchTableBase
     .dw EpochSecondsToRpnDateTime
     .db 2
-_RpnDateTimeToEpochDaysLabel:
-_RpnDateTimeToEpochDays equ _RpnDateTimeToEpochDaysLabel-branchTableBase
-    .dw RpnDateTimeToEpochDays
-    .db 2
 _EpochDaysToRpnDateTimeLabel:
 _EpochDaysToRpnDateTime equ _EpochDaysToRpnDateTimeLabel-branchTableBase
     .dw EpochDaysToRpnDateTime
     .db 2
-; arithmetics
 _AddRpnDateTimeBySecondsLabel:
 _AddRpnDateTimeBySeconds equ _AddRpnDateTimeBySecondsLabel-branchTableBase
     .dw AddRpnDateTimeBySeconds
@@ -1238,7 +1080,6 @@ _SubRpnDateTimeByObjectLabel:
 _SubRpnDateTimeByObject equ _SubRpnDateTimeByObjectLabel-branchTableBase
     .dw SubRpnDateTimeByObject
     .db 2
-; extractors
 _RpnDateTimeExtractDateLabel:
 _RpnDateTimeExtractDate equ _RpnDateTimeExtractDateLabel-branchTableBase
     .dw RpnDateTimeExtractDate
@@ -1273,7 +1114,6 @@ _SubRpnOffsetByObjectLabel:
 _SubRpnOffsetByObject equ _SubRpnOffsetByObjectLabel-branchTableBase
     .dw SubRpnOffsetByObject
     .db 2
-; extractors
 _RpnOffsetExtractHourLabel:
 _RpnOffsetExtractHour equ _RpnOffsetExtractHourLabel-branchTableBase
     .dw RpnOffsetExtractHour
@@ -1308,7 +1148,6 @@ _SubRpnOffsetDateTimeByObjectLabel:
 _SubRpnOffsetDateTimeByObject equ _SubRpnOffsetDateTimeByObjectLabel-branchTableBase
     .dw SubRpnOffsetDateTimeByObject
     .db 2
-; extractors
 _RpnOffsetDateTimeExtractDateLabel:
 _RpnOffsetDateTimeExtractDate equ _RpnOffsetDateTimeExtractDateLabel-branchTableBase
     .dw RpnOffsetDateTimeExtractDate
@@ -1363,7 +1202,6 @@ _DivRpnDurationByRealLabel:
 _DivRpnDurationByReal equ _DivRpnDurationByRealLabel-branchTableBase
     .dw DivRpnDurationByReal
     .db 2
-; extracors
 _RpnDurationExtractDayLabel:
 _RpnDurationExtractDay equ _RpnDurationExtractDayLabel-branchTableBase
     .dw RpnDurationExtractDay
@@ -1432,14 +1270,14 @@ _RtcGetNowLabel:
 _RtcGetNow equ _RtcGetNowLabel-branchTableBase
     .dw RtcGetNow
     .db 2
-_RtcGetDateLabel:
-_RtcGetDate equ _RtcGetDateLabel-branchTableBase
-    .dw RtcGetDate
-    .db 2
 _RtcGetTimeLabel:
 _RtcGetTime equ _RtcGetTimeLabel-branchTableBase
     .dw RtcGetTime
     .db 2
+_RtcGetDateLabel:
+_RtcGetDate equ _RtcGetDateLabel-branchTableBase
+    .dw RtcGetDate
+    .db 2
 _RtcGetOffsetDateTimeLabel:
 _RtcGetOffsetDateTime equ _RtcGetOffsetDateTimeLabel-branchTableBase
     .dw RtcGetOffsetDateTime
@@ -1448,11 +1286,6 @@ _RtcGetOffsetDateTimeForUtcLabel:
 _RtcGetOffsetDateTimeForUtc equ _RtcGetOffsetDateTimeForUtcLabel-branchTableBase
     .dw RtcGetOffsetDateTimeForUtc
     .db 2
-;
-_RtcSetClockLabel:
-_RtcSetClock equ _RtcSetClockLabel-branchTableBase
-    .dw RtcSetClock
-    .db 2
 _RtcSetTimeZoneLabel:
 _RtcSetTimeZone equ _RtcSetTimeZoneLabel-branchTableBase
     .dw RtcSetTimeZone
@@ -1461,6 +1294,116 @@ _RtcGetTimeZoneLabel:
 _RtcGetTimeZone equ _RtcGetTimeZoneLabel-branchTableBase
     .dw RtcGetTimeZone
     .db 2
+_RtcSetClockLabel:
+_RtcSetClock equ _RtcSetClockLabel-branchTableBase
+    .dw RtcSetClock
+    .db 2
+
+; formatdate2.asm
+_FormatDateLabel:
+_FormatDate equ _FormatDateLabel-branchTableBase
+    .dw FormatDate
+    .db 2
+_FormatTimeLabel:
+_FormatTime equ _FormatTimeLabel-branchTableBase
+    .dw FormatTime
+    .db 2
+_FormatDateTimeLabel:
+_FormatDateTime equ _FormatDateTimeLabel-branchTableBase
+    .dw FormatDateTime
+    .db 2
+_FormatOffsetLabel:
+_FormatOffset equ _FormatOffsetLabel-branchTableBase
+    .dw FormatOffset
+    .db 2
+_FormatOffsetDateTimeLabel:
+_FormatOffsetDateTime equ _FormatOffsetDateTimeLabel-branchTableBase
+    .dw FormatOffsetDateTime
+    .db 2
+_FormatDayOfWeekLabel:
+_FormatDayOfWeek equ _FormatDayOfWeekLabel-branchTableBase
+    .dw FormatDayOfWeek
+    .db 2
+_FormatDurationLabel:
+_FormatDuration equ _FormatDurationLabel-branchTableBase
+    .dw FormatDuration
+    .db 2
+
+; float2.asm
+_LnOnePlusLabel:
+_LnOnePlus equ _LnOnePlusLabel-branchTableBase
+    .dw LnOnePlus
+    .db 2
+_ExpMinusOneLabel:
+_ExpMinusOne equ _ExpMinusOneLabel-branchTableBase
+    .dw ExpMinusOne
+    .db 2
+
+; fps2.asm
+_PushRpnObject1Label:
+_PushRpnObject1 equ _PushRpnObject1Label-branchTableBase
+    .dw PushRpnObject1
+    .db 2
+_PopRpnObject1Label:
+_PopRpnObject1 equ _PopRpnObject1Label-branchTableBase
+    .dw PopRpnObject1
+    .db 2
+_PushRpnObject3Label:
+_PushRpnObject3 equ _PushRpnObject3Label-branchTableBase
+    .dw PushRpnObject3
+    .db 2
+_ReserveRpnObjectLabel:
+_ReserveRpnObject equ _ReserveRpnObjectLabel-branchTableBase
+    .dw ReserveRpnObject
+    .db 2
+_DropRpnObjectLabel:
+_DropRpnObject equ _DropRpnObjectLabel-branchTableBase
+    .dw DropRpnObject
+    .db 2
+
+; format2.asm
+_FormatAToStringLabel:
+_FormatAToString equ _FormatAToStringLabel-branchTableBase
+    .dw FormatAToString
+    .db 2
+
+; show2.asm
+_ClearShowAreaLabel:
+_ClearShowArea equ _ClearShowAreaLabel-branchTableBase
+    .dw ClearShowArea
+    .db 2
+_FormShowableLabel:
+_FormShowable equ _FormShowableLabel-branchTableBase
+    .dw FormShowable
+    .db 2
+
+; display2.asm
+_ColdInitDisplayLabel:
+_ColdInitDisplay equ _ColdInitDisplayLabel-branchTableBase
+    .dw ColdInitDisplay
+    .db 2
+_InitDisplayLabel:
+_InitDisplay equ _InitDisplayLabel-branchTableBase
+    .dw InitDisplay
+    .db 2
+_PrintMenuNameAtCLabel:
+_PrintMenuNameAtC equ _PrintMenuNameAtCLabel-branchTableBase
+    .dw PrintMenuNameAtC
+    .db 2
+_DisplayMenuFolderLabel:
+_DisplayMenuFolder equ _DisplayMenuFolderLabel-branchTableBase
+    .dw DisplayMenuFolder
+    .db 2
+_PrintInputBufLabel:
+_PrintInputBuf equ _PrintInputBufLabel-branchTableBase
+    .dw PrintInputBuf
+    .db 2
+
+; prime2.asm
+_PrimeFactorLabel:
+_PrimeFactor equ _PrimeFactorLabel-branchTableBase
+    .dw PrimeFactor
+    .db 2
 
 ; base2.asm
 _ColdInitBaseLabel:
@@ -1487,7 +1430,6 @@ _BitwiseNegLabel:
 _BitwiseNeg equ _BitwiseNegLabel-branchTableBase
     .dw BitwiseNeg
     .db 2
-;
 _BaseShiftLeftLogicalLabel:
 _BaseShiftLeftLogical equ _BaseShiftLeftLogicalLabel-branchTableBase
     .dw BaseShiftLeftLogical
@@ -1508,7 +1450,6 @@ _BaseShiftRightLogicalNLabel:
 _BaseShiftRightLogicalN equ _BaseShiftRightLogicalNLabel-branchTableBase
     .dw BaseShiftRightLogicalN
     .db 2
-;
 _BaseRotateLeftCircularLabel:
 _BaseRotateLeftCircular equ _BaseRotateLeftCircularLabel-branchTableBase
     .dw BaseRotateLeftCircular
@@ -1525,7 +1466,6 @@ _BaseRotateRightCarryLabel:
 _BaseRotateRightCarry equ _BaseRotateRightCarryLabel-branchTableBase
     .dw BaseRotateRightCarry
     .db 2
-;
 _BaseRotateLeftCircularNLabel:
 _BaseRotateLeftCircularN equ _BaseRotateLeftCircularNLabel-branchTableBase
     .dw BaseRotateLeftCircularN
@@ -1542,7 +1482,6 @@ _BaseRotateRightCarryNLabel:
 _BaseRotateRightCarryN equ _BaseRotateRightCarryNLabel-branchTableBase
     .dw BaseRotateRightCarryN
     .db 2
-;
 _BaseAddLabel:
 _BaseAdd equ _BaseAddLabel-branchTableBase
     .dw BaseAdd
@@ -1563,7 +1502,6 @@ _BaseDiv2Label:
 _BaseDiv2 equ _BaseDiv2Label-branchTableBase
     .dw BaseDiv2
     .db 2
-;
 _BaseReverseBitsLabel:
 _BaseReverseBits equ _BaseReverseBitsLabel-branchTableBase
     .dw BaseReverseBits
@@ -1584,7 +1522,6 @@ _BaseGetBitLabel:
 _BaseGetBit equ _BaseGetBitLabel-branchTableBase
     .dw BaseGetBit
     .db 2
-;
 _BaseStoreCarryFlagLabel:
 _BaseStoreCarryFlag equ _BaseStoreCarryFlagLabel-branchTableBase
     .dw BaseStoreCarryFlag
@@ -1593,7 +1530,6 @@ _BaseGetCarryFlagLabel:
 _BaseGetCarryFlag equ _BaseGetCarryFlagLabel-branchTableBase
     .dw BaseGetCarryFlag
     .db 2
-;
 _BaseSetWordSizeLabel:
 _BaseSetWordSize equ _BaseSetWordSizeLabel-branchTableBase
     .dw BaseSetWordSize
@@ -1603,12 +1539,6 @@ _BaseGetWordSize equ _BaseGetWordSizeLabel-branchTableBase
     .dw BaseGetWordSize
     .db 2
 
-; prime2.asm
-_PrimeFactorLabel:
-_PrimeFactor equ _PrimeFactorLabel-branchTableBase
-    .dw PrimeFactor
-    .db 2
-
 ; integerconv32.asm
 _ConvertOP1ToUxxNoFatalLabel:
 _ConvertOP1ToUxxNoFatal equ _ConvertOP1ToUxxNoFatalLabel-branchTableBase
@@ -1632,60 +1562,6 @@ _FormatCodedU32ToDecStringLabel:
 _FormatCodedU32ToDecString equ _FormatCodedU32ToDecStringLabel-branchTableBase
     .dw FormatCodedU32ToDecString
     .db 2
-_FormatU32ToHexStringLabel:
-_FormatU32ToHexString equ _FormatU32ToHexStringLabel-branchTableBase
-    .dw FormatU32ToHexString
-    .db 2
-_FormatU32ToOctStringLabel:
-_FormatU32ToOctString equ _FormatU32ToOctStringLabel-branchTableBase
-    .dw FormatU32ToOctString
-    .db 2
-_FormatU32ToBinStringLabel:
-_FormatU32ToBinString equ _FormatU32ToBinStringLabel-branchTableBase
-    .dw FormatU32ToBinString
-    .db 2
-_FormatU32ToDecStringLabel:
-_FormatU32ToDecString equ _FormatU32ToDecStringLabel-branchTableBase
-    .dw FormatU32ToDecString
-    .db 2
-
-; format2.asm
-_FormatAToStringLabel:
-_FormatAToString equ _FormatAToStringLabel-branchTableBase
-    .dw FormatAToString
-    .db 2
-
-; show2.asm
-_ClearShowAreaLabel:
-_ClearShowArea equ _ClearShowAreaLabel-branchTableBase
-    .dw ClearShowArea
-    .db 2
-_FormShowableLabel:
-_FormShowable equ _FormShowableLabel-branchTableBase
-    .dw FormShowable
-    .db 2
-
-; display2.asm
-_ColdInitDisplayLabel:
-_ColdInitDisplay equ _ColdInitDisplayLabel-branchTableBase
-    .dw ColdInitDisplay
-    .db 2
-_InitDisplayLabel:
-_InitDisplay equ _InitDisplayLabel-branchTableBase
-    .dw InitDisplay
-    .db 2
-_PrintMenuNameAtCLabel:
-_PrintMenuNameAtC equ _PrintMenuNameAtCLabel-branchTableBase
-    .dw PrintMenuNameAtC
-    .db 2
-_DisplayMenuFolderLabel:
-_DisplayMenuFolder equ _DisplayMenuFolderLabel-branchTableBase
-    .dw DisplayMenuFolder
-    .db 2
-_PrintInputBufLabel:
-_PrintInputBuf equ _PrintInputBufLabel-branchTableBase
-    .dw PrintInputBuf
-    .db 2
 
 ;-----------------------------------------------------------------------------
 ; Branch table entries for routines on Flash Page 3.
@@ -1700,7 +1576,6 @@ _SanitizeMenuLabel:
 _SanitizeMenu equ _SanitizeMenuLabel-branchTableBase
     .dw SanitizeMenu
     .db 3
-;
 _ClearJumpBackLabel:
 _ClearJumpBack equ _ClearJumpBackLabel-branchTableBase
     .dw ClearJumpBack
@@ -1725,14 +1600,13 @@ _GetCurrentMenuGroupNumRowsLabel:
 _GetCurrentMenuGroupNumRows equ _GetCurrentMenuGroupNumRowsLabel-branchTableBase
     .dw GetCurrentMenuGroupNumRows
     .db 3
-;
 _IsEqualToOrChildOfMenuGroupLabel:
 _IsEqualToOrChildOfMenuGroup equ _IsEqualToOrChildOfMenuGroupLabel-branchTableBase
     .dw IsEqualToOrChildOfMenuGroup
     .db 3
-_GetMenuNodeRowBeginIdLabel:
-_GetMenuNodeRowBeginId equ _GetMenuNodeRowBeginIdLabel-branchTableBase
-    .dw GetMenuNodeRowBeginId
+_GetMenuRowIndexOfChildLabel:
+_GetMenuRowIndexOfChild equ _GetMenuRowIndexOfChildLabel-branchTableBase
+    .dw GetMenuRowIndexOfChild
     .db 3
 _GetMenuNodeHandlerLabel:
 _GetMenuNodeHandler equ _GetMenuNodeHandlerLabel-branchTableBase
@@ -1774,14 +1648,14 @@ _ApplyRpnDenominateUnitLabel:
 _ApplyRpnDenominateUnit equ _ApplyRpnDenominateUnitLabel-branchTableBase
     .dw ApplyRpnDenominateUnit
     .db 4
-_GetRpnDenominateDisplayValueLabel:
-_GetRpnDenominateDisplayValue equ _GetRpnDenominateDisplayValueLabel-branchTableBase
-    .dw GetRpnDenominateDisplayValue
-    .db 4
 _ConvertRpnDenominateToBaseUnitLabel:
 _ConvertRpnDenominateToBaseUnit equ _ConvertRpnDenominateToBaseUnitLabel-branchTableBase
     .dw ConvertRpnDenominateToBaseUnit
     .db 4
+_GetRpnDenominateDisplayValueLabel:
+_GetRpnDenominateDisplayValue equ _GetRpnDenominateDisplayValueLabel-branchTableBase
+    .dw GetRpnDenominateDisplayValue
+    .db 4
 _ChsRpnDenominateLabel:
 _ChsRpnDenominate equ _ChsRpnDenominateLabel-branchTableBase
     .dw ChsRpnDenominate
@@ -1798,15 +1672,14 @@ _MultRpnDenominateByRealLabel:
 _MultRpnDenominateByReal equ _MultRpnDenominateByRealLabel-branchTableBase
     .dw MultRpnDenominateByReal
     .db 4
-_DivRpnDenominateByRealLabel:
-_DivRpnDenominateByReal equ _DivRpnDenominateByRealLabel-branchTableBase
-    .dw DivRpnDenominateByReal
-    .db 4
 _DivRpnDenominateByDenominateLabel:
 _DivRpnDenominateByDenominate equ _DivRpnDenominateByDenominateLabel-branchTableBase
     .dw DivRpnDenominateByDenominate
     .db 4
-;
+_DivRpnDenominateByRealLabel:
+_DivRpnDenominateByReal equ _DivRpnDenominateByRealLabel-branchTableBase
+    .dw DivRpnDenominateByReal
+    .db 4
 _RpnDenominatePercentLabel:
 _RpnDenominatePercent equ _RpnDenominatePercentLabel-branchTableBase
     .dw RpnDenominatePercent
@@ -1835,7 +1708,6 @@ _RpnDenominateMaxLabel:
 _RpnDenominateMax equ _RpnDenominateMaxLabel-branchTableBase
     .dw RpnDenominateMax
     .db 4
-;
 _RpnDenominateIntPartLabel:
 _RpnDenominateIntPart equ _RpnDenominateIntPartLabel-branchTableBase
     .dw RpnDenominateIntPart
@@ -1856,7 +1728,6 @@ _RpnDenominateNearLabel:
 _RpnDenominateNear equ _RpnDenominateNearLabel-branchTableBase
     .dw RpnDenominateNear
     .db 4
-;
 _RpnDenominateRoundToFixLabel:
 _RpnDenominateRoundToFix equ _RpnDenominateRoundToFixLabel-branchTableBase
     .dw RpnDenominateRoundToFix
@@ -1870,7 +1741,7 @@ _RpnDenominateRoundToN equ _RpnDenominateRoundToNLabel-branchTableBase
     .dw RpnDenominateRoundToN
     .db 4
 
-; formatdenominate2.asm
+; formatdenominate4.asm
 _FormatDenominateLabel:
 _FormatDenominate equ _FormatDenominateLabel-branchTableBase
     .dw FormatDenominate
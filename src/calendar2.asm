@@ -0,0 +1,65 @@
+;-----------------------------------------------------------------------------
+; Calendar constants and lookup tables used by datevalidation2.asm,
+; epoch2.asm and dayofweek2.asm, generated by gencalendar.py.
+;
+; DO NOT EDIT: This file was autogenerated.
+;-----------------------------------------------------------------------------
+
+; Number of days in the 400-year cycle of the Gregorian calendar.
+; 146097 = 2*65536 + 15025
+daysPer400YearsHigh equ 2
+daysPer400YearsLow equ 15025
+
+; Number of days from 0000-03-01 to the internal epoch 2000-01-01.
+; 730425 = 11*65536 + 9529
+internalEpochOffsetHigh equ 11
+internalEpochOffsetLow equ 9529
+
+; Maximum number of days of each month, indexed by month-1.
+maxDaysForMonth:
+    .db 31 ; Jan
+    .db 29 ; Feb
+    .db 31 ; Mar
+    .db 30 ; Apr
+    .db 31 ; May
+    .db 30 ; Jun
+    .db 31 ; Jul
+    .db 31 ; Aug
+    .db 30 ; Sep
+    .db 31 ; Oct
+    .db 30 ; Nov
+    .db 31 ; Dec
+
+; Number of days before each month of the shifted year which starts on Mar 1,
+; indexed by monthPrime=[0,11]. The leap day is the last day of the shifted
+; year, so this table is valid for both leap and non-leap years.
+daysBeforeMonthPrime:
+    .dw 0 ; Mar
+    .dw 31 ; Apr
+    .dw 61 ; May
+    .dw 92 ; Jun
+    .dw 122 ; Jul
+    .dw 153 ; Aug
+    .dw 184 ; Sep
+    .dw 214 ; Oct
+    .dw 245 ; Nov
+    .dw 275 ; Dec
+    .dw 306 ; Jan
+    .dw 337 ; Feb
+
+; Day of week offset of each month, indexed by month-1. The day of week
+; (Sun=0,Sat=6) is (y + y/4 - y/100 + y/400 + offset + day) % 7, where y is
+; the year, minus 1 for Jan and Feb.
+dayOfWeekMonthOffsets:
+    .db 0 ; Jan
+    .db 3 ; Feb
+    .db 2 ; Mar
+    .db 5 ; Apr
+    .db 0 ; May
+    .db 3 ; Jun
+    .db 5 ; Jul
+    .db 1 ; Aug
+    .db 4 ; Sep
+    .db 6 ; Oct
+    .db 2 ; Nov
+    .db 4 ; Dec
@@ -0,0 +1,132 @@
+;-----------------------------------------------------------------------------
+; Floating point constants for routines in Flash Page 0, generated from
+; constdef.txt.
+;
+; There are 2 sections:
+; - list of 'opNSetX' loader routines
+; - table of 9-byte TI-OS floating point constants
+;
+; DO NOT EDIT: This file was autogenerated.
+;-----------------------------------------------------------------------------
+
+; Description: Set OP1 to -1.
+; Destroys: all, HL
+op1SetM1:
+    ld hl, constM1
+    jp move9ToOp1
+
+; Description: Set OP1 to 0.
+; Destroys: all, HL
+op1Set0:
+    ld hl, const0
+    jp move9ToOp1
+
+; Description: Set OP2 to 0.
+; Destroys: all, HL
+op2Set0:
+    ld hl, const0
+    jp move9ToOp2
+
+; Description: Set OP3 to 0.
+; Destroys: all, HL
+op3Set0:
+    ld hl, const0
+    jp move9ToOp3
+
+; Description: Set OP4 to 0.
+; Destroys: all, HL
+op4Set0:
+    ld hl, const0
+    jp move9ToOp4
+
+; Description: Set OP2 to 10.
+; Destroys: all, HL
+op2Set10:
+    ld hl, const10
+    jp move9ToOp2
+
+; Description: Set OP2 to 12.
+; Destroys: all, HL
+op2Set12:
+    ld hl, const12
+    jp move9ToOp2
+
+; Description: Set OP2 to 24.
+; Destroys: all, HL
+op2Set24:
+    ld hl, const24
+    jp move9ToOp2
+
+; Description: Set OP1 to 100.
+; Destroys: all, HL
+op1Set100:
+    ld hl, const100
+    jp move9ToOp1
+
+; Description: Set OP2 to 100.
+; Destroys: all, HL
+op2Set100:
+    ld hl, const100
+    jp move9ToOp2
+
+; Description: Set OP2 to 1E-8.
+; Destroys: all, HL
+op2Set1EM8:
+    ld hl, const1EM8
+    jp move9ToOp2
+
+; Description: Set OP1 to 3.1415926535898.
+; Destroys: all, HL
+op1SetPi:
+    ld hl, constPi
+    jp move9ToOp1
+
+; Description: Set OP2 to 3.1415926535898.
+; Destroys: all, HL
+op2SetPi:
+    ld hl, constPi
+    jp move9ToOp2
+
+; Description: Set OP1 to 2.718281828459.
+; Destroys: all, HL
+op1SetEuler:
+    ld hl, constEuler
+    jp move9ToOp1
+
+; Description: Set OP2 to 2.718281828459.
+; Destroys: all, HL
+op2SetEuler:
+    ld hl, constEuler
+    jp move9ToOp2
+
+;-----------------------------------------------------------------------------
+
+constCount equ 9 ; number of constants
+
+constM1: ; -1
+    .db $80, $80, $10, $00, $00, $00, $00, $00, $00 ; -1
+
+const0: ; 0
+    .db $00, $80, $00, $00, $00, $00, $00, $00, $00 ; 0
+
+const10: ; 10
+    .db $00, $81, $10, $00, $00, $00, $00, $00, $00 ; 1E1
+
+const12: ; 12
+    .db $00, $81, $12, $00, $00, $00, $00, $00, $00 ; 1.2E1
+
+const24: ; 24
+    .db $00, $81, $24, $00, $00, $00, $00, $00, $00 ; 2.4E1
+
+const100: ; 100
+    .db $00, $82, $10, $00, $00, $00, $00, $00, $00 ; 1E2
+
+const1EM8: ; 1E-8
+    .db $00, $78, $10, $00, $00, $00, $00, $00, $00 ; 1E-8
+
+constPi: ; 3.14159265358979323846264338327950
+    .db $00, $80, $31, $41, $59, $26, $53, $58, $98 ; 3.1415926535898
+
+constEuler: ; 2.71828182845904523536028747135266
+    .db $00, $80, $27, $18, $28, $18, $28, $45, $90 ; 2.718281828459
+
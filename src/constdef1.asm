@@ -0,0 +1,63 @@
+;-----------------------------------------------------------------------------
+; Floating point constants for routines in Flash Page 1, generated from
+; constdef.txt.
+;
+; There are 2 sections:
+; - list of 'opNSetX' loader routines
+; - table of 9-byte TI-OS floating point constants
+;
+; DO NOT EDIT: This file was autogenerated.
+;-----------------------------------------------------------------------------
+
+; Description: Set OP1 to 0.
+; Destroys: all, HL
+op1Set0PageOne:
+    ld hl, const0PageOne
+    jp move9ToOp1PageOne
+
+; Description: Set OP2 to 0.
+; Destroys: all, HL
+op2Set0PageOne:
+    ld hl, const0PageOne
+    jp move9ToOp2PageOne
+
+; Description: Set OP4 to 0.
+; Destroys: all, HL
+op4Set0PageOne:
+    ld hl, const0PageOne
+    jp move9ToOp4PageOne
+
+; Description: Set OP2 to 100.
+; Destroys: all, HL
+op2Set100PageOne:
+    ld hl, const100PageOne
+    jp move9ToOp2PageOne
+
+; Description: Set OP2 to 2^16.
+; Destroys: all, HL
+op2Set2Pow16PageOne:
+    ld hl, const2Pow16PageOne
+    jp move9ToOp2PageOne
+
+; Description: Set OP3 to 6.9314718055995E-1.
+; Destroys: all, HL
+op3SetLn2PageOne:
+    ld hl, constLn2PageOne
+    jp move9ToOp3PageOne
+
+;-----------------------------------------------------------------------------
+
+constCountPageOne equ 4 ; number of constants
+
+const0PageOne: ; 0
+    .db $00, $80, $00, $00, $00, $00, $00, $00, $00 ; 0
+
+const100PageOne: ; 100
+    .db $00, $82, $10, $00, $00, $00, $00, $00, $00 ; 1E2
+
+const2Pow16PageOne: ; 2^16
+    .db $00, $84, $65, $53, $60, $00, $00, $00, $00 ; 6.5536E4
+
+constLn2PageOne: ; 0.69314718055994530941723212145818
+    .db $00, $7F, $69, $31, $47, $18, $05, $59, $95 ; 6.9314718055995E-1
+
@@ -0,0 +1,162 @@
+;-----------------------------------------------------------------------------
+; Floating point constants for routines in Flash Page 2, generated from
+; constdef.txt.
+;
+; There are 2 sections:
+; - list of 'opNSetX' loader routines
+; - table of 9-byte TI-OS floating point constants
+;
+; DO NOT EDIT: This file was autogenerated.
+;-----------------------------------------------------------------------------
+
+; Description: Set OP1 to -50.
+; Destroys: all, HL
+op1SetM50PageTwo:
+    ld hl, constM50PageTwo
+    jp move9ToOp1PageTwo
+
+; Description: Set OP1 to 0.
+; Destroys: all, HL
+op1Set0PageTwo:
+    ld hl, const0PageTwo
+    jp move9ToOp1PageTwo
+
+; Description: Set OP2 to 1E-10.
+; Destroys: all, HL
+op2Set1EM10PageTwo:
+    ld hl, const1EM10PageTwo
+    jp move9ToOp2PageTwo
+
+; Description: Set OP2 to 6E-5.
+; Destroys: all, HL
+op2Set6EM5PageTwo:
+    ld hl, const6EM5PageTwo
+    jp move9ToOp2PageTwo
+
+; Description: Set OP2 to 1.
+; Destroys: all, HL
+op2Set1PageTwo:
+    ld hl, const1PageTwo
+    jp move9ToOp2PageTwo
+
+; Description: Set OP1 to 7.
+; Destroys: all, HL
+op1Set7PageTwo:
+    ld hl, const7PageTwo
+    jp move9ToOp1PageTwo
+
+; Description: Set OP2 to 7.
+; Destroys: all, HL
+op2Set7PageTwo:
+    ld hl, const7PageTwo
+    jp move9ToOp2PageTwo
+
+; Description: Set OP2 to 12.
+; Destroys: all, HL
+op2Set12PageTwo:
+    ld hl, const12PageTwo
+    jp move9ToOp2PageTwo
+
+; Description: Set OP2 to 24.
+; Destroys: all, HL
+op2Set24PageTwo:
+    ld hl, const24PageTwo
+    jp move9ToOp2PageTwo
+
+; Description: Set OP1 to 100.
+; Destroys: all, HL
+op1Set100PageTwo:
+    ld hl, const100PageTwo
+    jp move9ToOp1PageTwo
+
+; Description: Set OP2 to 100.
+; Destroys: all, HL
+op2Set100PageTwo:
+    ld hl, const100PageTwo
+    jp move9ToOp2PageTwo
+
+; Description: Set OP2 to 3600.
+; Destroys: all, HL
+op2Set3600PageTwo:
+    ld hl, const3600PageTwo
+    jp move9ToOp2PageTwo
+
+; Description: Set OP2 to 2^32.
+; Destroys: all, HL
+op2Set2Pow32PageTwo:
+    ld hl, const2Pow32PageTwo
+    jp move9ToOp2PageTwo
+
+; Description: Set OP2 to 2^39.
+; Destroys: all, HL
+op2Set2Pow39PageTwo:
+    ld hl, const2Pow39PageTwo
+    jp move9ToOp2PageTwo
+
+; Description: Set OP2 to 2^40.
+; Destroys: all, HL
+op2Set2Pow40PageTwo:
+    ld hl, const2Pow40PageTwo
+    jp move9ToOp2PageTwo
+
+; Description: Set OP2 to 1E14.
+; Destroys: all, HL
+op2Set1E14PageTwo:
+    ld hl, const1E14PageTwo
+    jp move9ToOp2PageTwo
+
+; Description: Set OP1 to 9.9999999999999E99.
+; Destroys: all, HL
+op1SetMaxFloatPageTwo:
+    ld hl, constMaxFloatPageTwo
+    jp move9ToOp1PageTwo
+
+;-----------------------------------------------------------------------------
+
+constCountPageTwo equ 15 ; number of constants
+
+constM50PageTwo: ; -50
+    .db $80, $81, $50, $00, $00, $00, $00, $00, $00 ; -5E1
+
+const0PageTwo: ; 0
+    .db $00, $80, $00, $00, $00, $00, $00, $00, $00 ; 0
+
+const1PageTwo: ; 1
+    .db $00, $80, $10, $00, $00, $00, $00, $00, $00 ; 1
+
+const7PageTwo: ; 7
+    .db $00, $80, $70, $00, $00, $00, $00, $00, $00 ; 7
+
+const12PageTwo: ; 12
+    .db $00, $81, $12, $00, $00, $00, $00, $00, $00 ; 1.2E1
+
+const24PageTwo: ; 24
+    .db $00, $81, $24, $00, $00, $00, $00, $00, $00 ; 2.4E1
+
+const100PageTwo: ; 100
+    .db $00, $82, $10, $00, $00, $00, $00, $00, $00 ; 1E2
+
+const3600PageTwo: ; 3600
+    .db $00, $83, $36, $00, $00, $00, $00, $00, $00 ; 3.6E3
+
+const1EM10PageTwo: ; 1E-10
+    .db $00, $76, $10, $00, $00, $00, $00, $00, $00 ; 1E-10
+
+const6EM5PageTwo: ; 6E-5
+    .db $00, $7B, $60, $00, $00, $00, $00, $00, $00 ; 6E-5
+
+const1E14PageTwo: ; 1E14
+    .db $00, $8E, $10, $00, $00, $00, $00, $00, $00 ; 1E14
+
+const2Pow32PageTwo: ; 2^32
+    .db $00, $89, $42, $94, $96, $72, $96, $00, $00 ; 4.294967296E9
+
+const2Pow39PageTwo: ; 2^39
+    .db $00, $8B, $54, $97, $55, $81, $38, $88, $00 ; 5.49755813888E11
+
+const2Pow40PageTwo: ; 2^40
+    .db $00, $8C, $10, $99, $51, $16, $27, $77, $60 ; 1.099511627776E12
+
+constMaxFloatPageTwo: ; 9.9999999999999E99
+    .db $00, $E3, $99, $99, $99, $99, $99, $99, $99 ; 9.9999999999999E99
+
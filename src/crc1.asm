@@ -4,6 +4,23 @@
 ;
 ; CRC16 algorithm.
 ;
+; There are 3 versions. Each can be selected by passing the appropriate `-D`
+; flag to `spasm` in the Makefile:
+;
+; - (default) bit-by-bit version, no lookup table
+;   - about 458 T-states per byte
+; - USE_CRC16_TABLE16
+;   - one nibble at a time, using the 16-entry (32 bytes) crc16NibbleTable
+;   - about 379 T-states per byte
+; - USE_CRC16_TABLE256
+;   - one byte at a time, using the 256-entry (512 bytes) crc16TableHigh and
+;   crc16TableLow
+;   - about 122 T-states per byte
+;
+; The lookup tables are generated into crc16table.asm by the gencrc16.py
+; script, which also verifies all 3 algorithms against the check value of
+; CRC16-CCITT, and prints the estimated T-states of each version.
+;
 ; This is now on Flash Page 1, since it is called only once upon startup and
 ; once during shutdown. Labels with Capital letters are intended to be exported
 ; to other flash pages and should be placed in the branch table on Flash Page
@@ -57,6 +74,112 @@
 ;    }
 ;    return crc & 0xffff;
 ; }
+#ifdef USE_CRC16_TABLE256
+Crc16ccitt:
+    ex de, hl ; DE=pointer to data
+    ld hl, $1D0F
+    jr crc16ccitt_char_next
+crc16ccitt_char_loop:
+    ; crc=(crc<<8) ^ table[(crc>>8) ^ char]
+    ld a, (de) ; A=(DE)=char
+    inc de
+    push de
+    xor h ; A=index=(crc>>8)^char
+    ld e, a
+    ld d, 0 ; DE=index
+    ld a, l ; A=low(crc)
+    ld hl, crc16TableHigh
+    add hl, de ; HL=&crc16TableHigh[index]
+    xor (hl) ; A=high(newCrc)
+    inc h ; HL=&crc16TableLow[index]
+    ld l, (hl) ; L=low(newCrc)
+    ld h, a ; HL=newCrc
+    pop de
+    dec bc
+crc16ccitt_char_next:
+    ld a, b
+    or c ; if BC==0: ZF=1
+    jr nz, crc16ccitt_char_loop
+    ex de, hl ; DE=CRC16
+    ret
+#else
+#ifdef USE_CRC16_TABLE16
+Crc16ccitt:
+    ex de, hl ; DE=pointer to data
+    ld hl, $1D0F
+    jr crc16ccitt_char_next
+crc16ccitt_char_loop:
+    ; Process the high nibble, then the low nibble, of each char:
+    ; crc=(crc<<4) ^ table[(crc>>12) ^ nibble]. The nibble update is inlined
+    ; twice to avoid the overhead of a 'call'.
+    ld a, (de) ; A=(DE)=char
+    inc de
+    push bc
+    push de
+    ld c, a ; C=char
+    xor h
+    rrca
+    rrca
+    rrca
+    rrca
+    and $0F ; A=index=(crc>>12)^(char>>4)
+    add hl, hl
+    add hl, hl
+    add hl, hl
+    add hl, hl ; HL=crc<<4
+    ex de, hl ; DE=crc<<4
+    ; HL=crc16NibbleTable+2*index, without using another register pair
+    add a, a
+    add a, crc16NibbleTable & $FF
+    ld l, a
+    adc a, crc16NibbleTable >> 8
+    sub l
+    ld h, a ; HL=&crc16NibbleTable[index]
+    ld a, (hl)
+    xor e
+    ld e, a
+    inc hl
+    ld a, (hl)
+    xor d
+    ld h, a
+    ld l, e ; HL=(crc<<4)^crc16NibbleTable[index]
+    ld a, h
+    rrca
+    rrca
+    rrca
+    rrca
+    xor c
+    and $0F ; A=index=(crc>>12)^(char&0xF)
+    add hl, hl
+    add hl, hl
+    add hl, hl
+    add hl, hl ; HL=crc<<4
+    ex de, hl ; DE=crc<<4
+    ; HL=crc16NibbleTable+2*index, without using another register pair
+    add a, a
+    add a, crc16NibbleTable & $FF
+    ld l, a
+    adc a, crc16NibbleTable >> 8
+    sub l
+    ld h, a ; HL=&crc16NibbleTable[index]
+    ld a, (hl)
+    xor e
+    ld e, a
+    inc hl
+    ld a, (hl)
+    xor d
+    ld h, a
+    ld l, e ; HL=(crc<<4)^crc16NibbleTable[index]
+    pop de
+    pop bc
+    dec bc
+crc16ccitt_char_next:
+    ld a, b
+    or c ; if BC==0: ZF=1
+    jr nz, crc16ccitt_char_loop
+    ex de, hl ; DE=CRC16
+    ret
+#else
 Crc16ccitt:
     ex de, hl ; DE=pointer to data
     ld hl, $1D0F
@@ -93,3 +216,5 @@ crc16ccitt_char_next:
     jr nz, crc16ccitt_char_loop
     ex de, hl ; DE=CRC16
     ret
+#endif
+#endif
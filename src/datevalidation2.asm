@@ -63,7 +63,8 @@ ValidateDate:
 validateDateErr:
     bcall(_ErrInvalid)
 
-; Description: Return the max number of days for given month.
+; Description: Return the max number of days for given month, from the
+; maxDaysForMonth table in calendar2.asm.
 ; Input: A=month-1
 ; Output: A=maxDays
 ; Preserves: BC, DE, HL
@@ -79,21 +80,6 @@ getMaxDaysForMonth:
     pop hl
     ret
 
-; Description: Table of the maximum number of days for each month.
-maxDaysForMonth:
-    .db 31 ; Jan
-    .db 29 ; Feb
-    .db 31 ; Mar
-    .db 30 ; Apr
-    .db 31 ; May
-    .db 30 ; Jun
-    .db 31 ; Jul
-    .db 31 ; Aug
-    .db 30 ; Sep
-    .db 31 ; Oct
-    .db 30 ; Nov
-    .db 31 ; Dec
-
 ;-----------------------------------------------------------------------------
 
 ; Description: Validate the Time components (h,m,s) of the Time{} record in HL.
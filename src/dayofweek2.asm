@@ -14,7 +14,7 @@
 ; (RpnDate, RpnDateTime, RpnOffsetDateTime).
 ; Input: OP1:RpnDate|RpnDateTime|RpnOffsetDateTime=date
 ; Output: OP1:RpnDayOfWeek=dow
-; Destroys: all, OP3-OP5
+; Destroys: all
 RpnDateToDayOfWeek:
     ld hl, OP1+rpnObjectTypeSizeOf ; skip type byte
     call dateToDayOfWeekNumber ; A=[1,7]
@@ -32,30 +32,64 @@ convertAToRpnDayOfWeek:
     ret
 
 ; Description: Convert Date record to the ISO dayOfWeekNumber (1=Monday,
-; 7=Sunday).
-; Input: HL:DayOfWeek=dayOfWeek
+; 7=Sunday). Uses the dayOfWeekMonthOffsets table from calendar2.asm to
+; calculate dow=(y + y/4 - y/100 + y/400 + offset[month-1] + day) % 7 with
+; 16-bit arithmetic, where y is the year minus 1 for Jan and Feb, and dow=0 is
+; Sunday. The sum is at most 12460 for years 1-9999, so it fits in a u16.
+; Input: HL:Date=date
 ; Output: A:u8=dayOfWeekNumber [1-7]
-; Destroys: OP3-OP5
+; Destroys: BC, DE, HL
 dateToDayOfWeekNumber:
-    ex de, hl ; DE=inputDate
-    ld hl, OP3
-    call dateToInternalEpochDays ; HL=OP3=epochDays
-    ex de, hl ; DE=OP3=epochDays
+    ld c, (hl)
+    inc hl
+    ld b, (hl) ; BC=year
+    inc hl
+    ld d, (hl) ; D=month
+    inc hl
+    ld e, (hl) ; E=day
+    ld l, c
+    ld h, b ; HL=year
+    ld a, d ; A=month
+    call yearToYearPrime ; HL=y=yearPrime
+    ; sum=y+y/4
+    ld c, l
+    ld b, h ; BC=y
+    srl h
+    rr l
+    srl h
+    rr l ; HL=y/4
+    push hl ; stack=[y/4]
+    add hl, bc ; HL=sum=y+y/4
+    ex (sp), hl ; stack=[sum]; HL=y/4
+    ; y/100=(y/4)/25, y/400=(y/100)/4
+    ld c, 25
+    call divHLByCPageTwo ; HL=y/100
+    ld c, l
+    ld b, h ; BC=y/100
+    srl h
+    rr l
+    srl h
+    rr l ; HL=y/400
+    or a ; CF=0
+    sbc hl, bc ; HL=y/400-y/100, negative
+    pop bc ; stack=[]; BC=sum
+    add hl, bc ; HL=sum=y+y/4-y/100+y/400
+    ; sum+=offset[month-1]+day
+    push hl ; stack=[sum]
+    ld a, d ; A=month
+    dec a ; A=month-1
+    ld hl, dayOfWeekMonthOffsets
+    call addHLByAPageTwo ; HL=dayOfWeekMonthOffsets+month-1
+    ld a, (hl) ; A=offset
+    add a, e ; A=offset+day
+    pop hl ; stack=[]; HL=sum
+    call addHLByAPageTwo ; HL=sum+offset+day
+    ld c, 7
+    call divHLByCPageTwo ; A=dow=sum%7, 0=Sunday
+    ; Convert Sunday=0 to the ISO Sunday=7.
+    or a
+    ret nz
     ld a, 7
-    ld hl, OP4
-    call setU40ToA ; OP4=7
-    ex de, hl ; HL=OP3=epochDays; DE=OP4=7
-    ld bc, OP5 ; BC=OP5=remainder
-    call divI40U40 ; HL=quotient; BC=remainder ; TODO: create modU40U40()
-    ld a, (bc) ; A=remainder=0-6
-    ; 2000-01-01 is epoch 0, so returns 0, but it was a Sat, so should be a 6.
-    ; Readjust the result modulo 7 to conform to ISO weekday numbering.
-    add a, 5
-    cp 7
-    jr c, dateToDayOfWeekNumberEnd
-    sub 7
-dateToDayOfWeekNumberEnd:
-    inc a
     ret
 
 ;-----------------------------------------------------------------------------
@@ -754,12 +754,21 @@ displayMenu:
     ret z
     ; get starting menuId
     res fracDrawLFont, (iy + fontFlags) ; use small font
+#ifndef USE_MENU_ROW_MASKS
     bcall(_GetCurrentMenuRowBeginId) ; HL=rowMenuId
+#endif
     ; set up loop over 5 consecutive menu buttons
     ld e, 0 ; E = menuIndex [0,4]
     ld c, menuPenCol0 ; C = penCol
     ld b, 5 ; B = loop 5 times
 displayMenuLoop:
+#ifdef USE_MENU_ROW_MASKS
+    ; The menuIds of a row are not consecutive if it contains blank buttons.
+    push de ; stack=[menuIndex]
+    ld a, e ; A=menuIndex
+    bcall(_GetMenuIdOfButton) ; HL=menuId; preserves BC
+    pop de ; stack=[]; E=menuIndex
+#endif
     push hl ; stack=[menuId]
     call getMenuName ; HL:(const char*)=menuName; A=numRows
     bcall(_PrintMenuNameAtC) ; preserves A, BC, DE
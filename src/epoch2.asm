@@ -128,8 +128,8 @@ dateToInternalEpochDays:
     ld hl, dateToEpochP1
     call setU40ToBC ; HL=P1=era
     ex de, hl
-    ld a, 2
-    ld bc, 15025 ; ABC=146097
+    ld a, daysPer400YearsHigh
+    ld bc, daysPer400YearsLow ; ABC=146097
     ld hl, dateToEpochP2
     call setU40ToABC ; HL=P2=146097
     call multU40U40 ; HL=P2=146097*era
@@ -142,8 +142,8 @@ dateToInternalEpochDays:
     ;       =-(2000/400)*146097 + 60
     ;       =-730425
     ;       =-(11*65536+9529)
-    ld a, 11
-    ld bc, 9529
+    ld a, internalEpochOffsetHigh
+    ld bc, internalEpochOffsetLow
     ld hl, dateToEpochP1
     call setU40ToABC ; HL=P1=730425
     ; epochDays=dayOfEpochPrime-offset
@@ -181,17 +181,19 @@ monthToMonthPrime:
     add a, 12
     ret
 
-; Description: Return the number of days until given monthPrime.
+; Description: Return the number of days until given monthPrime, using the
+; daysBeforeMonthPrime table instead of calculating (153*monthPrime+2)/5.
 ; Input: HL=monthPrime
 ; Output: HL=daysUntilMonthPrime=(153*monthPrime+2)/5
 ; Destroys: DE
 daysUntilMonthPrime:
-    ld bc, 153
-    call multHLByBCPageTwo ; HL=monthPrime*153
+    add hl, hl ; HL=2*monthPrime
+    ld de, daysBeforeMonthPrime
+    add hl, de ; HL=daysBeforeMonthPrime+2*monthPrime
+    ld e, (hl)
     inc hl
-    inc hl ; HL=monthPrime*153+2
-    ld c, 5
-    call divHLByCPageTwo ; HL=(153*monthPrime+2)/5
+    ld d, (hl)
+    ex de, hl ; HL=daysBeforeMonthPrime[monthPrime]
     ret
 
 ;-----------------------------------------------------------------------------
@@ -287,8 +289,8 @@ internalEpochDaysToDate:
     ld de, epochToDateP1
     call copyU40 ; DE=P1=epochDays
     ; offset= 730425
-    ld a, 11
-    ld bc, 9529
+    ld a, internalEpochOffsetHigh
+    ld bc, internalEpochOffsetLow
     ld hl, epochToDateP2
     call setU40ToABC ; HL=P2=730425
     ; dayOfEpochPrime = epochDays+offset
@@ -299,8 +301,8 @@ internalEpochDaysToDate:
     ; P3=dayOfEra=dayOfEpochPrime%146097;
     ; P2=146097
     ex de, hl ; DE=P1=dayOfEpochPrime
-    ld a, 2
-    ld bc, 15025 ; ABC=146097
+    ld a, daysPer400YearsHigh
+    ld bc, daysPer400YearsLow ; ABC=146097
     ld hl, epochToDateP2
     call setU40ToABC ; HL=P2=146097
     ex de, hl ; DE=P2=146097; HL=P1=dayOfEpochPrime
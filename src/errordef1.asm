@@ -0,0 +1,264 @@
+;-----------------------------------------------------------------------------
+; Error codes and error strings generated from errordef.txt.
+;
+; DO NOT EDIT: This file was autogenerated.
+;-----------------------------------------------------------------------------
+
+errorCodeOk equ 0                        ; TI-OS uses 0 as "success"?
+errorCodeOverflow equ 1
+errorCodeDivBy0 equ 2
+errorCodeSingularMat equ 3
+errorCodeDomain equ 4
+errorCodeIncrement equ 5
+errorCodeBreak equ 6
+errorCodeNon_Real equ 7
+errorCodeSyntax equ 8                    ; also triggered by ErrNonReal??
+errorCodeDataType equ 9                  ; also triggered by ErrNonReal??
+errorCodeArgument equ 10
+errorCodeDimMismatch equ 11
+errorCodeDimension equ 12
+errorCodeUndefined equ 13                ; system error "Undefined"
+errorCodeMemory equ 14
+errorCodeInvalid equ 15
+errorCode16 equ 16
+errorCode17 equ 17
+errorCode18 equ 18
+errorCode19 equ 19
+errorCode20 equ 20
+errorCodeStat equ 21
+errorCode22 equ 22
+errorCode23 equ 23
+errorCodeSignChange equ 24
+errorCodeIterations equ 25
+errorCodeBadGuess equ 26
+errorCodeStatPlot equ 27
+errorCodeTolTooSmall equ 28
+errorCode29 equ 29
+errorCode30 equ 30
+errorCodeLinkXmit equ 31
+errorCodeArchived equ 47
+errorCodeQuitApp equ 64                  ; Handler wants to Quit the App
+errorCodeClearScreen equ 65              ; Handler wants to clear screen
+errorCodeNotYet equ 66                   ; Handler not yet implemented
+errorCodeClearAgain equ 67               ; next CLEAR is CLST
+errorCodeRegsCleared equ 68              ; REGS cleared
+errorCodeRegsExpanded equ 69             ; REGS expanded
+errorCodeRegsShrunk equ 70               ; REGS shrunk
+errorCodeRegsUnchanged equ 71            ; REGS unchanged
+errorCodeStackCleared equ 72             ; Stack cleared
+errorCodeStackExpanded equ 73            ; Stack expanded
+errorCodeStackShrunk equ 74              ; Stack shrunk
+errorCodeStackUnchanged equ 75           ; Stack unchanged
+errorCodeStatCleared equ 76              ; STAT registers cleared
+errorCodeTvmStored equ 77                ; TVM value was stored
+errorCodeTvmRecalled equ 78              ; TVM value was recalled
+errorCodeTvmCalculated equ 79            ; TVM value was calculated
+errorCodeTvmCalculatedMultiple equ 80
+errorCodeTvmNoSolution equ 81            ; TVM value has no solution
+errorCodeTvmNotFound equ 82              ; TVM value could not be found
+errorCodeTvmIterations equ 83            ; Solver hit max iterations
+errorCodeTvmCleared equ 84               ; TVM vars cleared
+errorCodeTvmSolverReset equ 85           ; TVM Solver params reset
+errorCodeTzStored equ 86                 ; TZ stored
+errorCodeEpochStored equ 87              ; Epoch stored
+errorCodeClockSet equ 88                 ; RTC set
+errorCodeNoClock equ 89                  ; No Clock on 83+
+errorCodeCount equ 90 ; total number of error codes
+
+; Array of (char*) pointers to C strings, indexed by the error code. The codes
+; without a message point to the Default message.
+errorStrings:
+    .dw errorStrOk ; 0
+    .dw errorStrOverflow ; 1
+    .dw errorStrDivBy0 ; 2
+    .dw errorStrSingularMat ; 3
+    .dw errorStrDomain ; 4
+    .dw errorStrIncrement ; 5
+    .dw errorStrBreak ; 6
+    .dw errorStrNon_Real ; 7
+    .dw errorStrSyntax ; 8
+    .dw errorStrDataType ; 9
+    .dw errorStrArgument ; 10
+    .dw errorStrDimMismatch ; 11
+    .dw errorStrDimension ; 12
+    .dw errorStrUndefined ; 13
+    .dw errorStrMemory ; 14
+    .dw errorStrInvalid ; 15
+    .dw errorStrUnknown ; 16
+    .dw errorStrUnknown ; 17
+    .dw errorStrUnknown ; 18
+    .dw errorStrUnknown ; 19
+    .dw errorStrUnknown ; 20
+    .dw errorStrStat ; 21
+    .dw errorStrUnknown ; 22
+    .dw errorStrUnknown ; 23
+    .dw errorStrSignChange ; 24
+    .dw errorStrIterations ; 25
+    .dw errorStrBadGuess ; 26
+    .dw errorStrStatPlot ; 27
+    .dw errorStrTolTooSmall ; 28
+    .dw errorStrUnknown ; 29
+    .dw errorStrUnknown ; 30
+    .dw errorStrLinkXmit ; 31
+    .dw errorStrUnknown ; 32
+    .dw errorStrUnknown ; 33
+    .dw errorStrUnknown ; 34
+    .dw errorStrUnknown ; 35
+    .dw errorStrUnknown ; 36
+    .dw errorStrUnknown ; 37
+    .dw errorStrUnknown ; 38
+    .dw errorStrUnknown ; 39
+    .dw errorStrUnknown ; 40
+    .dw errorStrUnknown ; 41
+    .dw errorStrUnknown ; 42
+    .dw errorStrUnknown ; 43
+    .dw errorStrUnknown ; 44
+    .dw errorStrUnknown ; 45
+    .dw errorStrUnknown ; 46
+    .dw errorStrArchived ; 47
+    .dw errorStrUnknown ; 48
+    .dw errorStrUnknown ; 49
+    .dw errorStrUnknown ; 50
+    .dw errorStrUnknown ; 51
+    .dw errorStrUnknown ; 52
+    .dw errorStrUnknown ; 53
+    .dw errorStrUnknown ; 54
+    .dw errorStrUnknown ; 55
+    .dw errorStrUnknown ; 56
+    .dw errorStrUnknown ; 57
+    .dw errorStrUnknown ; 58
+    .dw errorStrUnknown ; 59
+    .dw errorStrUnknown ; 60
+    .dw errorStrUnknown ; 61
+    .dw errorStrUnknown ; 62
+    .dw errorStrUnknown ; 63
+    .dw errorStrQuitApp ; 64
+    .dw errorStrClearScreen ; 65
+    .dw errorStrNotYet ; 66
+    .dw errorStrClearAgain ; 67
+    .dw errorStrRegsCleared ; 68
+    .dw errorStrRegsExpanded ; 69
+    .dw errorStrRegsShrunk ; 70
+    .dw errorStrRegsUnchanged ; 71
+    .dw errorStrStackCleared ; 72
+    .dw errorStrStackExpanded ; 73
+    .dw errorStrStackShrunk ; 74
+    .dw errorStrStackUnchanged ; 75
+    .dw errorStrStatCleared ; 76
+    .dw errorStrTvmStored ; 77
+    .dw errorStrTvmRecalled ; 78
+    .dw errorStrTvmCalculated ; 79
+    .dw errorStrTvmCalculatedMultiple ; 80
+    .dw errorStrTvmNoSolution ; 81
+    .dw errorStrTvmNotFound ; 82
+    .dw errorStrTvmIterations ; 83
+    .dw errorStrTvmCleared ; 84
+    .dw errorStrTvmSolverReset ; 85
+    .dw errorStrTzStored ; 86
+    .dw errorStrEpochStored ; 87
+    .dw errorStrClockSet ; 88
+    .dw errorStrNoClock ; 89
+
+; Pool of C strings.
+errorStrUnknown:
+    .db "Err: UNKNOWN", 0
+errorStrOk:
+    .db "OK", 0
+errorStrOverflow:
+    .db "Err: Overflow", 0
+errorStrDivBy0:
+    .db "Err: Divide By 0", 0
+errorStrSingularMat:
+    .db "Err: Singularity", 0
+errorStrDomain:
+    .db "Err: Domain", 0
+errorStrIncrement:
+    .db "Err: Increment", 0
+errorStrBreak:
+    .db "Err: Break", 0
+errorStrNon_Real:
+    .db "Err: Non Real", 0
+errorStrSyntax:
+    .db "Err: Syntax", 0
+errorStrDataType:
+    .db "Err: Data Type", 0
+errorStrArgument:
+    .db "Err: Argument", 0
+errorStrDimMismatch:
+    .db "Err: Dim Mismatch", 0
+errorStrDimension:
+    .db "Err: Invalid Dim", 0
+errorStrUndefined:
+    .db "Err: Undefined", 0
+errorStrMemory:
+    .db "Err: Memory", 0
+errorStrInvalid:
+    .db "Err: Invalid", 0
+errorStrStat:
+    .db "Err: Stat", 0
+errorStrSignChange:
+    .db "Err: No Sign Change", 0
+errorStrIterations:
+    .db "Err: Iterations", 0
+errorStrBadGuess:
+    .db "Err: Bad Guess", 0
+errorStrStatPlot:
+    .db "Err: StatPlot", 0
+errorStrTolTooSmall:
+    .db "Err: Tol Not Met", 0
+errorStrLinkXmit:
+    .db "Err: In Xmit", 0
+errorStrArchived:
+    .db "Err: Archived", 0
+errorStrQuitApp:
+    .db "QUIT", 0
+errorStrClearScreen:
+    .db "Clear Screen", 0
+errorStrNotYet:
+    .db "Err: NOT YET", 0
+errorStrClearAgain:
+    .db "CLEAR Again to Clear Stack", 0
+errorStrRegsCleared:
+    .db "REGS Cleared", 0
+errorStrRegsExpanded:
+    .db "REGS Expanded", 0
+errorStrRegsShrunk:
+    .db "REGS Shrunk", 0
+errorStrRegsUnchanged:
+    .db "REGS Unchanged", 0
+errorStrStackCleared:
+    .db "Stack Cleared", 0
+errorStrStackExpanded:
+    .db "Stack Expanded", 0
+errorStrStackShrunk:
+    .db "Stack Shrunk", 0
+errorStrStackUnchanged:
+    .db "Stack Unchanged", 0
+errorStrStatCleared:
+    .db "STAT Cleared", 0
+errorStrTvmStored:
+    .db "TVM Stored", 0
+errorStrTvmRecalled:
+    .db "TVM Recalled", 0
+errorStrTvmCalculated:
+    .db "TVM Calculated", 0
+errorStrTvmCalculatedMultiple:
+    .db "TVM Calculated (Multiple)", 0
+errorStrTvmNoSolution:
+    .db "TVM No Solution", 0
+errorStrTvmNotFound:
+    .db "TVM Not Found", 0
+errorStrTvmIterations:
+    .db "TVM Iterations", 0
+errorStrTvmCleared:
+    .db "TVM Cleared", 0
+errorStrTvmSolverReset:
+    .db "TVM Solver Reset", 0
+errorStrTzStored:
+    .db "TZ Stored", 0
+errorStrEpochStored:
+    .db "Epoch Stored", 0
+errorStrClockSet:
+    .db "Clock Set", 0
+errorStrNoClock:
+    .db "Err: No Clock", 0
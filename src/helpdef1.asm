@@ -1,11 +1,7 @@
 ;-----------------------------------------------------------------------------
-; MIT License
-; Copyright (c) 2023 Brian T. Park
+; Online HELP strings generated from helpdef.txt.
 ;
-; Online HELP strings.
-;
-; Capitalized labels are intended to be exported to the branch table on flash
-; page 0. Lowercased labels are intended to be local to the current flash page.
+; DO NOT EDIT: This file was autogenerated.
 ;-----------------------------------------------------------------------------
 
 ; Array of (char*) pointers to C-strings.
@@ -36,7 +32,6 @@ helpPageCount equ (helpPagesEnd-helpPages)/2
 msgHelpPage1:
     .db escapeLargeFont, "RPN83P", Lenter
     .db escapeSmallFont, "v1.2.0", Shyphen, "dev (2025", Shyphen, "11", Shyphen, "14)", Senter
-    ;.db escapeSmallFont, "v1.1.1 (2025", Shyphen, "11", Shyphen, "14)", Senter
     .db "(c) 2023", Shyphen, "2025 Brian T. Park", Senter
     .db Senter
     .db "An RPN calculator for the", Senter
@@ -194,8 +189,8 @@ msgHelpPage14:
     .db escapeLargeFont, "BASE Ops", Lenter
     .db escapeSmallFont, "SL,SR: Shift Logical", Senter
     .db "ASR: Arithmetic Shift Right", Senter
-    .db "RL,RR: Rotate Circular",  Senter
-    .db "RLC,RRC: Rotate thru Carry",  Senter
+    .db "RL,RR: Rotate Circular", Senter
+    .db "RLC,RRC: Rotate thru Carry", Senter
     .db "REVB: Reverse Bits", Senter
     .db "CNTB: Count Bits", Senter
     .db "WSIZ: 8, 16, 24, 32", Senter
@@ -210,16 +205,16 @@ msgHelpPage15:
     .db "C/YR: Compoundings/year", Senter
     .db "BEG: Payments at begin", Senter
     .db "END: Payments at end", Senter
-    .db "CLTV: Clear TVM",  Senter
+    .db "CLTV: Clear TVM", Senter
     .db SlBrack, "15/20", SrBrack, " Any key to continue...", Senter
     .db 0
 
 msgHelpPage16:
     .db escapeLargeFont, "TVM Solver", Lenter
-    .db escapeSmallFont, "IYR1: I%YR guess 1",  Senter
-    .db "IYR2: I%YR guess 2",  Senter
-    .db "TMAX: Iteration max",  Senter
-    .db "RSTV: Reset TVM Solver",  Senter
+    .db escapeSmallFont, "IYR1: I%YR guess 1", Senter
+    .db "IYR2: I%YR guess 2", Senter
+    .db "TMAX: Iteration max", Senter
+    .db "RSTV: Reset TVM Solver", Senter
     .db Senter
     .db Senter
     .db Senter
@@ -243,7 +238,7 @@ msgHelpPage18:
     .db escapeSmallFont, "D{y,m,d}: Date", Senter
     .db "T{h,m,s}: Time", Senter
     .db "DT{D,T}: DateTime", Senter
-    .db "TZ{h,m}: TimeZone",  Senter
+    .db "TZ{h,m}: TimeZone", Senter
     .db "DZ{D,T,TZ}: ZonedDateTime", Senter
     .db "DW{dw}: DayOfWeek (Mon=1)", Senter
     .db "DR{d,h,m,s}: Duration", Senter
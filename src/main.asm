@@ -46,6 +46,9 @@ warmInit:
     bcall(_InitRegs)
     bcall(_InitStatRegs)
     bcall(_InitLastX)
+#ifdef USE_MENU_PROFILE
+    bcall(_OpenMenuProfile)
+#endif
 
     ; Initialize the App monitor so that we can intercept the Put Away (2ND
     ; OFF) signal.
@@ -68,6 +71,9 @@ mainExit:
     bcall(_CloseRegs)
     bcall(_CloseStatRegs)
     bcall(_StoreAppState)
+#ifdef USE_MENU_PROFILE
+    bcall(_StoreMenuProfile)
+#endif
 
     ; Clean up the screen.
     set appAutoScroll, (iy + appFlags)
@@ -23,9 +23,7 @@ processMainCommands:
     call APP_PUSH_ERRORH
     ; Dispatch to the handler for the given button, either the normal buttons
     ; or the menu F1-F5 buttons.
-    ld hl, keyCodeHandlerTable
-    ld b, keyCodeHandlerTableSize
-    call dispatchHandler
+    call keyCodeHandlerTableDispatch
     ; Uninstall error handler
     call APP_POP_ERRORH
 
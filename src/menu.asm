@@ -25,6 +25,7 @@
 ;   uint8_t numRows; // 0 if MenuItem; >=1 if MenuGroup
 ;   union {
 ;       uint16_t rowBeginId; // nodeId of the first node of first menu row
+;       MenuRowMasks *rowMasks; // if USE_MENU_ROW_MASKS
 ;       uint16_t altName; // alternate name string (if nameSelector!=NULL)
 ;   }
 ;   void *handler; // pointer to the handler function
@@ -33,6 +34,34 @@
 ;
 ; sizeof(MenuNode) == 13
 ;
+; If USE_MENU_ROW_MASKS is defined, menudef.asm must be generated with
+; `compilemenu.py --layout rowmask`, which elides the blank MenuNodes of the
+; partial MenuRows. A MenuRow then contains 0 to 5 MenuNodes, and the
+; MenuGroup points to the following structure instead of the rowBeginId:
+;
+; struct MenuRowMasks {
+;   uint16_t rowBeginId; // nodeId of the first non-blank node of the group
+;   struct {
+;       uint8_t mask; // bit i is set if button i is not blank
+;       uint8_t offset; // number of non-blank nodes in the previous rows
+;   } rows[numRows];
+; };
+;
+; A blank button resolves to the mNull node.
+;
+; If USE_MENU_ALT_TABLE is defined, menudef.asm must be generated with
+; `compilemenu.py --alt-table`. The nameSelector field is removed from the
+; MenuNode, so sizeof(MenuNode) == 11, and the MenuItemAlt nodes are marked by
+; setting bit 15 of their 'name' pointer (menuNameAltFlag), which is always 0
+; for a pointer into the flash page at $4000-$7FFF. Their altName and
+; nameSelector are stored in the mMenuAltTable, sorted by id:
+;
+; struct MenuAlt {
+;   uint16_t id; // id of the MenuItemAlt
+;   uint16_t altName; // alternate name string
+;   void *nameSelector; // function that selects between 2 menu names
+; };
+;
 ;-----------------------------------------------------------------------------
 
 ; Offsets into the MenuNode struct. Intended to be used as offset to the IX
@@ -42,10 +71,21 @@ menuNodeFieldParentId equ 2
 menuNodeFieldName equ 4
 menuNodeFieldNumRows equ 6
 menuNodeFieldRowBeginId equ 7
+menuNodeFieldRowMasks equ 7
 menuNodeFieldAltName equ 7
 menuNodeFieldHandler equ 9
 menuNodeFieldNameSelector equ 11
 
+; Flag in the MenuNode.name field of the MenuItemAlt nodes, if
+; USE_MENU_ALT_TABLE.
+menuNameAltFlag equ $8000
+menuNameAltBit equ 7 ; bit of the high byte of MenuNode.name
+
+; Size of and offsets into the MenuAlt struct, if USE_MENU_ALT_TABLE.
+menuAltSize equ 6
+menuAltFieldAltName equ 2
+menuAltFieldNameSelector equ 4
+
 ;-----------------------------------------------------------------------------
 ; These routines cannot be moved into menu3.asm because they invoke callback
 ; functions which are defined on Flash Page 0.
@@ -114,6 +154,9 @@ getMenuNameFind:
 ; Destroys: A, B, C, DE, HL, IX
 dispatchMenuNode:
     bcall(_GetMenuNodeHandler) ; A=numRows; DE=handler; IX=menuNode; HL=HL
+#ifdef USE_MENU_PROFILE
+    bcall(_CountMenuNode) ; preserves all registers
+#endif
     ; Invoke a MenuItem.
     or a ; if numRows == 0: ZF=1 (i.e. a MenuItem)
     jp z, jumpDE ; Invoke menuHandler().
@@ -136,6 +179,9 @@ dispatchMenuNode:
 ; Destroys: B
 dispatchMenuNodeWithJumpBack:
     bcall(_GetMenuNodeHandler) ; A=numRows; DE=handler; IX=menuNode; HL=HL
+#ifdef USE_MENU_PROFILE
+    bcall(_CountMenuNode) ; preserves all registers
+#endif
     ; Invoke a MenuItem.
     or a ; if numRows == 0: ZF=1 (i.e. a MenuItem)
     jp z, jumpDE ; Invoke menuHandler().
@@ -195,58 +241,13 @@ exitMenuGroupToParent:
     ; Get target groupId and rowIndex of the parent group.
     push hl ; stack=[childId]
     bcall(_GetMenuNodeParent) ; A=numRows; DE=parentId; IX=menuNode
-    ex de, hl ; HL=parentId
-    push hl ; stack=[childId,parentId]
-    bcall(_GetMenuNodeRowBeginId) ; A=numRows; DE=rowBeginId; IX=parentMenuNode
     ; Deduce the parent's rowIndex which matches the childId.
-    pop hl ; stack=[childId]; HL=parentId
-    ex (sp), hl ; stack=[parentId]; HL=childId
-    call deduceRowIndex ; A=rowIndex
+    pop hl ; stack=[]; HL=childId
+    push de ; stack=[parentId]
+    bcall(_GetMenuRowIndexOfChild) ; A=rowIndex
     pop hl ; stack=[]; HL=parentId
     jr changeMenuGroup
 
-; Description: Deduce the rowIndex location of the childId (HL) within a parent
-; menuGroup that contains parentNumRows (B) which begin with parentRowBeginId
-; (DE). The formula is actually simple: `rowIndex = int((childId -
-; parentRowBeginId)/5)` but the problem is that the Z80 does not have a
-; hardware divison instruction. We could use one of the software divide
-; routines (e.g. divHLByCPageTwo()), but for this simple calculation, it's
-; easy enough to just loop through the 5 menu ids of each row until we find the
-; row that contains the childId.
-;
-; Input:
-;   - A=parentNumRows
-;   - DE=parentRowBeginId
-;   - HL=childId
-; Output:
-;    - A=rowIndex
-; Destroys: A, BC, DE
-; Preserves: HL
-deduceRowIndex:
-    ld b, a ; B=numRows
-    ld c, 0 ; C=rowIndex
-    ; begin with DE=rowId=parentRowBeginId
-deduceRowIndexLoop:
-    ; add 5 to DE=rowId to next rowBeginId
-    ld a, e
-    add a, 5
-    ld e, a
-    ld a, d
-    adc a, 0
-    ld d, a
-    ; check if childId is contained within the previous row
-    call cpHLDE ; if child<rowId: CF=1
-    jr c, deduceRowIndexEnd ; found if childId<rowId
-    inc c ; increment the candidate rowIndex
-    djnz deduceRowIndexLoop
-    ; We should never fall off the end of the loop, but if we do, set the
-    ; rowIndex to 0.
-    xor a
-    ret
-deduceRowIndexEnd:
-    ld a, c
-    ret
-
 ;-----------------------------------------------------------------------------
 
 ; Description: Change the current menu group to the target menuGroup and
@@ -157,6 +157,34 @@ getCurrentMenuArrowStatusCheckUp:
 ; Destroys: A, DE, HL, IX
 ; Preserves: BC
 GetMenuIdOfButton:
+#ifdef USE_MENU_ROW_MASKS
+    push bc ; stack=[BC]
+    ld c, a ; C=buttonIndex
+    ld hl, (currentMenuGroupId)
+    call findMenuNodeIX ; IX=menuNode; preserves BC
+    ld a, (currentMenuRowIndex)
+    call getMenuRowMask ; HL=rowMask; DE=rowBeginId
+    ld a, (hl) ; A=mask
+    inc hl
+    ld l, (hl)
+    ld h, 0 ; HL=offset
+    add hl, de ; HL=menuId of the first non-blank button of the row
+    ; Count the non-blank buttons to the left of the buttonIndex, leaving the
+    ; bit of the buttonIndex in CF.
+    ld b, c
+    inc b ; B=buttonIndex+1
+    jr getMenuIdOfButtonNext
+getMenuIdOfButtonCount:
+    jr nc, getMenuIdOfButtonNext
+    inc hl ; preserves CF
+getMenuIdOfButtonNext:
+    rrca ; CF=bit of the next button
+    djnz getMenuIdOfButtonCount
+    pop bc ; stack=[]; BC=BC
+    ret c
+    ld hl, mNullId ; blank button
+    ret
+#else
     ld e, a
     ld d, 0
     push de ; stack=[buttonIndex]
@@ -164,10 +192,13 @@ GetMenuIdOfButton:
     pop de
     add hl, de ; HL=menuId
     ret
+#endif
 
 ; Description: Return the node id of the first item in the menu row at
 ; `currentMenuRowIndex` of the `currentMenuGroupId`. The next 4 node
-; ids in sequential order define the other 4 menu buttons.
+; ids in sequential order define the other 4 menu buttons. (If
+; USE_MENU_ROW_MASKS, the node id of the first non-blank item, and the blank
+; buttons must be resolved using GetMenuIdOfButton().)
 ; Input:
 ;   - (currentMenuGroupId)
 ;   - (currentMenuRowIndex)
@@ -251,6 +282,14 @@ isChildOfMenuGroupTrue:
 ; Preserves: BC
 getMenuRowBeginId:
     call findMenuNodeIX ; IX=menuNode; preserves BC
+#ifdef USE_MENU_ROW_MASKS
+    call getMenuRowMask ; HL=rowMask; DE=rowBeginId
+    inc hl
+    ld l, (hl)
+    ld h, 0 ; HL=offset
+    add hl, de ; HL=rowMenuId=rowBeginId+offset
+    ret
+#else
     ld e, (ix + menuNodeFieldRowBeginId)
     ld d, (ix + menuNodeFieldRowBeginId + 1) ; DE=menuNode.rowBeginId
     ; Calc the rowMenuId at given rowIndex: rowMenuId=rowBeginId+5*rowIndex
@@ -263,21 +302,95 @@ getMenuRowBeginId:
     ; calc rowMenuId=rowBeginId+5*rowIndex
     add hl, de ; HL=rowMenuId=rowBeginId+5*rowIndex
     ret
+#endif
 
-; Description: Get the rowBeginId of the given MenuNode.
+#ifdef USE_MENU_ROW_MASKS
+; Description: Return the MenuRowMasks.rows[rowIndex] of the MenuGroup at IX.
 ; Input:
-;   - HL=menuNodeId
+;   - A=rowIndex
+;   - IX=menuNode
 ; Output:
-;   - A=numRows
 ;   - DE=rowBeginId
-;   - IX=menuNode
-; Destroys: A, DE, HL, IX
-; Preserves: BC
-GetMenuNodeRowBeginId:
-    call findMenuNodeIX ; IX=menuNode; preserves BC
-    ld a, (ix + menuNodeFieldNumRows) ; A=numRows
+;   - HL=rowMask=pointer to the (mask, offset) of rowIndex
+; Destroys: A, DE, HL
+; Preserves: BC, IX
+getMenuRowMask:
+    ld l, (ix + menuNodeFieldRowMasks)
+    ld h, (ix + menuNodeFieldRowMasks + 1) ; HL=rowMasks
+    ld e, (hl)
+    inc hl
+    ld d, (hl) ; DE=rowBeginId
+    inc hl ; HL=rows
+    push de ; stack=[rowBeginId]
+    add a, a ; A=2*rowIndex
+    ld e, a
+    ld d, 0
+    add hl, de ; HL=rowMask
+    pop de ; stack=[]; DE=rowBeginId
+    ret
+#endif
+
+; Description: Deduce the rowIndex of the parent menuGroup (DE) which contains
+; the childId (HL). The formula is actually simple: `rowIndex =
+; int((childId - parentRowBeginId)/5)` but the problem is that the Z80 does not
+; have a hardware divison instruction. We could use one of the software divide
+; routines, but for this simple calculation, it's easy enough to just loop
+; through the 5 menu ids of each row until we find the row that contains the
+; childId. If USE_MENU_ROW_MASKS, loop through the offsets of the rows instead.
+; Input:
+;   - DE=parentId
+;   - HL=childId
+; Output:
+;   - A=rowIndex
+; Destroys: A, BC, DE, HL, IX
+GetMenuRowIndexOfChild:
+    push hl ; stack=[childId]
+    ex de, hl ; HL=parentId
+    call findMenuNodeIX ; IX=parentMenuNode
+    ld b, (ix + menuNodeFieldNumRows) ; B=numRows
+    ld c, 0 ; C=rowIndex
+#ifdef USE_MENU_ROW_MASKS
+    xor a
+    call getMenuRowMask ; HL=rowMask of row 0; DE=rowBeginId
+    ex (sp), hl ; stack=[rowMask]; HL=childId
+    or a ; CF=0
+    sbc hl, de ; HL=childOffset=childId-rowBeginId, always < 256
+    ld a, l ; A=childOffset
+    pop hl ; stack=[]; HL=rowMask
+    inc hl ; HL=&rows[0].offset
+    dec b ; B=numRows-1
+    jr z, getMenuRowIndexOfChildEnd
+getMenuRowIndexOfChildLoop:
+    inc hl
+    inc hl ; HL=&rows[rowIndex+1].offset
+    cp (hl) ; CF=1 if childOffset<rows[rowIndex+1].offset
+    jr c, getMenuRowIndexOfChildEnd
+    inc c ; increment the candidate rowIndex
+    djnz getMenuRowIndexOfChildLoop
+#else
     ld e, (ix + menuNodeFieldRowBeginId)
-    ld d, (ix + menuNodeFieldRowBeginId + 1) ; DE=rowBeginId
+    ld d, (ix + menuNodeFieldRowBeginId + 1) ; DE=rowId=parentRowBeginId
+    pop hl ; stack=[]; HL=childId
+getMenuRowIndexOfChildLoop:
+    ; add 5 to DE=rowId to next rowBeginId
+    ld a, e
+    add a, 5
+    ld e, a
+    ld a, d
+    adc a, 0
+    ld d, a
+    ; check if childId is contained within the previous row
+    call cpHLDEPageThree ; if child<rowId: CF=1
+    jr c, getMenuRowIndexOfChildEnd ; found if childId<rowId
+    inc c ; increment the candidate rowIndex
+    djnz getMenuRowIndexOfChildLoop
+    ; We should never fall off the end of the loop, but if we do, set the
+    ; rowIndex to 0.
+    xor a
+    ret
+#endif
+getMenuRowIndexOfChildEnd:
+    ld a, c
     ret
 
 ;-----------------------------------------------------------------------------
@@ -337,6 +450,7 @@ findMenuNodeIX:
 
 ; Description: Return the byte offset of menuId into the the mMenuTable.
 ; The formula is: offset=menuId*sizeof(MenuNode)=menuId*13=menuId*0b1101
+; (If USE_MENU_ALT_TABLE: menuId*11=menuId*0b1011.)
 ; Input: HL=menuId
 ; Output: HL=offset
 ; Destroys: DE, HL
@@ -344,12 +458,21 @@ findMenuNodeIX:
 calcMenuNodeOffset:
     ld e, l
     ld d, h ; DE=HL
+#ifdef USE_MENU_ALT_TABLE
+    add hl, hl ; HL*0b0010
+    add hl, hl ; HL*0b0100
+    add hl, de ; HL*0b0101
+    add hl, hl ; HL*0b1010
+    add hl, de ; HL*0b1011
+    ret
+#else
     add hl, hl ; HL*0b0010
     add hl, de ; HL*0b0011
     add hl, hl ; HL*0b0110
     add hl, hl ; HL*0b1100
     add hl, de ; HL*0b1101
     ret
+#endif
 
 ;-----------------------------------------------------------------------------
 
@@ -378,6 +501,61 @@ calcMenuNodeOffset:
 ; Destroys: A, HL
 ; Preserves: BC, DE
 ExtractMenuNames:
+#ifdef USE_MENU_ALT_TABLE
+    ; Only the MenuItemAlt nodes have an altName and a nameSelector.
+    push hl ; stack=[menuId]
+    push de ; stack=[menuId,normalName]
+    call findMenuNodeIX ; IX=(MenuNode*); preserves BC
+    pop de ; stack=[menuId]; DE=normalName
+    ld l, (ix + menuNodeFieldName)
+    ld h, (ix + menuNodeFieldName + 1)
+    res menuNameAltBit, h ; HL=normalName
+    call extractMenuString ; (*DE)=normalName; preserves BC, DE, HL
+    pop hl ; stack=[]; HL=menuId
+    bit menuNameAltBit, (ix + menuNodeFieldName + 1) ; ZF=0 if MenuItemAlt
+    jr nz, extractMenuNamesAlt
+    ld a, (ix + menuNodeFieldNumRows) ; A=numRows
+    ld hl, 0 ; HL=nameSelector=NULL
+    ret
+extractMenuNamesAlt:
+    ; Find the MenuAlt of the menuId, which is known to exist.
+    push de ; stack=[normalName]
+    push bc ; stack=[normalName,altName]
+    ex de, hl ; DE=menuId
+    ld hl, mMenuAltTable
+    ld bc, menuAltSize-1
+extractMenuNamesAltLoop:
+    ld a, (hl)
+    inc hl ; HL=&menuAlt.id+1
+    cp e
+    jr nz, extractMenuNamesAltNext
+    ld a, (hl)
+    cp d
+    jr z, extractMenuNamesAltFound
+extractMenuNamesAltNext:
+    add hl, bc ; HL=next menuAlt
+    jr extractMenuNamesAltLoop
+extractMenuNamesAltFound:
+    inc hl
+    ld e, (hl)
+    inc hl
+    ld d, (hl) ; DE=altName
+    inc hl
+    ld a, (hl)
+    inc hl
+    ld h, (hl)
+    ld l, a ; HL=nameSelector
+    pop bc ; stack=[normalName]; BC=altName
+    push hl ; stack=[normalName,nameSelector]
+    ex de, hl ; HL=altName
+    ld e, c
+    ld d, b ; DE=altName
+    call extractMenuString ; (*DE)=altName
+    pop hl ; stack=[normalName]; HL=nameSelector
+    pop de ; stack=[]; DE=normalName
+    ld a, (ix + menuNodeFieldNumRows) ; A=numRows
+    ret
+#else
     push de ; stack=[normalName]
     push bc ; stack=[normalName,altName]
     call findMenuNodeIX ; IX=(MenuNode*)
@@ -401,6 +579,7 @@ ExtractMenuNames:
     ;
     pop bc ; stack=[]; BC=altname
     ret
+#endif
 
 ; Description: Copy the menu name identified by HL into the C-string buffer at
 ; DE. Copy at most 6 bytes include NUL (NOTE: Why? I think it's because the
@@ -56,6 +56,13 @@
 ;   https://www.cemetech.net/forum/viewtopic.php?p=307636 thread for various
 ;   ideas on improving this algorithm
 ;
+; - USE_PRIME_FACTOR_WHEEL (in addition to one of the USE_PRIME_FACTOR_MOD_XXX)
+;   - uses the wheel factorization tables in primewheel2.asm, generated by
+;   genprimewheel.py, instead of the (6n-1) and (6n+1) candidates
+;   - Estimated by the model in genprimewheel.py (15 MHz, modDEIXByBC, wheel
+;   of 210):
+;       - 65521*65521: 2.7 seconds (14980 instead of 21842 candidates)
+;
 ; The USE_PRIME_FACTOR_MOD_DEIX_BY_BC version is now 25X faster than the
 ; floating point version.
 ;
@@ -99,7 +106,11 @@ PrimeFactor:
     #ifdef USE_PRIME_FACTOR_INT
         jp primeFactorInt
     #else
-        jp primeFactorMod
+        #ifdef USE_PRIME_FACTOR_WHEEL
+            jp primeFactorWheel
+        #else
+            jp primeFactorMod
+        #endif
     #endif
 #endif
 
@@ -398,12 +409,102 @@ primeFactorModYes:
     bcall(_OP1Set1)
     ret
 primeFactorModNo:
+    ; If the candidate is the input itself (e.g. 5 or 7), then the input is a
+    ; prime. This happens only for small inputs, because the terminating
+    ; condition is checked only after a group of candidates.
+    ld hl, (OP1+2)
+    ld a, h
+    or l
+    jr nz, primeFactorModFactor
+    ld hl, (OP1)
+    or a ; CF=0
+    sbc hl, bc ; if x==candidate: ZF=1
+    jr z, primeFactorModYes
+primeFactorModFactor:
     ld (OP1), bc ; OP1=candidate
     ld hl, 0
     ld (OP1+2), hl
     call convertU32ToOP1 ; OP1=real(candidate)
     ret
 
+#ifdef USE_PRIME_FACTOR_WHEEL
+
+; Description: Determine if OP1 is a prime using the wheel factorization
+; tables generated into primewheel2.asm. The primes which generate the wheel
+; are checked first, then only the candidates which are coprime to those
+; primes, by adding the increments of primeWheelIncrements in a cycle. The
+; terminating condition is checked once per turn of the wheel. Like
+; primeFactorMod(), the candidate wraps around to 1 after 65535 (65537 is
+; coprime to every wheel size), which identifies the input as a prime.
+;
+; Input: OP1:real=an integer in the range of [2, 2^32-1].
+; Output: OP1:real=1 if prime, or the smallest prime factor if not
+; Destroys: all registers, OP1-OP3
+primeFactorWheel:
+    call pushRaw9Op1 ; FPS=[X]; HL=X
+    bcall(_SqRoot) ; OP1 = sqrt(OP1), uses OP1-OP3
+    bcall(_RndGuard)
+    bcall(_Trunc) ; OP1 = trunc(sqrt(X)), uses OP1,OP2
+    call convertOP1ToU32 ; OP1:u32=limit=sqrt(X)
+    call op1ToOp2PageTwo ; OP2:u32=limit
+    call popRaw9Op1 ; FPS=[]; OP1=X
+    call convertOP1ToU32 ; HL=OP1:u32=x
+    ; Check the primes which generate the wheel. The upper 16 bits of the
+    ; limit in OP2 are always 0, so OP2+2 holds the pointer into the table.
+    ld hl, primeWheelPrimes
+primeFactorWheelPrimesLoop:
+    ld c, (hl)
+    ld b, 0 ; BC=candidate
+    inc hl
+    ld (OP2+2), hl
+    ld a, c
+    ld hl, OP1
+    call cmpU32WithA ; if x==candidate: ZF=1
+    jr z, primeFactorModYes
+    call primeFactorModCheckDiv ; ZF=1 if remainder==0
+    jr z, primeFactorModNo
+    ld hl, (OP2+2)
+    ld a, (hl)
+    or a
+    jr nz, primeFactorWheelPrimesLoop
+primeFactorWheelSetup:
+    ld bc, primeWheelFirst ; BC=candidate
+    bcall(_RunIndicOn) ; enable run indicator
+    ; OP1:u32=x
+    ; OP2:u16=limit
+    ; OP2+2:u16=pointer to the increment
+    ; BC:u16=candidate
+primeFactorWheelTurn:
+    ld hl, primeWheelIncrements
+primeFactorWheelLoop:
+    ld (OP2+2), hl
+    ; Check for ON/Break
+    bit onInterrupt, (iy + onFlags)
+    jp nz, primeFactorBreak
+    call primeFactorModCheckDiv ; ZF=1 if remainder==0
+    jr z, primeFactorModNo
+    ; candidate+=increment
+    ld hl, (OP2+2)
+    ld a, (hl)
+    inc hl
+    add a, c
+    ld c, a
+    adc a, b
+    sub c
+    ld b, a
+    ; Continue until the 0 at the end of the increments.
+    ld a, (hl)
+    or a
+    jr nz, primeFactorWheelLoop
+    ; Terminate if all candidates have been checked.
+    ld hl, (OP2) ; HL=limit
+    or a ; clear CF
+    sbc hl, bc ; CF=1 if candidate>limit
+    jr nc, primeFactorWheelTurn
+    jp primeFactorModYes
+
+#endif
+
 ; Description: Check if `candidate` (BC) is an integer factor of `input` (OP1).
 ; Input:
 ;   - OP1:u32=x
@@ -0,0 +1,28 @@
+;-----------------------------------------------------------------------------
+; Wheel factorization tables of the USE_PRIME_FACTOR_WHEEL variant of
+; PrimeFactor() in prime2.asm, generated by genprimewheel.py.
+;
+; DO NOT EDIT: This file was autogenerated.
+;-----------------------------------------------------------------------------
+
+#ifdef USE_PRIME_FACTOR_WHEEL
+
+primeWheelSize equ 210
+
+; The primes which generate the wheel, checked before the wheel, terminated by
+; a 0.
+primeWheelPrimes:
+    .db 2, 3, 5, 7, 0
+
+; First candidate after the primes of the wheel.
+primeWheelFirst equ 11
+
+; Increments to the next candidate which is coprime to primeWheelSize, for one
+; turn of the wheel starting at primeWheelFirst, terminated by a 0.
+primeWheelIncrements:
+    .db 2, 4, 2, 4, 6, 2, 6, 4, 2, 4, 6, 6, 2, 6, 4, 2
+    .db 6, 4, 6, 8, 4, 2, 4, 2, 4, 8, 6, 4, 6, 2, 4, 6
+    .db 2, 6, 6, 4, 2, 4, 6, 2, 6, 4, 2, 4, 2, 10, 2, 10
+    .db 0
+
+#endif
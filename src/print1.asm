@@ -17,6 +17,8 @@
 ;   beginning of the next line.
 ;   - Supports inlined escape characters (escapeLargeFont, escapeSmallFont) to
 ;   change the font dynamically.
+;   - If HELP_DICTIONARY is defined by helpdef1.asm, expands the
+;   (escapeDictionary, index) pair into the phrase at helpDictionary[index].
 ;   - Automatically adjusts the line height to be 7px for small font and 8px
 ;   for large font.
 ;
@@ -30,6 +32,7 @@
 ; Destroys: all
 escapeLargeFont equ $FE ; pseudo-char to switch to large font
 escapeSmallFont equ $FF ; pseudo-char to switch to small font
+escapeDictionary equ $FD ; pseudo-char followed by the index of a phrase
 eVPutS:
     ; assume using small font
     ld c, smallFontHeight ; C = current font height
@@ -46,9 +49,32 @@ eVPutSCheckSpecialChars:
     jr z, eVPutSLargeFont
     cp a, escapeSmallFont ; check for small font
     jr z, eVPutSSmallFont
+#ifdef HELP_DICTIONARY
+    cp a, escapeDictionary ; check for dictionary phrase
+    jr z, eVPutSDictionary
+#endif
 eVPutSNormal:
     bcall(_VPutMap) ; preserves BC, HL
     jr eVPutSLoop
+#ifdef HELP_DICTIONARY
+eVPutSDictionary:
+    ld a, (hl) ; A = index of phrase
+    inc hl
+    push hl ; stack=[next char]
+    ld hl, helpDictionary
+    call getStringPageOne ; HL=phrase; preserves BC
+eVPutSDictionaryLoop:
+    ; The phrase contains only printable characters.
+    ld a, (hl)
+    inc hl
+    or a
+    jr z, eVPutSDictionaryEnd
+    bcall(_VPutMap) ; preserves BC, HL
+    jr eVPutSDictionaryLoop
+eVPutSDictionaryEnd:
+    pop hl ; stack=[]; HL=next char
+    jr eVPutSLoop
+#endif
 eVPutSLargeFont:
     ld c, largeFontHeight
     set fracDrawLFont, (iy + fontFlags) ; use large font
@@ -0,0 +1,212 @@
+;-----------------------------------------------------------------------------
+; MIT License
+; Copyright (c) 2025 Brian T. Park
+;
+; Usage profile of the menu nodes, which counts the number of times that each
+; menu node is dispatched by dispatchMenuNode() and
+; dispatchMenuNodeWithJumpBack(). These are not compiled into the app unless
+; the -DUSE_MENU_PROFILE flag is given to the spasm-ng assembler, and
+; menudef.asm was generated by 'compilemenu.py --profile'.
+;
+; The counters are stored directly in an AppVar named 'RPN83PRF', described by
+; the following C struct:
+;
+; struct MenuProfile {
+;   uint16_t size; // maintained by the TIOS
+;   struct RpnVarHeader header; // varType=rpnVarTypeMenuProfile,
+;       // schemaVersion=mMenuProfileSignature
+;   uint16_t count; // mMenuProfileCount
+;   uint16_t counters[count]; // indexed by menuId, saturated at $FFFF
+; };
+;
+; The CRC16 of the header is updated only by StoreMenuProfile() when the app
+; exits. The AppVar can be transferred to the host and decoded into a report by
+; tools/menuprofile.py.
+;
+; Labels with Capital letters are intended to be exported to other flash pages
+; and should be placed in the branch table on Flash Page 0. Labels with
+; lowercase letters are intended to be private so do not need a branch table
+; entry.
+;-----------------------------------------------------------------------------
+
+menuProfileName:
+    .db AppVarObj, "RPN83PRF" ; max 8 characters, NUL terminated if < 8
+
+; Offsets of the fields from the pointer returned by ChkFindSym().
+menuProfileFieldCrc16 equ 2
+menuProfileFieldAppId equ 4
+menuProfileFieldCount equ 10
+
+; Size of the AppVar, not including its 'size' field.
+menuProfileSize equ rpnVarHeaderSize + 2 + 2*mMenuProfileCount
+
+setMenuProfileName:
+    ld hl, menuProfileName
+    bcall(_Mov9ToOP1)
+    ret
+
+;-----------------------------------------------------------------------------
+
+; Description: Open the RPN83PRF AppVar. If it does not exist, or if it was
+; created for a different menu hierarchy, create a new one with all counters
+; set to 0. An archived AppVar is left alone, which disables the counters
+; until it is unarchived.
+; Destroys: all, OP1
+OpenMenuProfile:
+    call setMenuProfileName
+    bcall(_ChkFindSym) ; DE=pointer to data; B=romPage
+    jr c, openMenuProfileCreate ; if CF=1: not found
+    ld a, b
+    or a ; if archived: ZF=0
+    ret nz
+    ex de, hl ; HL=pointer to data
+    ld de, menuProfileSize
+    call cpMenuProfileField
+    jr nz, openMenuProfileDelete
+    inc hl
+    inc hl ; skip the CRC16
+    ld de, rpn83pAppId
+    call cpMenuProfileField
+    jr nz, openMenuProfileDelete
+    ld de, rpnVarTypeMenuProfile
+    call cpMenuProfileField
+    jr nz, openMenuProfileDelete
+    ld de, mMenuProfileSignature
+    call cpMenuProfileField
+    ret z
+openMenuProfileDelete:
+    call setMenuProfileName
+    bcall(_ChkFindSym)
+    bcall(_DelVarArc)
+openMenuProfileCreate:
+    call setMenuProfileName
+    ld hl, menuProfileSize
+    bcall(_CreateAppVar) ; DE=pointer to data
+    ex de, hl ; HL=pointer to data
+    inc hl
+    inc hl ; skip the size
+    ld de, 0
+    call setMenuProfileField ; crc16, updated by StoreMenuProfile()
+    ld de, rpn83pAppId
+    call setMenuProfileField
+    ld de, rpnVarTypeMenuProfile
+    call setMenuProfileField
+    ld de, mMenuProfileSignature
+    call setMenuProfileField
+    ld de, mMenuProfileCount
+    call setMenuProfileField
+    ; Clear the counters.
+    ld (hl), 0
+    ld d, h
+    ld e, l
+    inc de
+    ld bc, 2*mMenuProfileCount - 1
+    ldir
+    ret
+
+; Description: Compare the u16 field at HL with DE.
+; Input: HL=pointer to field; DE=expected
+; Output: ZF=1 if equal; HL=HL+2
+; Destroys: A
+cpMenuProfileField:
+    ld a, (hl)
+    inc hl
+    cp e
+    jr nz, cpMenuProfileFieldNotEqual
+    ld a, (hl)
+    inc hl
+    cp d
+    ret
+cpMenuProfileFieldNotEqual:
+    inc hl
+    ret
+
+; Description: Set the u16 field at HL to DE.
+; Output: HL=HL+2
+setMenuProfileField:
+    ld (hl), e
+    inc hl
+    ld (hl), d
+    inc hl
+    ret
+
+;-----------------------------------------------------------------------------
+
+; Description: Increment the counter of the given menu node, saturating at
+; $FFFF. Does nothing if the RPN83PRF AppVar does not exist, is archived, or if
+; the menuId is out of range. The AppVar is searched on every call because its
+; address changes when other variables are created or deleted.
+; Input: HL=menuId
+; Destroys: none
+CountMenuNode:
+    push af
+    push bc
+    push de
+    push hl
+    push ix
+    bcall(_PushRealO1) ; FPS=[OP1]
+    call setMenuProfileName
+    bcall(_ChkFindSym) ; DE=pointer to data; B=romPage
+    jr c, countMenuNodeEnd ; if CF=1: not found
+    ld a, b
+    or a ; if archived: ZF=0
+    jr nz, countMenuNodeEnd
+    ld hl, menuProfileFieldCount
+    add hl, de ; HL=pointer to count
+    ld c, (hl)
+    inc hl
+    ld b, (hl) ; BC=count
+    inc hl ; HL=pointer to counters
+    ex de, hl ; DE=pointer to counters
+    ; Retrieve the menuId saved on the stack, below IX.
+    ld hl, 2
+    add hl, sp ; HL=pointer to the saved menuId
+    ld a, (hl)
+    inc hl
+    ld h, (hl)
+    ld l, a ; HL=menuId
+    or a ; CF=0
+    sbc hl, bc ; if menuId<count: CF=1
+    jr nc, countMenuNodeEnd
+    add hl, bc ; HL=menuId
+    add hl, hl ; HL=2*menuId
+    add hl, de ; HL=pointer to counter
+    inc (hl)
+    jr nz, countMenuNodeEnd
+    inc hl
+    inc (hl)
+    jr nz, countMenuNodeEnd
+    ; Saturate at $FFFF.
+    dec (hl)
+    dec hl
+    dec (hl)
+countMenuNodeEnd:
+    bcall(_PopRealO1) ; FPS=[]; OP1=OP1
+    pop ix
+    pop hl
+    pop de
+    pop bc
+    pop af
+    ret
+
+;-----------------------------------------------------------------------------
+
+; Description: Update the CRC16 of the RPN83PRF AppVar. Called when the app
+; exits.
+; Destroys: all, OP1
+StoreMenuProfile:
+    call setMenuProfileName
+    bcall(_ChkFindSym) ; DE=pointer to data; B=romPage
+    ret c ; if CF=1: not found
+    ld a, b
+    or a ; if archived: ZF=0
+    ret nz
+    push de ; stack=[pointer to data]
+    ld hl, menuProfileFieldAppId
+    add hl, de ; HL=pointer to appId
+    ld bc, menuProfileSize - 2 ; don't include the CRC16 field itself
+    bcall(_Crc16ccitt) ; DE=crc16
+    pop hl ; stack=[]; HL=pointer to data
+    ld bc, menuProfileFieldCrc16
+    add hl, bc ; HL=pointer to crc16
+    jr setMenuProfileField
@@ -39,6 +39,8 @@ keyMenuSecond2 equ kTblSet
 keyMenuSecond3 equ kFormat
 keyMenuSecond4 equ kCalc
 keyMenuSecond5 equ kTable
+; ON key generates 00 as the key code.
+kOnExit equ 0
 
 ; Define font sizes
 smallFontHeight equ 7
@@ -134,6 +136,7 @@ rpn83pAppId equ $1E69
 rpnVarTypeAppState equ 0 ; app state, excluding RpnElements
 rpnVarTypeElementList equ 1 ; RpnElements, stack or storage registers
 rpnVarTypeFullState equ 2 ; all state including RpnElements (not implemented)
+rpnVarTypeMenuProfile equ 3 ; usage counters of the menu nodes (profile1.asm)
 
 ; Size of the common appVar header: crc16 + appId + varType + schemaVersion = 8
 rpnVarHeaderSize equ 8
@@ -881,7 +884,7 @@ defpage(0, "RPN83P")
 #include "rpnobject.asm"
 #include "conv.asm"
 #include "print.asm"
-#include "const.asm"
+#include "constdef.asm"
 #include "handlertab.asm"
 #include "arghandlertab.asm"
 #include "format.asm"
@@ -910,6 +913,7 @@ defpage(0, "RPN83P")
 ; - HMS routines (hms1.asm)
 ; - PROB routines (prob1.asm)
 ; - Debug print functions (included only if DEBUG defined)
+; - Menu usage profile (included only if USE_MENU_PROFILE defined)
 ;-----------------------------------------------------------------------------
 
 defpage(1)
@@ -924,10 +928,12 @@ defpage(1)
 #include "appstate1.asm"
 #include "osstate1.asm"
 #include "modes1.asm"
-#include "help1.asm"
+#include "helpdef1.asm"
 #include "helpscanner1.asm"
 #include "crc1.asm"
+#include "crc16table.asm"
 #include "errorcode1.asm"
+#include "errordef1.asm"
 #include "print1.asm"
 #include "input1.asm"
 #include "arg1.asm"
@@ -947,7 +953,7 @@ defpage(1)
 #include "integer1.asm"
 #include "rpnobject1.asm"
 #include "integerconv1.asm"
-#include "const1.asm"
+#include "constdef1.asm"
 #include "universal1.asm"
 #include "complex1.asm"
 #include "formatcomplex1.asm"
@@ -961,6 +967,10 @@ defpage(1)
 #include "debug1.asm"
 #endif
 
+#ifdef USE_MENU_PROFILE
+#include "profile1.asm"
+#endif
+
 ;-----------------------------------------------------------------------------
 ; Flash Page 2:
 ;
@@ -986,6 +996,7 @@ defpage(2)
 #include "selectepoch2.asm"
 #include "epoch2.asm"
 #include "datevalidation2.asm"
+#include "calendar2.asm"
 #include "date2.asm"
 #include "time2.asm"
 #include "dayofweek2.asm"
@@ -1008,13 +1019,14 @@ defpage(2)
 #include "display2.asm"
 #include "print2.asm"
 #include "memory2.asm"
-#include "const2.asm"
+#include "constdef2.asm"
 #include "integer2.asm"
 #include "rpnobject2.asm"
 #include "cstring2.asm"
 #include "common2.asm"
 
 #include "prime2.asm"
+#include "primewheel2.asm"
 #include "base2.asm"
 #include "integerconv32.asm"
 #include "formatinteger32.asm"
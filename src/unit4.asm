@@ -19,6 +19,18 @@
 ; }
 ; sizeof(UnitInfo) = 12
 ;
+; If unitdef.asm was generated with `compileunit.py --layout soa`, it defines
+; UNIT_LAYOUT_SOA and each field is stored in its own parallel array instead:
+;
+; const char* unitTypeNameTable[unitTypesCount]; // stride 2
+; uint8_t unitTypeBaseUnitIdTable[unitTypesCount]; // stride 1
+; const char* unitNameTable[unitsCount]; // stride 2
+; uint8_t unitTypeIdTable[unitsCount]; // stride 1
+; float unitScaleTable[unitsCount]; // stride 9, or 16 if UNIT_SCALE_STRIDE_16
+;
+; Each accessor then needs only a few shifts to calculate its offset, and
+; reads only the array that it needs.
+;
 ; Labels with Capital letters are intended to be exported to other flash pages
 ; and should be placed in the branch table on Flash Page 0. Labels with
 ; lowercase letters are intended to be private so do not need a branch table
@@ -34,6 +46,8 @@ unitInfoFieldName equ 0
 unitInfoFieldUnitTypeId equ 2
 unitInfoFieldScale equ 3
 
+#ifndef UNIT_LAYOUT_SOA
+
 ;-----------------------------------------------------------------------------
 ; UnitTypes
 ;-----------------------------------------------------------------------------
@@ -218,3 +232,126 @@ calcUnitInfoOffset:
     add hl, hl ; HL*0b1100
     pop de
     ret
+
+#else
+
+;-----------------------------------------------------------------------------
+; Units, struct of arrays layout (UNIT_LAYOUT_SOA)
+;-----------------------------------------------------------------------------
+
+; The accessors below calculate the offsets into the arrays using shifts, so
+; make sure that the strides generated in unitdef.asm match those shifts.
+#if unitNameStride != 2
+  .error "unitNameStride must be 2, see ExtractUnitName"
+#endif
+#if unitTypeIdStride != 1
+  .error "unitTypeIdStride must be 1, see GetUnitTypeId"
+#endif
+#if unitTypeBaseUnitIdStride != 1
+  .error "unitTypeBaseUnitIdStride must be 1, see GetUnitBaseId"
+#endif
+#ifdef UNIT_SCALE_STRIDE_16
+#if unitScaleStride != 16
+  .error "unitScaleStride must be 16, see GetUnitScale"
+#endif
+#else
+#if unitScaleStride != 9
+  .error "unitScaleStride must be 9, see GetUnitScale"
+#endif
+#endif
+
+; Description: Extract the name of the unit given in register A, and copy it
+; into the buffer given by HL. See the array of structs version above.
+; Input:
+;   - A:u8=unitId
+;   - HL:(const char*)=namebuf
+; Output:
+;   - HL:(const char*)=next char in namebuf
+; Destroys: A
+; Preserves: BC, DE, IX
+ExtractUnitName:
+    push de
+    push bc
+    ex de, hl ; DE=namebuf
+    ld l, a
+    ld h, 0
+    add hl, hl ; HL=unitId*2
+    ld bc, unitNameTable
+    add hl, bc ; HL=&unitNameTable[unitId]
+    ld a, (hl)
+    inc hl
+    ld h, (hl)
+    ld l, a ; HL=name
+    call copyCStringPageFour ; DE+=sizeof(name)
+    ex de, hl ; HL=nameBuf+sizeof(name)
+    pop bc
+    pop de
+    ret
+
+; Description: Return the unitTypeId of the unit given in register A.
+; Input:
+;   - A:u8=unitId
+; Output:
+;   - A:u8=unitTypeId
+; Destroys: A
+; Preserves: BC, DE, HL, IX
+GetUnitTypeId:
+    push hl
+    push de
+    ld hl, unitTypeIdTable
+    ld e, a
+    ld d, 0
+    add hl, de ; HL=&unitTypeIdTable[unitId]
+    ld a, (hl) ; A=unitTypeId
+    pop de
+    pop hl
+    ret
+
+; Description: Return the baseUnit of the unit given in register A.
+; Input:
+;   - A:u8=unitId
+; Output:
+;   - A:u8=baseUnitId
+; Preserves: BC, DE, HL, IX
+GetUnitBaseId:
+    push hl
+    push de
+    ld hl, unitTypeIdTable
+    ld e, a
+    ld d, 0
+    add hl, de ; HL=&unitTypeIdTable[unitId]
+    ld e, (hl) ; E=unitTypeId
+    ld hl, unitTypeBaseUnitIdTable
+    add hl, de ; HL=&unitTypeBaseUnitIdTable[unitTypeId]
+    ld a, (hl) ; A=baseUnitId
+    pop de
+    pop hl
+    ret
+
+; Description: Return the scale of the unit given in register A.
+; Input:
+;   - A:u8=unitId
+; Output:
+;   - OP1:Real=scale
+; Destroys: all
+GetUnitScale:
+    ld l, a
+    ld h, 0
+    add hl, hl ; HL=unitId*2
+    add hl, hl ; HL=unitId*4
+    add hl, hl ; HL=unitId*8
+#ifdef UNIT_SCALE_STRIDE_16
+    add hl, hl ; HL=unitId*16
+#else
+    ld e, a
+    ld d, 0
+    add hl, de ; HL=unitId*9
+#endif
+    ld de, unitScaleTable
+    add hl, de ; HL=&unitScaleTable[unitId]
+    ld de, OP1
+    ld bc, unitScaleSize
+    ldir
+    ret
+
+#endif
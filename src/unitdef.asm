@@ -186,17 +186,17 @@ unitTwipInfo:
 unitTwipId equ 14
     .dw unitTwipName ; name
     .db unitTypeLengthId ; unitTypeId
-    .db $00, $7B, $17, $63, $88, $88, $88, $88, $89 ; scale=17.638888888889e-6
+    .db $00, $7B, $17, $63, $88, $88, $88, $88, $89 ; scale=Inch/1440
 unitPointInfo:
 unitPointId equ 15
     .dw unitPointName ; name
     .db unitTypeLengthId ; unitTypeId
-    .db $00, $7C, $35, $27, $77, $77, $77, $77, $78 ; scale=0.35277777777778e-3
+    .db $00, $7C, $35, $27, $77, $77, $77, $77, $78 ; scale=Inch/72
 unitPicaInfo:
 unitPicaId equ 16
     .dw unitPicaName ; name
     .db unitTypeLengthId ; unitTypeId
-    .db $00, $7D, $42, $33, $33, $33, $33, $33, $33 ; scale=4.2333333333333e-3
+    .db $00, $7D, $42, $33, $33, $33, $33, $33, $33 ; scale=Point*12
 unitLightSecondInfo:
 unitLightSecondId equ 17
     .dw unitLightSecondName ; name
@@ -211,17 +211,17 @@ unitLightYearInfo:
 unitLightYearId equ 19
     .dw unitLightYearName ; name
     .db unitTypeLengthId ; unitTypeId
-    .db $00, $8F, $94, $60, $73, $04, $72, $58, $08 ; scale=9.4607304725808e15
+    .db $00, $8F, $94, $60, $73, $04, $72, $58, $08 ; scale=LightSecond*31557600
 unitParsecInfo:
 unitParsecId equ 20
     .dw unitParsecName ; name
     .db unitTypeLengthId ; unitTypeId
-    .db $00, $90, $30, $85, $67, $75, $81, $49, $13 ; scale=30856775814913673
+    .db $00, $90, $30, $85, $67, $75, $81, $49, $14 ; scale=30856775814913673
 unitFathomInfo:
 unitFathomId equ 21
     .dw unitFathomName ; name
     .db unitTypeLengthId ; unitTypeId
-    .db $00, $80, $18, $28, $80, $00, $00, $00, $00 ; scale=1.8288
+    .db $00, $80, $18, $28, $80, $00, $00, $00, $00 ; scale=Foot*6
 unitCableInfo:
 unitCableId equ 22
     .dw unitCableName ; name
@@ -236,7 +236,7 @@ unitSurveyFootInfo:
 unitSurveyFootId equ 24
     .dw unitSurveyFootName ; name
     .db unitTypeLengthId ; unitTypeId
-    .db $00, $7F, $30, $48, $00, $60, $96, $01, $22 ; scale=0.30480060960122
+    .db $00, $7F, $30, $48, $00, $60, $96, $01, $22 ; scale=1200/3937
 unitRodInfo:
 unitRodId equ 25
     .dw unitRodName ; name
@@ -256,7 +256,7 @@ unitSurveyMileInfo:
 unitSurveyMileId equ 28
     .dw unitSurveyMileName ; name
     .db unitTypeLengthId ; unitTypeId
-    .db $00, $83, $16, $09, $34, $72, $18, $69, $44 ; scale=1609.3472186944
+    .db $00, $83, $16, $09, $34, $72, $18, $69, $44 ; scale=6336000/3937
 unitLeagueInfo:
 unitLeagueId equ 29
     .dw unitLeagueName ; name
@@ -291,47 +291,47 @@ unitSqInchInfo:
 unitSqInchId equ 35
     .dw unitSqInchName ; name
     .db unitTypeAreaId ; unitTypeId
-    .db $00, $7C, $64, $51, $60, $00, $00, $00, $00 ; scale=6.4516e-4
+    .db $00, $7C, $64, $51, $60, $00, $00, $00, $00 ; scale=Inch^2
 unitSqFootInfo:
 unitSqFootId equ 36
     .dw unitSqFootName ; name
     .db unitTypeAreaId ; unitTypeId
-    .db $00, $7E, $92, $90, $30, $40, $00, $00, $00 ; scale=0.09290304
+    .db $00, $7E, $92, $90, $30, $40, $00, $00, $00 ; scale=Foot^2
 unitSqYardInfo:
 unitSqYardId equ 37
     .dw unitSqYardName ; name
     .db unitTypeAreaId ; unitTypeId
-    .db $00, $7F, $83, $39, $34, $24, $00, $00, $00 ; scale=0.83393424
+    .db $00, $7F, $83, $61, $27, $36, $00, $00, $00 ; scale=Yard^2
 unitSqMileInfo:
 unitSqMileId equ 38
     .dw unitSqMileName ; name
     .db unitTypeAreaId ; unitTypeId
-    .db $00, $86, $25, $89, $98, $81, $10, $33, $60 ; scale=2.589988110336e6
+    .db $00, $86, $25, $89, $98, $81, $10, $33, $60 ; scale=Mile^2
 unitSqNauticalMileInfo:
 unitSqNauticalMileId equ 39
     .dw unitSqNauticalMileName ; name
     .db unitTypeAreaId ; unitTypeId
-    .db $00, $86, $34, $29, $90, $40, $00, $00, $00 ; scale=3429904
+    .db $00, $86, $34, $29, $90, $40, $00, $00, $00 ; scale=NauticalMile^2
 unitSqRodInfo:
 unitSqRodId equ 40
     .dw unitSqRodName ; name
     .db unitTypeAreaId ; unitTypeId
-    .db $00, $81, $25, $29, $28, $52, $64, $00, $00 ; scale=25.29285264
+    .db $00, $81, $25, $29, $28, $52, $64, $00, $00 ; scale=Rod^2
 unitSqChainInfo:
 unitSqChainId equ 41
     .dw unitSqChainName ; name
     .db unitTypeAreaId ; unitTypeId
-    .db $00, $82, $40, $46, $85, $64, $22, $40, $00 ; scale=404.68564224
+    .db $00, $82, $40, $46, $85, $64, $22, $40, $00 ; scale=Chain^2
 unitSqFurlongInfo:
 unitSqFurlongId equ 42
     .dw unitSqFurlongName ; name
     .db unitTypeAreaId ; unitTypeId
-    .db $00, $84, $40, $46, $85, $64, $22, $40, $00 ; scale=40468.564224
+    .db $00, $84, $40, $46, $85, $64, $22, $40, $00 ; scale=Furlong^2
 unitAcreInfo:
 unitAcreId equ 43
     .dw unitAcreName ; name
     .db unitTypeAreaId ; unitTypeId
-    .db $00, $83, $40, $46, $85, $64, $22, $40, $00 ; scale=4046.8564224
+    .db $00, $83, $40, $46, $85, $64, $22, $40, $00 ; scale=Chain*Furlong
 unitHectareInfo:
 unitHectareId equ 44
     .dw unitHectareName ; name
@@ -341,12 +341,12 @@ unitUSFootballInfo:
 unitUSFootballId equ 45
     .dw unitUSFootballName ; name
     .db unitTypeAreaId ; unitTypeId
-    .db $00, $83, $44, $59, $34, $59, $20, $00, $00 ; scale=4.45934592e3
+    .db $00, $83, $44, $59, $34, $59, $20, $00, $00 ; scale=Yard*100*Foot*160
 unitCAFootballInfo:
 unitCAFootballId equ 46
     .dw unitCAFootballName ; name
     .db unitTypeAreaId ; unitTypeId
-    .db $00, $83, $59, $78, $31, $06, $24, $00, $00 ; scale=5.978310624e3
+    .db $00, $83, $59, $78, $31, $06, $24, $00, $00 ; scale=Yard^2*110*65
 unitCuMicroMeterInfo:
 unitCuMicroMeterId equ 47
     .dw unitCuMicroMeterName ; name
@@ -376,27 +376,27 @@ unitCuInchInfo:
 unitCuInchId equ 52
     .dw unitCuInchName ; name
     .db unitTypeVolumeId ; unitTypeId
-    .db $00, $7B, $16, $38, $70, $64, $00, $00, $00 ; scale=1.6387064e-5
+    .db $00, $7B, $16, $38, $70, $64, $00, $00, $00 ; scale=Inch^3
 unitCuFootInfo:
 unitCuFootId equ 53
     .dw unitCuFootName ; name
     .db unitTypeVolumeId ; unitTypeId
-    .db $00, $7E, $28, $31, $68, $46, $59, $20, $00 ; scale=2.8316846592e-2
+    .db $00, $7E, $28, $31, $68, $46, $59, $20, $00 ; scale=Foot^3
 unitCuYardInfo:
 unitCuYardId equ 54
     .dw unitCuYardName ; name
     .db unitTypeVolumeId ; unitTypeId
-    .db $00, $7F, $76, $45, $54, $85, $79, $84, $00 ; scale=7.64554857984e-1
+    .db $00, $7F, $76, $45, $54, $85, $79, $84, $00 ; scale=Yard^3
 unitCuMileInfo:
 unitCuMileId equ 55
     .dw unitCuMileName ; name
     .db unitTypeVolumeId ; unitTypeId
-    .db $00, $89, $41, $68, $18, $18, $25, $44, $06 ; scale=4.1681818254406e9
+    .db $00, $89, $41, $68, $18, $18, $25, $44, $06 ; scale=Mile^3
 unitCuNauticalMileInfo:
 unitCuNauticalMileId equ 56
     .dw unitCuNauticalMileName ; name
     .db unitTypeVolumeId ; unitTypeId
-    .db $00, $89, $63, $52, $18, $22, $08, $00, $00 ; scale=6352182208
+    .db $00, $89, $63, $52, $18, $22, $08, $00, $00 ; scale=NauticalMile^3
 unitMicroLiterInfo:
 unitMicroLiterId equ 57
     .dw unitMicroLiterName ; name
@@ -511,37 +511,37 @@ unitDryQuartInfo:
 unitDryQuartId equ 79
     .dw unitDryQuartName ; name
     .db unitTypeVolumeId ; unitTypeId
-    .db $00, $7D, $11, $01, $22, $09, $42, $71, $50 ; scale=1.101220942715e-3
+    .db $00, $7D, $11, $01, $22, $09, $42, $71, $50 ; scale=DryPint*2
 unitDryGallonInfo:
 unitDryGallonId equ 80
     .dw unitDryGallonName ; name
     .db unitTypeVolumeId ; unitTypeId
-    .db $00, $7D, $44, $04, $88, $37, $70, $86, $00 ; scale=4.40488377086e-3
+    .db $00, $7D, $44, $04, $88, $37, $70, $86, $00 ; scale=DryQuart*4
 unitPeckInfo:
 unitPeckId equ 81
     .dw unitPeckName ; name
     .db unitTypeVolumeId ; unitTypeId
-    .db $00, $7D, $88, $09, $76, $75, $41, $72, $00 ; scale=8.80976754172e-3
+    .db $00, $7D, $88, $09, $76, $75, $41, $72, $00 ; scale=DryGallon*2
 unitBushelInfo:
 unitBushelId equ 82
     .dw unitBushelName ; name
     .db unitTypeVolumeId ; unitTypeId
-    .db $00, $7E, $35, $23, $90, $70, $16, $68, $80 ; scale=35.23907016688e-3
+    .db $00, $7E, $35, $23, $90, $70, $16, $68, $80 ; scale=Peck*4
 unitDryBarrelInfo:
 unitDryBarrelId equ 83
     .dw unitDryBarrelName ; name
     .db unitTypeVolumeId ; unitTypeId
-    .db $00, $7F, $11, $56, $27, $12, $35, $84, $00 ; scale=0.115627123584
+    .db $00, $7F, $11, $56, $27, $12, $35, $84, $00 ; scale=CuInch*7056
 unitBoardFootInfo:
 unitBoardFootId equ 84
     .dw unitBoardFootName ; name
     .db unitTypeVolumeId ; unitTypeId
-    .db $00, $7D, $23, $59, $73, $72, $16, $00, $00 ; scale=2.359737216e-3
+    .db $00, $7D, $23, $59, $73, $72, $16, $00, $00 ; scale=CuFoot/12
 unitOilBarrelInfo:
 unitOilBarrelId equ 85
     .dw unitOilBarrelName ; name
     .db unitTypeVolumeId ; unitTypeId
-    .db $00, $7F, $15, $89, $87, $29, $49, $28, $00 ; scale=1.58987294928e-1
+    .db $00, $7F, $15, $89, $87, $29, $49, $28, $00 ; scale=Gallon*42
 unitOlympicPoolInfo:
 unitOlympicPoolId equ 86
     .dw unitOlympicPoolName ; name
@@ -551,7 +551,7 @@ unitAcreFootInfo:
 unitAcreFootId equ 87
     .dw unitAcreFootName ; name
     .db unitTypeVolumeId ; unitTypeId
-    .db $00, $83, $12, $33, $48, $18, $37, $54, $75 ; scale=1233.4818375475
+    .db $00, $83, $12, $33, $48, $18, $37, $54, $75 ; scale=Acre*Foot
 unitAtomicMassUnitInfo:
 unitAtomicMassUnitId equ 88
     .dw unitAtomicMassUnitName ; name
@@ -586,7 +586,7 @@ unitGrainInfo:
 unitGrainId equ 94
     .dw unitGrainName ; name
     .db unitTypeMassId ; unitTypeId
-    .db $00, $7A, $64, $79, $89, $10, $00, $00, $00 ; scale=6.479891e-6
+    .db $00, $7B, $64, $79, $89, $10, $00, $00, $00 ; scale=0.45359237/7000
 unitDramInfo:
 unitDramId equ 95
     .dw unitDramName ; name
@@ -606,52 +606,52 @@ unitSlugInfo:
 unitSlugId equ 98
     .dw unitSlugName ; name
     .db unitTypeMassId ; unitTypeId
-    .db $00, $81, $14, $59, $39, $02, $93, $72, $07 ; scale=14.593902937207
+    .db $00, $81, $14, $59, $39, $02, $93, $72, $06 ; scale=Pound*9.80665/0.3048
 unitHundredWeightInfo:
 unitHundredWeightId equ 99
     .dw unitHundredWeightName ; name
     .db unitTypeMassId ; unitTypeId
-    .db $00, $81, $45, $35, $92, $37, $00, $00, $00 ; scale=45.359237
+    .db $00, $81, $45, $35, $92, $37, $00, $00, $00 ; scale=Pound*100
 unitShortTonInfo:
 unitShortTonId equ 100
     .dw unitShortTonName ; name
     .db unitTypeMassId ; unitTypeId
-    .db $00, $82, $90, $71, $84, $74, $00, $00, $00 ; scale=907.18474
+    .db $00, $82, $90, $71, $84, $74, $00, $00, $00 ; scale=Pound*2000
 unitStoneInfo:
 unitStoneId equ 101
     .dw unitStoneName ; name
     .db unitTypeMassId ; unitTypeId
-    .db $00, $80, $63, $50, $29, $31, $80, $00, $00 ; scale=6.35029318
+    .db $00, $80, $63, $50, $29, $31, $80, $00, $00 ; scale=Pound*14
 unitQuarterInfo:
 unitQuarterId equ 102
     .dw unitQuarterName ; name
     .db unitTypeMassId ; unitTypeId
-    .db $00, $81, $12, $70, $05, $86, $36, $00, $00 ; scale=12.70058636
+    .db $00, $81, $12, $70, $05, $86, $36, $00, $00 ; scale=Stone*2
 unitLongHundredWeightInfo:
 unitLongHundredWeightId equ 103
     .dw unitLongHundredWeightName ; name
     .db unitTypeMassId ; unitTypeId
-    .db $00, $81, $50, $80, $23, $45, $44, $00, $00 ; scale=50.80234544
+    .db $00, $81, $50, $80, $23, $45, $44, $00, $00 ; scale=Stone*8
 unitLongTonInfo:
 unitLongTonId equ 104
     .dw unitLongTonName ; name
     .db unitTypeMassId ; unitTypeId
-    .db $00, $83, $10, $16, $04, $69, $08, $80, $00 ; scale=1016.0469088
+    .db $00, $83, $10, $16, $04, $69, $08, $80, $00 ; scale=Pound*2240
 unitTroyPennyWeightInfo:
 unitTroyPennyWeightId equ 105
     .dw unitTroyPennyWeightName ; name
     .db unitTypeMassId ; unitTypeId
-    .db $00, $7D, $15, $55, $17, $38, $40, $00, $00 ; scale=1.55517384e-3
+    .db $00, $7D, $15, $55, $17, $38, $40, $00, $00 ; scale=Grain*24
 unitTroyOunceInfo:
 unitTroyOunceId equ 106
     .dw unitTroyOunceName ; name
     .db unitTypeMassId ; unitTypeId
-    .db $00, $7E, $31, $10, $34, $76, $80, $00, $00 ; scale=31.1034768e-3
+    .db $00, $7E, $31, $10, $34, $76, $80, $00, $00 ; scale=TroyPennyWeight*20
 unitTroyPoundInfo:
 unitTroyPoundId equ 107
     .dw unitTroyPoundName ; name
     .db unitTypeMassId ; unitTypeId
-    .db $00, $7F, $37, $32, $41, $72, $16, $00, $00 ; scale=373.2417216e-3
+    .db $00, $7F, $37, $32, $41, $72, $16, $00, $00 ; scale=TroyOunce*12
 unitCelsiusInfo:
 unitCelsiusId equ 108
     .dw unitCelsiusName ; name
@@ -691,27 +691,27 @@ unitMetricTonForceInfo:
 unitMetricTonForceId equ 115
     .dw unitMetricTonForceName ; name
     .db unitTypeForceId ; unitTypeId
-    .db $00, $83, $98, $06, $65, $00, $00, $00, $00 ; scale=9.80665e3
+    .db $00, $83, $98, $06, $65, $00, $00, $00, $00 ; scale=KilogramForce*1000
 unitPoundalInfo:
 unitPoundalId equ 116
     .dw unitPoundalName ; name
     .db unitTypeForceId ; unitTypeId
-    .db $00, $7F, $13, $82, $54, $95, $43, $76, $00 ; scale=0.138254954376
+    .db $00, $7F, $13, $82, $54, $95, $43, $76, $00 ; scale=Pound*Foot
 unitPoundForceInfo:
 unitPoundForceId equ 117
     .dw unitPoundForceName ; name
     .db unitTypeForceId ; unitTypeId
-    .db $00, $80, $44, $48, $22, $16, $15, $26, $05 ; scale=4.4482216152605
+    .db $00, $80, $44, $48, $22, $16, $15, $26, $05 ; scale=Pound*KilogramForce
 unitShortTonForceInfo:
 unitShortTonForceId equ 118
     .dw unitShortTonForceName ; name
     .db unitTypeForceId ; unitTypeId
-    .db $00, $83, $88, $96, $44, $32, $30, $52, $10 ; scale=8.896443230521e3
+    .db $00, $83, $88, $96, $44, $32, $30, $52, $10 ; scale=ShortTon*KilogramForce
 unitLongTonForceInfo:
 unitLongTonForceId equ 119
     .dw unitLongTonForceName ; name
     .db unitTypeForceId ; unitTypeId
-    .db $00, $83, $99, $64, $01, $64, $18, $18, $35 ; scale=9.96401641818352e3
+    .db $00, $83, $99, $64, $01, $64, $18, $18, $35 ; scale=LongTon*KilogramForce
 unitMilliPascalInfo:
 unitMilliPascalId equ 120
     .dw unitMilliPascalName ; name
@@ -751,7 +751,7 @@ unitPoundSquareInchInfo:
 unitPoundSquareInchId equ 127
     .dw unitPoundSquareInchName ; name
     .db unitTypePressureId ; unitTypeId
-    .db $00, $83, $68, $94, $75, $72, $93, $16, $84 ; scale=6894.7572931684
+    .db $00, $83, $68, $94, $75, $72, $93, $16, $84 ; scale=PoundForce/SqInch
 unitAtmosphereInfo:
 unitAtmosphereId equ 128
     .dw unitAtmosphereName ; name
@@ -761,7 +761,7 @@ unitTorrInfo:
 unitTorrId equ 129
     .dw unitTorrName ; name
     .db unitTypePressureId ; unitTypeId
-    .db $00, $82, $13, $33, $22, $36, $84, $21, $05 ; scale=133.32236842105
+    .db $00, $82, $13, $33, $22, $36, $84, $21, $05 ; scale=Atmosphere/760
 unitMilliMeterMercuryInfo:
 unitMilliMeterMercuryId equ 130
     .dw unitMilliMeterMercuryName ; name
@@ -771,7 +771,7 @@ unitInchMercuryInfo:
 unitInchMercuryId equ 131
     .dw unitInchMercuryName ; name
     .db unitTypePressureId ; unitTypeId
-    .db $00, $83, $33, $86, $38, $86, $40, $34, $10 ; scale=3386.388640341
+    .db $00, $83, $33, $86, $38, $86, $40, $34, $10 ; scale=MilliMeterMercury*25.4
 unitMilliMeterWaterInfo:
 unitMilliMeterWaterId equ 132
     .dw unitMilliMeterWaterName ; name
@@ -781,7 +781,7 @@ unitInchWaterInfo:
 unitInchWaterId equ 133
     .dw unitInchWaterName ; name
     .db unitTypePressureId ; unitTypeId
-    .db $00, $82, $24, $90, $88, $91, $00, $00, $00 ; scale=249.08891
+    .db $00, $82, $24, $90, $88, $91, $00, $00, $00 ; scale=MilliMeterWater*25.4
 unitElectronVoltInfo:
 unitElectronVoltId equ 134
     .dw unitElectronVoltName ; name
@@ -841,7 +841,7 @@ unitFootPoundEnergyInfo:
 unitFootPoundEnergyId equ 145
     .dw unitFootPoundEnergyName ; name
     .db unitTypeEnergyId ; unitTypeId
-    .db $00, $80, $13, $55, $81, $79, $48, $33, $14 ; scale=1.3558179483314
+    .db $00, $80, $13, $55, $81, $79, $48, $33, $14 ; scale=Foot*PoundForce
 unitBritishThermalUnitInfo:
 unitBritishThermalUnitId equ 146
     .dw unitBritishThermalUnitName ; name
@@ -861,7 +861,7 @@ unitLiterAtmosphereInfo:
 unitLiterAtmosphereId equ 149
     .dw unitLiterAtmosphereName ; name
     .db unitTypeEnergyId ; unitTypeId
-    .db $00, $82, $10, $13, $25, $00, $00, $00, $00 ; scale=101.325
+    .db $00, $82, $10, $13, $25, $00, $00, $00, $00 ; scale=Liter*Atmosphere
 unitWattInfo:
 unitWattId equ 150
     .dw unitWattName ; name
@@ -876,7 +876,7 @@ unitFootPoundEnergyPerSecondInfo:
 unitFootPoundEnergyPerSecondId equ 152
     .dw unitFootPoundEnergyPerSecondName ; name
     .db unitTypePowerId ; unitTypeId
-    .db $00, $80, $13, $55, $81, $79, $48, $33, $14 ; scale=1.3558179483314
+    .db $00, $80, $13, $55, $81, $79, $48, $33, $14 ; scale=FootPoundEnergy
 unitCaloriePerSecondInfo:
 unitCaloriePerSecondId equ 153
     .dw unitCaloriePerSecondName ; name
@@ -886,17 +886,17 @@ unitBtuPerHourInfo:
 unitBtuPerHourId equ 154
     .dw unitBtuPerHourName ; name
     .db unitTypePowerId ; unitTypeId
-    .db $00, $7F, $29, $30, $55, $55, $55, $55, $56 ; scale=.29305555555556
+    .db $00, $7F, $29, $30, $55, $55, $55, $55, $56 ; scale=BritishThermalUnit/3600
 unitBtuPerMinuteInfo:
 unitBtuPerMinuteId equ 155
     .dw unitBtuPerMinuteName ; name
     .db unitTypePowerId ; unitTypeId
-    .db $00, $81, $17, $58, $33, $33, $33, $33, $33 ; scale=17.583333333333
+    .db $00, $81, $17, $58, $33, $33, $33, $33, $33 ; scale=BritishThermalUnit/60
 unitHorsepowerInfo:
 unitHorsepowerId equ 156
     .dw unitHorsepowerName ; name
     .db unitTypePowerId ; unitTypeId
-    .db $00, $82, $74, $56, $99, $87, $15, $82, $27 ; scale=745.69987158227022
+    .db $00, $82, $74, $56, $99, $87, $15, $82, $27 ; scale=FootPoundEnergy*550
 unitNanoSecondInfo:
 unitNanoSecondId equ 157
     .dw unitNanoSecondName ; name
@@ -951,22 +951,22 @@ unitFootPerSecondInfo:
 unitFootPerSecondId equ 167
     .dw unitFootPerSecondName ; name
     .db unitTypeSpeedId ; unitTypeId
-    .db $00, $7F, $30, $48, $00, $00, $00, $00, $00 ; scale=0.3048
+    .db $00, $7F, $30, $48, $00, $00, $00, $00, $00 ; scale=Foot
 unitKiloMeterPerHourInfo:
 unitKiloMeterPerHourId equ 168
     .dw unitKiloMeterPerHourName ; name
     .db unitTypeSpeedId ; unitTypeId
-    .db $00, $7F, $27, $77, $77, $77, $77, $77, $78 ; scale=0.27777777777778
+    .db $00, $7F, $27, $77, $77, $77, $77, $77, $78 ; scale=KiloMeter/Hour
 unitMilePerHourInfo:
 unitMilePerHourId equ 169
     .dw unitMilePerHourName ; name
     .db unitTypeSpeedId ; unitTypeId
-    .db $00, $7F, $44, $70, $40, $00, $00, $00, $00 ; scale=0.44704
+    .db $00, $7F, $44, $70, $40, $00, $00, $00, $00 ; scale=Mile/Hour
 unitKnotInfo:
 unitKnotId equ 170
     .dw unitKnotName ; name
     .db unitTypeSpeedId ; unitTypeId
-    .db $00, $7F, $51, $44, $44, $44, $44, $44, $44 ; scale=0.51444444444444
+    .db $00, $7F, $51, $44, $44, $44, $44, $44, $44 ; scale=NauticalMile/Hour
 unitLightSpeedInfo:
 unitLightSpeedId equ 171
     .dw unitLightSpeedName ; name
@@ -1049,11 +1049,7 @@ universalTwoPowComplex:
 ; Output: OP1/OP2: log2(X)
 UniversalLog2:
     call UniversalLn ; CP1=ln(X)
-    bcall(_PushOP1) ; FPS=[ln(X)]
-    bcall(_OP1Set2) ; OP1=2.0
-    bcall(_LnX) ; OP1=ln(2.0) ; TODO: Precalculate ln(2)
-    call op1ToOp3PageOne ; OP3=ln(2.0)
-    bcall(_PopOP1) ; FPS=[]; CP1=ln(x)
+    call op3SetLn2PageOne ; OP3=ln(2.0); preserves OP1, OP2
     jp UniversalDiv ; CP1=CP1/ln(2)
 
 ; Description: LogB(X) = log(X)/log(B).
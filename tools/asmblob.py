@@ -0,0 +1,89 @@
+#
+# Copyright 2025 Brian T. Park
+# MIT License.
+
+"""
+Pre-assembled binary blobs of static data, shared by compilemenu.py and
+compileunit.py.
+
+The '--blob' flag of those compilers writes the purely static sections of the
+generated file (the pools of name strings, and the TI-OS floating point scales
+of the units) into a binary file, which is included by the assembly file using
+the '#import' directive of spasm-ng. The assembly file keeps only the 'equ'
+statements which map each label to its offset inside the blob, so the
+assembler no longer needs to tokenize thousands of '.db' statements.
+
+The font tags of the names (e.g. 'Sdegree') are resolved into their byte codes
+using the 'equ' definitions of ti83plus.inc, read by the SymbolResolver of
+compilekeys.py.
+"""
+
+from typing import Dict
+from typing import List
+from typing import TextIO
+
+from compilekeys import SymbolResolver
+
+
+def encode_chars(chars: List[str], symbols: SymbolResolver) -> bytes:
+    """Convert the exploded characters of a name (e.g. ["Sdegree", "'F'"])
+    into bytes, resolving the font tags using the symbols. Throws ValueError
+    if a font tag is unknown or is not a valid character of a C string."""
+    data = bytearray()
+    for c in chars:
+        if len(c) == 3 and c[0] == "'" and c[2] == "'":
+            data.append(ord(c[1]))
+            continue
+        try:
+            code = symbols.resolve(c)
+        except ValueError as e:
+            raise ValueError(f"Font tag '{c}': {str(e)}")
+        if code < 1 or code > 255:
+            raise ValueError(f"Font tag '{c}': invalid character code {code}")
+        data.append(code)
+    return bytes(data)
+
+
+def encode_cstring(chars: List[str], symbols: SymbolResolver) -> bytes:
+    """Convert the exploded characters into a NUL-terminated C string."""
+    return encode_chars(chars, symbols) + b'\x00'
+
+
+class Blob:
+    """A binary blob of static data, and the offsets of the labels inside the
+    blob. The symbols resolve the font tags of the C strings."""
+
+    def __init__(self, label: str, filename: str, symbols: SymbolResolver):
+        self.label = label  # assembly label of the start of the blob
+        self.filename = filename  # name used by the '#import' directive
+        self.symbols = symbols
+        self.data = bytearray()
+        self.offsets: Dict[str, int] = {}  # {label -> offset}
+
+    def add(self, label: str, data: bytes) -> int:
+        """Append the data at the end of the blob, and return its offset."""
+        offset = len(self.data)
+        self.data += data
+        self.offsets[label] = offset
+        return offset
+
+    def add_cstring(self, label: str, chars: List[str]) -> int:
+        """Append the exploded characters as a NUL-terminated C string, and
+        return its offset."""
+        return self.add(label, encode_cstring(chars, self.symbols))
+
+    def size(self) -> int:
+        return len(self.data)
+
+    def generate_import(self, output: TextIO) -> None:
+        """Generate the directive which includes the binary file, and the size
+        of the blob."""
+        print(f"""\
+{self.label}:
+#import "{self.filename}"
+{self.label}Size equ {self.size()}
+""", file=output, end='')
+
+    def equate(self, label: str) -> str:
+        """Return the 'equ' statement of the label inside the blob."""
+        return f"{label} equ {self.label}+{self.offsets[label]}"
@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 Brian T. Park
+# MIT License.
+
+"""
+A cached index of the symbols defined and referenced by the assembly source
+files, used to check the external references emitted by compilemenu.py and
+compileunit.py without running the assembler, and to answer cross-reference
+queries for the other tools.
+
+Usage:
+$ asmindex.py [--cache .asmindex.json] [--exclude menudef.asm]
+    [--lookup SYMBOL ...] [--refs SYMBOL ...] [--bcalls SYMBOL ...]
+    [--deps SYMBOL ...] src/
+
+A directory is expanded into its '*.asm' and '*.inc' files. A symbol is
+defined by:
+
+- a label at the start of a line ('label:'),
+- an 'equ' statement ('label equ value', 'label .equ value', 'label = value'),
+- a '#define' or '#macro' directive.
+
+Every other identifier in the code (outside of comments and strings) which is
+not a Z80 mnemonic, register or condition is recorded as a reference, with its
+line number. The 'bcall(_Xxx)' and 'bjump(_Xxx)' sites are also recorded
+under the name of the routine 'Xxx', and the identifiers in the value of each
+'equ' statement are recorded as its dependencies.
+
+The entries of each file are cached in a JSON file, along with the SHA-1 hash
+of the content of the file, so only the files which changed since the
+previous run are parsed again. The cross-reference maps are rebuilt from the
+cached entries, so every query is a dictionary lookup. Conditional assembly
+('#ifdef') is ignored, so a symbol is considered defined if it is defined in
+any variant of the app.
+
+The '--link-check' flag of the compilers collects the symbols referenced by
+the generated file (e.g. the '{label}Handler' of each MenuItem), removes the
+symbols defined by the generated file itself, then reports every remaining
+symbol missing from the index, with the line of the definition file which
+caused the reference.
+"""
+
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import TypedDict
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+
+# Version of the format of the cache file. A cache file with a different
+# version is ignored.
+CACHE_VERSION = 2
+
+# Default name of the cache file, in the first directory being indexed.
+CACHE_FILENAME = '.asmindex.json'
+
+# File extensions indexed when a directory is given.
+SOURCE_EXTENSIONS = ('.asm', '.inc')
+
+
+def main() -> None:
+    # Configure command line flags.
+    parser = argparse.ArgumentParser(
+        description='Index the symbols defined by the assembly files'
+    )
+    parser.add_argument(
+        '--cache',
+        help=f'Cache file (default: {CACHE_FILENAME} in the first directory)',
+        required=False,
+    )
+    parser.add_argument(
+        '--exclude',
+        help='Base name of a file which should not be indexed',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        '--lookup',
+        help='Print the location of the definition of the symbol',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        '--refs',
+        help='Print the locations which refer to the symbol',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        '--bcalls',
+        help='Print the bcall() sites of the routine',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        '--deps',
+        help='Print the symbols used by the equ statement, and its users',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        'paths',
+        help='Assembly files or directories',
+        nargs='+',
+    )
+    args = parser.parse_args()
+
+    # Configure logging. This should normally be executed after the
+    # parser.parse_args() because it allows us set the logging.level using a
+    # flag.
+    logging.basicConfig(level=logging.INFO)
+
+    index = load_index(args.paths, args.exclude, args.cache)
+    for symbol in args.lookup:
+        definition = index.lookup(symbol)
+        if definition is None:
+            print(f"{symbol}: undefined")
+        else:
+            print(f"{symbol}: {definition[0]}:{definition[1]}")
+    for symbol in args.refs:
+        print_locations(f"{symbol}: references", index.references(symbol))
+    for symbol in args.bcalls:
+        print_locations(f"{symbol}: bcall() sites", index.bcall_sites(symbol))
+    for symbol in args.deps:
+        print(f"{symbol}: depends on {' '.join(index.dependencies(symbol))}")
+        print(f"{symbol}: used by {' '.join(index.dependents(symbol))}")
+
+
+def print_locations(title: str, locations: List[Tuple[str, int]]) -> None:
+    print(f"{title}: {len(locations)}")
+    for path, line_number in locations:
+        print(f"  {path}:{line_number}")
+
+# -----------------------------------------------------------------------------
+
+
+# A label at the start of the line, 'label:'.
+LABEL_PATTERN = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*):')
+
+# 'label equ value', 'label .equ value', and 'label = value'.
+EQU_PATTERN = re.compile(
+    r'^([A-Za-z_][A-Za-z0-9_]*)\s+(?:\.?equ\b|=)', re.IGNORECASE)
+
+# '#define NAME ...' and '#macro name(...)'.
+DIRECTIVE_PATTERN = re.compile(
+    r'^\s*#(?:define|macro)\s+([A-Za-z_][A-Za-z0-9_]*)', re.IGNORECASE)
+
+
+# An identifier which is not a part of a number ('$FF', '0FFh', '%101') or of
+# a directive ('.db').
+IDENTIFIER_PATTERN = re.compile(r'(?<![\w$%.])[A-Za-z_][A-Za-z0-9_]*')
+
+# A string or a character literal.
+STRING_PATTERN = re.compile(r'"[^"]*"|\'[^\']*\'')
+
+# 'bcall(_Xxx)' and 'bjump(_Xxx)'.
+BCALL_PATTERN = re.compile(r'\bb(?:call|jump)\(\s*_([A-Za-z0-9_]+)\s*\)')
+
+# Identifiers which are never symbols, in lowercase.
+KEYWORDS = {
+    # mnemonics
+    'adc', 'add', 'and', 'bit', 'call', 'ccf', 'cp', 'cpd', 'cpdr', 'cpi',
+    'cpir', 'cpl', 'daa', 'dec', 'di', 'djnz', 'ei', 'ex', 'exx', 'halt',
+    'im', 'in', 'inc', 'ind', 'indr', 'ini', 'inir', 'jp', 'jr', 'ld', 'ldd',
+    'lddr', 'ldi', 'ldir', 'neg', 'nop', 'or', 'otdr', 'otir', 'out', 'outd',
+    'outi', 'pop', 'push', 'res', 'ret', 'reti', 'retn', 'rl', 'rla', 'rlc',
+    'rlca', 'rld', 'rr', 'rra', 'rrc', 'rrca', 'rrd', 'rst', 'sbc', 'scf',
+    'set', 'sla', 'sll', 'sra', 'srl', 'sub', 'xor', 'equ',
+    # registers
+    'a', 'b', 'c', 'd', 'e', 'h', 'l', 'i', 'r', 'af', 'bc', 'de', 'hl',
+    'ix', 'iy', 'sp', 'ixh', 'ixl', 'iyh', 'iyl',
+    # conditions
+    'z', 'nz', 'nc', 'po', 'pe', 'p', 'm',
+}
+
+
+class ParsedFile(TypedDict):
+    """The symbols defined and referenced by one source file."""
+    symbols: List[Tuple[str, int]]  # [(symbol, line number)]
+    references: Dict[str, List[int]]  # {symbol -> [line number]}
+    bcalls: List[Tuple[str, int]]  # [(routine, line number)]
+    equs: Dict[str, List[str]]  # {symbol -> [symbols used by its value]}
+
+
+def match_definition(line: str) -> Optional[re.Match[str]]:
+    return (
+        LABEL_PATTERN.match(line)
+        or EQU_PATTERN.match(line)
+        or DIRECTIVE_PATTERN.match(line)
+    )
+
+
+def parse_symbols(lines: Iterable[str]) -> List[Tuple[str, int]]:
+    """Return the symbols defined by the lines of an assembly file, as a list
+    of (symbol, line number)."""
+    symbols: List[Tuple[str, int]] = []
+    for line_number, line in enumerate(lines, 1):
+        match = match_definition(line)
+        if match:
+            symbols.append((match.group(1), line_number))
+    return symbols
+
+
+def parse_file(lines: Iterable[str]) -> ParsedFile:
+    """Return the definitions, the references, the bcall() sites and the
+    dependencies of the equ statements of the lines of an assembly file."""
+    parsed: ParsedFile = {
+        'symbols': [], 'references': {}, 'bcalls': [], 'equs': {}}
+    for line_number, line in enumerate(lines, 1):
+        definition = match_definition(line)
+        code = STRING_PATTERN.sub('""', line).split(';', 1)[0]
+        if definition:
+            parsed['symbols'].append((definition.group(1), line_number))
+            code = code[definition.end():]
+        elif code.lstrip().startswith('#'):
+            continue  # '#ifdef', '#include', etc.
+        for routine in BCALL_PATTERN.findall(code):
+            parsed['bcalls'].append((routine, line_number))
+        names: List[str] = []
+        for name in IDENTIFIER_PATTERN.findall(code):
+            if name.lower() not in KEYWORDS and name not in names:
+                names.append(name)
+        for name in names:
+            parsed['references'].setdefault(name, []).append(line_number)
+        if definition and EQU_PATTERN.match(line):
+            parsed['equs'][definition.group(1)] = names
+    return parsed
+
+
+def find_sources(paths: List[str], exclude: Iterable[str] = ()) -> List[str]:
+    """Expand the directories into their assembly files, sorted by name. The
+    files whose base name is in 'exclude' are skipped."""
+    excluded = set(exclude)
+    sources: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            names = sorted(
+                name for name in os.listdir(path)
+                if name.endswith(SOURCE_EXTENSIONS))
+            candidates = [os.path.join(path, name) for name in names]
+        else:
+            candidates = [path]
+        for candidate in candidates:
+            if os.path.basename(candidate) not in excluded:
+                sources.append(candidate)
+    return sources
+
+
+def default_cache_path(paths: List[str]) -> str:
+    first = paths[0]
+    directory = first if os.path.isdir(first) else os.path.dirname(first)
+    return os.path.join(directory, CACHE_FILENAME)
+
+# -----------------------------------------------------------------------------
+
+
+class FileEntry(ParsedFile):
+    """The cached entries of one source file."""
+    hash: str  # SHA-1 of the content of the file
+
+
+def make_entry(digest: str, parsed: ParsedFile) -> FileEntry:
+    return {
+        'hash': digest,
+        'symbols': parsed['symbols'],
+        'references': parsed['references'],
+        'bcalls': parsed['bcalls'],
+        'equs': parsed['equs'],
+    }
+
+
+class SymbolIndex:
+    """The symbols defined and referenced by a set of assembly files."""
+
+    def __init__(self) -> None:
+        self.files: Dict[str, FileEntry] = {}  # {path -> FileEntry}
+        self.definitions: Dict[str, Tuple[str, int]] = {}  # {symbol -> loc}
+        self.referrers: Dict[str, List[Tuple[str, int]]] = {}
+        self.bcallers: Dict[str, List[Tuple[str, int]]] = {}
+        self.equs: Dict[str, List[str]] = {}  # {symbol -> dependencies}
+        self.users: Dict[str, List[str]] = {}  # {symbol -> dependent equs}
+        self.parsed_count = 0  # number of files parsed by the last update()
+
+    def load(self, cache_path: str) -> None:
+        """Load the cached entries. A missing, corrupted or obsolete cache file
+        is ignored."""
+        try:
+            with open(cache_path, encoding="utf-8") as file:
+                cache = json.load(file)
+        except (OSError, ValueError):
+            return
+        if not isinstance(cache, dict) \
+                or cache.get('version') != CACHE_VERSION:
+            return
+        for path, entry in cache.get('files', {}).items():
+            self.files[path] = {
+                'hash': entry['hash'],
+                'symbols': [(s, n) for s, n in entry['symbols']],
+                'references': entry['references'],
+                'bcalls': [(s, n) for s, n in entry['bcalls']],
+                'equs': entry['equs'],
+            }
+
+    def save(self, cache_path: str) -> None:
+        cache = {'version': CACHE_VERSION, 'files': self.files}
+        with open(cache_path, "w", encoding="utf-8") as file:
+            json.dump(cache, file, separators=(',', ':'))
+
+    def update(self, sources: List[str]) -> None:
+        """Index the given source files, parsing only the files whose content
+        changed since they were cached. Files which are no longer in the list
+        are dropped from the index."""
+        files: Dict[str, FileEntry] = {}
+        self.parsed_count = 0
+        for path in sources:
+            with open(path, "rb") as file:
+                content = file.read()
+            digest = hashlib.sha1(content).hexdigest()
+            entry = self.files.get(path)
+            if entry is None or entry['hash'] != digest:
+                text = content.decode("utf-8", errors="replace")
+                entry = make_entry(digest, parse_file(text.splitlines()))
+                self.parsed_count += 1
+            files[path] = entry
+        self.files = files
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Rebuild the cross-reference maps from the entries of the files.
+        The first definition of a symbol wins."""
+        self.definitions = {}
+        self.referrers = {}
+        self.bcallers = {}
+        self.equs = {}
+        self.users = {}
+        for path, entry in self.files.items():
+            for symbol, line_number in entry['symbols']:
+                self.definitions.setdefault(symbol, (path, line_number))
+            for symbol, line_numbers in entry['references'].items():
+                self.referrers.setdefault(symbol, []).extend(
+                    (path, n) for n in line_numbers)
+            for routine, line_number in entry['bcalls']:
+                self.bcallers.setdefault(routine, []).append(
+                    (path, line_number))
+            for symbol, dependencies in entry['equs'].items():
+                if symbol in self.equs:
+                    continue
+                self.equs[symbol] = dependencies
+                for dependency in dependencies:
+                    self.users.setdefault(dependency, []).append(symbol)
+
+    def lookup(self, symbol: str) -> Optional[Tuple[str, int]]:
+        """Return the (path, line number) of the definition of the symbol, or
+        None if undefined."""
+        return self.definitions.get(symbol)
+
+    def references(self, symbol: str) -> List[Tuple[str, int]]:
+        """Return the (path, line number) of the references to the symbol,
+        excluding its definitions."""
+        return self.referrers.get(symbol, [])
+
+    def bcall_sites(self, routine: str) -> List[Tuple[str, int]]:
+        """Return the (path, line number) of the 'bcall(_routine)' sites."""
+        return self.bcallers.get(routine, [])
+
+    def dependencies(self, symbol: str) -> List[str]:
+        """Return the symbols used by the value of the equ statement."""
+        return self.equs.get(symbol, [])
+
+    def dependents(self, symbol: str) -> List[str]:
+        """Return the equ statements whose value uses the symbol."""
+        return self.users.get(symbol, [])
+
+
+def load_index(
+    paths: List[str],
+    exclude: Iterable[str] = (),
+    cache_path: Optional[str] = None,
+) -> SymbolIndex:
+    """Create the index of the given files and directories, using and updating
+    the cache file."""
+    if cache_path is None:
+        cache_path = default_cache_path(paths)
+    start = time.perf_counter()
+    index = SymbolIndex()
+    index.load(cache_path)
+    sources = find_sources(paths, exclude)
+    index.update(sources)
+    if index.parsed_count > 0:
+        index.save(cache_path)
+    elapsed = time.perf_counter() - start
+    logging.info(
+        f"  Indexed {len(index.definitions)} symbols in {len(sources)} files "
+        f"({index.parsed_count} parsed) in {elapsed * 1000:.0f} ms")
+    return index
+
+# -----------------------------------------------------------------------------
+
+
+class Reference(TypedDict):
+    """A symbol referenced by the generated assembly file."""
+    symbol: str
+    line: int  # line number in the definition file which caused it
+    context: str  # human readable origin, e.g. "MenuItem mPi"
+
+
+def find_undefined(
+    references: List[Reference], index: SymbolIndex, generated: str,
+) -> List[Reference]:
+    """Return the references which are defined neither by the generated
+    assembly code, nor by the index, sorted by line number."""
+    local: Set[str] = {
+        symbol for symbol, _ in parse_symbols(generated.splitlines())}
+    undefined = [
+        ref for ref in references
+        if ref['symbol'] not in local and index.lookup(ref['symbol']) is None
+    ]
+    undefined.sort(key=lambda ref: ref['line'])
+    return undefined
+
+
+def link_check(
+    filename: str,
+    references: List[Reference],
+    generated: str,
+    paths: List[str],
+    exclude: Iterable[str] = (),
+    cache_path: Optional[str] = None,
+) -> None:
+    """Check the references of the generated code against the symbols of the
+    assembly files. Log every undefined reference with the line of the
+    definition file, then throw ValueError if there were any."""
+    logging.info(f"Checking {len(references)} references")
+    index = load_index(paths, exclude, cache_path)
+    undefined = find_undefined(references, index, generated)
+    for ref in undefined:
+        logging.error(
+            f"  {filename}:{ref['line']}: {ref['context']}: "
+            f"undefined '{ref['symbol']}'")
+    if undefined:
+        raise ValueError(f"{len(undefined)} undefined references")
+    logging.info("  OK")
+
+
+if __name__ == '__main__':
+    main()
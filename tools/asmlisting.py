@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 Brian T. Park
+# MIT License.
+
+"""
+Summarize the listing file generated by 'spasm -T' (rpn83p.lst) into the
+number of bytes used by each flash page, source file and label, and the free
+space of each page, optionally compared to a previous listing.
+
+Usage:
+$ asmlisting.py [--src DIR] [--top N] [--diff old.lst] rpn83p.lst
+
+Each line of the listing contains the line number of the source file, the
+flash page and the address, up to 4 bytes of generated code (an empty slot is
+printed as '-'), followed by the source line:
+
+      111 00:4080 C3 C9 40 -  	jp main
+
+Instructions and data directives which generate more than 4 bytes are
+continued on the following lines, without a line number and without source.
+The listing does not identify the source file of each line, so the bytes are
+attributed to the most recent label defined on the same flash page, and each
+label is mapped to its source file using the symbol index of asmindex.py. The
+bytes before the first label of a page are attributed to the empty label.
+
+The listing is large (several MB), so it is memory-mapped and parsed one line
+at a time, without loading the whole file. The free space of a page is
+measured from the highest address used by the page, so it includes any gap
+or alignment padding.
+"""
+
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import TextIO
+from typing import Tuple
+from typing import TypedDict
+
+import argparse
+import logging
+import mmap
+import os
+import re
+import sys
+
+from asmindex import load_index
+
+# Address range of a flash page of an app, mapped into memory bank A.
+PAGE_START = 0x4000
+PAGE_END = 0x8000
+
+# Line number (optional on continuation lines), page and address.
+PREFIX_PATTERN = re.compile(
+    r'^\s*(\d*)\s+([0-9A-Fa-f]{2}):([0-9A-Fa-f]{4}) ')
+
+# One of the 4 byte slots, either 2 hex digits or '-', padded to 3 columns.
+SLOT_PATTERN = re.compile(r'([0-9A-Fa-f]{2}|- ) ')
+
+# Maximum number of bytes on each line of the listing.
+SLOTS_PER_LINE = 4
+
+# A label at the start of the source line, 'label:'.
+LABEL_PATTERN = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*):')
+
+# Name of the bytes which cannot be attributed to a label or a file.
+UNKNOWN = '(unknown)'
+
+
+def main() -> None:
+    # Configure command line flags.
+    parser = argparse.ArgumentParser(
+        description='Summarize the size of the flash pages from the listing'
+    )
+    parser.add_argument(
+        '--src',
+        help='Directory of the assembly files (default: listing directory)',
+        required=False,
+    )
+    parser.add_argument(
+        '--top',
+        help='Number of files and labels to print (default: 20)',
+        type=int,
+        default=20,
+    )
+    parser.add_argument(
+        '--diff',
+        help='Previous listing to compare against',
+        required=False,
+    )
+    parser.add_argument(
+        'filename',
+        help='Listing file (rpn83p.lst)',
+    )
+    args = parser.parse_args()
+
+    # Configure logging. This should normally be executed after the
+    # parser.parse_args() because it allows us set the logging.level using a
+    # flag.
+    logging.basicConfig(level=logging.INFO)
+
+    srcdir = args.src or os.path.dirname(args.filename) or '.'
+    index = load_index([srcdir])
+    files: Dict[str, str] = {
+        symbol: os.path.basename(path)
+        for symbol, (path, _) in index.definitions.items()
+    }
+
+    logging.info(f"Reading {args.filename}")
+    summary = read_listing(args.filename)
+    previous: Optional[ListingSummary] = None
+    if args.diff:
+        logging.info(f"Reading {args.diff}")
+        previous = read_listing(args.diff)
+    print_report(summary, previous, files, args.top)
+
+# -----------------------------------------------------------------------------
+
+
+class ListingLine(TypedDict):
+    line: int  # line number in the source file, 0 for continuation lines
+    page: int
+    address: int
+    size: int  # number of bytes generated
+    source: str  # source line, without the end of line
+
+
+class PageUsage(TypedDict):
+    size: int  # number of bytes generated on the page
+    end: int  # highest address used + 1
+
+
+class ListingSummary(TypedDict):
+    labels: Dict[Tuple[int, str], int]  # {(page, label) -> bytes}
+    pages: Dict[int, PageUsage]
+
+
+def parse_line(text: str) -> Optional[ListingLine]:
+    """Parse a line of the listing. Return None if it is not in the format of
+    the listing (e.g. an error message of the assembler)."""
+    match = PREFIX_PATTERN.match(text)
+    if match is None:
+        return None
+    position = match.end()
+    size = 0
+    for _ in range(SLOTS_PER_LINE):
+        slot = SLOT_PATTERN.match(text, position)
+        if slot is None:
+            break
+        if slot.group(1) != '- ':
+            size += 1
+        position = slot.end()
+    return {
+        'line': int(match.group(1)) if match.group(1) else 0,
+        'page': int(match.group(2), 16),
+        'address': int(match.group(3), 16),
+        'size': size,
+        'source': text[position:].rstrip('\r\n'),
+    }
+
+
+def summarize(lines: Iterable[str]) -> ListingSummary:
+    """Accumulate the bytes of each label and each page of the listing."""
+    labels: Dict[Tuple[int, str], int] = {}
+    pages: Dict[int, PageUsage] = {}
+    current: Dict[int, str] = {}  # {page -> current label}
+    for text in lines:
+        listing_line = parse_line(text)
+        if listing_line is None:
+            continue
+        page = listing_line['page']
+        match = LABEL_PATTERN.match(listing_line['source'])
+        if match:
+            current[page] = match.group(1)
+        size = listing_line['size']
+        key = (page, current.get(page, ''))
+        labels[key] = labels.get(key, 0) + size
+        usage = pages.setdefault(page, {'size': 0, 'end': PAGE_START})
+        usage['size'] += size
+        if size:
+            usage['end'] = max(usage['end'], listing_line['address'] + size)
+    return {'labels': labels, 'pages': pages}
+
+
+def label_sizes(lines: Iterable[str]) -> Dict[Tuple[int, str], int]:
+    """Return the number of bytes generated after each label, until the next
+    label on the same page, as {(page, label) -> size}."""
+    return summarize(lines)['labels']
+
+
+def mapped_lines(filename: str) -> Iterator[str]:
+    """Iterate over the lines of the file using a memory map, so that only
+    the current line is held in memory."""
+    with open(filename, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for line in iter(data.readline, b''):
+                yield line.decode('latin-1')
+
+
+def read_listing(filename: str) -> ListingSummary:
+    return summarize(mapped_lines(filename))
+
+# -----------------------------------------------------------------------------
+
+
+def file_sizes(
+    summary: ListingSummary, files: Dict[str, str],
+) -> Dict[str, int]:
+    """Return the bytes of each source file, using the {label -> file} map.
+    The bytes of the unknown labels are attributed to UNKNOWN."""
+    sizes: Dict[str, int] = {}
+    for (_, label), size in summary['labels'].items():
+        filename = files.get(label, UNKNOWN)
+        sizes[filename] = sizes.get(filename, 0) + size
+    return sizes
+
+
+def named_label_sizes(summary: ListingSummary) -> Dict[str, int]:
+    """Return the bytes of each label. The bytes before the first label of a
+    page are named after the page."""
+    return {
+        (label if label else f"{UNKNOWN} page {page}"): size
+        for (page, label), size in summary['labels'].items()
+    }
+
+
+def ranked_changes(
+    current: Dict[str, int], previous: Optional[Dict[str, int]], top: int,
+) -> List[Tuple[str, int, int]]:
+    """Return the top entries as (name, size, change). Without a previous
+    listing, they are the largest entries, otherwise the largest changes."""
+    if previous is None:
+        rows = [(name, size, 0) for name, size in current.items()]
+        rows.sort(key=lambda row: (-row[1], row[0]))
+    else:
+        names = set(current) | set(previous)
+        rows = [
+            (name, current.get(name, 0),
+             current.get(name, 0) - previous.get(name, 0))
+            for name in names
+        ]
+        rows = [row for row in rows if row[2] != 0]
+        rows.sort(key=lambda row: (-abs(row[2]), row[0]))
+    return rows[:top] if top else rows
+
+
+def format_change(change: int, enabled: bool) -> str:
+    return f" ({change:+d})" if enabled else ''
+
+
+def print_report(
+    summary: ListingSummary,
+    previous: Optional[ListingSummary],
+    files: Dict[str, str],
+    top: int = 20,
+    output: TextIO = sys.stdout,
+) -> None:
+    diff = previous is not None
+    print("Flash pages:", file=output)
+    pages = sorted(set(summary['pages']) | set(
+        previous['pages'] if previous is not None else []))
+    for page in pages:
+        usage = summary['pages'].get(page, {'size': 0, 'end': PAGE_START})
+        free = PAGE_END - usage['end']
+        change = 0
+        if previous is not None:
+            old = previous['pages'].get(page, {'size': 0, 'end': PAGE_START})
+            change = usage['size'] - old['size']
+        print(
+            f"  page {page}: {usage['size']:5d} bytes, "
+            f"end ${usage['end']:04X}, {free:5d} free"
+            f"{format_change(change, diff)}", file=output)
+
+    title = "changes" if diff else "largest"
+    print(f"Files ({title}):", file=output)
+    previous_files = file_sizes(previous, files) if previous is not None \
+        else None
+    for name, size, change in ranked_changes(
+            file_sizes(summary, files), previous_files, top):
+        print(
+            f"  {size:6d} {name}{format_change(change, diff)}", file=output)
+
+    print(f"Labels ({title}):", file=output)
+    previous_labels = named_label_sizes(previous) if previous is not None \
+        else None
+    for name, size, change in ranked_changes(
+            named_label_sizes(summary), previous_labels, top):
+        print(
+            f"  {size:6d} {name}{format_change(change, diff)}", file=output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 Brian T. Park
+# MIT License.
+
+"""
+Vectorized model of the 14-digit BCD multiplication and division of the
+TI-OS, used to check the rounding errors of every unit conversion of the
+unit definition file in one batch. Requires NumPy.
+
+Usage:
+$ bcdmodel.py [--values N] [--seed S] [--truncate] [--top N] unitdef.txt
+
+A TI-OS floating point number has a sign, a 14-digit BCD mantissa and a
+decimal exponent. The model stores the mantissa as an integer in
+[10^13, 10^14) instead of an array of digits, so that an array of numbers is
+a few NumPy int64 arrays:
+
+    value = sign * mantissa * 10^(exponent - 13)
+
+The product of two 14-digit mantissas (28 digits) would overflow an int64, so
+each mantissa is split into 7-digit halves, and the product is computed as a
+pair of 14-digit words. The quotient is computed by long division, one digit
+at a time for all the elements of the arrays. The exact result is then
+rounded to 14 digits (round-half-up, like compileconst.py), or truncated with
+the '--truncate' flag, to bracket the unknown use of the guard digits by
+FPMult() and FPDiv().
+
+A unit is converted by denominate4.asm in 2 steps, through the base unit of
+its UnitType: 'baseValue = FPMult(scale(src), value)', then
+'value = FPDiv(baseValue, scale(dst))', where each scale is the 14-digit
+float generated by compileunit.py. Every (src, dst) pair of each UnitType is
+checked with 1 and the given number of random 14-digit values, against the
+exact value computed from the exact scales. The error is measured in units in
+the last place (ulp) of the exact value. A result within 0.5 ulp is correctly
+rounded. The Temperature and Fuel units, which are converted by special
+formulas, are not checked.
+"""
+
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import TextIO
+from typing import Tuple
+from typing import TypedDict
+
+import argparse
+import decimal
+import logging
+import sys
+import time
+from fractions import Fraction
+
+import numpy as np
+from numpy.typing import NDArray
+
+from compileunit import Unit
+from compileunit import compile_unit
+from compileconst import FloatExploder as ConstExploder
+from compileconst import TIOS_DIGITS
+
+# Range of the normalized mantissa, [10^13, 10^14).
+MANTISSA_MIN = 10**(TIOS_DIGITS - 1)
+MANTISSA_LIMIT = 10**TIOS_DIGITS
+
+# The mantissas are split into 2 halves of 7 digits for the multiplication.
+SPLIT = 10**(TIOS_DIGITS // 2)
+
+# UnitTypes whose conversions use special formulas instead of the scale.
+SPECIAL_UNIT_TYPES = {'Temperature', 'Fuel'}
+
+# Precision of the exact references, far beyond the 14 digits being checked.
+REFERENCE_CONTEXT = decimal.Context(prec=40)
+
+Int64Array = NDArray[np.int64]
+
+
+def main() -> None:
+    # Configure command line flags.
+    parser = argparse.ArgumentParser(
+        description='Check the rounding errors of the RPN83P unit conversions'
+    )
+    parser.add_argument(
+        '--values',
+        help='Number of random values converted by each pair (default: 16)',
+        type=int,
+        default=16,
+    )
+    parser.add_argument(
+        '--seed',
+        help='Seed of the random values (default: 1)',
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        '--truncate',
+        help='Truncate the results to 14 digits instead of rounding them',
+        action='store_true',
+        default=False,
+    )
+    parser.add_argument(
+        '--top',
+        help='Print the N worst conversions (default: 10)',
+        type=int,
+        default=10,
+    )
+    parser.add_argument(
+        'filename',
+        help='Unit definition file',
+    )
+    args = parser.parse_args()
+
+    # Configure logging. This should normally be executed after the
+    # parser.parse_args() because it allows us set the logging.level using a
+    # flag.
+    logging.basicConfig(level=logging.INFO)
+
+    logging.info(f"Reading {args.filename}")
+    with open(args.filename, encoding="utf-8") as file:
+        units = compile_unit(file.read())['content']['units']
+
+    start = time.perf_counter()
+    batch = conversion_batch(units, random_values(args.values, args.seed))
+    results = convert(batch, not args.truncate)
+    errors = ulp_errors(results, batch['exact'])
+    elapsed = time.perf_counter() - start
+    logging.info(
+        f"  Checked {len(errors)} conversions in {elapsed:.2f} seconds")
+    print_report(batch, errors, args.top)
+
+# -----------------------------------------------------------------------------
+
+
+class FloatArray(TypedDict):
+    """An array of TI-OS floating point numbers. A zero has a mantissa of 0.
+    """
+    sign: Int64Array  # +1 or -1
+    mantissa: Int64Array  # 14 digits, in [10^13, 10^14), or 0
+    exponent: Int64Array  # value = sign * mantissa * 10^(exponent - 13)
+
+
+def from_bytes(values: Iterable[bytes]) -> FloatArray:
+    """Decode the 9-byte TI-OS floats (objectType, exponent + 128, 7 bytes of
+    BCD digits)."""
+    signs: List[int] = []
+    mantissas: List[int] = []
+    exponents: List[int] = []
+    for value in values:
+        signs.append(-1 if value[0] & 0x80 else 1)
+        mantissas.append(int(value[2:9].hex()))
+        exponents.append(value[1] - 128 if value[2] else 0)
+    return {
+        'sign': np.array(signs, dtype=np.int64),
+        'mantissa': np.array(mantissas, dtype=np.int64),
+        'exponent': np.array(exponents, dtype=np.int64),
+    }
+
+
+def from_fractions(values: Iterable[Fraction]) -> FloatArray:
+    """Round the exact values to 14 digits, the same way as the scales of the
+    units are generated by compileunit.py."""
+    return from_bytes(ConstExploder.explode_fraction(x) for x in values)
+
+
+def to_decimals(values: FloatArray) -> List[decimal.Decimal]:
+    """Return the exact values of the floats."""
+    return [
+        decimal.Decimal((0 if sign > 0 else 1, tuple(map(int, str(m))),
+                         exponent - TIOS_DIGITS + 1))
+        if m else decimal.Decimal(0)
+        for sign, m, exponent in zip(
+            values['sign'].tolist(), values['mantissa'].tolist(),
+            values['exponent'].tolist())
+    ]
+
+
+def round_mantissa(
+    sign: Int64Array,
+    mantissa: Int64Array,
+    rest: Int64Array,
+    scale: Int64Array,
+    exponent: Int64Array,
+    rounding: bool,
+) -> FloatArray:
+    """Round the 14-digit mantissa using the discarded digits 'rest' out of
+    'scale' (round-half-up), renormalizing if it overflows to 15 digits."""
+    if rounding:
+        mantissa = mantissa + (2 * rest >= scale)
+    overflow = mantissa >= MANTISSA_LIMIT
+    mantissa = np.where(overflow, mantissa // 10, mantissa)
+    exponent = exponent + overflow
+    return {'sign': sign, 'mantissa': mantissa, 'exponent': exponent}
+
+
+def multiply(a: FloatArray, b: FloatArray, rounding: bool = True) -> FloatArray:
+    """Return the products a*b, element by element, as FPMult() would."""
+    ah, al = np.divmod(a['mantissa'], SPLIT)
+    bh, bl = np.divmod(b['mantissa'], SPLIT)
+    # The 28-digit product is high * 10^14 + low.
+    cross = ah * bl + al * bh
+    low = al * bl + (cross % SPLIT) * SPLIT
+    high = ah * bh + cross // SPLIT + low // MANTISSA_LIMIT
+    low = low % MANTISSA_LIMIT
+
+    # The product has 27 or 28 digits.
+    wide = high >= MANTISSA_MIN
+    mantissa = np.where(wide, high, high * 10 + low // MANTISSA_MIN)
+    rest = np.where(wide, low, low % MANTISSA_MIN)
+    scale = np.where(wide, MANTISSA_LIMIT, MANTISSA_MIN)
+    exponent = a['exponent'] + b['exponent'] + wide
+    result = round_mantissa(
+        a['sign'] * b['sign'], mantissa, rest, scale, exponent, rounding)
+
+    zero = (a['mantissa'] == 0) | (b['mantissa'] == 0)
+    result['mantissa'] = np.where(zero, 0, result['mantissa'])
+    result['exponent'] = np.where(zero, 0, result['exponent'])
+    return result
+
+
+def divide(a: FloatArray, b: FloatArray, rounding: bool = True) -> FloatArray:
+    """Return the quotients a/b, element by element, as FPDiv() would. Throws
+    ValueError if a divisor is zero."""
+    divisor = b['mantissa']
+    if np.any(divisor == 0):
+        raise ValueError("Division by zero")
+    # Long division: the first digit is 0 if the mantissa of a is smaller
+    # than the mantissa of b, followed by 15 more digits.
+    remainder = a['mantissa']
+    quotient = np.zeros_like(remainder)
+    for _ in range(TIOS_DIGITS + 2):
+        digit = remainder // divisor
+        remainder = (remainder - digit * divisor) * 10
+        quotient = quotient * 10 + digit
+
+    wide = quotient >= 10 * MANTISSA_LIMIT
+    mantissa = np.where(wide, quotient // 100, quotient // 10)
+    rest = np.where(wide, quotient % 100, quotient % 10)
+    scale = np.where(wide, 100, 10)
+    exponent = a['exponent'] - b['exponent'] - 1 + wide
+    result = round_mantissa(
+        a['sign'] * b['sign'], mantissa, rest, scale, exponent, rounding)
+
+    zero = a['mantissa'] == 0
+    result['mantissa'] = np.where(zero, 0, result['mantissa'])
+    result['exponent'] = np.where(zero, 0, result['exponent'])
+    return result
+
+# -----------------------------------------------------------------------------
+
+
+class ConversionBatch(TypedDict):
+    """The conversions of every (src, dst) pair of units of the same
+    UnitType, applied to every test value. Each array has one element per
+    conversion."""
+    unit_types: List[str]
+    srcs: List[str]
+    dsts: List[str]
+    value: FloatArray
+    src_scale: FloatArray
+    dst_scale: FloatArray
+    exact: List[decimal.Decimal]  # value * exact(src) / exact(dst)
+
+
+def random_values(count: int, seed: int) -> List[Fraction]:
+    """Return 1, followed by random 14-digit values in [1, 10)."""
+    generator = np.random.default_rng(seed)
+    mantissas = generator.integers(MANTISSA_MIN, MANTISSA_LIMIT, count)
+    return [Fraction(1)] + [
+        Fraction(int(m), MANTISSA_MIN) for m in mantissas.tolist()]
+
+
+def conversion_batch(
+    units: List[Unit], values: List[Fraction],
+) -> ConversionBatch:
+    """Create the conversions of every pair of units of each UnitType, except
+    the SPECIAL_UNIT_TYPES."""
+    by_type: Dict[str, List[Unit]] = {}
+    for unit in units:
+        if unit['unit_type'] not in SPECIAL_UNIT_TYPES:
+            by_type.setdefault(unit['unit_type'], []).append(unit)
+
+    batch: ConversionBatch = {
+        'unit_types': [], 'srcs': [], 'dsts': [],
+        'value': from_fractions([]), 'src_scale': from_fractions([]),
+        'dst_scale': from_fractions([]), 'exact': [],
+    }
+    test_values: List[Fraction] = []
+    src_scales: List[bytes] = []
+    dst_scales: List[bytes] = []
+    for unit_type, members in by_type.items():
+        for src in members:
+            for dst in members:
+                ratio = src['scale_fraction'] / dst['scale_fraction']
+                for value in values:
+                    batch['unit_types'].append(unit_type)
+                    batch['srcs'].append(src['label'])
+                    batch['dsts'].append(dst['label'])
+                    test_values.append(value)
+                    src_scales.append(src['scale_bytes'])
+                    dst_scales.append(dst['scale_bytes'])
+                    exact = value * ratio
+                    batch['exact'].append(REFERENCE_CONTEXT.divide(
+                        decimal.Decimal(exact.numerator),
+                        decimal.Decimal(exact.denominator)))
+    batch['value'] = from_fractions(test_values)
+    batch['src_scale'] = from_bytes(src_scales)
+    batch['dst_scale'] = from_bytes(dst_scales)
+    return batch
+
+
+def convert(batch: ConversionBatch, rounding: bool = True) -> FloatArray:
+    """Convert the values through the base unit, like denominate4.asm."""
+    base = multiply(batch['src_scale'], batch['value'], rounding)
+    return divide(base, batch['dst_scale'], rounding)
+
+
+def ulp_errors(
+    results: FloatArray, exact: List[decimal.Decimal],
+) -> NDArray[np.float64]:
+    """Return the errors of the results in units of the 14th digit of the
+    exact values."""
+    errors: List[float] = []
+    for result, reference in zip(to_decimals(results), exact):
+        if reference == 0:
+            errors.append(0.0 if result == 0 else float('inf'))
+            continue
+        ulp = decimal.Decimal(1).scaleb(reference.adjusted() - TIOS_DIGITS + 1)
+        errors.append(float(
+            REFERENCE_CONTEXT.divide(abs(result - reference), ulp)))
+    return np.array(errors, dtype=np.float64)
+
+# -----------------------------------------------------------------------------
+
+
+class TypeSummary(TypedDict):
+    conversions: int
+    worst: float  # largest error in ulp
+    index: int  # index of the conversion with the largest error
+    misrounded: int  # number of errors larger than 0.5 ulp
+
+
+def summarize(
+    batch: ConversionBatch, errors: NDArray[np.float64],
+) -> Dict[str, TypeSummary]:
+    summaries: Dict[str, TypeSummary] = {}
+    for i, unit_type in enumerate(batch['unit_types']):
+        error = float(errors[i])
+        summary = summaries.setdefault(unit_type, {
+            'conversions': 0, 'worst': -1.0, 'index': i, 'misrounded': 0})
+        summary['conversions'] += 1
+        if error > summary['worst']:
+            summary['worst'] = error
+            summary['index'] = i
+        if error > 0.5:
+            summary['misrounded'] += 1
+    return summaries
+
+
+def describe(batch: ConversionBatch, index: int) -> str:
+    value = to_decimals({
+        'sign': batch['value']['sign'][index:index + 1],
+        'mantissa': batch['value']['mantissa'][index:index + 1],
+        'exponent': batch['value']['exponent'][index:index + 1],
+    })[0]
+    return f"{value} {batch['srcs'][index]} -> {batch['dsts'][index]}"
+
+
+def print_report(
+    batch: ConversionBatch,
+    errors: NDArray[np.float64],
+    top: int = 10,
+    output: TextIO = sys.stdout,
+) -> None:
+    summaries = summarize(batch, errors)
+    print(
+        f"{'UnitType':<16} {'conv':>6} {'>0.5ulp':>7} {'max ulp':>8}  worst",
+        file=output)
+    for unit_type, summary in summaries.items():
+        print(
+            f"{unit_type:<16} {summary['conversions']:6d} "
+            f"{summary['misrounded']:7d} {summary['worst']:8.3f}  "
+            f"{describe(batch, summary['index'])}", file=output)
+    misrounded = sum(s['misrounded'] for s in summaries.values())
+    print(
+        f"Total: {len(errors)} conversions, {misrounded} not correctly "
+        "rounded", file=output)
+
+    if top:
+        print(f"Worst {top} conversions:", file=output)
+        worst: List[Tuple[float, int]] = sorted(
+            ((float(e), i) for i, e in enumerate(errors)),
+            key=lambda x: (-x[0], x[1]))[:top]
+        for error, index in worst:
+            print(
+                f"  {error:8.3f} ulp: {describe(batch, index)}", file=output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,638 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 Brian T. Park
+# MIT License.
+
+"""
+Compile the Constant Definition Language file into the TI-OS Z80 assembly
+language file of a single flash page.
+
+Usage:
+$ compileconst.py [--debug] --page N [--output constdef.asm] constdef.txt
+
+The constdef.txt file has 2 parts. The 'Constants' section defines each
+floating point constant once, using an exact decimal value. Each 'Page' section
+lists the 'opNSetX' loader routines, and the constants without loaders
+('Table'), that are needed by the code on that flash page:
+
+Constants [
+  Constant Pi 3.14159265358979323846 # many digits, rounded once
+  Constant 2Pow32 2^32
+  Constant Ln2 0.69314718055994530942
+  Constant MilePerKm 1/1.609344
+]
+Page 0 [
+  Load OP1 Pi
+  Load OP2 Pi
+]
+Page 2 [
+  Load OP2 2Pow32
+]
+
+The value of a Constant is either a decimal number ('12', '-1', '1E-10',
+'3.1415926535897932'), an integer power ('2^40'), or a quotient of those
+('1/1.609344'). The value is evaluated exactly using Python fractions, then
+rounded once to the 14 significant digits of the TI-OS floating point number.
+
+For the selected page, the compiler generates a 'move9ToOpN' loader stub for
+each 'Load' (6 bytes), and a table of deduplicated 9-byte constants, which
+contains only the constants referenced on that page. Constants with different
+names but identical values share the same 9 bytes. The flash cost of each page
+is printed at the end.
+"""
+
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TextIO
+from typing import TypedDict
+
+import argparse
+import decimal
+import logging
+import sys
+import os
+from fractions import Fraction
+from pprint import pp
+
+
+def main() -> None:
+    # Configure command line flags.
+    parser = argparse.ArgumentParser(
+        description='Compile the RPN83P floating point constant file'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        help='Assembly code output file',
+        required=False,
+    )
+    parser.add_argument(
+        '--debug',
+        help='Print the AST for debugging',
+        action='store_true',
+        default=False,
+    )
+    parser.add_argument(
+        '--page',
+        help='Flash page to generate',
+        type=int,
+        required=True,
+    )
+    parser.add_argument(
+        'filename',
+        help='Constant definition file',
+    )
+    args = parser.parse_args()
+
+    # Configure logging. This should normally be executed after the
+    # parser.parse_args() because it allows us set the logging.level using a
+    # flag.
+    logging.basicConfig(level=logging.INFO)
+
+    # Open the input file and parse.
+    logging.info(f"Reading {args.filename}")
+    with open(args.filename) as file:
+        lexer = Lexer(file)
+        const_parser = ConstParser(lexer)
+        content = const_parser.parse()
+
+    validator = Validator(content)
+    validator.validate()
+
+    exploder = FloatExploder(content)
+    exploder.explode()
+
+    if args.debug:
+        pp(content['constants'], stream=sys.stderr)
+        pp(content['pages'], stream=sys.stderr)
+
+    page = content['pages_by_number'].get(args.page)
+    if page is None:
+        raise ValueError(f"Page {args.page} not defined in {args.filename}")
+    code_generator = CodeGenerator(args.filename, content, page)
+
+    # Determine the output file name.
+    if args.output:
+        outputname = args.output
+    else:
+        outputname = os.path.splitext(args.filename)[0] + f"{args.page}.asm"
+    logging.info(f"Generating {outputname}")
+
+    # Open the output file and generate
+    with open(outputname, "w", encoding="utf-8") as file:
+        code_generator.generate(file)
+
+    logging.info(
+        f"  Page {args.page}: "
+        f"{code_generator.table_count} constants "
+        f"({code_generator.table_size} bytes), "
+        f"{code_generator.loader_count} loaders "
+        f"({code_generator.loader_size} bytes), "
+        f"total {code_generator.table_size + code_generator.loader_size} bytes"
+    )
+    if code_generator.duplicate_count:
+        logging.info(
+            f"  Page {args.page}: {code_generator.duplicate_count} duplicate "
+            f"constants merged ({code_generator.duplicate_count * 9} bytes)"
+        )
+
+# -----------------------------------------------------------------------------
+
+
+# Name suffix of the labels generated for each flash page. The labels on Flash
+# Page 0 have no suffix.
+PAGE_SUFFIXES = {
+    0: '',
+    1: 'PageOne',
+    2: 'PageTwo',
+    3: 'PageThree',
+    4: 'PageFour',
+}
+
+# The OPx registers which have a 'move9ToOpN' routine on each flash page, in
+# memory.asm, memory1.asm, memory2.asm and memory4.asm. Flash Page 3 has none.
+LOAD_REGISTERS = {
+    0: ['OP1', 'OP2', 'OP3', 'OP4'],
+    1: ['OP1', 'OP2', 'OP3', 'OP4'],
+    2: ['OP1', 'OP2', 'OP3'],
+    3: [],
+    4: ['OP1', 'OP2', 'OP3'],
+}
+
+# Size of a loader stub: 'ld hl, constX' (3 bytes) + 'jp move9ToOpN' (3 bytes).
+LOADER_SIZE = 6
+
+# Number of significant digits of a TI-OS floating point number.
+TIOS_DIGITS = 14
+
+
+class Constant(TypedDict, total=False):
+    """A floating point Constant inside the Constants list."""
+    label: str  # suffix of the assembly code label, e.g. 'Pi' for 'constPi'
+    value: str  # exact value expression as written in the constdef file
+    # derived fields
+    value_fraction: Fraction  # 'value' evaluated exactly
+    value_bytes: bytes  # 9-byte TI-OS floating point number
+    value_db_string: str  # 'value_bytes' converted into 9 hex digits
+
+
+class Loader(TypedDict, total=False):
+    """A 'Load' entry inside a Page, i.e. the 'opNSetX' routine."""
+    register: str  # OP1, OP2, OP3, OP4
+    constant: str  # label of the Constant
+
+
+class Page(TypedDict, total=False):
+    """A Page of loaders and constants."""
+    number: int  # flash page number
+    loaders: List[Loader]
+    tables: List[str]  # labels of Constants without a loader
+
+
+class ParsedContent(TypedDict, total=False):
+    """The parsed content of the constdef file."""
+    constants: List[Constant]
+    pages: List[Page]
+
+    constants_by_label: Dict[str, Constant]  # {label -> Constant}
+    pages_by_number: Dict[int, Page]  # {number -> Page}
+
+
+# -----------------------------------------------------------------------------
+
+
+class Lexer:
+    """Read the sys.stdin and tokenize by spliting on white spaces. Comments
+    begin with '#'.
+    """
+    def __init__(self, input: TextIO):
+        self.input = input
+
+        # Input line number, for error messages
+        self.line_number = 0
+        # Internal buffer to hold batches of tokens from each line.
+        self.current_tokens: List[str] = []
+
+    def get_token(self) -> str:
+        token = self.get_token_or_none()
+        if token is None:
+            raise ValueError("Unexpected EOF")
+        return token
+
+    def get_token_or_none(self) -> Optional[str]:
+        """Read the next token. Return None if EOF."""
+        if len(self.current_tokens) == 0:
+            current_line = self.read_line()
+            if current_line is None:
+                return None
+            self.current_tokens = current_line.split()
+
+        token = self.current_tokens[0]
+        self.current_tokens = self.current_tokens[1:]
+        return token
+
+    def read_line(self) -> Optional[str]:
+        """Return the next line. Return None if EOF reached.
+
+        * Comment lines beginning with a '#' character are skipped.
+        * Trailing comment lines beginning with '#' are stripped.
+        * Trailing whitespaces are stripped.
+        * Blank lines are skipped.
+        * Leading whitespaces are kept.
+        """
+        while True:
+            line = self.input.readline()
+            self.line_number += 1
+
+            # EOF returns ''. A blank line returns '\n'.
+            if line == '':
+                return None
+
+            # remove trailing comments
+            i = line.find('#')
+            if i >= 0:
+                line = line[:i]
+
+            # strip any trailing whitespaces
+            line = line.rstrip()
+
+            # skip any blank lines after stripping
+            if not line:
+                continue
+
+            return line
+
+
+# -----------------------------------------------------------------------------
+
+
+class ConstParser:
+    """Create an abstract syntax tree (AST) of Constants and Pages in the
+    constant definition file.
+    """
+    def __init__(self, lexer: Lexer):
+        self.lexer = lexer
+
+    def parse(self) -> ParsedContent:
+        content: ParsedContent = {}
+        content['constants'] = self.process_constants()
+        pages: List[Page] = []
+        while True:
+            token = self.lexer.get_token_or_none()
+            if token is None:
+                break
+            if token != 'Page':
+                raise ValueError(
+                    f"Unexpected '{token}' "
+                    f"at line {self.lexer.line_number}, expected 'Page'"
+                )
+            pages.append(self.process_page())
+        content['pages'] = pages
+        return content
+
+    def expect(self, expected: str) -> None:
+        token = self.lexer.get_token()
+        if token != expected:
+            raise ValueError(
+                f"Unexpected '{token}' "
+                f"at line {self.lexer.line_number}, expected '{expected}'"
+            )
+
+    def process_constants(self) -> List[Constant]:
+        self.expect('Constants')
+        self.expect('[')
+        constants: List[Constant] = []
+        while True:
+            token = self.lexer.get_token()
+            if token == 'Constant':
+                constant: Constant = {}
+                constant['label'] = self.lexer.get_token()
+                constant['value'] = self.lexer.get_token()
+                constants.append(constant)
+            elif token == ']':
+                break
+            else:
+                raise ValueError(
+                    f"Unexpected '{token}' "
+                    f"at line {self.lexer.line_number}, expected ']'"
+                )
+        return constants
+
+    def process_page(self) -> Page:
+        page: Page = {}
+        token = self.lexer.get_token()
+        try:
+            page['number'] = int(token)
+        except ValueError:
+            raise ValueError(
+                f"Invalid page number '{token}' "
+                f"at line {self.lexer.line_number}"
+            )
+        self.expect('[')
+        loaders: List[Loader] = []
+        tables: List[str] = []
+        while True:
+            token = self.lexer.get_token()
+            if token == 'Load':
+                loader: Loader = {}
+                loader['register'] = self.lexer.get_token()
+                loader['constant'] = self.lexer.get_token()
+                loaders.append(loader)
+            elif token == 'Table':
+                tables.append(self.lexer.get_token())
+            elif token == ']':
+                break
+            else:
+                raise ValueError(
+                    f"Unexpected '{token}' "
+                    f"at line {self.lexer.line_number}, expected ']'"
+                )
+        page['loaders'] = loaders
+        page['tables'] = tables
+        return page
+
+
+# -----------------------------------------------------------------------------
+
+
+class Validator:
+    """Validate the constants and pages, and create the lookup maps."""
+
+    def __init__(self, content: ParsedContent):
+        self.content = content
+
+    def validate(self) -> None:
+        self.validate_constants()
+        self.validate_pages()
+
+    def validate_constants(self) -> None:
+        """Check for duplicate constant labels."""
+        constants_by_label: Dict[str, Constant] = {}
+        for constant in self.content['constants']:
+            label = constant['label']
+            if label in constants_by_label:
+                raise ValueError(f"Duplicate Constant '{label}' found")
+            constants_by_label[label] = constant
+        self.content['constants_by_label'] = constants_by_label
+
+    def validate_pages(self) -> None:
+        """Check for duplicate pages, unknown registers, unknown constants,
+        and duplicate loaders."""
+        constants_by_label = self.content['constants_by_label']
+        pages_by_number: Dict[int, Page] = {}
+        for page in self.content['pages']:
+            number = page['number']
+            if number not in PAGE_SUFFIXES:
+                raise ValueError(f"Unsupported Page {number}")
+            if number in pages_by_number:
+                raise ValueError(f"Duplicate Page {number} found")
+            pages_by_number[number] = page
+
+            loader_names: Dict[str, Loader] = {}
+            for loader in page['loaders']:
+                register = loader['register']
+                label = loader['constant']
+                if register not in LOAD_REGISTERS[number]:
+                    raise ValueError(
+                        f"Page {number}: Unsupported register '{register}'")
+                if label not in constants_by_label:
+                    raise ValueError(
+                        f"Page {number}: Unknown Constant '{label}'")
+                name = f"{register}{label}"
+                if name in loader_names:
+                    raise ValueError(
+                        f"Page {number}: Duplicate Load '{register} {label}'")
+                loader_names[name] = loader
+            for label in page['tables']:
+                if label not in constants_by_label:
+                    raise ValueError(
+                        f"Page {number}: Unknown Constant '{label}'")
+        self.content['pages_by_number'] = pages_by_number
+
+
+# -----------------------------------------------------------------------------
+
+
+class FloatExploder:
+    """Evaluate the exact value of each Constant, and convert it to the 9-byte
+    native format used by TI-OS."""
+
+    def __init__(self, content: ParsedContent):
+        self.constants = content['constants']
+
+    def explode(self) -> None:
+        for constant in self.constants:
+            self.explode_constant(constant)
+
+    def explode_constant(self, constant: Constant) -> None:
+        label = constant['label']
+        value = constant['value']
+        try:
+            fraction = self.parse_value(value)
+            constant['value_fraction'] = fraction
+            value_bytes = self.explode_fraction(fraction)
+        except ValueError as e:
+            raise ValueError(f"Invalid Constant '{label}': {str(e)}")
+        constant['value_bytes'] = value_bytes
+        constant['value_db_string'] = self.convert_to_db_string(value_bytes)
+
+    @staticmethod
+    def parse_value(value: str) -> Fraction:
+        """Parse the value expression '{term}' or '{term}/{term}', where
+        '{term}' is a decimal number or an integer power '{decimal}^{int}'.
+        """
+        terms = value.split('/')
+        if len(terms) > 2:
+            raise ValueError(f"Too many '/' in '{value}'")
+        result = FloatExploder.parse_term(terms[0])
+        if len(terms) == 2:
+            divisor = FloatExploder.parse_term(terms[1])
+            if divisor == 0:
+                raise ValueError(f"Division by zero in '{value}'")
+            result /= divisor
+        return result
+
+    @staticmethod
+    def parse_term(term: str) -> Fraction:
+        base_exponent = term.split('^')
+        if len(base_exponent) > 2:
+            raise ValueError(f"Too many '^' in '{term}'")
+        try:
+            base = Fraction(decimal.Decimal(base_exponent[0]))
+        except decimal.InvalidOperation:
+            raise ValueError(f"Invalid number '{base_exponent[0]}'")
+        if len(base_exponent) == 2:
+            try:
+                exponent = int(base_exponent[1])
+            except ValueError:
+                raise ValueError(f"Invalid exponent '{base_exponent[1]}'")
+            base = base ** exponent
+        return base
+
+    @staticmethod
+    def explode_fraction(x: Fraction) -> bytes:
+        """Convert the exact fraction into a TIOS float in scientific notation
+        with 14 significant digits, rounded once (round-half-up), and return
+        the 9-byte representation."""
+        # Decimal division is correctly rounded to the precision of the context.
+        context = decimal.Context(
+            prec=TIOS_DIGITS, rounding=decimal.ROUND_HALF_UP)
+        d = context.divide(
+            decimal.Decimal(x.numerator), decimal.Decimal(x.denominator))
+
+        hexes = bytearray()
+        if d.is_zero():
+            hexes.append(0)  # objectType
+            hexes.append(0x80)  # exponent
+            hexes.extend(bytes(7))
+            return bytes(hexes)
+
+        sign, digits, _ = d.as_tuple()
+        exponent = d.adjusted()
+        if exponent < -99 or exponent > 99:
+            raise ValueError(f"Exponent out of range: '{d}'")
+        ti_digits = list(digits) + [0] * (TIOS_DIGITS - len(digits))
+
+        # Convert to the 9-byte binary representation TIOS floating number
+        hexes.append(0x80 if sign else 0)  # objectType, with sign bit
+        hexes.append(exponent + 128)  # exponent as one binary byte
+        for i in range(0, TIOS_DIGITS, 2):
+            # Convert 7 pairs of digits to BCD notation
+            hexes.append(ti_digits[i] * 16 + ti_digits[i + 1])
+        return bytes(hexes)
+
+    @staticmethod
+    def convert_to_db_string(value_bytes: bytes) -> str:
+        return ", ".join(f"${b:02X}" for b in value_bytes)
+
+    @staticmethod
+    def convert_to_str(value_bytes: bytes) -> str:
+        """Convert the 9-byte TIOS float back into a human readable string,
+        e.g. '3.1415926535898E0'."""
+        sign = '-' if value_bytes[0] & 0x80 else ''
+        exponent = value_bytes[1] - 128
+        digits = value_bytes[2:].hex().upper().rstrip('0') or '0'
+        mantissa = digits[0] + ('.' + digits[1:] if len(digits) > 1 else '')
+        if exponent == 0:
+            return f"{sign}{mantissa}"
+        return f"{sign}{mantissa}E{exponent}"
+
+
+# -----------------------------------------------------------------------------
+
+
+class CodeGenerator:
+    """Generate the Z80 assembly statements for a single flash page. There are
+    2 sections:
+    1) the 'opNSetX' loader routines,
+    2) the table of deduplicated 9-byte constants used by those loaders.
+    """
+    def __init__(
+        self,
+        inputfile: str,
+        content: ParsedContent,
+        page: Page,
+    ):
+        self.inputfile = inputfile
+        self.content = content
+        self.page = page
+        self.suffix = PAGE_SUFFIXES[page['number']]
+
+        # Statistics, available after generate()
+        self.loader_count = 0
+        self.loader_size = 0
+        self.table_count = 0
+        self.table_size = 0
+        self.duplicate_count = 0
+
+    def generate(self, output: TextIO) -> None:
+        self.output = output
+        number = self.page['number']
+
+        print(f"""\
+;-----------------------------------------------------------------------------
+; Floating point constants for routines in Flash Page {number}, generated from
+; {self.inputfile}.
+;
+; There are 2 sections:
+; - list of 'opNSetX' loader routines
+; - table of 9-byte TI-OS floating point constants
+;
+; DO NOT EDIT: This file was autogenerated.
+;-----------------------------------------------------------------------------
+
+""", file=self.output, end='')
+
+        logging.info(f"  Generating Page {number} loaders")
+        self.generate_loaders()
+
+        logging.info(f"  Generating Page {number} constants")
+        self.generate_table()
+
+    def generate_loaders(self) -> None:
+        constants_by_label = self.content['constants_by_label']
+        suffix = self.suffix
+        for loader in self.page['loaders']:
+            register = loader['register']
+            label = loader['constant']
+            constant = constants_by_label[label]
+            value = constant['value']
+            if len(value) > TIOS_DIGITS + 2:
+                # Show the rounded value instead of the long exact value.
+                value = FloatExploder.convert_to_str(constant['value_bytes'])
+            n = register[2:]
+            print(f"""\
+; Description: Set {register} to {value}.
+; Destroys: all, HL
+op{n}Set{label}{suffix}:
+    ld hl, const{label}{suffix}
+    jp move9ToOp{n}{suffix}
+
+""", file=self.output, end='')
+            self.loader_count += 1
+        self.loader_size = self.loader_count * LOADER_SIZE
+
+    def generate_table(self) -> None:
+        """Generate the constants referenced on this page, in the order of the
+        Constants section. Constants with identical bytes share a single entry
+        with multiple labels."""
+        referenced = set(loader['constant'] for loader in self.page['loaders'])
+        referenced.update(self.page['tables'])
+
+        # Group the labels by their 9-byte value, preserving the order.
+        labels_by_bytes: Dict[bytes, List[Constant]] = {}
+        for constant in self.content['constants']:
+            if constant['label'] not in referenced:
+                continue
+            value_bytes = constant['value_bytes']
+            labels_by_bytes.setdefault(value_bytes, []).append(constant)
+
+        print(f"""\
+;-----------------------------------------------------------------------------
+
+constCount{self.suffix} equ {len(labels_by_bytes)} ; number of constants
+
+""", file=self.output, end='')
+
+        suffix = self.suffix
+        for value_bytes, constants in labels_by_bytes.items():
+            for constant in constants:
+                label = constant['label']
+                value = constant['value']
+                print(f"const{label}{suffix}: ; {value}", file=self.output)
+            value_str = FloatExploder.convert_to_str(value_bytes)
+            db_string = FloatExploder.convert_to_db_string(value_bytes)
+            print(f"""\
+    .db {db_string} ; {value_str}
+
+""", file=self.output, end='')
+            self.table_count += 1
+            self.duplicate_count += len(constants) - 1
+        self.table_size = self.table_count * 9
+
+
+# -----------------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 Brian T. Park
+# MIT License.
+
+"""
+Compile the Error Definition Language file into a TI-OS Z80 assembly language
+file containing the error code equates, the errorStrings pointer table, and
+the pool of error message strings.
+
+Usage:
+$ compileerror.py [--debug] [--output errordef1.asm] errordef.txt
+
+The error definition file contains lines of the form:
+
+Default {name} "{message}" [# comment]
+Error {code} {name} "{message}" [# comment]
+Reserved {code} [# comment]
+
+Each 'Error' generates an 'errorCode{name} equ {code}' equate, and an entry
+at index {code} of the errorStrings table pointing to 'errorStr{name}'. Each
+'Reserved' generates a placeholder 'errorCode{code} equ {code}' equate for a
+code whose message is not known. The codes which are reserved or not defined
+point to the 'Default' message. The 'errorCodeCount' equate is one more than
+the largest code, so that the table can be indexed directly by the error code
+with a single bounds check.
+
+The message strings are stored in a pool. A message which is identical to, or
+a suffix of, a longer message is not stored again, but is defined as an offset
+into the longer message. The size of the pool and the number of bytes saved
+are printed.
+"""
+
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TextIO
+from typing import Tuple
+from typing import TypedDict
+
+import argparse
+import logging
+import os
+import re
+import sys
+from pprint import pp
+
+
+def main() -> None:
+    # Configure command line flags.
+    parser = argparse.ArgumentParser(
+        description='Compile the RPN83P error definition file'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        help='Assembly code output file',
+        required=False,
+    )
+    parser.add_argument(
+        '--debug',
+        help='Print the AST for debugging',
+        action='store_true',
+        default=False,
+    )
+    parser.add_argument(
+        'filename',
+        help='Error definition file',
+    )
+    args = parser.parse_args()
+
+    # Configure logging. This should normally be executed after the
+    # parser.parse_args() because it allows us set the logging.level using a
+    # flag.
+    logging.basicConfig(level=logging.INFO)
+
+    # Open the input file and parse.
+    logging.info(f"Reading {args.filename}")
+    with open(args.filename) as file:
+        error_parser = ErrorParser(file)
+        config = error_parser.parse()
+
+    validator = Validator(config)
+    validator.validate()
+
+    pool = StringPool(config)
+    pool.build()
+
+    if args.debug:
+        pp(config, stream=sys.stderr)
+        pp(pool.aliases, stream=sys.stderr)
+
+    # Determine the output file name.
+    if args.output:
+        outputname = args.output
+    else:
+        outputname = os.path.splitext(args.filename)[0] + "1.asm"
+    logging.info(f"Generating {outputname}")
+
+    # Open the output file and generate
+    with open(outputname, "w", encoding="utf-8") as file:
+        code_generator = CodeGenerator(args.filename, config, pool)
+        code_generator.generate(file)
+
+    count = error_code_count(config)
+    logging.info(
+        f"  Error codes: {count} ({len(config['errors'])} defined, "
+        f"{len(config['reserved'])} reserved)")
+    logging.info(f"  Pointer table: {2 * count} bytes")
+    logging.info(
+        f"  String pool: {pool.pool_size()} bytes "
+        f"(saved {pool.unpooled_size() - pool.pool_size()} bytes)"
+    )
+
+# -----------------------------------------------------------------------------
+
+
+class ErrorDef(TypedDict, total=False):
+    """An Error, a Reserved code, or the Default message."""
+    code: int  # not defined for the Default
+    name: str  # the code itself for a Reserved code
+    message: str  # empty for a Reserved code
+    comment: str
+    line: int  # line number in the source file, for error messages
+
+
+class ErrorConfig(TypedDict, total=False):
+    """The parsed content of the error definition file."""
+    default: ErrorDef
+    errors: List[ErrorDef]
+    reserved: List[ErrorDef]  # codes which use the Default message
+
+# -----------------------------------------------------------------------------
+
+
+class ErrorParser:
+    """Read the error definition file line by line. Comment lines begin with
+    '#', and trailing comments after the message are kept in the generated
+    code."""
+
+    ERROR_PATTERN = re.compile(
+        r'^Error\s+(\d+)\s+([A-Za-z0-9_]+)\s+"([^"]*)"\s*(?:#\s*(.*))?$'
+    )
+    DEFAULT_PATTERN = re.compile(
+        r'^Default\s+([A-Za-z0-9_]+)\s+"([^"]*)"\s*(?:#\s*(.*))?$'
+    )
+    RESERVED_PATTERN = re.compile(r'^Reserved\s+(\d+)\s*(?:#\s*(.*))?$')
+
+    def __init__(self, input: TextIO):
+        self.input = input
+
+    def parse(self) -> ErrorConfig:
+        config: ErrorConfig = {'errors': [], 'reserved': []}
+        for line_number, line in enumerate(self.input, start=1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            match = self.ERROR_PATTERN.match(line)
+            if match:
+                config['errors'].append({
+                    'code': int(match.group(1)),
+                    'name': match.group(2),
+                    'message': match.group(3),
+                    'comment': match.group(4) or '',
+                    'line': line_number,
+                })
+                continue
+            match = self.RESERVED_PATTERN.match(line)
+            if match:
+                config['reserved'].append({
+                    'code': int(match.group(1)),
+                    'name': match.group(1),
+                    'message': '',
+                    'comment': match.group(2) or '',
+                    'line': line_number,
+                })
+                continue
+            match = self.DEFAULT_PATTERN.match(line)
+            if match:
+                if 'default' in config:
+                    raise ValueError(
+                        f"Duplicate 'Default' at line {line_number}")
+                config['default'] = {
+                    'name': match.group(1),
+                    'message': match.group(2),
+                    'comment': match.group(3) or '',
+                    'line': line_number,
+                }
+                continue
+            raise ValueError(f"Invalid syntax '{line}' at line {line_number}")
+        return config
+
+# -----------------------------------------------------------------------------
+
+
+class Validator:
+    """Validate the error codes and names."""
+
+    # The error code is passed around in a single byte.
+    MAX_CODE = 255
+
+    def __init__(self, config: ErrorConfig):
+        self.config = config
+
+    def validate(self) -> None:
+        if 'default' not in self.config:
+            raise ValueError("Missing 'Default'")
+        if not self.config['errors']:
+            raise ValueError("No 'Error' found")
+        names: Dict[str, ErrorDef] = {
+            self.config['default']['name']: self.config['default']
+        }
+        codes: Dict[int, ErrorDef] = {}
+        for error in self.config['errors'] + self.config['reserved']:
+            code = error['code']
+            if code > self.MAX_CODE:
+                raise ValueError(
+                    f"Code {code} at line {error['line']} "
+                    f"must be <= {self.MAX_CODE}")
+            if code in codes:
+                raise ValueError(
+                    f"Duplicate code {code} at line {error['line']}")
+            codes[code] = error
+            name = error['name']
+            if name in names:
+                raise ValueError(
+                    f"Duplicate name '{name}' at line {error['line']}")
+            names[name] = error
+
+
+def error_code_count(config: ErrorConfig) -> int:
+    return max(
+        error['code'] for error in config['errors'] + config['reserved']) + 1
+
+# -----------------------------------------------------------------------------
+
+
+class StringPool:
+    """Determine which messages share the bytes of a longer message. The
+    messages are NUL-terminated, so a message can share only the tail of
+    another message.
+    """
+
+    def __init__(self, config: ErrorConfig):
+        self.config = config
+        # {name -> (target name, offset)} for messages which are not stored
+        self.aliases: Dict[str, Tuple[str, int]] = {}
+
+    def all_defs(self) -> List[ErrorDef]:
+        return [self.config['default']] + self.config['errors']
+
+    def build(self) -> None:
+        # Examine the longest messages first, so that every message is
+        # compared against all the messages which could contain it.
+        stored: List[ErrorDef] = []
+        for d in sorted(self.all_defs(), key=lambda d: -len(d['message'])):
+            target = self.find_container(stored, d['message'])
+            if target is None:
+                stored.append(d)
+                continue
+            offset = len(target['message']) - len(d['message'])
+            self.aliases[d['name']] = (target['name'], offset)
+
+    @staticmethod
+    def find_container(
+        stored: List[ErrorDef], message: str
+    ) -> Optional[ErrorDef]:
+        for d in stored:
+            if d['message'].endswith(message):
+                return d
+        return None
+
+    def unpooled_size(self) -> int:
+        return sum(len(d['message']) + 1 for d in self.all_defs())
+
+    def pool_size(self) -> int:
+        return sum(
+            len(d['message']) + 1 for d in self.all_defs()
+            if d['name'] not in self.aliases
+        )
+
+# -----------------------------------------------------------------------------
+
+
+class CodeGenerator:
+    """Generate the Z80 assembly statements. There are 3 sections:
+    1) the errorCodeXxx equates,
+    2) the errorStrings table, indexed by the error code,
+    3) the string pool.
+    """
+
+    def __init__(self, inputfile: str, config: ErrorConfig, pool: StringPool):
+        self.inputfile = inputfile
+        self.config = config
+        self.pool = pool
+
+    def generate(self, output: TextIO) -> None:
+        self.output = output
+
+        print(f"""\
+;-----------------------------------------------------------------------------
+; Error codes and error strings generated from {self.inputfile}.
+;
+; DO NOT EDIT: This file was autogenerated.
+;-----------------------------------------------------------------------------
+
+""", file=self.output, end='')
+
+        self.generate_codes()
+        self.generate_table()
+        self.generate_strings()
+
+    def generate_codes(self) -> None:
+        logging.info("  Generating errorCode equates")
+        equates = sorted(
+            self.config['errors'] + self.config['reserved'],
+            key=lambda error: error['code'])
+        for error in equates:
+            equate = f"errorCode{error['name']} equ {error['code']}"
+            comment = error['comment']
+            if comment:
+                print(f"{equate:<40} ; {comment}", file=self.output)
+            else:
+                print(equate, file=self.output)
+        count = error_code_count(self.config)
+        print(f"""\
+errorCodeCount equ {count} ; total number of error codes
+
+""", file=self.output, end='')
+
+    def generate_table(self) -> None:
+        logging.info("  Generating errorStrings")
+        by_code = {error['code']: error for error in self.config['errors']}
+        default_name = self.config['default']['name']
+        print("""\
+; Array of (char*) pointers to C strings, indexed by the error code. The codes
+; without a message point to the Default message.
+errorStrings:
+""", file=self.output, end='')
+        for code in range(error_code_count(self.config)):
+            error = by_code.get(code)
+            name = default_name if error is None else error['name']
+            print(f"    .dw errorStr{name} ; {code}", file=self.output)
+        print(file=self.output)
+
+    def generate_strings(self) -> None:
+        logging.info("  Generating string pool")
+        print("; Pool of C strings.", file=self.output)
+        defs = self.pool.all_defs()
+        for d in defs:
+            if d['name'] in self.pool.aliases:
+                continue
+            print(f"""\
+errorStr{d['name']}:
+    .db "{d['message']}", 0
+""", file=self.output, end='')
+
+        # The aliases must come after their targets, because spasm-ng cannot
+        # handle forward references in 'equ' statements.
+        aliases = [d for d in defs if d['name'] in self.pool.aliases]
+        if not aliases:
+            return
+        print("""
+; Strings which are the suffix of a string above.
+""", file=self.output, end='')
+        for d in aliases:
+            target, offset = self.pool.aliases[d['name']]
+            print(
+                f"errorStr{d['name']} equ errorStr{target}+{offset}"
+                f' ; "{d["message"]}"',
+                file=self.output)
+
+
+if __name__ == '__main__':
+    main()
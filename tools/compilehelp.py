@@ -0,0 +1,548 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 Brian T. Park
+# MIT License.
+
+"""
+Compile the Help Definition Language file into a TI-OS Z80 assembly language
+file containing the online HELP pages, and the 'helpPages' pointer table used
+by helpscanner1.asm.
+
+Usage:
+$ compilehelp.py [--debug] [--compress] [--output helpdef1.asm] helpdef.txt
+
+Each 'Page {title}' line starts a new page. The title is rendered in the large
+font. The lines following it, until the next 'Page', are the body of the page
+in the small font. Special characters of the small font are referenced using
+their identifier enclosed in '<' and '>', e.g. '<Shyphen>', the same as
+compilemenu.py. Comment lines begin with a '#' in the first column. Trailing
+blank lines of each page are ignored.
+
+The layout of each page is calculated at compile time:
+
+- body lines wider than the LCD (96 pixels) are wrapped at a space, using the
+  approximate glyph widths of the small font,
+- the body is padded with blank lines so that the footer is always on the last
+  line of the LCD,
+- the footer with the page number '[n/N]' is generated automatically.
+
+If '--compress' is given, phrases which occur more than once across all pages
+are moved into a shared dictionary ('helpDictionary') and replaced by a 2-byte
+reference (escapeDictionary, index) which is expanded by eVPutS() in
+print1.asm. The dictionary is selected greedily, one phrase at a time, by the
+largest number of bytes saved. The size of the help text before and after
+compression is printed.
+"""
+
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TextIO
+from typing import Tuple
+from typing import TypedDict
+
+import argparse
+import logging
+import os
+import sys
+from pprint import pp
+
+
+def main() -> None:
+    # Configure command line flags.
+    parser = argparse.ArgumentParser(
+        description='Compile the RPN83P help definition file'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        help='Assembly code output file',
+        required=False,
+    )
+    parser.add_argument(
+        '--debug',
+        help='Print the AST for debugging',
+        action='store_true',
+        default=False,
+    )
+    parser.add_argument(
+        '--compress',
+        help='Compress the help text using a shared dictionary',
+        action='store_true',
+        default=False,
+    )
+    parser.add_argument(
+        'filename',
+        help='Help definition file',
+    )
+    args = parser.parse_args()
+
+    # Configure logging. This should normally be executed after the
+    # parser.parse_args() because it allows us set the logging.level using a
+    # flag.
+    logging.basicConfig(level=logging.INFO)
+
+    # Open the input file and parse.
+    logging.info(f"Reading {args.filename}")
+    with open(args.filename) as file:
+        help_parser = HelpParser(file)
+        pages = help_parser.parse()
+
+    layout = Layout(pages)
+    layout.layout()
+
+    dictionary: List[Phrase] = []
+    uncompressed_size = text_size(pages, dictionary)
+    if args.compress:
+        compressor = Compressor(pages)
+        dictionary = compressor.compress()
+
+    if args.debug:
+        pp(pages, stream=sys.stderr)
+        pp(dictionary, stream=sys.stderr)
+
+    # Determine the output file name.
+    if args.output:
+        outputname = args.output
+    else:
+        outputname = os.path.splitext(args.filename)[0] + "1.asm"
+    logging.info(f"Generating {outputname}")
+
+    # Open the output file and generate
+    with open(outputname, "w", encoding="utf-8") as file:
+        code_generator = CodeGenerator(args.filename, pages, dictionary)
+        code_generator.generate(file)
+
+    logging.info(f"  Pages: {len(pages)}")
+    logging.info(f"  Uncompressed size: {uncompressed_size} bytes")
+    if args.compress:
+        compressed_size = text_size(pages, dictionary)
+        logging.info(
+            f"  Compressed size: {compressed_size} bytes, "
+            f"with {len(dictionary)} dictionary phrases "
+            f"(saved {uncompressed_size - compressed_size} bytes)"
+        )
+
+# -----------------------------------------------------------------------------
+
+
+# A Token is a single byte of the help text, as a (kind, value) tuple:
+#   - ('c', 'a'): a printable ASCII character
+#   - ('s', 'Shyphen'): a character of the small font by its identifier
+#   - ('d', '3'): a reference to the phrase at index 3 of the dictionary,
+#     which occupies 2 bytes (escapeDictionary, index)
+Token = Tuple[str, str]
+Phrase = Tuple[Token, ...]
+
+
+class Page(TypedDict, total=False):
+    """A help page."""
+    title: List[Token]
+    lines: List[List[Token]]  # body lines
+    line: int  # line number in the source file, for error messages
+    # derived fields
+    footer: List[Token]  # footer line, only if compressed
+
+
+# Dimensions of the LCD in pixels.
+LCD_WIDTH = 96
+LCD_HEIGHT = 64
+LARGE_FONT_HEIGHT = 8
+LARGE_FONT_WIDTH = 6
+SMALL_FONT_HEIGHT = 7
+
+# Number of body lines in the small font between the title line and the
+# footer line.
+BODY_LINES = (LCD_HEIGHT - LARGE_FONT_HEIGHT) // SMALL_FONT_HEIGHT - 1
+
+FOOTER_NEXT = " Any key to continue..."
+FOOTER_LAST = " Any key to return."
+
+# Max number of phrases in the dictionary, indexed by a single byte.
+DICTIONARY_LIMIT = 256
+
+# Approximate widths (in pixels, including the 1-pixel spacing) of the glyphs
+# of the small font which are different from the default. Only used to wrap
+# long lines, so the exact values are not critical.
+DEFAULT_GLYPH_WIDTH = 4
+GLYPH_WIDTHS: Dict[str, int] = {
+    ' ': 1, '!': 2, "'": 2, ',': 2, '.': 2, ':': 2, ';': 2, 'i': 2,
+    'l': 2, '|': 2,
+    '(': 3, ')': 3, '[': 3, ']': 3, '1': 3, 'I': 3, 'j': 3,
+    '{': 3, '}': 3,
+    'M': 6, 'N': 5, 'Q': 5, 'W': 6, 'm': 6, 'w': 6, '#': 6, '%': 6,
+    '&': 5, '@': 6, '~': 5,
+}
+
+# Characters which cannot appear inside a dictionary phrase, because eVPutS()
+# interprets them instead of printing them.
+CONTROL_SYMBOLS = {'Senter', 'Lenter', 'escapeLargeFont', 'escapeSmallFont'}
+
+# -----------------------------------------------------------------------------
+
+
+class HelpParser:
+    """Read the help definition file line by line, and create the list of
+    Pages."""
+
+    def __init__(self, input: TextIO):
+        self.input = input
+        self.line_number = 0
+
+    def parse(self) -> List[Page]:
+        pages: List[Page] = []
+        page: Optional[Page] = None
+        for line in self.input:
+            self.line_number += 1
+            if line.startswith('#'):
+                continue
+            line = line.rstrip()
+            if line.startswith('Page ') or line == 'Page':
+                page = {
+                    'title': self.explode_line(line[5:].strip()),
+                    'lines': [],
+                    'line': self.line_number,
+                }
+                pages.append(page)
+                continue
+            if page is None:
+                if line:
+                    raise ValueError(
+                        f"Unexpected '{line}' at line {self.line_number}, "
+                        "expected 'Page'"
+                    )
+                continue
+            page['lines'].append(self.explode_line(line))
+
+        if not pages:
+            raise ValueError("No 'Page' found")
+        for page in pages:
+            # Remove trailing blank lines.
+            lines = page['lines']
+            while lines and not lines[-1]:
+                lines.pop()
+        return pages
+
+    def explode_line(self, s: str) -> List[Token]:
+        try:
+            return explode_str(s)
+        except ValueError as e:
+            raise ValueError(f"{str(e)} at line {self.line_number}")
+
+
+def explode_str(s: str) -> List[Token]:
+    """Convert the string into a list of Tokens. The small font identifiers
+    are enclosed in '<' and '>'."""
+    i = 0
+    tokens: List[Token] = []
+    while i < len(s):
+        c = s[i]
+        if c == '<':
+            j = s.find('>', i)
+            if j < 0:
+                raise ValueError(f"Missing '>' in string '{s}'")
+            fonttag = s[i + 1:j]  # extract word inside <...>
+            if not fonttag:
+                raise ValueError(f"Empty <> in string '{s}'")
+            tokens.append(('s', fonttag))
+            i = j
+        elif c == '"' or c == '\\' or ord(c) < 32 or ord(c) > 126:
+            raise ValueError(f"Unsupported character '{c}'")
+        else:
+            tokens.append(('c', c))
+        i += 1
+    return tokens
+
+# -----------------------------------------------------------------------------
+
+
+class Layout:
+    """Wrap the long lines and validate the height of each page."""
+
+    def __init__(self, pages: List[Page]):
+        self.pages = pages
+
+    def layout(self) -> None:
+        for page in self.pages:
+            title_width = len(page['title']) * LARGE_FONT_WIDTH
+            if title_width > LCD_WIDTH:
+                raise ValueError(
+                    f"Title of Page at line {page['line']} is too wide "
+                    f"({title_width} pixels)"
+                )
+            lines: List[List[Token]] = []
+            for line in page['lines']:
+                lines.extend(self.wrap(line))
+            if len(lines) > BODY_LINES:
+                raise ValueError(
+                    f"Page at line {page['line']} has too many lines "
+                    f"({len(lines)}), must be <= {BODY_LINES}"
+                )
+            page['lines'] = lines
+
+    @staticmethod
+    def wrap(line: List[Token]) -> List[List[Token]]:
+        """Split the line at the last space which fits in the LCD width. A
+        word which is wider than the LCD is not split."""
+        lines: List[List[Token]] = []
+        while line_width(line) > LCD_WIDTH:
+            width = 0
+            split = -1
+            for i, token in enumerate(line):
+                width += token_width(token)
+                if width > LCD_WIDTH:
+                    break
+                if token == ('c', ' '):
+                    split = i
+            if split <= 0:
+                break
+            lines.append(line[:split])
+            line = line[split + 1:]
+        lines.append(line)
+        return lines
+
+
+def token_width(token: Token) -> int:
+    kind, value = token
+    if kind == 'c':
+        return GLYPH_WIDTHS.get(value, DEFAULT_GLYPH_WIDTH)
+    return DEFAULT_GLYPH_WIDTH
+
+
+def line_width(line: List[Token]) -> int:
+    return sum(token_width(token) for token in line)
+
+# -----------------------------------------------------------------------------
+
+
+def footer(page_number: int, page_count: int) -> List[Token]:
+    """Return the '[n/N] Any key...' footer of the page_number (1-based)."""
+    text = FOOTER_LAST if page_number == page_count else FOOTER_NEXT
+    return (
+        [('s', 'SlBrack')]
+        + explode_str(f"{page_number}/{page_count}")
+        + [('s', 'SrBrack')]
+        + explode_str(text)
+    )
+
+
+def page_lines(page: Page, page_number: int, page_count: int) \
+        -> List[List[Token]]:
+    """Return the body lines of the page, padded with blank lines, followed by
+    the footer."""
+    lines = list(page['lines'])
+    while len(lines) < BODY_LINES:
+        lines.append([])
+    lines.append(page.get('footer') or footer(page_number, page_count))
+    return lines
+
+
+def tokens_size(tokens: List[Token]) -> int:
+    return sum(2 if kind == 'd' else 1 for kind, _ in tokens)
+
+
+def text_size(pages: List[Page], dictionary: List[Phrase]) -> int:
+    """Return the number of bytes of the help text, including the pointer
+    tables and the dictionary."""
+    size = 2 * len(pages)
+    for page_number, page in enumerate(pages, start=1):
+        # escapeLargeFont, title, Lenter, escapeSmallFont
+        size += 1 + len(page['title']) + 1 + 1
+        for line in page_lines(page, page_number, len(pages)):
+            size += tokens_size(line) + 1  # Senter
+        size += 1  # NUL
+    for phrase in dictionary:
+        size += 2 + len(phrase) + 1
+    return size
+
+# -----------------------------------------------------------------------------
+
+
+class Compressor:
+    """Replace the phrases occurring more than once by references to a shared
+    dictionary. The footers are compressed as well, so they are stored in the
+    page."""
+
+    MIN_PHRASE = 3
+    MAX_PHRASE = 32
+
+    def __init__(self, pages: List[Page]):
+        self.pages = pages
+
+    def compress(self) -> List[Phrase]:
+        page_count = len(self.pages)
+        for page_number, page in enumerate(self.pages, start=1):
+            page['footer'] = footer(page_number, page_count)
+
+        dictionary: List[Phrase] = []
+        while len(dictionary) < DICTIONARY_LIMIT:
+            best: Optional[Phrase] = None
+            best_saving = 0
+            for phrase, count in self.count_phrases().items():
+                # Each occurrence shrinks to 2 bytes. The phrase costs its
+                # pointer, its bytes, and the NUL terminator.
+                saving = count * (len(phrase) - 2) - (2 + len(phrase) + 1)
+                if saving > best_saving:
+                    best = phrase
+                    best_saving = saving
+            if best is None:
+                break
+            self.replace(best, len(dictionary))
+            dictionary.append(best)
+        return dictionary
+
+    def all_lines(self) -> List[List[Token]]:
+        lines: List[List[Token]] = []
+        for page in self.pages:
+            lines.extend(page['lines'])
+            lines.append(page['footer'])
+        return lines
+
+    def count_phrases(self) -> Dict[Phrase, int]:
+        """Count the non-overlapping occurrences of every phrase."""
+        counts: Dict[Phrase, int] = {}
+        for line in self.all_lines():
+            last_end: Dict[Phrase, int] = {}
+            for i in range(len(line)):
+                if not self.is_compressible(line[i]):
+                    continue
+                for j in range(i + 1, min(i + self.MAX_PHRASE, len(line)) + 1):
+                    if not self.is_compressible(line[j - 1]):
+                        break
+                    if j - i < self.MIN_PHRASE:
+                        continue
+                    phrase = tuple(line[i:j])
+                    if i < last_end.get(phrase, 0):
+                        continue
+                    last_end[phrase] = j
+                    counts[phrase] = counts.get(phrase, 0) + 1
+        return counts
+
+    @staticmethod
+    def is_compressible(token: Token) -> bool:
+        kind, value = token
+        return kind == 'c' or (kind == 's' and value not in CONTROL_SYMBOLS)
+
+    def replace(self, phrase: Phrase, index: int) -> None:
+        for line in self.all_lines():
+            i = 0
+            n = len(phrase)
+            while i + n <= len(line):
+                if tuple(line[i:i + n]) == phrase:
+                    line[i:i + n] = [('d', str(index))]
+                i += 1
+
+# -----------------------------------------------------------------------------
+
+
+class CodeGenerator:
+    """Generate the Z80 assembly statements. There are 3 sections:
+    1) the helpPages pointer table,
+    2) the optional dictionary,
+    3) the pages.
+    """
+
+    def __init__(
+        self,
+        inputfile: str,
+        pages: List[Page],
+        dictionary: List[Phrase],
+    ):
+        self.inputfile = inputfile
+        self.pages = pages
+        self.dictionary = dictionary
+
+    def generate(self, output: TextIO) -> None:
+        self.output = output
+
+        print(f"""\
+;-----------------------------------------------------------------------------
+; Online HELP strings generated from {self.inputfile}.
+;
+; DO NOT EDIT: This file was autogenerated.
+;-----------------------------------------------------------------------------
+
+""", file=self.output, end='')
+
+        self.generate_pointers()
+        if self.dictionary:
+            self.generate_dictionary()
+        self.generate_pages()
+
+    def generate_pointers(self) -> None:
+        print("""\
+; Array of (char*) pointers to C-strings.
+helpPages:
+""", file=self.output, end='')
+        for page_number in range(1, len(self.pages) + 1):
+            print(f"    .dw msgHelpPage{page_number}", file=self.output)
+        print("""\
+helpPagesEnd:
+helpPageCount equ (helpPagesEnd-helpPages)/2
+
+""", file=self.output, end='')
+
+    def generate_dictionary(self) -> None:
+        logging.info("  Generating helpDictionary")
+        print("""\
+; Enable the expansion of escapeDictionary in eVPutS().
+#define HELP_DICTIONARY
+
+; Array of (char*) pointers to the phrases shared by the help pages.
+helpDictionary:
+""", file=self.output, end='')
+        for index in range(len(self.dictionary)):
+            print(f"    .dw helpPhrase{index}", file=self.output)
+        print(file=self.output)
+        for index, phrase in enumerate(self.dictionary):
+            print(f"""\
+helpPhrase{index}:
+    .db {self.format_tokens(list(phrase))}, 0
+""", file=self.output, end='')
+        print(file=self.output)
+
+    def generate_pages(self) -> None:
+        logging.info("  Generating msgHelpPage")
+        page_count = len(self.pages)
+        for page_number, page in enumerate(self.pages, start=1):
+            title = self.format_tokens(page['title'])
+            print(f"""\
+msgHelpPage{page_number}:
+    .db escapeLargeFont, {title}, Lenter
+""", file=self.output, end='')
+            lines = page_lines(page, page_number, page_count)
+            for i, line in enumerate(lines):
+                prefix = "escapeSmallFont, " if i == 0 else ""
+                if line:
+                    text = self.format_tokens(line)
+                    print(
+                        f"    .db {prefix}{text}, Senter",
+                        file=self.output)
+                else:
+                    print(f"    .db {prefix}Senter", file=self.output)
+            print("    .db 0", file=self.output)
+            if page_number < page_count:
+                print(file=self.output)
+
+    @staticmethod
+    def format_tokens(tokens: List[Token]) -> str:
+        """Join the consecutive characters into quoted strings."""
+        items: List[str] = []
+        chars = ''
+        for kind, value in tokens:
+            if kind == 'c':
+                chars += value
+                continue
+            if chars:
+                items.append(f'"{chars}"')
+                chars = ''
+            if kind == 'd':
+                items.append(f"escapeDictionary, {value}")
+            else:
+                items.append(value)
+        if chars:
+            items.append(f'"{chars}"')
+        return ", ".join(items)
+
+
+if __name__ == '__main__':
+    main()
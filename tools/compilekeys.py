@@ -0,0 +1,727 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 Brian T. Park
+# MIT License.
+
+"""
+Compile the Key Binding Definition Language file into a TI-OS Z80 assembly
+language file containing a key code dispatch table and its dispatch routine.
+
+Usage:
+$ compilekeys.py [--debug] [--layout {linear,sorted,direct,auto}]
+    [--include ti83plus.inc ...] [--output handlertab.asm] handlertab.txt
+
+The key binding file contains a single KeyTable:
+
+KeyTable keyCodeHandlerTable keyCodeHandlerTableSize [
+  Key k0 handleKey0
+  Key kOnExit handleKeyExit # comment
+]
+
+The compiler generates a '{table}Dispatch' routine which dispatches the key
+code in register A to its handler, using one of the following layouts:
+
+- linear: 3-byte entries of (keyCode, handler) in the order of the file,
+  scanned linearly by dispatchHandler() in mainscanner.asm. The worst case is
+  N comparisons.
+- sorted: the same 3-byte entries sorted by keyCode, searched using a binary
+  search. The worst case is ceil(log2(N+1)) comparisons.
+- direct: a table of 2-byte handlers indexed directly by (keyCode-minKeyCode),
+  over the range of the key codes. Unused key codes point to a 'ret'. The
+  worst case is a single comparison, but the table can be larger.
+- auto: the 'direct' layout if it is not larger than the 'sorted' layout,
+  otherwise the 'sorted' layout.
+
+The 'linear' layout needs only the symbolic names of the key codes. The other
+layouts need the numerical values of the key codes, which are read from the
+'equ' statements of the files given by '--include' (e.g. ti83plus.inc of
+spasm-ng, and rpn83p.asm for the keyMenu1-keyMenuSecond5 aliases). The
+worst-case number of comparisons before and after is printed at the end.
+"""
+
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TextIO
+from typing import TypedDict
+
+import argparse
+import io
+import logging
+import math
+import re
+import os
+import sys
+from pprint import pp
+
+from z80cost import format_cost
+from z80cost import linear_decisions
+from z80cost import lookup_cost
+from z80cost import read_program
+
+
+def main() -> None:
+    # Configure command line flags.
+    parser = argparse.ArgumentParser(
+        description='Compile the RPN83P key binding file'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        help='Assembly code output file',
+        required=False,
+    )
+    parser.add_argument(
+        '--debug',
+        help='Print the AST for debugging',
+        action='store_true',
+        default=False,
+    )
+    parser.add_argument(
+        '--layout',
+        help='Layout of the dispatch table',
+        choices=LAYOUTS,
+        default='linear',
+    )
+    parser.add_argument(
+        '--include', '-I',
+        help='Assembly file with the equ definitions of the key codes',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        '--cost',
+        help='Assembly file with dispatchHandler() and jumpDE(), to print the '
+        'predicted size and T-states of a lookup',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        'filename',
+        help='Key binding definition file',
+    )
+    args = parser.parse_args()
+
+    # Configure logging. This should normally be executed after the
+    # parser.parse_args() because it allows us set the logging.level using a
+    # flag.
+    logging.basicConfig(level=logging.INFO)
+
+    # Open the input file and parse.
+    logging.info(f"Reading {args.filename}")
+    with open(args.filename) as file:
+        lexer = Lexer(file)
+        key_parser = KeyParser(lexer)
+        table = key_parser.parse()
+
+    validator = Validator(table)
+    validator.validate()
+
+    # Resolve the numerical key codes, needed by the non-linear layouts.
+    if args.layout != 'linear':
+        symbols = SymbolResolver()
+        for include in args.include:
+            logging.info(f"Reading {include}")
+            with open(include, encoding="utf-8", errors="replace") as file:
+                symbols.read(file)
+        symbols.resolve_table(table)
+
+    if args.debug:
+        pp(table, stream=sys.stderr)
+
+    layout_selector = LayoutSelector(table)
+    layout = layout_selector.select(args.layout)
+    code_generator = CodeGenerator(args.filename, table, layout)
+
+    # Determine the output file name.
+    if args.output:
+        outputname = args.output
+    else:
+        outputname = os.path.splitext(args.filename)[0] + ".asm"
+    logging.info(f"Generating {outputname}")
+
+    # Open the output file and generate
+    with open(outputname, "w", encoding="utf-8") as file:
+        code_generator.generate(file)
+
+    layout_selector.print_report(layout)
+    if args.cost:
+        layout_selector.print_costs(args.filename, layout, args.cost)
+
+# -----------------------------------------------------------------------------
+
+
+LAYOUTS = ['linear', 'sorted', 'direct', 'auto']
+
+# Max number of entries in the direct table, because the count is passed in
+# an 8-bit register.
+DIRECT_LIMIT = 255
+
+
+class KeyBinding(TypedDict, total=False):
+    """A Key inside a KeyTable."""
+    key: str  # symbolic key code, e.g. 'kCapA'
+    handler: str  # handler label
+    line: int  # line number in the source file, for error messages
+    # derived fields
+    code: int  # numerical key code
+
+
+class KeyTable(TypedDict, total=False):
+    """The parsed content of the key binding file."""
+    label: str  # label of the table, e.g. 'keyCodeHandlerTable'
+    size_label: str  # label of the number of entries
+    bindings: List[KeyBinding]
+
+# -----------------------------------------------------------------------------
+
+
+class Lexer:
+    """Read the sys.stdin and tokenize by spliting on white spaces. Comments
+    begin with '#'.
+    """
+    def __init__(self, input: TextIO):
+        self.input = input
+
+        # Input line number, for error messages
+        self.line_number = 0
+        # Internal buffer to hold batches of tokens from each line.
+        self.current_tokens: List[str] = []
+
+    def get_token(self) -> str:
+        token = self.get_token_or_none()
+        if token is None:
+            raise ValueError("Unexpected EOF")
+        return token
+
+    def get_token_or_none(self) -> Optional[str]:
+        """Read the next token. Return None if EOF."""
+        if len(self.current_tokens) == 0:
+            current_line = self.read_line()
+            if current_line is None:
+                return None
+            self.current_tokens = current_line.split()
+
+        token = self.current_tokens[0]
+        self.current_tokens = self.current_tokens[1:]
+        return token
+
+    def read_line(self) -> Optional[str]:
+        """Return the next line. Return None if EOF reached.
+
+        * Comment lines beginning with a '#' character are skipped.
+        * Trailing comment lines beginning with '#' are stripped.
+        * Trailing whitespaces are stripped.
+        * Blank lines are skipped.
+        * Leading whitespaces are kept.
+        """
+        while True:
+            line = self.input.readline()
+            self.line_number += 1
+
+            # EOF returns ''. A blank line returns '\n'.
+            if line == '':
+                return None
+
+            # remove trailing comments
+            i = line.find('#')
+            if i >= 0:
+                line = line[:i]
+
+            # strip any trailing whitespaces
+            line = line.rstrip()
+
+            # skip any blank lines after stripping
+            if not line:
+                continue
+
+            return line
+
+# -----------------------------------------------------------------------------
+
+
+class KeyParser:
+    """Create the KeyTable from the key binding file."""
+
+    def __init__(self, lexer: Lexer):
+        self.lexer = lexer
+
+    def parse(self) -> KeyTable:
+        token = self.lexer.get_token()
+        if token != 'KeyTable':
+            raise ValueError(
+                f"Unexpected '{token}' "
+                f"at line {self.lexer.line_number}, expected 'KeyTable'"
+            )
+        table: KeyTable = {}
+        table['label'] = self.lexer.get_token()
+        table['size_label'] = self.lexer.get_token()
+        token = self.lexer.get_token()
+        if token != '[':
+            raise ValueError(
+                f"Unexpected '{token}' "
+                f"at line {self.lexer.line_number}, expected '['"
+            )
+        bindings: List[KeyBinding] = []
+        while True:
+            token = self.lexer.get_token()
+            if token == 'Key':
+                binding: KeyBinding = {}
+                binding['key'] = self.lexer.get_token()
+                binding['handler'] = self.lexer.get_token()
+                binding['line'] = self.lexer.line_number
+                bindings.append(binding)
+            elif token == ']':
+                break
+            else:
+                raise ValueError(
+                    f"Unexpected '{token}' "
+                    f"at line {self.lexer.line_number}, expected ']'"
+                )
+        table['bindings'] = bindings
+
+        token_or_none = self.lexer.get_token_or_none()
+        if token_or_none is not None:
+            raise ValueError(
+                f"Unexpected '{token_or_none}' "
+                f"at line {self.lexer.line_number}, expected EOF"
+            )
+        return table
+
+# -----------------------------------------------------------------------------
+
+
+class Validator:
+    """Validate the KeyTable."""
+
+    def __init__(self, table: KeyTable):
+        self.table = table
+
+    def validate(self) -> None:
+        """Check for an empty table and duplicate key codes."""
+        bindings = self.table['bindings']
+        if len(bindings) == 0:
+            raise ValueError(f"KeyTable '{self.table['label']}' is empty")
+        if len(bindings) > 255:
+            raise ValueError(
+                f"KeyTable '{self.table['label']}' has too many "
+                f"({len(bindings)}) keys, must be <= 255"
+            )
+        keys: Dict[str, KeyBinding] = {}
+        for binding in bindings:
+            key = binding['key']
+            if key in keys:
+                raise ValueError(
+                    f"Duplicate Key '{key}' at line {binding['line']}")
+            keys[key] = binding
+
+# -----------------------------------------------------------------------------
+
+
+class SymbolResolver:
+    """Collect the 'equ' definitions from assembly language files, and resolve
+    the symbolic key codes into numbers."""
+
+    # Matches 'label equ value', 'label .equ value', and 'label = value',
+    # with an optional trailing comment.
+    EQU_PATTERN = re.compile(
+        r'^\s*([A-Za-z_][A-Za-z0-9_]*):?\s+'
+        r'(?:\.?equ\b|=)\s*([^;]+?)\s*(?:;.*)?$',
+        re.IGNORECASE,
+    )
+
+    def __init__(self) -> None:
+        self.definitions: Dict[str, str] = {}  # {label -> value expression}
+
+    def read(self, input: TextIO) -> None:
+        for line in input:
+            match = self.EQU_PATTERN.match(line)
+            if match:
+                self.definitions[match.group(1)] = match.group(2)
+
+    def resolve_table(self, table: KeyTable) -> None:
+        for binding in table['bindings']:
+            key = binding['key']
+            try:
+                code = self.resolve(key)
+            except ValueError as e:
+                raise ValueError(
+                    f"Key '{key}' at line {binding['line']}: {str(e)}")
+            if code < 0 or code > 255:
+                raise ValueError(
+                    f"Key '{key}' at line {binding['line']}: "
+                    f"key code {code} out of range")
+            binding['code'] = code
+        codes: Dict[int, KeyBinding] = {}
+        for binding in table['bindings']:
+            code = binding['code']
+            existing = codes.get(code)
+            if existing is not None:
+                raise ValueError(
+                    f"Key '{binding['key']}' at line {binding['line']} has "
+                    f"the same key code {code} as '{existing['key']}'")
+            codes[code] = binding
+
+    def resolve(self, expression: str, depth: int = 0) -> int:
+        """Resolve a number ('12', '0Ch', '$0C', '0x0C', '%1100') or a
+        label defined by another 'equ'."""
+        if depth > 16:
+            raise ValueError(f"Recursive definition of '{expression}'")
+        number = self.parse_number(expression)
+        if number is not None:
+            return number
+        value = self.definitions.get(expression)
+        if value is None:
+            raise ValueError(f"Unknown symbol '{expression}'")
+        return self.resolve(value, depth + 1)
+
+    @staticmethod
+    def parse_number(s: str) -> Optional[int]:
+        try:
+            if s.startswith('$'):
+                return int(s[1:], 16)
+            if s.startswith('%'):
+                return int(s[1:], 2)
+            if s.lower().startswith('0x'):
+                return int(s[2:], 16)
+            if s[0].isdigit() and s[-1] in 'hH':
+                return int(s[:-1], 16)
+            if s[0].isdigit() and s[-1] in 'bB':
+                return int(s[:-1], 2)
+            return int(s)
+        except ValueError:
+            return None
+
+# -----------------------------------------------------------------------------
+
+
+class LayoutSelector:
+    """Calculate the size and worst-case cost of each layout, and select the
+    layout."""
+
+    def __init__(self, table: KeyTable):
+        self.table = table
+        self.count = len(table['bindings'])
+
+    def select(self, layout: str) -> str:
+        if layout != 'auto':
+            if layout == 'direct' and self.direct_range() > DIRECT_LIMIT:
+                raise ValueError(
+                    f"Range of key codes {self.direct_range()} too large "
+                    f"for 'direct' layout, must be <= {DIRECT_LIMIT}")
+            return layout
+        if self.direct_range() <= DIRECT_LIMIT \
+                and self.size('direct') <= self.size('sorted'):
+            return 'direct'
+        return 'sorted'
+
+    def direct_range(self) -> int:
+        codes = [binding['code'] for binding in self.table['bindings']]
+        return max(codes) - min(codes) + 1
+
+    def size(self, layout: str) -> int:
+        """Size of the table in bytes."""
+        if layout == 'direct':
+            return 2 * self.direct_range()
+        return 3 * self.count
+
+    def worst_case(self, layout: str) -> int:
+        """Worst case number of key code comparisons."""
+        if layout == 'linear':
+            return self.count
+        if layout == 'sorted':
+            return math.ceil(math.log2(self.count + 1))
+        return 1
+
+    def print_report(self, layout: str) -> None:
+        label = self.table['label']
+        logging.info(
+            f"  {label}: {self.count} keys, layout '{layout}', "
+            f"{self.size(layout)} bytes"
+        )
+        logging.info(
+            f"  {label}: worst-case comparisons: "
+            f"{self.worst_case('linear')} (linear) -> "
+            f"{self.worst_case(layout)} ({layout})"
+        )
+
+    def print_costs(
+        self, inputfile: str, selected: str, filenames: List[str]
+    ) -> None:
+        """Print the predicted cost of the dispatch of every key in the
+        table, for each layout. The 'sorted' and 'direct' layouts need the
+        numerical key codes. The cost of the handler itself is excluded."""
+        label = self.table['label']
+        layouts = ['linear']
+        if all('code' in b for b in self.table['bindings']):
+            layouts += ['sorted', 'direct']
+        for layout in layouts:
+            output = io.StringIO()
+            CodeGenerator(inputfile, self.table, layout).generate(output)
+            program = read_program(filenames, texts=[output.getvalue()])
+            cost = lookup_cost(
+                program, f"{label}Dispatch", self.scenarios(layout),
+                self.size(layout))
+            name = f"{label} {layout}"
+            if layout == selected:
+                name += " (selected)"
+            logging.info("  " + format_cost(name, cost))
+
+    def scenarios(self, layout: str) -> List[Dict[str, List[bool]]]:
+        """Return the branch decisions of the dispatch of each key."""
+        bindings = self.table['bindings']
+        if layout == 'linear':
+            return [
+                linear_decisions(
+                    i, 'jr z, dispatchHandlerMatched', 'djnz dispatchHandler')
+                for i in range(len(bindings))
+            ]
+        if layout == 'direct':
+            return [{'ret nc': [False]} for _ in bindings]
+        codes = sorted(b['code'] for b in bindings)
+        return [self.binary_search_decisions(codes, code) for code in codes]
+
+    @staticmethod
+    def binary_search_decisions(
+        codes: List[int], code: int
+    ) -> Dict[str, List[bool]]:
+        """Model of dispatchHandlerSorted()."""
+        decisions: Dict[str, List[bool]] = {
+            'ret nc': [],
+            'jr z, dispatchHandlerSortedMatched': [],
+            'jr c, dispatchHandlerSortedLower': [],
+        }
+        lo = 0
+        hi = len(codes)
+        while True:
+            decisions['ret nc'].append(lo >= hi)
+            if lo >= hi:
+                return decisions
+            mid = (lo + hi) // 2
+            decisions['jr z, dispatchHandlerSortedMatched'].append(
+                code == codes[mid])
+            if code == codes[mid]:
+                return decisions
+            decisions['jr c, dispatchHandlerSortedLower'].append(
+                code < codes[mid])
+            if code < codes[mid]:
+                hi = mid
+            else:
+                lo = mid + 1
+
+# -----------------------------------------------------------------------------
+
+
+class CodeGenerator:
+    """Generate the Z80 assembly statements. There are 2 sections:
+    1) the '{table}Dispatch' routine,
+    2) the table in the selected layout.
+    """
+    def __init__(self, inputfile: str, table: KeyTable, layout: str):
+        self.inputfile = inputfile
+        self.table = table
+        self.layout = layout
+
+    def generate(self, output: TextIO) -> None:
+        self.output = output
+        label = self.table['label']
+
+        print(f"""\
+;-----------------------------------------------------------------------------
+; Key code dispatch table '{label}', generated from {self.inputfile}
+; using the '{self.layout}' layout.
+;
+; DO NOT EDIT: This file was autogenerated.
+;-----------------------------------------------------------------------------
+
+""", file=self.output, end='')
+
+        logging.info(f"  Generating {label} ({self.layout})")
+        if self.layout == 'linear':
+            self.generate_linear()
+        elif self.layout == 'sorted':
+            self.generate_sorted()
+        else:
+            self.generate_direct()
+
+    def generate_linear(self) -> None:
+        label = self.table['label']
+        size_label = self.table['size_label']
+        print(f"""\
+; Description: Dispatch the keyCode in A to its handler using a linear scan.
+; Destroys: A, B, DE, HL (and any other registers destroyed by the handler)
+{label}Dispatch:
+    ld hl, {label}
+    ld b, {size_label}
+    jp dispatchHandler
+
+""", file=self.output, end='')
+        self.generate_entries(self.table['bindings'])
+
+    def generate_sorted(self) -> None:
+        label = self.table['label']
+        size_label = self.table['size_label']
+        print(f"""\
+; Description: Dispatch the keyCode in A to its handler using a binary search.
+; Destroys: A, BC, DE, HL (and any other registers destroyed by the handler)
+{label}Dispatch:
+    ld hl, {label}
+    ld b, {size_label}
+    jp dispatchHandlerSorted
+
+""", file=self.output, end='')
+        self.generate_sorted_dispatcher()
+        bindings = sorted(self.table['bindings'], key=lambda b: b['code'])
+        self.generate_entries(bindings)
+
+    def generate_entries(self, bindings: List[KeyBinding]) -> None:
+        label = self.table['label']
+        size_label = self.table['size_label']
+        print(f"{label}:", file=self.output)
+        for binding in bindings:
+            code = binding.get('code')
+            comment = "" if code is None else f" ; ${code:02X}"
+            print(f"""\
+    .db {binding['key']}{comment}
+    .dw {binding['handler']}
+""", file=self.output, end='')
+        print(f"""\
+
+; Auto-calculate the number of entries in the table.
+{label}End:
+{size_label} equ ({label}End-{label})/3
+""", file=self.output, end='')
+
+    def generate_direct(self) -> None:
+        label = self.table['label']
+        size_label = self.table['size_label']
+        bindings = self.table['bindings']
+        by_code: Dict[int, KeyBinding] = {b['code']: b for b in bindings}
+        min_code = min(by_code.keys())
+        max_code = max(by_code.keys())
+        print(f"""\
+; Description: Dispatch the keyCode in A to its handler using a table indexed
+; by the keyCode.
+; Destroys: A, BC, DE, HL (and any other registers destroyed by the handler)
+{label}Dispatch:
+    ld hl, {label}
+    ld b, {label}MinKeyCode
+    ld c, {size_label}
+    jp dispatchHandlerDirect
+
+""", file=self.output, end='')
+        self.generate_direct_dispatcher()
+        print(f"""\
+{label}MinKeyCode equ ${min_code:02X}
+{label}:
+""", file=self.output, end='')
+        for code in range(min_code, max_code + 1):
+            binding = by_code.get(code)
+            if binding is None:
+                print(
+                    f"    .dw dispatchHandlerNone ; ${code:02X}",
+                    file=self.output)
+            else:
+                print(
+                    f"    .dw {binding['handler']} ; "
+                    f"${code:02X} {binding['key']}",
+                    file=self.output)
+        print(f"""\
+
+; Number of entries in the table, from MinKeyCode to MaxKeyCode.
+{label}End:
+{size_label} equ ({label}End-{label})/2
+""", file=self.output, end='')
+
+    def generate_sorted_dispatcher(self) -> None:
+        """Generate dispatchHandlerSorted() once, even if more than one
+        table uses the 'sorted' layout."""
+        print("""\
+#ifndef DISPATCH_HANDLER_SORTED
+#define DISPATCH_HANDLER_SORTED
+; Description: Handle the keyCode given by A using a binary search of the
+; handler table sorted by keyCode. If keyCode is not in the table, do nothing.
+; Input:
+;   - A: keyCode from GetKey()
+;   - HL: pointer to handler table sorted by keyCode
+;   - B: number of entries in the handler table
+; Output: none
+; Destroys: A, BC, DE, HL (and any other registers destroyed by the handler)
+dispatchHandlerSorted:
+    ld d, a ; D=keyCode
+    ld c, 0 ; C=lo; B=hi (exclusive)
+dispatchHandlerSortedLoop:
+    ld a, c
+    cp b ; if lo>=hi: CF=0
+    ret nc ; not found
+    add a, b
+    rra ; A=mid=(lo+hi)/2, using the 9-bit sum in CF:A
+    ld e, a ; E=mid
+    push hl ; stack=[table]
+    push de ; stack=[table,keyCode|mid]
+    ld d, 0 ; DE=mid
+    add hl, de
+    add hl, de
+    add hl, de ; HL=&table[mid]
+    pop de ; stack=[table]; D=keyCode; E=mid
+    ld a, d
+    cp (hl) ; if keyCode<table[mid].keyCode: CF=1; if equal: ZF=1
+    jr z, dispatchHandlerSortedMatched
+    pop hl ; stack=[]; HL=table
+    jr c, dispatchHandlerSortedLower
+    ld c, e
+    inc c ; lo=mid+1
+    jr dispatchHandlerSortedLoop
+dispatchHandlerSortedLower:
+    ld b, e ; hi=mid
+    jr dispatchHandlerSortedLoop
+dispatchHandlerSortedMatched:
+    pop de ; stack=[]
+    ; jump to the corresponding jump table entry
+    inc hl
+    ld e, (hl)
+    inc hl
+    ld d, (hl)
+    jp jumpDE
+#endif
+
+""", file=self.output, end='')
+
+    def generate_direct_dispatcher(self) -> None:
+        """Generate dispatchHandlerDirect() once, even if more than one table
+        uses the 'direct' layout."""
+        print("""\
+#ifndef DISPATCH_HANDLER_DIRECT
+#define DISPATCH_HANDLER_DIRECT
+; Description: Handle the keyCode given by A using a table of handlers indexed
+; by (keyCode-minKeyCode). If keyCode is outside the table, do nothing.
+; Input:
+;   - A: keyCode from GetKey()
+;   - HL: pointer to handler table
+;   - B: keyCode of the first entry in the handler table
+;   - C: number of entries in the handler table
+; Output: none
+; Destroys: A, BC, DE, HL (and any other registers destroyed by the handler)
+dispatchHandlerDirect:
+    sub b ; A=index=keyCode-minKeyCode
+    cp c ; if index>=count (including keyCode<minKeyCode): CF=0
+    ret nc
+    ld e, a
+    ld d, 0
+    add hl, de
+    add hl, de ; HL=&table[index]
+    ld e, (hl)
+    inc hl
+    ld d, (hl)
+    jp jumpDE
+; Handler of the unused entries in the table.
+dispatchHandlerNone:
+    ret
+#endif
+
+""", file=self.output, end='')
+
+# -----------------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main()
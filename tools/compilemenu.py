@@ -8,7 +8,10 @@ Compile the Menu Definition Language file into a TI-OS Z80 assembly language
 file.
 
 Usage:
-$ compilemenu.py [--debug] [--output menudef.asm] menudef.txt
+$ compilemenu.py [--debug] [--layout {padded,rowmask}] [--alt-table]
+    [--name-index] [--blob --include ti83plus.inc] [--profile]
+    [-D SYMBOL ...] [--variant NAME=SYMBOL,... ...] [--link-check ../src]
+    [--cost menu3.asm] [--output menudef.asm] menudef.txt
 
 Data Structure and Algorithm Note:
 
@@ -33,21 +36,99 @@ series of MenuNodes. This means that a MenuGroup can capture its children nodes
 (in groups organized by MenuRows) with just 2 additional fields (`numRows`
 and `rowBeginId`), without using a secondary data structure. Signficant amount
 of memory can be saved using this representation.
+
+The default 'padded' layout pads every partial MenuRow with blank MenuItems, so
+that each MenuRow is exactly 5 contiguous MenuNodes. The 'rowmask' layout
+elides the blank MenuItems, and replaces the rowBeginId of each MenuGroup with
+a pointer to a table of 5-bit occupancy masks, one per MenuRow. The MenuNodes
+are renumbered into compact ids, and a blank button resolves to the mNull
+node. This layout requires the USE_MENU_ROW_MASKS variant of menu3.asm.
+
+The '--alt-table' flag moves the altName and nameSelector of the MenuItemAlt
+nodes into a separate mMenuAltTable sorted by menu id, and marks those nodes
+with the high bit of their name pointer. The nameSelector field is removed
+from every MenuNode, which shrinks from 13 to 11 bytes. This requires the
+USE_MENU_ALT_TABLE variant of menu3.asm.
+
+The '--name-index' flag appends the mNameIndex, which maps the display names of
+the MenuItems to their menu ids, sorted by the TI-OS font codes of the names,
+with prefix compressed names and the shortest unique prefix of each name. The
+font tags are resolved using the files given by '--include'. See NameIndex
+below.
+
+The '--blob' flag writes the pool of name strings into a binary file next to
+the output file (e.g. menudef.bin), included with '#import', and replaces the
+'.db' statements with the 'equ' statements of the name labels. The font tags
+are resolved using the files given by '--include'. See asmblob.py.
+
+The '--profile' flag generates the mMenuProfileCount and the
+mMenuProfileSignature used by the USE_MENU_PROFILE variant of the app, which
+counts the number of times each menu node is dispatched (see profile1.asm).
+The signature is the CRC16 of the labels of the menu nodes in the order of
+their ids, so that menuprofile.py can verify that a saved profile belongs to
+the given menu definition file.
+
+Conditional Compilation Note:
+
+MenuRows, and the MenuNodes inside a MenuRow, can be wrapped in an If block,
+which is kept only if its symbol is defined by a '-D' flag. A '!' prefix
+negates the symbol, and If blocks can be nested:
+
+MenuGroup root mRoot [
+  MenuRow [ ... ]
+  If DEBUG [
+    MenuRow [ ... ]
+  ]
+  MenuRow [
+    MenuItem PI mPi
+    If !LEAN [
+      MenuGroup CFIT mCfit [ ... ]
+    ]
+  ]
+]
+
+The disabled blocks are pruned from the tree before the partial MenuRows are
+filled with blank MenuItems and before the ids are assigned, so the ids of each
+variant are dense. A MenuRow whose nodes are all pruned is removed. The file
+is parsed only once, and each '--variant NAME=SYMBOL,...' flag generates an
+additional output file '{output}_NAME.asm' (e.g. menudef_lean.asm) from the
+same parse, with its own list of symbols.
+
+The '--link-check' flag verifies that the handlers of the MenuNodes, and the
+nameSelector of the MenuItemAlt nodes, are defined by the assembly files of the
+given directories, using the cached symbol index of asmindex.py, before the
+output file is written. All undefined handlers are reported at once, with the
+line of the menu definition file.
 """
 
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Set
 from typing import TextIO
 from typing import Tuple
 from typing import TypedDict
 
 import argparse
+import copy
+import io
 import logging
 import sys
 import os
+import re
 from pprint import pp
 
+from asmblob import Blob
+from asmblob import encode_chars
+from asmindex import Reference
+from asmindex import link_check
+from compilekeys import SymbolResolver
+from gencrc16 import crc16_bitwise
+from z80cost import format_cost
+from z80cost import lookup_cost
+from z80cost import read_program
+
 
 def main() -> None:
     # Configure command line flags.
@@ -65,6 +146,73 @@ def main() -> None:
         action='store_true',
         default=False,
     )
+    parser.add_argument(
+        '--layout',
+        help='Layout of the MenuRows, padded with blank MenuNodes (padded) '
+        'or with occupancy masks (rowmask)',
+        choices=MENU_LAYOUTS,
+        default='padded',
+    )
+    parser.add_argument(
+        '--alt-table',
+        help='Move the altName and nameSelector into a separate table',
+        action='store_true',
+        default=False,
+    )
+    parser.add_argument(
+        '--name-index',
+        help='Generate the sorted index of the MenuItem names',
+        action='store_true',
+        default=False,
+    )
+    parser.add_argument(
+        '--blob',
+        help='Pre-assemble the name strings into a binary file',
+        action='store_true',
+        default=False,
+    )
+    parser.add_argument(
+        '--include', '-I',
+        help='Assembly file with the equ definitions of the font tags',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        '--profile',
+        help='Generate the constants of the menu usage counters',
+        action='store_true',
+        default=False,
+    )
+    parser.add_argument(
+        '--define', '-D',
+        help='Define the symbol used by the If blocks',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        '--variant',
+        help='Also generate the variant NAME=SYMBOL,... into {output}_NAME.asm',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        '--link-check',
+        help='Directory or assembly file which defines the handlers',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        '--index-cache',
+        help='Cache file of the symbol index used by --link-check',
+        required=False,
+    )
+    parser.add_argument(
+        '--cost',
+        help='Assembly file with the accessor routines, to print the '
+        'predicted size and T-states of a lookup',
+        action='append',
+        default=[],
+    )
     parser.add_argument(
         'filename',
         help='Menu definition file',
@@ -76,40 +224,115 @@ def main() -> None:
     # flag.
     logging.basicConfig(level=logging.INFO)
 
-    # Open the input file and parse.
+    # Determine the output file name.
+    if args.output:
+        outputname = args.output
+    else:
+        outputname = os.path.splitext(args.filename)[0] + ".asm"
+
+    # Read and parse the input file once, then compile each variant.
     logging.info(f"Reading {args.filename}")
     with open(args.filename) as file:
-        lexer = Lexer(file)
-        menu_parser = MenuParser(lexer)
-        config, root = menu_parser.parse()
+        config, root = parse_menu(file.read())
+    variants = [(outputname, args.define)]
+    for variant in args.variant:
+        name, _, symbols = variant.partition('=')
+        if not name:
+            raise ValueError(f"Invalid variant '{variant}'")
+        base, ext = os.path.splitext(outputname)
+        defines = [symbol for symbol in symbols.split(',') if symbol]
+        variants.append((f"{base}_{name}{ext}", defines))
+    for variant_outputname, defines in variants:
+        generate_variant(args, config, root, variant_outputname, defines)
+
+
+def generate_variant(
+    args: argparse.Namespace,
+    config: "MenuConfig",
+    root: "MenuNode",
+    outputname: str,
+    defines: List[str],
+) -> None:
+    """Compile the variant of the menu hierarchy selected by the 'defines',
+    and write it into the output file."""
+    options: MenuOptions = {
+        'filename': args.filename,
+        'layout': args.layout,
+        'alt_table': args.alt_table,
+        'name_index': args.name_index,
+        'profile': args.profile,
+        'defines': defines,
+    }
+    if args.blob:
+        blobname = os.path.splitext(outputname)[0] + ".bin"
+        options['blob'] = os.path.basename(blobname)
+    if args.blob or args.name_index:
+        options['symbols'] = read_symbols(args.include)
+    logging.info(f"Generating {outputname}")
+    result = compile_menu_tree(config, root, options)
 
     if args.debug:
-        pp(config, stream=sys.stderr)
+        pp(result['config'], stream=sys.stderr)
+        pp(result['root'], stream=sys.stderr)
+        pp(result['stats'], stream=sys.stderr)
 
-    validator = Validator(root)
-    validator.validate()
+    if args.link_check:
+        # The previous version of the output file must not be indexed.
+        exclude = [os.path.basename(outputname)]
+        link_check(
+            args.filename, result['references'], result['asm'],
+            args.link_check, exclude, args.index_cache)
 
-    sym_generator = SymbolGenerator(root)
-    sym_generator.generate()
+    with open(outputname, "w", encoding="utf-8") as file:
+        file.write(result['asm'])
+    if args.blob:
+        logging.info(
+            f"Generating {blobname} ({len(result['blob'])} bytes)")
+        with open(blobname, "wb") as file:
+            file.write(result['blob'])
+
+    stats = result['stats']
+    logging.info(
+        f"  {stats['nodes']} MenuNodes ({stats['table_size']} bytes)")
+    if args.layout == 'rowmask':
+        elided_size = stats['elided_size']
+        masks_size = stats['row_masks_size']
+        logging.info(
+            f"  Elided {stats['blank_nodes']} blank MenuNodes ({elided_size} "
+            f"bytes), added row masks ({masks_size} bytes), saved "
+            f"{elided_size - masks_size} bytes"
+        )
 
-    exploder = StringExploder(root)
-    exploder.explode()
+    if args.alt_table:
+        alt_size = stats['alt_nodes'] * MENU_ALT_SIZE
+        selectors_size = stats['nodes'] * 2
+        logging.info(
+            f"  Moved {stats['alt_nodes']} MenuItemAlt into mMenuAltTable "
+            f"({alt_size} bytes), removed nameSelector fields "
+            f"({selectors_size} bytes), saved {selectors_size - alt_size} "
+            "bytes"
+        )
 
-    if args.debug:
-        pp(root, stream=sys.stderr)
+    if args.name_index:
+        logging.info(
+            f"  Indexed {stats['name_index_entries']} names "
+            f"({stats['name_index_duplicates']} duplicates): "
+            f"{stats['name_index_size']} bytes, uncompressed "
+            f"{stats['name_index_uncompressed_size']} bytes"
+        )
 
-    code_generator = CodeGenerator(args.filename, sym_generator, config, root)
+    if args.cost:
+        print_cost(args.cost, stats['nodes'], args.alt_table)
 
-    # Determine the output file name.
-    if args.output:
-        outputname = args.output
-    else:
-        outputname = os.path.splitext(args.filename)[0] + ".asm"
-    logging.info(f"Generating {outputname}")
 
-    # Open the output file and generate
-    with open(outputname, "w", encoding="utf-8") as file:
-        code_generator.generate(file)
+def read_symbols(filenames: List[str]) -> SymbolResolver:
+    """Read the equ definitions of the font tags from the assembly files."""
+    symbols = SymbolResolver()
+    for filename in filenames:
+        logging.info(f"Reading {filename}")
+        with open(filename, encoding="utf-8", errors="replace") as file:
+            symbols.read(file)
+    return symbols
 
 # -----------------------------------------------------------------------------
 
@@ -126,6 +349,16 @@ MENU_TYPE_ITEM_ALT = 2  # MenuItem with alternate display name
 # than 1260. Let's set the limit to 768 as an early warning.
 MENU_ID_LIMIT = 768
 
+# sizeof(MenuNode) in menu.asm.
+MENU_NODE_SIZE = 13
+
+# sizeof(MenuNode) and sizeof(MenuAlt) in menu.asm, if USE_MENU_ALT_TABLE.
+MENU_NODE_SIZE_ALT_TABLE = 11
+MENU_ALT_SIZE = 6
+
+# Layouts of the MenuRows, selected by the '--layout' flag.
+MENU_LAYOUTS = ['padded', 'rowmask']
+
 MenuRow = List["MenuNode"]
 
 
@@ -145,6 +378,9 @@ class MenuNode(TypedDict, total=False):
     label: str
     rows: List[MenuRow]  # List of MenuNodes in groups of 5
     group_handler: str  # optional group handler
+    line: int  # line number in the menudef file, 0 for implicit blanks
+    conditions: List[str]  # symbols of the enclosing If blocks of the row
+    row_conditions: List[List[str]]  # symbols of the If blocks of each row
 
 
 class MenuConfig(TypedDict, total=False):
@@ -152,11 +388,130 @@ class MenuConfig(TypedDict, total=False):
     item_name: str  # default MenuItem name
     item_handler: str  # default MenuItem handler
     group_handler: str  # default MenuGroup handler
+    line: int  # line number of the 'MenuConfig'
 
 
 # -----------------------------------------------------------------------------
 
 
+class MenuOptions(TypedDict, total=False):
+    """Options of compile_menu(), equivalent to the command line flags."""
+    filename: str  # name of the menu definition file, for the comments
+    layout: str  # 'padded' (default) or 'rowmask'
+    alt_table: bool
+    name_index: bool
+    blob: str  # name of the binary file of the name strings, if not empty
+    symbols: SymbolResolver  # equ definitions of the font tags
+    profile: bool
+    defines: List[str]  # symbols which enable the If blocks
+
+
+class CompileResult(TypedDict):
+    """Result of compile_menu()."""
+    asm: str  # the generated assembly code
+    blob: bytes  # content of the binary file, empty if not enabled
+    config: MenuConfig
+    root: MenuNode  # the AST, annotated by the compiler
+    ids: Dict[str, int]  # {label -> menuId} of the generated MenuNodes
+    labels: List[str]  # labels of the generated MenuNodes, indexed by menuId
+    references: List[Reference]  # external symbols used by the generated code
+    stats: Dict[str, int]  # {statistic -> value}
+
+
+def parse_menu(text: str) -> Tuple[MenuConfig, MenuNode]:
+    """Parse the menu definition text into the MenuConfig and the tree of
+    MenuNodes, including the nodes of every If block."""
+    return MenuParser(Lexer(io.StringIO(text))).parse()
+
+
+def compile_menu(
+    text: str, options: Optional[MenuOptions] = None,
+) -> CompileResult:
+    """Compile the menu definition text into Z80 assembly code, without any
+    file I/O. Each call uses its own instances of the compiler classes, so
+    multiple menus can be compiled concurrently. Throws ValueError if the
+    menu definition is invalid."""
+    config, root = parse_menu(text)
+    return compile_menu_tree(config, root, options)
+
+
+def compile_menu_tree(
+    config: MenuConfig, root: MenuNode, options: Optional[MenuOptions] = None,
+) -> CompileResult:
+    """Compile the tree returned by parse_menu(). The tree is not modified,
+    so several variants with different 'defines' can be compiled from a
+    single parse."""
+    if options is None:
+        options = {}
+    layout_name = options.get('layout', 'padded')
+    if layout_name not in MENU_LAYOUTS:
+        raise ValueError(f"Unknown layout '{layout_name}'")
+
+    root = prune_menu(root, options.get('defines', []))
+    Validator(root).validate()
+    symbols = SymbolGenerator(root)
+    symbols.generate()
+
+    layout: Optional[RowMaskLayout] = None
+    if layout_name == 'rowmask':
+        layout = RowMaskLayout(config, symbols)
+        layout.generate()
+        layout.verify()
+
+    StringExploder(root).explode()
+
+    resolver = options.get('symbols', SymbolResolver())
+    blob: Optional[Blob] = None
+    if options.get('blob'):
+        blob = Blob('mNamesBlob', options['blob'], resolver)
+
+    alt_table = options.get('alt_table', False)
+    code_generator = CodeGenerator(
+        options.get('filename', 'menudef.txt'), symbols, config, root, layout,
+        alt_table, options.get('name_index', False), blob,
+        options.get('profile', False), resolver)
+    output = io.StringIO()
+    code_generator.generate(output)
+
+    node_size = MENU_NODE_SIZE_ALT_TABLE if alt_table else MENU_NODE_SIZE
+    stats = {
+        'nodes': code_generator.menu_table_count,
+        'table_size': code_generator.menu_table_count * node_size,
+        'names': code_generator.names_count,
+        'names_pool_size': code_generator.names_pool_size,
+    }
+    if layout is not None:
+        stats['blank_nodes'] = layout.blank_count
+        stats['elided_size'] = layout.blank_count * node_size
+        stats['row_masks_size'] = layout.row_masks_size()
+    if alt_table:
+        stats['alt_nodes'] = len(code_generator.alt_nodes)
+    index = code_generator.name_index
+    if index is not None:
+        stats['name_index_entries'] = len(index.entries)
+        stats['name_index_duplicates'] = len(index.duplicates)
+        stats['name_index_size'] = index.size()
+        stats['name_index_uncompressed_size'] = index.uncompressed_size()
+    if blob is not None:
+        stats['blob_size'] = blob.size()
+    labels = code_generator.menu_labels()
+    stats['profile_signature'] = profile_signature(labels)
+
+    ids = {label: id for id, label in enumerate(labels) if id != 0}
+    return {
+        'asm': output.getvalue(),
+        'blob': b'' if blob is None else bytes(blob.data),
+        'config': config,
+        'root': root,
+        'ids': ids,
+        'labels': labels,
+        'references': code_generator.references,
+        'stats': stats,
+    }
+
+# -----------------------------------------------------------------------------
+
+
 class Lexer:
     """Read the sys.stdin and tokenize by spliting on white spaces. Comments
     begin with '#'.
@@ -258,7 +613,7 @@ class MenuParser:
                 f"Unexpected '{token}' "
                 f"at line {self.lexer.line_number}, expected '['"
             )
-        config: MenuConfig = {}
+        config: MenuConfig = {'line': self.lexer.line_number}
         while True:
             token = self.lexer.get_token()
             if token == 'ItemName':
@@ -280,11 +635,13 @@ class MenuParser:
         return config
 
     def process_menugroup(self) -> MenuNode:
-        """A MenuGroup is a list of MenuRows."""
+        """A MenuGroup is a list of MenuRows, some of which may be inside If
+        blocks."""
         node = MenuNode()
         node["mtype"] = MENU_TYPE_GROUP
         node["name"] = self.lexer.get_token()
         node["label"] = self.lexer.get_token()
+        node["line"] = self.lexer.line_number
         node["id"] = 0  # added early to help debugging with pprint.pp()
         node["parent_id"] = 0
 
@@ -300,24 +657,41 @@ class MenuParser:
                 )
         # Process list of MenuRow
         rows: List[MenuRow] = []
+        row_conditions: List[List[str]] = []
+        self.process_rows(rows, row_conditions, [])
+        node["rows"] = rows
+        if any(row_conditions):
+            node["row_conditions"] = row_conditions
+        return node
+
+    def process_rows(
+        self,
+        rows: List[MenuRow],
+        row_conditions: List[List[str]],
+        conditions: List[str],
+    ) -> None:
+        """Append the MenuRows up to the closing ']', and the symbols of their
+        enclosing If blocks."""
         while True:
             token = self.lexer.get_token()
             if token == 'MenuRow':
-                row = self.process_menurow()
+                rows.append(self.process_menurow())
+                row_conditions.append(conditions)
+            elif token == 'If':
+                symbol = self.process_if()
+                self.process_rows(rows, row_conditions, conditions + [symbol])
             elif token == ']':
                 break
             else:
                 raise ValueError(
                     f"Unexpected token '{token}' "
-                    f"at line {self.lexer.line_number}, should be 'MenuRow'"
-                    " or ']'"
+                    f"at line {self.lexer.line_number}, should be 'MenuRow',"
+                    " 'If' or ']'"
                 )
-            rows.append(row)
-        node["rows"] = rows
-        return node
 
     def process_menurow(self) -> MenuRow:
-        """A MenuRow is a list of MenuItem or MenuGroup."""
+        """A MenuRow is a list of MenuItem or MenuGroup, some of which may be
+        inside If blocks."""
         row: MenuRow = []
         token = self.lexer.get_token()
         if token != '[':
@@ -325,7 +699,12 @@ class MenuParser:
                 f"Unexpected token '{token}' "
                 f"at line {self.lexer.line_number}, should be '['"
             )
-        # Process list of MenuItems or MenuGroups
+        self.process_nodes(row, [])
+        return row
+
+    def process_nodes(self, row: MenuRow, conditions: List[str]) -> None:
+        """Append the MenuItems or MenuGroups up to the closing ']'. The nodes
+        inside an If block record the symbols of the enclosing If blocks."""
         while True:
             token = self.lexer.get_token()
             if token == 'MenuItem':
@@ -334,6 +713,10 @@ class MenuParser:
                 node = self.process_menugroup()
             elif token == 'MenuItemAlt':
                 node = self.process_menuitemalt()
+            elif token == 'If':
+                symbol = self.process_if()
+                self.process_nodes(row, conditions + [symbol])
+                continue
             elif token == ']':
                 break
             else:
@@ -341,14 +724,32 @@ class MenuParser:
                     f"Unexpected token '{token}' "
                     f"at line {self.lexer.line_number}"
                 )
+            if conditions:
+                node["conditions"] = conditions
             row.append(node)
-        return row
+
+    def process_if(self) -> str:
+        """Read the symbol of 'If SYMBOL [', or 'If !SYMBOL ['."""
+        symbol = self.lexer.get_token()
+        if not IF_SYMBOL_PATTERN.match(symbol):
+            raise ValueError(
+                f"Invalid If symbol '{symbol}' "
+                f"at line {self.lexer.line_number}"
+            )
+        token = self.lexer.get_token()
+        if token != '[':
+            raise ValueError(
+                f"Unexpected token '{token}' "
+                f"at line {self.lexer.line_number}, should be '['"
+            )
+        return symbol
 
     def process_menuitem(self) -> MenuNode:
         item = MenuNode()
         item["mtype"] = MENU_TYPE_ITEM
         item["name"] = self.lexer.get_token()
         item["label"] = self.lexer.get_token()
+        item["line"] = self.lexer.line_number
         return item
 
     def process_menuitemalt(self) -> MenuNode:
@@ -357,9 +758,59 @@ class MenuParser:
         item["name"] = self.lexer.get_token()
         item["altname"] = self.lexer.get_token()
         item["label"] = self.lexer.get_token()
+        item["line"] = self.lexer.line_number
         return item
 
 
+# -----------------------------------------------------------------------------
+
+
+# Symbol of an If block, optionally negated with '!'.
+IF_SYMBOL_PATTERN = re.compile(r'^!?[A-Za-z_][A-Za-z0-9_]*$')
+
+
+def is_enabled(conditions: List[str], defines: Set[str]) -> bool:
+    """Return True if every symbol of the If blocks is defined, or every
+    negated symbol ('!SYMBOL') is not defined."""
+    for symbol in conditions:
+        if symbol.startswith('!'):
+            if symbol[1:] in defines:
+                return False
+        elif symbol not in defines:
+            return False
+    return True
+
+
+def prune_menu(root: MenuNode, defines: Iterable[str]) -> MenuNode:
+    """Return a copy of the tree without the MenuRows and MenuNodes of the If
+    blocks which are not enabled by the defines. This happens before the
+    Validator fills the partial MenuRows with blank MenuItems, and before the
+    SymbolGenerator assigns the ids, so the ids of each variant are dense."""
+    root = copy.deepcopy(root)
+    prune_group(root, set(defines))
+    return root
+
+
+def prune_group(node: MenuNode, defines: Set[str]) -> None:
+    row_conditions = node.pop("row_conditions", [])
+    rows: List[MenuRow] = []
+    for i, row in enumerate(node["rows"]):
+        if row_conditions and not is_enabled(row_conditions[i], defines):
+            continue
+        pruned: MenuRow = []
+        for slot in row:
+            if is_enabled(slot.pop("conditions", []), defines):
+                pruned.append(slot)
+        # A MenuRow whose nodes are all disabled is removed.
+        if pruned:
+            rows.append(pruned)
+    node["rows"] = rows
+    for row in rows:
+        for slot in row:
+            if slot["mtype"] == MENU_TYPE_GROUP:
+                prune_group(slot, defines)
+
+
 # -----------------------------------------------------------------------------
 
 class Validator:
@@ -648,6 +1099,303 @@ class SymbolGenerator:
 # -----------------------------------------------------------------------------
 
 
+def node_handler(config: MenuConfig, node: MenuNode) -> str:
+    """Return the label of the handler of the node, which is written into the
+    MenuNode.handler field."""
+    if node["mtype"] == MENU_TYPE_GROUP:
+        return node.get('group_handler') or config['group_handler']
+    if node["name"] == '*':
+        return config['item_handler']
+    return f"{node['label']}Handler"
+
+# -----------------------------------------------------------------------------
+
+
+def is_blank(node: MenuNode) -> bool:
+    return node["name"] == '*'
+
+
+class RowMaskLayout:
+    """Elide the blank MenuNodes of the 'rowmask' layout. The remaining
+    MenuNodes are renumbered in the same order, so the children of each
+    MenuGroup are still contiguous. Each MenuGroup is given the rowBeginId of
+    its first non-blank child, and a (mask, offset) pair for each MenuRow,
+    where bit i of the mask is set if button i is not blank, and the offset is
+    the number of non-blank children in the previous MenuRows.
+    """
+    def __init__(self, config: MenuConfig, symbols: SymbolGenerator):
+        self.config = config
+        self.id_map = symbols.id_map  # {node_id -> MenuNode}
+        self.id_remap: Dict[int, int] = {}  # {node_id -> compact_id}
+        # {compact_group_id -> [(mask, offset)]}
+        self.row_masks: Dict[int, List[Tuple[int, int]]] = {}
+        # {compact_group_id -> compact rowBeginId}
+        self.row_begin_ids: Dict[int, int] = {}
+        self.blank_count = 0
+        self.id_counter = 1  # Null node is id=0
+
+    def generate(self) -> None:
+        # A blank button resolves to the mNull node, so the blank MenuItems
+        # must be equivalent to mNull.
+        if self.config['item_name'] != 'mNullName' \
+                or self.config['item_handler'] != 'mNullHandler':
+            raise ValueError(
+                "Layout 'rowmask' requires 'ItemName mNullName' and "
+                "'ItemHandler mNullHandler'"
+            )
+
+        for id in sorted(self.id_map.keys()):
+            if is_blank(self.id_map[id]):
+                self.blank_count += 1
+                continue
+            self.id_remap[id] = self.id_counter
+            self.id_counter += 1
+
+        for id, node in self.id_map.items():
+            if node["mtype"] != MENU_TYPE_GROUP:
+                continue
+            masks: List[Tuple[int, int]] = []
+            offset = 0
+            for row in node["rows"]:
+                mask = 0
+                for i, slot in enumerate(row):
+                    if not is_blank(slot):
+                        mask |= 1 << i
+                masks.append((mask, offset))
+                offset += bin(mask).count('1')
+            if offset > 255:
+                raise ValueError(
+                    f"MenuGroup {node['name']} has too many ({offset}) "
+                    "children, must be <= 255"
+                )
+            group_id = self.id_remap[id]
+            self.row_masks[group_id] = masks
+            child = first_nonblank_child(node)
+            self.row_begin_ids[group_id] = \
+                0 if child is None else self.id_remap[child["id"]]
+
+    def row_masks_size(self) -> int:
+        """Size of the row masks: the rowBeginId, and 2 bytes per MenuRow."""
+        return sum(2 + 2 * len(masks) for masks in self.row_masks.values())
+
+    def menu_id_of_button(self, group_id: int, row: int, button: int) -> int:
+        """Model of GetMenuIdOfButton() of USE_MENU_ROW_MASKS."""
+        mask, offset = self.row_masks[group_id][row]
+        if not mask & (1 << button):
+            return 0
+        before = bin(mask & ((1 << button) - 1)).count('1')
+        return self.row_begin_ids[group_id] + offset + before
+
+    def row_index_of_child(self, group_id: int, child_id: int) -> int:
+        """Model of GetMenuRowIndexOfChild() of USE_MENU_ROW_MASKS."""
+        child_offset = child_id - self.row_begin_ids[group_id]
+        masks = self.row_masks[group_id]
+        for row in range(len(masks) - 1):
+            if child_offset < masks[row + 1][1]:
+                return row
+        return len(masks) - 1
+
+    def verify(self) -> None:
+        """Verify that every button of every MenuRow resolves to the same
+        MenuNode as the padded layout, and that the parent MenuRow of every
+        MenuGroup is deduced correctly. Throws ValueError on failure."""
+        for id, node in self.id_map.items():
+            if node["mtype"] != MENU_TYPE_GROUP:
+                continue
+            group_id = self.id_remap[id]
+            for row_index, row in enumerate(node["rows"]):
+                for button, slot in enumerate(row):
+                    expected = 0 if is_blank(slot) else \
+                        self.id_remap[slot["id"]]
+                    menu_id = self.menu_id_of_button(
+                        group_id, row_index, button)
+                    if menu_id != expected:
+                        raise ValueError(
+                            f"MenuGroup {node['name']}: row {row_index}: "
+                            f"button {button}: got {menu_id}, "
+                            f"expected {expected}"
+                        )
+                    if slot["mtype"] != MENU_TYPE_GROUP:
+                        continue
+                    deduced = self.row_index_of_child(group_id, expected)
+                    if deduced != row_index:
+                        raise ValueError(
+                            f"MenuGroup {slot['name']}: parent row: got "
+                            f"{deduced}, expected {row_index}"
+                        )
+
+
+def first_nonblank_child(node: MenuNode) -> Optional[MenuNode]:
+    """Return the first non-blank child of the MenuGroup, or None."""
+    for row in node["rows"]:
+        for slot in row:
+            if not is_blank(slot):
+                return slot
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+# Number of entries in each block of the mNameIndex. The first entry of a
+# block stores its full name, the others store only the suffix after the
+# prefix shared with the previous entry.
+NAME_INDEX_BLOCK_SIZE = 8
+
+
+class NameIndexEntry(TypedDict):
+    name: bytes  # TI-OS font codes of the name
+    chars: List[str]  # exploded characters of the name
+    id: int  # menuId
+    label: str
+    prefix_len: int  # length of the prefix shared with the previous entry
+    unique_len: int  # length of the shortest unique prefix, 0 if none
+
+
+class NameIndex:
+    """Index of the MenuItems sorted by their display name, with front-coded
+    (prefix compressed) names. The names are compared using the codes of their
+    characters in the TI-OS font, with the font tags resolved by the symbols,
+    so that they sort in the same order on the calculator. MenuItems with the
+    same name are adjacent entries, sorted by menuId.
+
+    The index is divided into blocks whose first entry stores its full name,
+    so that a name is found using a binary search over the first entry of each
+    block, followed by a linear scan through the block. The shortest unique
+    prefix of each name is stored in a separate table, so that a partially
+    typed name can be completed.
+    """
+    def __init__(
+        self,
+        items: List[Tuple[List[str], int, str]],
+        symbols: SymbolResolver,
+    ):
+        """Create the index from the list of (exploded chars, menuId, label).
+        Throws ValueError if a font tag cannot be resolved."""
+        self.duplicates: List[str] = []  # labels of the repeated names
+        self.entries: List[NameIndexEntry] = []
+        indexed: List[Tuple[bytes, int, str, List[str]]] = []
+        for chars, id, label in items:
+            try:
+                name = encode_chars(chars, symbols)
+            except ValueError as e:
+                raise ValueError(f"NameIndex: '{label}': {str(e)}")
+            indexed.append((name, id, label, chars))
+        indexed.sort(key=lambda item: (item[0], item[1]))
+
+        names = [name for name, _, _, _ in indexed]
+        for i, (name, id, label, chars) in enumerate(indexed):
+            if i > 0 and names[i - 1] == name:
+                self.duplicates.append(label)
+            prefix_len = 0
+            if i % NAME_INDEX_BLOCK_SIZE != 0:
+                prefix_len = common_prefix_len(names[i - 1], name)
+            # Shortest prefix which does not match any other name.
+            shared = 0
+            if i > 0:
+                shared = common_prefix_len(names[i - 1], name)
+            if i + 1 < len(names):
+                shared = max(shared, common_prefix_len(names[i + 1], name))
+            # A name which is the prefix of another name, or a repeated name,
+            # is not unique.
+            unique_len = shared + 1 if shared < len(name) else 0
+            self.entries.append({
+                'name': name,
+                'chars': chars,
+                'id': id,
+                'label': label,
+                'prefix_len': prefix_len,
+                'unique_len': unique_len,
+            })
+
+    def block_count(self) -> int:
+        return -(-len(self.entries) // NAME_INDEX_BLOCK_SIZE)
+
+    def size(self) -> int:
+        """Size of the index: the block pointers, the front-coded entries (the
+        prefix length, the suffix length, the suffix, and the menuId), and the
+        unique prefix lengths."""
+        size = 2 * self.block_count()
+        for entry in self.entries:
+            size += 2 + len(entry['name']) - entry['prefix_len'] + 2 + 1
+        return size
+
+    def uncompressed_size(self) -> int:
+        """Size of an index of full NUL terminated names, without the block
+        pointers."""
+        return sum(len(e['name']) + 1 + 2 + 1 for e in self.entries)
+
+    def decode_block(self, block: int) -> List[Tuple[bytes, int]]:
+        """Decode the (name, menuId) of each entry of the block, from the
+        front-coded names, as the calculator would."""
+        begin = block * NAME_INDEX_BLOCK_SIZE
+        decoded: List[Tuple[bytes, int]] = []
+        name = b''
+        for entry in self.entries[begin:begin + NAME_INDEX_BLOCK_SIZE]:
+            suffix = entry['name'][entry['prefix_len']:]
+            name = name[:entry['prefix_len']] + suffix
+            decoded.append((name, entry['id']))
+        return decoded
+
+    def search(self, name: bytes) -> List[int]:
+        """Return the menuIds of the entries matching the name, or an empty
+        list if not found. Model of a binary search for the last block whose
+        first name is less than the name, followed by a linear scan from that
+        block, through the adjacent entries with the same name."""
+        low = 0
+        high = self.block_count()
+        while high - low > 1:
+            mid = (low + high) // 2
+            if self.decode_block(mid)[0][0] < name:
+                low = mid
+            else:
+                high = mid
+        ids: List[int] = []
+        for block in range(low, self.block_count()):
+            for entry_name, id in self.decode_block(block):
+                if entry_name == name:
+                    ids.append(id)
+                elif entry_name > name:
+                    return ids
+        return ids
+
+    def complete(self, prefix: bytes) -> int:
+        """Return the menuId of the entry whose shortest unique prefix is a
+        prefix of the given name, or 0 if the name is ambiguous."""
+        for entry in self.entries:
+            unique_len = entry['unique_len']
+            if unique_len and len(prefix) >= unique_len \
+                    and entry['name'].startswith(prefix):
+                return entry['id']
+        return 0
+
+    def verify(self) -> None:
+        """Verify that every indexed name can be found. Throws ValueError on
+        failure."""
+        for entry in self.entries:
+            name = entry['name']
+            id = entry['id']
+            found = self.search(name)
+            if id not in found:
+                raise ValueError(
+                    f"NameIndex: '{entry['label']}': got {found}, "
+                    f"expected {id}")
+            if self.search(name + b'\xff'):
+                raise ValueError(
+                    f"NameIndex: '{entry['label']}' should not match a "
+                    "longer name")
+
+
+def common_prefix_len(a: bytes, b: bytes) -> int:
+    n = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        n += 1
+    return n
+
+# -----------------------------------------------------------------------------
+
+
 class CodeGenerator:
     """Generate the Z80 assembly statements. There are 2 sections:
     1) the tree of menu nodes,
@@ -660,17 +1408,43 @@ class CodeGenerator:
         symbols: SymbolGenerator,
         config: MenuConfig,
         root: MenuNode,
+        layout: Optional[RowMaskLayout] = None,
+        alt_table: bool = False,
+        name_index: bool = False,
+        blob: Optional[Blob] = None,
+        profile: bool = False,
+        resolver: Optional[SymbolResolver] = None,
     ):
         self.inputfile = inputfile
+        self.blob = blob
+        self.profile = profile
         self.config = config
         self.root = root
+        self.layout = layout
+        self.alt_table = alt_table
+        self.name_index: Optional[NameIndex] = None
+        if name_index:
+            self.name_index = NameIndex([
+                (node["exploded_chars"], self.node_id(node), node["label"])
+                for node in symbols.id_map.values()
+                if node["mtype"] != MENU_TYPE_GROUP and not is_blank(node)
+            ], resolver or SymbolResolver())
+            self.name_index.verify()
 
         # id_map{} does not include NullNode, the count is off by one
         assert symbols.id_counter == len(symbols.id_map) + 1
-        self.menu_table_count = symbols.id_counter
+        if layout is None:
+            self.menu_table_count = symbols.id_counter
+        else:
+            self.menu_table_count = layout.id_counter
 
         self.id_map = symbols.id_map  # {node_id -> MenuNode}
         self.flat_names: List[MenuNode] = []
+        # MenuItemAlt nodes sorted by id, if alt_table
+        self.alt_nodes: List[MenuNode] = []
+        # External symbols referenced by the MenuNodes, without duplicates
+        self.references: List[Reference] = []
+        self.referenced: Set[str] = set()
 
     def generate(self, output: TextIO) -> None:
         self.output = output
@@ -679,9 +1453,29 @@ class CodeGenerator:
         self.generate_menus(self.root)
         print(file=self.output)
 
+        if self.alt_table:
+            logging.info("  Generating alt names")
+            self.generate_alt_table()
+            print(file=self.output)
+
+        if self.layout is not None:
+            logging.info("  Generating row masks")
+            self.generate_row_masks()
+            print(file=self.output)
+
         logging.info("  Generating name strings")
         self.generate_names(self.root)
 
+        if self.name_index is not None:
+            logging.info("  Generating name index")
+            print(file=self.output)
+            self.generate_name_index(self.name_index)
+
+        if self.profile:
+            logging.info("  Generating profile constants")
+            print(file=self.output)
+            self.generate_profile()
+
     def generate_menus(self, node: MenuNode) -> None:
         default_item_name = self.config["item_name"]
         default_item_handler = self.config["item_handler"]
@@ -719,6 +1513,29 @@ class CodeGenerator:
 ; DO NOT EDIT: This file was autogenerated.
 ;-----------------------------------------------------------------------------
 
+""", file=self.output, end='')
+
+        if self.layout is not None:
+            print("""\
+; Generated with '--layout rowmask': the blank MenuItems are elided, and the
+; rowBeginId of each MenuGroup is replaced with a pointer to its row masks.
+#ifndef USE_MENU_ROW_MASKS
+    .error "menudef.asm with '--layout rowmask' requires USE_MENU_ROW_MASKS"
+#endif
+
+""", file=self.output, end='')
+
+        if self.alt_table:
+            print("""\
+; Generated with '--alt-table': the altName and nameSelector are moved into the
+; mMenuAltTable, and the nameSelector field is removed from the MenuNode.
+#ifndef USE_MENU_ALT_TABLE
+    .error "menudef.asm with '--alt-table' requires USE_MENU_ALT_TABLE"
+#endif
+
+""", file=self.output, end='')
+
+        print(f"""\
 mMenuTableCount equ {self.menu_table_count} ; number of menu nodes
 mMenuTable:
 
@@ -730,8 +1547,9 @@ mNullId equ 0
     .db 0 ; numRows
     .dw 0 ; rowBeginId
     .dw mNullHandler
-    .dw 0
 """, file=self.output, end='')
+        if not self.alt_table:
+            print("    .dw 0", file=self.output)
 
         self.generate_menu_node(self.root)
         self.generate_menu_group(self.root)
@@ -740,7 +1558,7 @@ mNullId equ 0
         mtype = node["mtype"]
         name = node["name"]
         label = node["label"]
-        id = node["id"]
+        id = self.node_id(node)
         parent_id = node["parent_id"]
 
         if parent_id == 0:
@@ -757,19 +1575,24 @@ mNullId equ 0
             if name == '*':
                 node_id = f"{label}Id"
                 name_label = self.config['item_name']
-                handler = self.config['item_handler']
                 handler_comment = "predefined"
             else:
                 node_id = f"{label}Id"
                 name_label = f"{label}Name"
-                handler = f"{label}Handler"
                 handler_comment = "to be implemented"
+        elif mtype == MENU_TYPE_ITEM_ALT and self.alt_table:
+            num_rows = 0
+            node_id = f"{label}Id"
+            name_label = f"{label}Name+menuNameAltFlag"
+            row_begin_or_alt_name = "0"
+            handler_comment = "to be implemented"
+            name_selector = "0"
+            self.alt_nodes.append(node)
         elif mtype == MENU_TYPE_ITEM_ALT:
             num_rows = 0
             node_id = f"{label}Id"
             name_label = f"{label}Name"
             row_begin_or_alt_name = f"{label}AltName"
-            handler = f"{label}Handler"
             handler_comment = "to be implemented"
             name_selector = f"{label}NameSelector"
         else:
@@ -777,17 +1600,30 @@ mNullId equ 0
             name_label = f"{label}Name"
             rows = node["rows"]
             num_rows = len(rows)
-            begin_id = rows[0][0]["id"]
-            row_begin_node = self.id_map[begin_id]
-            row_begin_or_alt_name = row_begin_node["label"] + "Id"
-            overridden_handler = node.get('group_handler')
-            if overridden_handler is None:
-                handler = self.config['group_handler']
+            if self.layout is None:
+                begin_id = rows[0][0]["id"]
+                row_begin_node = self.id_map[begin_id]
+                row_begin_or_alt_name = row_begin_node["label"] + "Id"
+            else:
+                row_begin_or_alt_name = f"{label}RowMasks"
+            if node.get('group_handler') is None:
                 handler_comment = "predefined"
             else:
-                handler = overridden_handler
                 handler_comment = "to be implemented"
             name_selector = "0"
+        handler = node_handler(self.config, node)
+        if handler_comment == "predefined":
+            # The default handlers are configured by the MenuConfig.
+            self.add_reference(
+                handler, self.config.get('line', 0), "MenuConfig")
+        else:
+            self.add_reference(handler, node.get('line', 0), f"Menu '{name}'")
+        if name_selector != "0":
+            self.add_reference(
+                name_selector, node.get('line', 0), f"Menu '{name}'")
+        row_begin_field = "rowBeginId" if self.layout is None else "rowMasks"
+        if not self.alt_table:
+            row_begin_field += " or altName"
 
         print(f"""\
 {label}:
@@ -796,10 +1632,19 @@ mNullId equ 0
     .dw {parent_node_label}Id ; parentId
     .dw {name_label} ; name
     .db {num_rows} ; numRows
-    .dw {row_begin_or_alt_name} ; rowBeginId or altName
+    .dw {row_begin_or_alt_name} ; {row_begin_field}
     .dw {handler} ; handler ({handler_comment})
-    .dw {name_selector} ; nameSelector
 """, file=self.output, end='')
+        if not self.alt_table:
+            print(
+                f"    .dw {name_selector} ; nameSelector", file=self.output)
+
+    def add_reference(self, symbol: str, line: int, context: str) -> None:
+        if symbol in self.referenced:
+            return
+        self.referenced.add(symbol)
+        self.references.append(
+            {'symbol': symbol, 'line': line, 'context': context})
 
     def generate_menu_group(self, node: MenuNode) -> None:
         group_name = node["name"]
@@ -814,6 +1659,8 @@ mNullId equ 0
                 file=self.output
             )
             for slot in row:
+                if self.layout is not None and is_blank(slot):
+                    continue
                 self.generate_menu_node(slot)
             row_index += 1
 
@@ -824,11 +1671,75 @@ mNullId equ 0
                 if mtype == MENU_TYPE_GROUP:
                     self.generate_menu_group(slot)
 
+    def node_id(self, node: MenuNode) -> int:
+        """Return the id of the node in the generated mMenuTable."""
+        if self.layout is None:
+            return node["id"]
+        return self.layout.id_remap[node["id"]]
+
+    def menu_labels(self) -> List[str]:
+        """Return the labels of the nodes of the generated mMenuTable, indexed
+        by their id."""
+        labels = ['mNull'] * self.menu_table_count
+        for node in self.id_map.values():
+            if self.layout is not None and is_blank(node):
+                continue
+            labels[self.node_id(node)] = node["label"]
+        return labels
+
+    def generate_alt_table(self) -> None:
+        # Sorted by id, which is the order of the mMenuTable.
+        self.alt_nodes.sort(key=self.node_id)
+        print(f"""\
+;-----------------------------------------------------------------------------
+; Alternate names of the MenuItemAlt nodes, sorted by id, used by
+; USE_MENU_ALT_TABLE. See menu.asm for the equivalent C struct declaration.
+;-----------------------------------------------------------------------------
+
+mMenuAltTableCount equ {len(self.alt_nodes)} ; number of MenuItemAlt nodes
+mMenuAltTable:
+""", file=self.output, end='')
+        for node in self.alt_nodes:
+            label = node["label"]
+            print(f"""\
+    .dw {label}Id ; id
+    .dw {label}AltName ; altName
+    .dw {label}NameSelector ; nameSelector
+""", file=self.output, end='')
+
+    def generate_row_masks(self) -> None:
+        assert self.layout is not None
+        print("""\
+;-----------------------------------------------------------------------------
+; Row masks of the MenuGroups, used by USE_MENU_ROW_MASKS. See menu.asm for the
+; equivalent C struct declaration.
+;-----------------------------------------------------------------------------
+""", file=self.output, end='')
+
+        # Same order as the mMenuTable.
+        for id in sorted(self.id_map.keys()):
+            group = self.id_map[id]
+            if group["mtype"] != MENU_TYPE_GROUP:
+                continue
+            label = group["label"]
+            child = first_nonblank_child(group)
+            begin_label = "mNull" if child is None else child["label"]
+            print(f"""
+{label}RowMasks:
+    .dw {begin_label}Id ; rowBeginId
+""", file=self.output, end='')
+            masks = self.layout.row_masks[self.node_id(group)]
+            for row_index, (mask, offset) in enumerate(masks):
+                print(
+                    f"    .db %{mask:05b}, {offset} ; row {row_index}",
+                    file=self.output)
+
     def generate_names(self, node: MenuNode) -> None:
         # Collect the name strings into a list, so that we can generate
         # continguous name ids.
         names = self.flatten_nodes(node)
         names_count = len(names)
+        self.names_count = names_count
 
         # Calculate total size of string pool
         names_pool_size = 0
@@ -839,6 +1750,11 @@ mNullId equ 0
             if alt_name is not None:
                 chars = node["exploded_altchars"]
                 names_pool_size += len(chars) + 1  # include NUL
+        self.names_pool_size = names_pool_size
+
+        if self.blob is not None:
+            self.generate_names_blob(names, self.blob)
+            return
 
         # Generate the pool of C-strings
         print(f"""\
@@ -880,6 +1796,104 @@ mNullName:
     .db {display_altname}, 0
 """, file=self.output, end='')
 
+    def generate_names_blob(self, names: List[MenuNode], blob: Blob) -> None:
+        """Generate the pool of C-strings into the blob, and the equates of
+        their labels."""
+        blob.add('mNullName', b'\x00')
+        for node in names:
+            label = node["label"]
+            try:
+                blob.add_cstring(f"{label}Name", node["exploded_chars"])
+                if node.get("altname"):
+                    blob.add_cstring(
+                        f"{label}AltName", node["exploded_altchars"])
+            except ValueError as e:
+                raise ValueError(f"Menu '{label}': {str(e)}")
+        # The names pool size does not include the mNullName.
+        if blob.size() != self.names_pool_size + 1:
+            raise ValueError(
+                f"Blob size {blob.size()} != names pool size "
+                f"{self.names_pool_size} + 1")
+
+        print(f"""\
+;-----------------------------------------------------------------------------
+; Pool of menu names as NUL-terminated C strings, pre-assembled into
+; {blob.filename} by '--blob'.
+;-----------------------------------------------------------------------------
+
+mNamesCount equ {self.names_count} ; number of names and altnames
+mNamesPoolSize equ {self.names_pool_size} ; size of names string pool
+
+""", file=self.output, end='')
+        blob.generate_import(self.output)
+        print(file=self.output)
+        for label in blob.offsets:
+            print(blob.equate(label), file=self.output)
+
+    def generate_name_index(self, index: NameIndex) -> None:
+        print(f"""\
+;-----------------------------------------------------------------------------
+; Index of the MenuItems sorted by name, generated by '--name-index'. Each entry
+; is composed of:
+;   - .db prefixLen ; length of the prefix shared with the previous entry
+;   - .db suffixLen ; length of the rest of the name
+;   - .db suffix ; rest of the name, in the codes of the TI-OS font
+;   - .dw menuId
+; The entries are sorted by the font codes of their names, then by menuId, so
+; the MenuItems with the same name are adjacent. The first entry of each block
+; of mNameIndexBlockSize entries contains its full name (prefixLen=0), and is
+; pointed to by mNameIndexBlocks, so a name can be found with a binary search
+; over the blocks, then a linear scan.
+;-----------------------------------------------------------------------------
+
+mNameIndexCount equ {len(index.entries)} ; number of entries
+mNameIndexBlockSize equ {NAME_INDEX_BLOCK_SIZE} ; number of entries per block
+mNameIndexBlockCount equ {index.block_count()} ; number of blocks
+
+mNameIndexBlocks:
+""", file=self.output, end='')
+        for block in range(index.block_count()):
+            print(f"    .dw mNameIndexBlock{block}", file=self.output)
+
+        for i, entry in enumerate(index.entries):
+            if i % NAME_INDEX_BLOCK_SIZE == 0:
+                block = i // NAME_INDEX_BLOCK_SIZE
+                print(f"mNameIndexBlock{block}:", file=self.output)
+            prefix_len = entry['prefix_len']
+            suffix = entry['chars'][prefix_len:]
+            chars = ''.join(f", {c}" for c in suffix)
+            print(f"""\
+    .db {prefix_len}, {len(suffix)}{chars} ; {entry['label']}
+    .dw {entry['label']}Id
+""", file=self.output, end='')
+
+        print("""
+; Length of the shortest prefix which identifies the name of each entry, or 0
+; if the name is the prefix of another name.
+mNameIndexUniqueLens:
+""", file=self.output, end='')
+        for entry in index.entries:
+            print(
+                f"    .db {entry['unique_len']} ; {entry['label']}",
+                file=self.output)
+
+    def generate_profile(self) -> None:
+        labels = self.menu_labels()
+        print(f"""\
+;-----------------------------------------------------------------------------
+; Constants of the menu usage counters of profile1.asm, generated by
+; '--profile'. The counters are indexed by menuId. The signature is the CRC16
+; of the labels of the menu nodes, which identifies this menu hierarchy.
+;-----------------------------------------------------------------------------
+
+#ifndef USE_MENU_PROFILE
+    .error "menudef.asm with '--profile' requires USE_MENU_PROFILE"
+#endif
+
+mMenuProfileCount equ {len(labels)} ; number of counters
+mMenuProfileSignature equ ${profile_signature(labels):04X}
+""", file=self.output, end='')
+
     def flatten_nodes(self, node: MenuNode) -> List[MenuNode]:
         """Recursively descend the menu tree starting at 'node' and flatten
         the nodes into a list.
@@ -910,5 +1924,31 @@ mNullName:
 # -----------------------------------------------------------------------------
 
 
+def profile_signature(labels: List[str]) -> int:
+    """Return the CRC16 of the labels of the menu nodes, in the order of their
+    ids, using the same CRC16-CCITT as Crc16ccitt() of crc1.asm."""
+    return crc16_bitwise("\n".join(labels).encode("utf-8"))
+
+# -----------------------------------------------------------------------------
+
+
+def print_cost(
+    filenames: List[str], menu_table_count: int, alt_table: bool = False,
+) -> None:
+    """Print the predicted cost of findMenuNodeIX(), which does not depend on
+    the menuId."""
+    if alt_table:
+        program = read_program(filenames, {'USE_MENU_ALT_TABLE'})
+        node_size = MENU_NODE_SIZE_ALT_TABLE
+    else:
+        program = read_program(filenames)
+        node_size = MENU_NODE_SIZE
+    cost = lookup_cost(
+        program, 'findMenuNodeIX', [{}], node_size * menu_table_count)
+    logging.info("  " + format_cost('findMenuNodeIX', cost))
+
+# -----------------------------------------------------------------------------
+
+
 if __name__ == '__main__':
     main()
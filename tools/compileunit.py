@@ -8,8 +8,38 @@ Compile the Unit Definition Language file into a TI-OS Z80 assembly language
 file.
 
 Usage:
-$ compileunit.py [--debug] [--output unitdef.asm] unitdef.txt
-
+$ compileunit.py [--debug] [--layout {aos,soa}] [--pad-scale]
+    [--blob --include ti83plus.inc] [--link-check ../src] [--cost unit4.asm]
+    [--output unitdef.asm] unitdef.txt
+
+Table Layout Note:
+
+The default 'aos' (array of structs) layout emits a 'unitTable' of 12-byte
+UnitInfo records and a 'unitTypeTable' of 3-byte UnitTypeInfo records. Finding
+a record requires multiplying the id by 12 or 3, which costs a handful of
+shift-add instructions on the Z80.
+
+The 'soa' (struct of arrays) layout emits each field into its own parallel
+array instead: the name pointers (stride 2), the unitTypeIds (stride 1), and
+the scales (stride 9, or 16 with '--pad-scale'). Each accessor in unit4.asm
+then indexes its array with one or more shifts, and touches only the field that
+it needs. The generated file defines UNIT_LAYOUT_SOA (and UNIT_SCALE_STRIDE_16
+if padded) which selects the matching accessors in unit4.asm, so unitdef.asm
+must be included before unit4.asm.
+
+The '--blob' flag writes the pools of name strings, and the unitScaleTable of
+the 'soa' layout, into a binary file next to the output file (e.g.
+unitdef.bin), included with '#import'. The generated file keeps only the
+'equ' statements of their labels. The font tags are resolved using the files
+given by '--include'. See asmblob.py.
+
+The '--link-check' flag verifies that the unitType{Y}Id and unit{X}Id symbols
+referenced by the generated tables are defined, either by the generated file
+itself or by the assembly files of the given directories (see asmindex.py),
+and reports all undefined symbols with the line of the unit definition file.
+
+The '--cost' flag prints the table size, and the code size and T-states of
+the accessors of unit4.asm, for each layout.
 """
 
 from typing import Dict
@@ -19,12 +49,25 @@ from typing import TextIO
 from typing import TypedDict
 
 import argparse
+import decimal
+import io
 import logging
+import re
 import sys
 import os
-import math
+from fractions import Fraction
 from pprint import pp
 
+from asmblob import Blob
+from asmindex import Reference
+from asmindex import link_check
+from compileconst import FloatExploder as ConstExploder
+from compilekeys import SymbolResolver
+from z80cost import format_cost
+from z80cost import lookup_cost
+from z80cost import read_program
+from z80cost import repeat_decisions
+
 
 def main() -> None:
     # Configure command line flags.
@@ -42,56 +85,110 @@ def main() -> None:
         action='store_true',
         default=False,
     )
+    parser.add_argument(
+        '--layout',
+        help='Table layout, array of structs (aos) or struct of arrays (soa)',
+        choices=['aos', 'soa'],
+        default='aos',
+    )
+    parser.add_argument(
+        '--pad-scale',
+        help='Pad each scale to 16 bytes in the soa layout',
+        action='store_true',
+        default=False,
+    )
+    parser.add_argument(
+        '--blob',
+        help='Pre-assemble the static tables into a binary file',
+        action='store_true',
+        default=False,
+    )
+    parser.add_argument(
+        '--include', '-I',
+        help='Assembly file with the equ definitions of the font tags',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        '--link-check',
+        help='Directory or assembly file which defines the external symbols',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        '--index-cache',
+        help='Cache file of the symbol index used by --link-check',
+        required=False,
+    )
+    parser.add_argument(
+        '--cost',
+        help='Assembly file with the accessor routines, to print the '
+        'predicted size and T-states of a lookup',
+        action='append',
+        default=[],
+    )
     parser.add_argument(
         'filename',
         help='Unit definition file',
     )
     args = parser.parse_args()
+    if args.pad_scale and args.layout != 'soa':
+        parser.error("flag '--pad-scale' requires '--layout soa'")
 
     # Configure logging. This should normally be executed after the
     # parser.parse_args() because it allows us set the logging.level using a
     # flag.
     logging.basicConfig(level=logging.INFO)
 
-    # Open the input file and parse.
-    logging.info(f"Reading {args.filename}")
-    with open(args.filename) as file:
-        lexer = Lexer(file)
-        unitdef_parser = UnitDefParser(lexer)
-        content = unitdef_parser.parse()
-
-    if args.debug:
-        pp(content['unit_types'], stream=sys.stderr)
-        pp(content['units'], stream=sys.stderr)
-
-    sym_generator = SymbolGenerator(content)
-    sym_generator.generate()
-
-    validator = Validator(content)
-    validator.validate()
-
-    s_exploder = StringExploder(content)
-    s_exploder.explode()
-
-    f_exploder = FloatExploder(content)
-    f_exploder.explode()
-
-    if args.debug:
-        pp(content['units'], stream=sys.stderr)
-
-    code_generator = CodeGenerator(args.filename, content)
-
     # Determine the output file name.
     if args.output:
         outputname = args.output
     else:
         outputname = os.path.splitext(args.filename)[0] + ".asm"
+
+    # Read the input file and compile.
+    logging.info(f"Reading {args.filename}")
+    with open(args.filename) as file:
+        text = file.read()
+    options: UnitOptions = {
+        'filename': args.filename,
+        'layout': args.layout,
+        'pad_scale': args.pad_scale,
+    }
+    if args.blob:
+        blobname = os.path.splitext(outputname)[0] + ".bin"
+        options['blob'] = os.path.basename(blobname)
+        options['symbols'] = SymbolResolver()
+        for include in args.include:
+            logging.info(f"Reading {include}")
+            with open(include, encoding="utf-8", errors="replace") as file:
+                options['symbols'].read(file)
     logging.info(f"Generating {outputname}")
+    result = compile_unit(text, options)
+
+    if args.debug:
+        pp(result['content']['unit_types'], stream=sys.stderr)
+        pp(result['content']['units'], stream=sys.stderr)
+        pp(result['stats'], stream=sys.stderr)
+
+    if args.link_check:
+        # The previous version of the output file must not be indexed.
+        exclude = [os.path.basename(outputname)]
+        link_check(
+            args.filename, result['references'], result['asm'],
+            args.link_check, exclude, args.index_cache)
 
-    # Open the output file and generate
     with open(outputname, "w", encoding="utf-8") as file:
-        code_generator.generate(file)
+        file.write(result['asm'])
+    if args.blob:
+        logging.info(
+            f"Generating {blobname} ({len(result['blob'])} bytes)")
+        with open(blobname, "wb") as file:
+            file.write(result['blob'])
 
+    if args.cost:
+        print_costs(
+            args.cost, result['content'], args.layout, args.pad_scale)
 
 # -----------------------------------------------------------------------------
 
@@ -101,6 +198,7 @@ class UnitType(TypedDict, total=False):
     label: str  # assembly code label of unit type
     name: str  # display name for this unit type
     base_unit: str  # base unit for all units of this type
+    line: int  # line number in the unitdef file
     # derived fields
     id: int  # integer id of class
     exploded_chars: List[str]  # list of individual chars in name
@@ -113,10 +211,12 @@ class Unit(TypedDict, total=False):
     label: str  # assembly code label of unit
     name: str  # display name used with its value
     unit_type: str  # unit type label
-    scale: str  # scale of unit measured in base_unit of the unit_type
+    scale: str  # scale expression, measured in base_unit of the unit_type
+    line: int  # line number in the unitdef file
     # derived fields
     id: int  # integer id of unit
-    scale_float: float  # 'scale' string converted into Python float type
+    scale_fraction: Fraction  # exact value of the 'scale' expression
+    scale_float: float  # 'scale_fraction' converted into Python float type
     scale_bytes: bytes  # 'scale' converted into 9 bytes of TIOS float type
     scale_db_string: str  # 'scale_bytes' converted into 9 hex digits
     exploded_chars: List[str]  # list of individual chars in name
@@ -139,6 +239,108 @@ class ParsedContent(TypedDict, total=False):
 # -----------------------------------------------------------------------------
 
 
+class UnitOptions(TypedDict, total=False):
+    """Options of compile_unit(), equivalent to the command line flags."""
+    filename: str  # name of the unit definition file, for the comments
+    layout: str  # 'aos' (default) or 'soa'
+    pad_scale: bool
+    blob: str  # name of the binary file of the static tables, if not empty
+    symbols: SymbolResolver  # equ definitions of the font tags, for the blob
+
+
+class CompileResult(TypedDict):
+    """Result of compile_unit()."""
+    asm: str  # the generated assembly code
+    blob: bytes  # content of the binary file, empty if not enabled
+    content: ParsedContent  # the AST, annotated by the compiler
+    unit_ids: Dict[str, int]  # {label -> id} of the Units
+    unit_type_ids: Dict[str, int]  # {label -> id} of the UnitTypes
+    references: List[Reference]  # symbols used by the generated code
+    stats: Dict[str, int]  # {statistic -> value}
+
+
+def compile_unit(
+    text: str, options: Optional[UnitOptions] = None,
+) -> CompileResult:
+    """Compile the unit definition text into Z80 assembly code, without any
+    file I/O. Each call uses its own instances of the compiler classes, so
+    multiple files can be compiled concurrently. Throws ValueError if the
+    unit definition is invalid."""
+    if options is None:
+        options = {}
+    layout = options.get('layout', 'aos')
+    pad_scale = options.get('pad_scale', False)
+    if layout not in ('aos', 'soa'):
+        raise ValueError(f"Unknown layout '{layout}'")
+    if pad_scale and layout != 'soa':
+        raise ValueError("Flag '--pad-scale' requires '--layout soa'")
+
+    content = UnitDefParser(Lexer(io.StringIO(text))).parse()
+    SymbolGenerator(content).generate()
+    Validator(content).validate()
+    StringExploder(content).explode()
+    FloatExploder(content).explode()
+
+    blob: Optional[Blob] = None
+    if options.get('blob'):
+        blob = Blob(
+            'unitDefBlob', options['blob'],
+            options.get('symbols', SymbolResolver()))
+
+    code_generator = CodeGenerator(
+        options.get('filename', 'unitdef.txt'), content, layout, pad_scale,
+        blob)
+    output = io.StringIO()
+    code_generator.generate(output)
+
+    stats = {
+        'units': len(content['units']),
+        'unit_types': len(content['unit_types']),
+        'table_size': table_size(content, layout, pad_scale),
+    }
+    if blob is not None:
+        stats['blob_size'] = blob.size()
+
+    return {
+        'asm': output.getvalue(),
+        'blob': b'' if blob is None else bytes(blob.data),
+        'content': content,
+        'unit_ids': {
+            label: unit['id']
+            for label, unit in content['units_by_label'].items()
+        },
+        'unit_type_ids': {
+            label: unit_type['id']
+            for label, unit_type in content['unit_types_by_label'].items()
+        },
+        'references': unit_references(content),
+        'stats': stats,
+    }
+
+
+def unit_references(content: ParsedContent) -> List[Reference]:
+    """Return the unit and unitType ids referenced by the generated tables.
+    They are normally defined by the generated file itself, unless a Unit
+    refers to an unknown UnitType."""
+    references: List[Reference] = []
+    for unit_type in content['unit_types']:
+        references.append({
+            'symbol': f"unit{unit_type['base_unit']}Id",
+            'line': unit_type.get('line', 0),
+            'context': f"UnitType '{unit_type['label']}'",
+        })
+    for unit in content['units']:
+        references.append({
+            'symbol': f"unitType{unit['unit_type']}Id",
+            'line': unit.get('line', 0),
+            'context': f"Unit '{unit['label']}'",
+        })
+    return references
+
+
+# -----------------------------------------------------------------------------
+
+
 class Lexer:
     """Read the sys.stdin and tokenize by spliting on white spaces. Comments
     begin with '#'.
@@ -234,7 +436,7 @@ class UnitDefParser:
         while True:
             token = self.lexer.get_token()
             if token == 'UnitType':
-                unit_type: UnitType = {}
+                unit_type: UnitType = {'line': self.lexer.line_number}
 
                 token = self.lexer.get_token()
                 unit_type['label'] = token
@@ -272,7 +474,7 @@ class UnitDefParser:
         while True:
             token = self.lexer.get_token()
             if token == 'Unit':
-                unit: Unit = {}
+                unit: Unit = {'line': self.lexer.line_number}
 
                 token = self.lexer.get_token()
                 unit['label'] = token
@@ -486,52 +688,161 @@ class StringExploder:
 
 
 class FloatExploder:
-    """Convert the floating point number in 'scale' to the 9-byte native
-    format used by TI-OS."""
+    """Evaluate the 'scale' expression of each Unit exactly, and convert it to
+    the 9-byte native format used by TI-OS.
+
+    The 'scale' is an arithmetic expression of decimal numbers (e.g. '0.3048',
+    '1e-3'), labels of previously defined Units (e.g. 'Foot'), the operators
+    '+', '-', '*', '/', integer powers '^', and parentheses. No spaces are
+    allowed, since the scale is a single token. For example:
+
+        Unit FootPoundEnergy ft<SdotIcon>lbf Energy Foot*PoundForce
+        Unit BtuPerHour Btu/h Power BritishThermalUnit/3600
+
+    The expression is evaluated using Python fractions, then rounded once to
+    the 14 significant digits of the TI-OS floating point number.
+    """
+
+    TOKEN_PATTERN = re.compile(
+        r'(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)'
+        r'|(?P<label>[A-Za-z_][A-Za-z0-9_]*)'
+        r'|(?P<op>[-+*/^()])'
+    )
 
     def __init__(self, content: ParsedContent):
         self.units = content['units']
+        self.scales: Dict[str, Fraction] = {}  # {label -> exact scale}
+        # state of evaluate()
+        self.expression = ''
+        self.tokens: List[str] = []
+        self.index = 0
 
     def explode(self) -> None:
         for unit in self.units:
             self.explode_unit(unit)
 
     def explode_unit(self, unit: Unit) -> None:
+        label = unit['label']
         scale = unit['scale']
-        scale_float = float(scale)
-        unit['scale_float'] = scale_float
-        scale_bytes = self.explode_float(scale_float)
+        try:
+            scale_fraction = self.evaluate(scale)
+            if scale_fraction <= 0:
+                raise ValueError(f"Scale must be positive: '{scale}'")
+            scale_bytes = ConstExploder.explode_fraction(scale_fraction)
+        except ValueError as e:
+            raise ValueError(f"Invalid Unit '{label}': {str(e)}")
+        self.scales[label] = scale_fraction
+        unit['scale_fraction'] = scale_fraction
+        unit['scale_float'] = float(scale_fraction)
         unit['scale_bytes'] = scale_bytes
         unit['scale_db_string'] = self.convert_to_db_string(scale_bytes)
 
-    @staticmethod
-    def explode_float(x: float) -> bytes:
-        """Convert the float into TIOS float in scientific notation with 14
-        significant digits."""
-
-        # Human readable version of TIOS float number
-        tios_str = f"{x:.14e}"
-
-        # Exponent
-        exponent = math.floor(math.log10(x))
-        if exponent < -99 or exponent > 99:
-            raise ValueError(f"Exponent too large: '{tios_str}'")
-        ti_exponent = exponent + 128
-
-        # Mantissa
-        ti_digits = tios_str[0:16]
-        ti_digits = ti_digits.replace('.', '')
-
-        # Convert to the 9-byte binary representation TIOS floating number
-        hexes = bytearray()
-        hexes.append(0)  # objectType
-        hexes.append(ti_exponent)  # exponent as one binary byte
-        for i in range(0, 14, 2):
-            # Convert 7 pairs of digits to BCD notation
-            byte = int(ti_digits[i]) * 16 + int(ti_digits[i + 1])
-            hexes.append(byte)
-
-        return bytes(hexes)
+    def evaluate(self, expression: str) -> Fraction:
+        """Evaluate the scale expression exactly, using the scales of the Units
+        defined so far."""
+        self.expression = expression
+        self.tokens = self.tokenize(expression)
+        self.index = 0
+        result = self.parse_sum()
+        if self.index < len(self.tokens):
+            raise ValueError(
+                f"Unexpected '{self.tokens[self.index]}' in '{expression}'")
+        return result
+
+    def tokenize(self, expression: str) -> List[str]:
+        tokens: List[str] = []
+        pos = 0
+        while pos < len(expression):
+            match = self.TOKEN_PATTERN.match(expression, pos)
+            if match is None:
+                raise ValueError(
+                    f"Invalid character '{expression[pos]}' "
+                    f"in '{expression}'")
+            tokens.append(match.group(0))
+            pos = match.end()
+        return tokens
+
+    def peek(self) -> Optional[str]:
+        if self.index < len(self.tokens):
+            return self.tokens[self.index]
+        return None
+
+    def next(self) -> str:
+        token = self.peek()
+        if token is None:
+            raise ValueError(f"Unexpected end of '{self.expression}'")
+        self.index += 1
+        return token
+
+    def parse_sum(self) -> Fraction:
+        """sum := product (('+' | '-') product)*"""
+        result = self.parse_product()
+        while self.peek() in ('+', '-'):
+            op = self.next()
+            term = self.parse_product()
+            result = result + term if op == '+' else result - term
+        return result
+
+    def parse_product(self) -> Fraction:
+        """product := unary (('*' | '/') unary)*"""
+        result = self.parse_unary()
+        while self.peek() in ('*', '/'):
+            op = self.next()
+            factor = self.parse_unary()
+            if op == '*':
+                result *= factor
+            else:
+                if factor == 0:
+                    raise ValueError(
+                        f"Division by zero in '{self.expression}'")
+                result /= factor
+        return result
+
+    def parse_unary(self) -> Fraction:
+        """unary := ('+' | '-') unary | power"""
+        if self.peek() in ('+', '-'):
+            op = self.next()
+            value = self.parse_unary()
+            return -value if op == '-' else value
+        return self.parse_power()
+
+    def parse_power(self) -> Fraction:
+        """power := primary ('^' ['-'] integer)?"""
+        base = self.parse_primary()
+        if self.peek() != '^':
+            return base
+        self.next()
+        sign = 1
+        if self.peek() == '-':
+            self.next()
+            sign = -1
+        token = self.next()
+        if not token.isdigit():
+            raise ValueError(
+                f"Invalid exponent '{token}' in '{self.expression}'")
+        exponent = sign * int(token)
+        if base == 0 and exponent < 0:
+            raise ValueError(f"Division by zero in '{self.expression}'")
+        return base ** exponent
+
+    def parse_primary(self) -> Fraction:
+        """primary := number | label | '(' sum ')'"""
+        token = self.next()
+        if token == '(':
+            result = self.parse_sum()
+            if self.next() != ')':
+                raise ValueError(f"Missing ')' in '{self.expression}'")
+            return result
+        if token[0].isdigit() or token[0] == '.':
+            return Fraction(decimal.Decimal(token))
+        if token[0].isalpha() or token[0] == '_':
+            scale = self.scales.get(token)
+            if scale is None:
+                raise ValueError(
+                    f"Unknown or forward reference to Unit '{token}' "
+                    f"in '{self.expression}'")
+            return scale
+        raise ValueError(f"Unexpected '{token}' in '{self.expression}'")
 
     @staticmethod
     def convert_to_db_string(scale_bytes: bytes) -> str:
@@ -557,14 +868,23 @@ class CodeGenerator:
     3) 'unitTable' with the list of Units
     4) the C-strings used by the units, composed of the pool of c-strings
     concatenated together.
+
+    In the 'soa' layout, sections 1) and 3) are replaced by parallel arrays,
+    one array per field.
     """
     def __init__(
         self,
         inputfile: str,
         content: ParsedContent,
+        layout: str = 'aos',
+        pad_scale: bool = False,
+        blob: Optional[Blob] = None,
     ):
         self.inputfile = inputfile
         self.content = content
+        self.layout = layout
+        self.pad_scale = pad_scale
+        self.blob = blob
 
     def generate(self, output: TextIO) -> None:
         self.output = output
@@ -585,18 +905,62 @@ class CodeGenerator:
 
 """, file=self.output, end='')
 
+        if self.layout == 'soa':
+            self.generate_soa_defines()
+
+        if self.blob is not None:
+            self.fill_blob(self.blob)
+
         logging.info("  Generating UnitTypes")
-        self.generate_unit_types()
+        if self.layout == 'soa':
+            self.generate_unit_types_soa()
+        else:
+            self.generate_unit_types()
 
         logging.info("  Generating UnitType names")
         self.generate_unit_type_names()
 
         logging.info("  Generating Units")
-        self.generate_units()
+        if self.layout == 'soa':
+            self.generate_units_soa()
+        else:
+            self.generate_units()
 
         logging.info("  Generating Unit names")
         self.generate_unit_names()
 
+        if self.blob is not None:
+            print(f"""\
+
+;-----------------------------------------------------------------------------
+; Static data pre-assembled into {self.blob.filename} by '--blob'.
+;-----------------------------------------------------------------------------
+
+""", file=self.output, end='')
+            self.blob.generate_import(self.output)
+
+    def fill_blob(self, blob: Blob) -> None:
+        """Pre-assemble the pools of names, and the unitScaleTable of the
+        'soa' layout, into the blob."""
+        for unit_type in self.content['unit_types']:
+            label = unit_type['label']
+            try:
+                blob.add_cstring(
+                    f"unitType{label}Name", unit_type['exploded_chars'])
+            except ValueError as e:
+                raise ValueError(f"UnitType '{label}': {str(e)}")
+        if self.layout == 'soa':
+            padding = bytes(7 if self.pad_scale else 0)
+            blob.add('unitScaleTable', b''.join(
+                unit['scale_bytes'] + padding
+                for unit in self.content['units']))
+        for unit in self.content['units']:
+            label = unit['label']
+            try:
+                blob.add_cstring(f"unit{label}Name", unit['exploded_chars'])
+            except ValueError as e:
+                raise ValueError(f"Unit '{label}': {str(e)}")
+
     def generate_unit_types(self) -> None:
         unit_types_count = len(self.content['unit_types'])
         print(f"""\
@@ -620,6 +984,58 @@ unitType{label}Id equ {id}
     .db unit{base_unit}Id ; baseUnit
 """, file=self.output, end='')
 
+    def generate_soa_defines(self) -> None:
+        scale_stride = 16 if self.pad_scale else 9
+        print("""\
+;-----------------------------------------------------------------------------
+; Struct of arrays layout. The following defines select the matching accessors
+; in unit4.asm, so this file must be included before unit4.asm.
+;-----------------------------------------------------------------------------
+
+#define UNIT_LAYOUT_SOA
+""", file=self.output, end='')
+        if self.pad_scale:
+            print("#define UNIT_SCALE_STRIDE_16", file=self.output)
+        print(f"""\
+
+unitTypeBaseUnitIdStride equ 1 ; sizeof(unitTypeBaseUnitIdTable[0])
+unitNameStride equ 2 ; sizeof(unitNameTable[0])
+unitTypeIdStride equ 1 ; sizeof(unitTypeIdTable[0])
+unitScaleStride equ {scale_stride} ; sizeof(unitScaleTable[0])
+unitScaleSize equ 9 ; sizeof(float)
+
+""", file=self.output, end='')
+
+    def generate_unit_types_soa(self) -> None:
+        unit_types = self.content['unit_types']
+        unit_types_count = len(unit_types)
+        print(f"""\
+;-----------------------------------------------------------------------------
+; List of UnitTypes, as parallel arrays indexed by unitTypeId.
+;-----------------------------------------------------------------------------
+
+unitTypesCount equ {unit_types_count} ; number of unit types
+
+""", file=self.output, end='')
+
+        for unit_type in unit_types:
+            label = unit_type['label']
+            id = unit_type['id']
+            print(f"unitType{label}Id equ {id}", file=self.output)
+
+        print("\nunitTypeNameTable:", file=self.output)
+        for unit_type in unit_types:
+            label = unit_type['label']
+            print(f"    .dw unitType{label}Name", file=self.output)
+
+        print("\nunitTypeBaseUnitIdTable:", file=self.output)
+        for unit_type in unit_types:
+            label = unit_type['label']
+            base_unit = unit_type['base_unit']
+            print(
+                f"    .db unit{base_unit}Id ; {label}",
+                file=self.output)
+
     def generate_unit_type_names(self) -> None:
         unit_type_names_count = len(self.content['units'])
 
@@ -641,6 +1057,14 @@ unitTypeNamesPoolSize equ {unit_type_names_pool_size} \
 
 """, file=self.output, end='')
 
+        if self.blob is not None:
+            for unit_type in self.content['unit_types']:
+                label = unit_type['label']
+                print(
+                    self.blob.equate(f"unitType{label}Name"),
+                    file=self.output)
+            return
+
         for unit_type in self.content['unit_types']:
             label = unit_type['label']
             name_contains_special = unit_type["name_contains_special"]
@@ -683,6 +1107,52 @@ unit{label}Id equ {id}
     .db {scale_db_string} ; scale={scale}
 """, file=self.output, end='')
 
+    def generate_units_soa(self) -> None:
+        units = self.content['units']
+        units_count = len(units)
+        scale_pad = 7 if self.pad_scale else 0
+        print(f"""\
+
+;-----------------------------------------------------------------------------
+; List of Units, as parallel arrays indexed by unitId.
+;-----------------------------------------------------------------------------
+
+unitsCount equ {units_count} ; number of units
+
+""", file=self.output, end='')
+
+        for unit in units:
+            label = unit['label']
+            id = unit['id']
+            print(f"unit{label}Id equ {id}", file=self.output)
+
+        print("\nunitNameTable:", file=self.output)
+        for unit in units:
+            label = unit['label']
+            print(f"    .dw unit{label}Name", file=self.output)
+
+        print("\nunitTypeIdTable:", file=self.output)
+        for unit in units:
+            label = unit['label']
+            unit_type = unit['unit_type']
+            print(f"    .db unitType{unit_type}Id ; {label}", file=self.output)
+
+        if self.blob is not None:
+            print(
+                "\n" + self.blob.equate("unitScaleTable"), file=self.output)
+            return
+
+        print("\nunitScaleTable:", file=self.output)
+        for unit in units:
+            label = unit['label']
+            scale = unit['scale']
+            scale_db_string = unit['scale_db_string']
+            if scale_pad:
+                scale_db_string += ", $00" * scale_pad
+            print(
+                f"    .db {scale_db_string} ; {label}={scale}",
+                file=self.output)
+
     def generate_unit_names(self) -> None:
         unit_names_count = len(self.content['units'])
 
@@ -703,6 +1173,12 @@ unitNamesPoolSize equ {unit_names_pool_size} ; size of unit names string pool
 
 """, file=self.output, end='')
 
+        if self.blob is not None:
+            for unit in self.content['units']:
+                label = unit['label']
+                print(self.blob.equate(f"unit{label}Name"), file=self.output)
+            return
+
         for unit in self.content['units']:
             label = unit['label']
             name_contains_special = unit["name_contains_special"]
@@ -720,6 +1196,51 @@ unit{label}Name:
 
 # -----------------------------------------------------------------------------
 
+# Table layouts compared by '--cost': (layout, pad_scale) -> #define symbols of
+# unit4.asm
+COST_LAYOUTS = [
+    ('aos', False, set()),
+    ('soa', False, {'UNIT_LAYOUT_SOA'}),
+    ('soa', True, {'UNIT_LAYOUT_SOA', 'UNIT_SCALE_STRIDE_16'}),
+]
+
+# Accessors of unit4.asm, and the decisions of their branches. The cost of an
+# accessor does not depend on the unitId.
+COST_ACCESSORS = {
+    'GetUnitTypeId': {},
+    'GetUnitBaseId': {},
+    'GetUnitScale': {'ldir': repeat_decisions(9)},
+}
+
+
+def table_size(content: ParsedContent, layout: str, pad_scale: bool) -> int:
+    """Size in bytes of the unitTypeTable and unitTable, or their parallel
+    arrays, excluding the name strings."""
+    num_types = len(content['unit_types'])
+    num_units = len(content['units'])
+    if layout == 'aos':
+        return 3 * num_types + 12 * num_units
+    scale_stride = 16 if pad_scale else 9
+    return 3 * num_types + (2 + 1 + scale_stride) * num_units
+
+
+def print_costs(
+    filenames: List[str],
+    content: ParsedContent,
+    selected_layout: str,
+    selected_pad_scale: bool,
+) -> None:
+    """Print the predicted cost of each accessor for each layout."""
+    for layout, pad_scale, defines in COST_LAYOUTS:
+        program = read_program(filenames, defines)
+        name = layout + (' --pad-scale' if pad_scale else '')
+        if (layout, pad_scale) == (selected_layout, selected_pad_scale):
+            name += ' (selected)'
+        size = table_size(content, layout, pad_scale)
+        for accessor, decisions in COST_ACCESSORS.items():
+            cost = lookup_cost(program, accessor, [decisions], size)
+            logging.info(f"  {name}: " + format_cost(accessor, cost))
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 Brian T. Park
+# MIT License.
+
+"""
+Find the menu handlers and their helper routines which are no longer reachable
+from the menu definition file or the key handler tables, and estimate the
+number of bytes of flash which would be reclaimed by removing them.
+
+Usage:
+$ deadcode.py [-D SYMBOL ...] [--candidates '*menuhandlers.asm' ...]
+    [--menudef menudef.txt] [--keytab handlertab.txt ...] rpn83p.asm
+
+The candidate files (by default, the '*menuhandlers.asm' files included by the
+main file) are parsed into basic blocks using the Program of z80cost.py,
+honoring the '#ifdef' directives and the '-D' flags. Each block starts at a
+label (aliases at the same address are merged) and ends at the next label.
+A block refers to:
+
+- every label in the operands of its instructions ('call', 'jp', 'jr',
+  'ld hl, label', '.dw label', etc.),
+- the target of a 'bcall(_Xxx)',
+- the next block, unless its last instruction is an unconditional 'ret',
+  'jp' or 'jr', or a data directive.
+
+The roots of the reachability graph are:
+
+- the handlers referenced by the menu definition file, compiled in memory
+  with the same '-D' flags as the ones used to build the app,
+- the handlers of the key tables ('--keytab'),
+- every label of a candidate file which is mentioned by any other file
+  included by the main file, except the generated files (menudef.asm,
+  handlertab.asm, arghandlertab.asm, branchtab.asm).
+
+The unreachable blocks are grouped into routines (a chain of blocks which fall
+through into each other), labeled as a 'handler' if one of the labels ends
+with 'Handler', otherwise as a 'helper'. The sizes are the static estimates of
+z80cost.py, which cover the instructions and the '.db' and '.dw' data.
+"""
+
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import TextIO
+from typing import TypedDict
+
+import argparse
+import fnmatch
+import logging
+import os
+import re
+import sys
+
+from compilekeys import KeyParser
+from compilekeys import Lexer
+from compilemenu import compile_menu
+from genbranchtab import IncludeScanner
+from z80cost import Instruction
+from z80cost import Program
+
+# Files generated from the definition files. Their references are provided by
+# the roots of the definition files themselves, and the branch table would
+# otherwise keep every bcall() target alive.
+GENERATED_FILES = [
+    'menudef.asm', 'handlertab.asm', 'arghandlertab.asm', 'branchtab.asm',
+]
+
+# Default key tables, relative to the directory of the main file.
+KEY_TABLES = ['handlertab.txt', 'arghandlertab.txt']
+
+
+def main() -> None:
+    # Configure command line flags.
+    parser = argparse.ArgumentParser(
+        description='Find the unreachable menu handlers of the RPN83P'
+    )
+    parser.add_argument(
+        '--define', '-D',
+        help='Define the symbol used by #ifdef and the If blocks',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        '--candidates',
+        help="Glob of the files searched for dead code "
+        "(default: '*menuhandlers.asm')",
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        '--menudef',
+        help='Menu definition file (default: menudef.txt)',
+        required=False,
+    )
+    parser.add_argument(
+        '--keytab',
+        help='Key binding file (default: handlertab.txt, arghandlertab.txt)',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        'filename',
+        help='Main assembly file containing the #include statements',
+    )
+    args = parser.parse_args()
+
+    # Configure logging. This should normally be executed after the
+    # parser.parse_args() because it allows us set the logging.level using a
+    # flag.
+    logging.basicConfig(level=logging.INFO)
+
+    srcdir = os.path.dirname(args.filename)
+    candidates = args.candidates or ['*menuhandlers.asm']
+    menudef = args.menudef or os.path.join(srcdir, 'menudef.txt')
+    keytabs = args.keytab or [os.path.join(srcdir, f) for f in KEY_TABLES]
+
+    logging.info(f"Reading {args.filename}")
+    with open(args.filename, encoding="utf-8") as file:
+        sources = [s['filename'] for s in IncludeScanner(file).scan()]
+    candidate_files = [
+        f for f in sources
+        if any(fnmatch.fnmatch(f, pattern) for pattern in candidates)
+    ]
+    other_files = [
+        f for f in sources
+        if f not in candidate_files and f not in GENERATED_FILES
+    ]
+
+    graph = CallGraph(set(args.define))
+    for filename in candidate_files:
+        with open(os.path.join(srcdir, filename), encoding="utf-8") as file:
+            graph.add_file(filename, file)
+
+    roots: Set[str] = set()
+    logging.info(f"Reading {menudef}")
+    with open(menudef, encoding="utf-8") as file:
+        roots.update(menu_roots(file.read(), args.define))
+    for keytab in keytabs:
+        logging.info(f"Reading {keytab}")
+        with open(keytab, encoding="utf-8") as file:
+            roots.update(key_roots(file))
+    for filename in other_files:
+        path = os.path.join(srcdir, filename)
+        with open(path, encoding="utf-8", errors="replace") as file:
+            roots.update(graph.mentioned_labels(file))
+
+    routines = graph.find_dead(roots)
+    logging.info(
+        f"  {len(graph.blocks)} blocks in {len(candidate_files)} files, "
+        f"{len(roots)} roots")
+    print_report(routines, candidate_files)
+
+# -----------------------------------------------------------------------------
+
+
+def menu_roots(text: str, defines: Iterable[str] = ()) -> List[str]:
+    """Return the handlers and the name selectors referenced by the menu
+    definition."""
+    result = compile_menu(text, {'defines': list(defines)})
+    return [ref['symbol'] for ref in result['references']]
+
+
+def key_roots(input: TextIO) -> List[str]:
+    """Return the handlers of the KeyTable of the key binding file."""
+    table = KeyParser(Lexer(input)).parse()
+    return [binding['handler'] for binding in table['bindings']]
+
+# -----------------------------------------------------------------------------
+
+
+# An identifier in the operands of an instruction, or in the text of a file.
+IDENTIFIER_PATTERN = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+# Instructions which never fall through to the next instruction, if they are
+# unconditional.
+TERMINATORS = {'ret', 'reti', 'retn', 'jp', 'jr'}
+
+
+class Block(TypedDict):
+    """A sequence of instructions starting at one or more labels."""
+    filename: str
+    labels: List[str]  # aliases at the same address, in the order of the file
+    line: int  # line number of the first label
+    size: int  # estimated bytes
+    unknown: int  # number of instructions of unknown size
+    refs: Set[str]  # labels referenced by the instructions
+    next: Optional[str]  # first label of the next block if it falls through
+
+
+class Routine(TypedDict):
+    """A chain of unreachable blocks which fall through into each other."""
+    filename: str
+    labels: List[str]
+    line: int
+    size: int
+    unknown: int
+    kind: str  # 'handler' or 'helper'
+
+
+def falls_through(instruction: Instruction) -> bool:
+    """Return True if the next instruction may be executed after this one.
+    A data directive ends a table, which is not executed."""
+    mnemonic = instruction['mnemonic']
+    if mnemonic.startswith('.'):
+        return False
+    if mnemonic not in TERMINATORS:
+        return True
+    if mnemonic in ('ret', 'reti', 'retn'):
+        return len(instruction['operands']) > 0  # 'ret z'
+    return len(instruction['operands']) > 1  # 'jp z, label'
+
+
+def block_starts(program: Program) -> Dict[int, List[str]]:
+    """Return the labels at the start of each block, as {instruction index ->
+    labels}, with the aliases in the order of the file."""
+    starts: Dict[int, List[str]] = {}
+    for label, index in program.labels.items():
+        starts.setdefault(index, []).append(label)
+    return starts
+
+
+class CallGraph:
+    """The blocks of the candidate files, and the labels they refer to."""
+
+    def __init__(self, defines: Optional[Set[str]] = None):
+        self.defines: Set[str] = set() if defines is None else defines
+        self.blocks: Dict[str, Block] = {}  # {first label -> Block}
+        self.owners: Dict[str, str] = {}  # {label -> first label of Block}
+        self.order: List[str] = []  # first labels, in the order of the files
+
+    def add_file(self, filename: str, input: TextIO) -> None:
+        program = Program(self.defines)
+        program.read(input)
+        self.add_program(filename, program)
+
+    def add_program(self, filename: str, program: Program) -> None:
+        instructions = program.instructions
+        starts = block_starts(program)
+        indexes = sorted(starts)
+
+        previous: Optional[Block] = None
+        previous_body: List[Instruction] = []
+        for i, start in enumerate(indexes):
+            end = indexes[i + 1] if i + 1 < len(indexes) \
+                else len(instructions)
+            labels = starts[start]
+            body = instructions[start:end]
+            block: Block = {
+                'filename': filename,
+                'labels': labels,
+                'line': program.label_lines[labels[0]],
+                'size': sum(ins['size'] for ins in body),
+                'unknown': sum(
+                    1 for ins in body
+                    if ins['size'] == 0 and not ins['mnemonic'].startswith(
+                        '.')),
+                'refs': set(),
+                'next': None,
+            }
+            for ins in body:
+                for operand in ins['operands']:
+                    block['refs'].update(IDENTIFIER_PATTERN.findall(operand))
+                if 'target' in ins:
+                    block['refs'].add(ins['target'])
+            if previous is not None and (
+                    not previous_body or falls_through(previous_body[-1])):
+                previous['next'] = labels[0]
+            previous = block
+            previous_body = body
+            self.blocks[labels[0]] = block
+            self.order.append(labels[0])
+            for label in labels:
+                self.owners[label] = labels[0]
+
+    def mentioned_labels(self, input: TextIO) -> Set[str]:
+        """Return the labels of the blocks mentioned by the code of another
+        file, ignoring comments. The '_Xxx' of a bcall() refers to 'Xxx'."""
+        mentioned: Set[str] = set()
+        for line in input:
+            code = line.split(';', 1)[0]
+            for name in IDENTIFIER_PATTERN.findall(code):
+                if name not in self.owners and name.startswith('_'):
+                    name = name[1:]
+                if name in self.owners:
+                    mentioned.add(name)
+        return mentioned
+
+    def reachable(self, roots: Iterable[str]) -> Set[str]:
+        """Return the first labels of the blocks reachable from the roots."""
+        visited: Set[str] = set()
+        stack = [self.owners[r] for r in roots if r in self.owners]
+        while stack:
+            key = stack.pop()
+            if key in visited:
+                continue
+            visited.add(key)
+            block = self.blocks[key]
+            for ref in block['refs']:
+                owner = self.owners.get(ref)
+                if owner is not None and owner not in visited:
+                    stack.append(owner)
+            if block['next'] is not None:
+                stack.append(block['next'])
+        return visited
+
+    def find_dead(self, roots: Iterable[str]) -> List[Routine]:
+        """Return the unreachable routines, in the order of the files."""
+        live = self.reachable(roots)
+        routines: List[Routine] = []
+        current: Optional[Routine] = None
+        previous: Optional[Block] = None
+        for key in self.order:
+            block = self.blocks[key]
+            if key in live:
+                current = None
+            elif current is not None and previous is not None \
+                    and previous['next'] == key:
+                current['labels'].extend(block['labels'])
+                current['size'] += block['size']
+                current['unknown'] += block['unknown']
+            else:
+                current = {
+                    'filename': block['filename'],
+                    'labels': list(block['labels']),
+                    'line': block['line'],
+                    'size': block['size'],
+                    'unknown': block['unknown'],
+                    'kind': 'helper',
+                }
+                routines.append(current)
+            previous = block
+        for routine in routines:
+            if any(label.endswith('Handler') for label in routine['labels']):
+                routine['kind'] = 'handler'
+        return routines
+
+# -----------------------------------------------------------------------------
+
+
+def print_report(
+    routines: List[Routine],
+    filenames: List[str],
+    output: TextIO = sys.stdout,
+) -> None:
+    """Print the unreachable routines and the bytes reclaimable, per file."""
+    total = 0
+    for filename in filenames:
+        dead = [r for r in routines if r['filename'] == filename]
+        if not dead:
+            continue
+        size = sum(r['size'] for r in dead)
+        total += size
+        print(f"{filename}: {size} bytes", file=output)
+        for routine in dead:
+            labels = routine['labels']
+            aliases = f" (+{len(labels) - 1} labels)" if len(labels) > 1 \
+                else ''
+            unknown = f", {routine['unknown']} unknown" \
+                if routine['unknown'] else ''
+            print(
+                f"  {filename}:{routine['line']}: {labels[0]}{aliases}: "
+                f"{routine['kind']}, {routine['size']} bytes{unknown}",
+                file=output)
+    print(
+        f"Total: {len(routines)} unreachable routines, {total} bytes",
+        file=output)
+
+
+if __name__ == '__main__':
+    main()
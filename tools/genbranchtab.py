@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 Brian T. Park
+# MIT License.
+
+"""
+Generate the bcall() branch table (branchtab.asm) on Flash Page 0 from the
+assembly source files, keeping only the entries which are actually called.
+
+Usage:
+$ genbranchtab.py [--output branchtab.asm] [--debug] rpn83p.asm
+
+The generator reads the '#include' statements of the main file (rpn83p.asm)
+to determine the flash page of each source file from the 'defpage(N)'
+macros, then scans every included file for:
+
+- the labels defined by each file, and
+- the 'bcall(_Xxx)' call sites (ignoring comments).
+
+A branch table entry is created for every 'bcall(_Xxx)' whose target label
+'Xxx' is defined by one of the included files (calls into the TI-OS are
+ignored). Files which are included conditionally (e.g. debug1.asm inside
+'#ifdef DEBUG') contain debugging routines which are called on an ad hoc
+basis, so all of their Capitalized labels are exported, inside the same
+'#ifdef' condition.
+
+The entries are ordered by flash page, then by the order of the '#include'
+statements, then by the order of the labels in each file, so the output is
+deterministic. The entries which were in the previous version of the branch
+table (the branchtab.asm next to the main file, even if '--output' writes the
+new table somewhere else) but are no longer called are listed, along with the
+number of bytes on Flash Page 0 reclaimed by dropping them. The report is
+skipped if there is no previous branch table.
+"""
+
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import TextIO
+from typing import TypedDict
+
+import argparse
+import logging
+import os
+import re
+import sys
+from pprint import pp
+
+
+def main() -> None:
+    # Configure command line flags.
+    parser = argparse.ArgumentParser(
+        description='Generate the bcall() branch table of the RPN83P'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        help='Assembly code output file',
+        required=False,
+    )
+    parser.add_argument(
+        '--debug',
+        help='Print the entries for debugging',
+        action='store_true',
+        default=False,
+    )
+    parser.add_argument(
+        'filename',
+        help='Main assembly file containing the #include statements',
+    )
+    args = parser.parse_args()
+
+    # Configure logging. This should normally be executed after the
+    # parser.parse_args() because it allows us set the logging.level using a
+    # flag.
+    logging.basicConfig(level=logging.INFO)
+
+    # Determine the output file name.
+    if args.output:
+        outputname = args.output
+    else:
+        outputname = os.path.join(
+            os.path.dirname(args.filename), BRANCH_TABLE_FILE)
+
+    logging.info(f"Reading {args.filename}")
+    srcdir = os.path.dirname(args.filename)
+    with open(args.filename, encoding="utf-8") as file:
+        include_scanner = IncludeScanner(file)
+        sources = include_scanner.scan()
+
+    source_scanner = SourceScanner(srcdir, BRANCH_TABLE_FILE)
+    for source in sources:
+        source_scanner.scan(source)
+
+    entries = source_scanner.find_entries(sources)
+    if args.debug:
+        pp(entries, stream=sys.stderr)
+
+    # Read the entries of the branch table included by the main file, to
+    # report the entries which were dropped.
+    previous: Optional[List[str]] = None
+    previousname = os.path.join(srcdir, BRANCH_TABLE_FILE)
+    if os.path.exists(previousname):
+        with open(previousname, encoding="utf-8") as file:
+            previous = read_previous_entries(file)
+
+    logging.info(f"Generating {outputname}")
+    with open(outputname, "w", encoding="utf-8") as file:
+        code_generator = CodeGenerator(args.filename, entries)
+        code_generator.generate(file)
+
+    if previous is not None:
+        print_report(previous, entries)
+
+# -----------------------------------------------------------------------------
+
+
+class Source(TypedDict, total=False):
+    """An included assembly file."""
+    filename: str
+    page: int  # flash page
+    condition: str  # '#ifdef' condition, or '' if unconditional
+    # derived fields
+    labels: List[str]  # labels in the order of definition
+
+
+class Entry(TypedDict):
+    """An entry in the branch table."""
+    name: str  # label of the routine, without the leading '_'
+    filename: str
+    page: int
+    condition: str
+
+
+# The branch table included by the main file, which is regenerated.
+BRANCH_TABLE_FILE = 'branchtab.asm'
+
+# A label definition at the start of a line, e.g. 'GetRpnKeyCode:'.
+LABEL_PATTERN = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*):')
+
+# A bcall() site, e.g. 'bcall(_GetRpnKeyCode)'.
+BCALL_PATTERN = re.compile(r'\bbcall\(\s*_([A-Za-z0-9_]+)\s*\)')
+
+# An entry in the previous branch table, e.g. '_GetRpnKeyCodeLabel:'.
+ENTRY_PATTERN = re.compile(r'^_([A-Za-z0-9_]+)Label:')
+
+# -----------------------------------------------------------------------------
+
+
+class IncludeScanner:
+    """Find the included files and their flash pages from the main file."""
+
+    INCLUDE_PATTERN = re.compile(r'^#include\s+"([^"]+)"')
+    DEFPAGE_PATTERN = re.compile(r'^defpage\(\s*(\d+)')
+    IFDEF_PATTERN = re.compile(r'^#ifn?def\s+(\S+)')
+
+    def __init__(self, input: TextIO):
+        self.input = input
+
+    def scan(self) -> List[Source]:
+        sources: List[Source] = []
+        page: Optional[int] = None
+        conditions: List[str] = []
+        for line in self.input:
+            line = line.strip()
+            match = self.DEFPAGE_PATTERN.match(line)
+            if match:
+                page = int(match.group(1))
+                continue
+            match = self.IFDEF_PATTERN.match(line)
+            if match:
+                conditions.append(line)
+                continue
+            if line.startswith('#if'):
+                conditions.append(line)
+                continue
+            if line.startswith('#endif'):
+                if conditions:
+                    conditions.pop()
+                continue
+            match = self.INCLUDE_PATTERN.match(line)
+            if match is None or page is None:
+                continue
+            source: Source = {
+                'filename': match.group(1),
+                'page': page,
+                'condition': conditions[-1] if conditions else '',
+            }
+            sources.append(source)
+        return sources
+
+# -----------------------------------------------------------------------------
+
+
+class SourceScanner:
+    """Collect the labels and the bcall() targets of the included files."""
+
+    def __init__(self, srcdir: str, outputname: str):
+        self.srcdir = srcdir
+        self.outputname = outputname
+        self.calls: Set[str] = set()
+
+    def scan(self, source: Source) -> None:
+        source['labels'] = []
+        # The branch table itself is regenerated, so its labels and calls
+        # must not be counted.
+        if source['filename'] == self.outputname:
+            return
+        path = os.path.join(self.srcdir, source['filename'])
+        with open(path, encoding="utf-8", errors="replace") as file:
+            for line in file:
+                match = LABEL_PATTERN.match(line)
+                if match:
+                    source['labels'].append(match.group(1))
+                code = line.split(';', 1)[0]
+                self.calls.update(BCALL_PATTERN.findall(code))
+
+    def find_entries(self, sources: List[Source]) -> List[Entry]:
+        """Return the entries of the branch table in the order of the flash
+        page, then the order of the sources. Throws ValueError if a bcall()
+        target is defined in more than one file."""
+        definitions: Dict[str, Source] = {}
+        for source in sources:
+            for label in source['labels']:
+                existing = definitions.get(label)
+                if existing is not None \
+                        and existing['filename'] != source['filename'] \
+                        and label in self.calls:
+                    raise ValueError(
+                        f"bcall() target '{label}' defined in both "
+                        f"'{existing['filename']}' and '{source['filename']}'"
+                    )
+                definitions[label] = source
+
+        entries: List[Entry] = []
+        ordered = sorted(
+            enumerate(sources), key=lambda x: (x[1]['page'], x[0]))
+        for _, source in ordered:
+            seen: Set[str] = set()
+            for label in source['labels']:
+                if label in seen:
+                    continue
+                seen.add(label)
+                if source['condition']:
+                    exported = label[0].isupper()
+                else:
+                    exported = label in self.calls
+                if not exported:
+                    continue
+                entries.append({
+                    'name': label,
+                    'filename': source['filename'],
+                    'page': source['page'],
+                    'condition': source['condition'],
+                })
+        return entries
+
+# -----------------------------------------------------------------------------
+
+
+def read_previous_entries(input: TextIO) -> List[str]:
+    entries: List[str] = []
+    for line in input:
+        match = ENTRY_PATTERN.match(line)
+        if match:
+            entries.append(match.group(1))
+    return entries
+
+
+def print_report(previous: List[str], entries: List[Entry]) -> None:
+    """Print the entries which were added or dropped, and the number of bytes
+    reclaimed on Flash Page 0 (3 bytes per entry)."""
+    current = set(entry['name'] for entry in entries)
+    dropped = [name for name in previous if name not in current]
+    added = [entry['name'] for entry in entries
+             if entry['name'] not in set(previous)]
+    for name in dropped:
+        logging.info(f"  Dropped _{name}: no bcall() site")
+    for name in added:
+        logging.info(f"  Added _{name}")
+    logging.info(
+        f"  Entries: {len(previous)} -> {len(entries)}; "
+        f"Flash Page 0 reclaimed: {3 * (len(previous) - len(entries))} bytes"
+    )
+
+# -----------------------------------------------------------------------------
+
+
+class CodeGenerator:
+    """Generate the Z80 assembly statements of the branch table, one section
+    per flash page, one group per source file."""
+
+    def __init__(self, inputfile: str, entries: List[Entry]):
+        self.inputfile = os.path.basename(inputfile)
+        self.entries = entries
+
+    def generate(self, output: TextIO) -> None:
+        self.output = output
+
+        print(f"""\
+;-----------------------------------------------------------------------------
+; Branch table entries are placed on Flash Page 0. They can be called from any
+; other flash page using the bcall() macro. The dependencies are maintained so
+; that Flash Page 0 contains the main event handler loop and the various
+; handlers. Those handlers depend on other flash pages, but code on other flash
+; pages does not depend on code on Flash Page 0.
+;
+; The bcall() labels are defined as offsets from start of flash page, $4000,
+; instead of the `(44+n)*3` expression recommended by the spasm-ng
+; documentation, so that the labels are automatically updated when entries are
+; added or removed. Warning: spasm-ng cannot handle forward references in `equ`
+; statements, so the bcall() label is defined *after* the XxxLabel label.
+;
+; Generated by genbranchtab.py from the files included by {self.inputfile}.
+; Only the routines which are called by a bcall() are included.
+;
+; DO NOT EDIT: This file was autogenerated.
+;-----------------------------------------------------------------------------
+
+branchTableBase equ $4000
+""", file=self.output, end='')
+
+        page: Optional[int] = None
+        filename = ''
+        condition = ''
+        for entry in self.entries:
+            if entry['page'] != page or entry['filename'] != filename:
+                if condition:
+                    print("#endif", file=self.output)
+                    condition = ''
+            if entry['page'] != page:
+                page = entry['page']
+                print(f"""
+;-----------------------------------------------------------------------------
+; Branch table entries for routines on Flash Page {page}.
+;-----------------------------------------------------------------------------
+""", file=self.output, end='')
+            if entry['filename'] != filename:
+                filename = entry['filename']
+                print(f"\n; {filename}", file=self.output)
+                condition = entry['condition']
+                if condition:
+                    print(condition, file=self.output)
+            self.generate_entry(entry)
+        if condition:
+            print("#endif", file=self.output)
+
+    def generate_entry(self, entry: Entry) -> None:
+        name = entry['name']
+        print(f"""\
+_{name}Label:
+_{name} equ _{name}Label-branchTableBase
+    .dw {name}
+    .db {entry['page']}
+""", file=self.output, end='')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 Brian T. Park
+# MIT License.
+
+"""
+Generate the calendar lookup tables and constants used by datevalidation2.asm,
+epoch2.asm and dayofweek2.asm, after verifying the date algorithms of those
+files against the Python 'datetime' module.
+
+Usage:
+$ gencalendar.py [--output calendar2.asm] [--years FIRST LAST]
+
+The following are generated:
+
+1) daysPer400Years: the number of days in the 400-year cycle of the Gregorian
+   calendar, split into the 8-bit and 16-bit parts required by setU40ToABC().
+2) internalEpochOffset: the number of days from 0000-03-01 to the internal
+   epoch date 2000-01-01.
+3) maxDaysForMonth: the maximum number of days of each month.
+4) daysBeforeMonthPrime: the cumulative number of days before each month of
+   the shifted year which starts on March 1. The leap day is the last day of
+   the shifted year, so a single table works for both leap and non-leap
+   years. It replaces the (153*monthPrime+2)/5 multiplication and division.
+5) dayOfWeekMonthOffsets: the day of week offset of each month, which allows
+   the day of week to be calculated with 16-bit arithmetic, without going
+   through the u40 epoch days.
+
+The verification models the Z80 algorithms using these tables, and compares
+them against 'datetime' for every day of every year in the given range, which
+by default is the full range [1, 9999] accepted by ValidateDate().
+"""
+
+from typing import List
+from typing import TextIO
+from typing import Tuple
+
+import argparse
+import datetime
+import logging
+
+# The internal epoch date of epoch2.asm.
+INTERNAL_EPOCH = datetime.date(2000, 1, 1)
+
+# Range of years accepted by ValidateDate().
+MIN_YEAR = 1
+MAX_YEAR = 9999
+
+MONTH_NAMES = [
+    'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+    'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec',
+]
+
+
+def main() -> None:
+    # Configure command line flags.
+    parser = argparse.ArgumentParser(
+        description='Generate the calendar lookup tables of the RPN83P'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        help='Assembly code output file',
+        required=False,
+    )
+    parser.add_argument(
+        '--years',
+        help='Range of years to verify',
+        type=int,
+        nargs=2,
+        metavar=('FIRST', 'LAST'),
+        default=[MIN_YEAR, MAX_YEAR],
+    )
+    args = parser.parse_args()
+
+    # Configure logging. This should normally be executed after the
+    # parser.parse_args() because it allows us set the logging.level using a
+    # flag.
+    logging.basicConfig(level=logging.INFO)
+
+    first, last = args.years
+    logging.info(f"Verifying the calendar algorithms for years {first}-{last}")
+    days = verify(first, last)
+    logging.info(f"  {days} days: OK")
+
+    # Determine the output file name.
+    if args.output:
+        outputname = args.output
+    else:
+        outputname = "calendar2.asm"
+    logging.info(f"Generating {outputname}")
+    with open(outputname, "w", encoding="utf-8") as file:
+        code_generator = CodeGenerator()
+        code_generator.generate(file)
+
+# -----------------------------------------------------------------------------
+
+
+def is_leap(year: int) -> bool:
+    return (year % 4 == 0 and year % 100 != 0) or year % 400 == 0
+
+
+def max_days_for_month() -> List[int]:
+    """Maximum number of days of each month, using a leap year."""
+    return [
+        (datetime.date(2000 + m // 12, m % 12 + 1, 1)
+            - datetime.date(2000, m, 1)).days
+        for m in range(1, 13)
+    ]
+
+
+def days_before_month(leap: bool) -> List[int]:
+    """Cumulative days before each month of a year starting on Jan 1,
+    including the total for the year at index 12."""
+    year = 2000 if leap else 2001
+    start = datetime.date(year, 1, 1)
+    return [
+        (datetime.date(year, m, 1) - start).days for m in range(1, 13)
+    ] + [366 if leap else 365]
+
+
+def days_before_month_prime() -> List[int]:
+    """Cumulative days before each monthPrime of the shifted year starting on
+    Mar 1. Derived from the non-leap table, which works for leap years too
+    because Feb is the last month of the shifted year."""
+    jan = days_before_month(leap=False)
+    march = jan[2]
+    return [
+        (jan[(mp + 2) % 12] - march) % 365 for mp in range(12)
+    ]
+
+
+def days_per_400_years() -> int:
+    return (datetime.date(2400, 1, 1) - datetime.date(2000, 1, 1)).days
+
+
+def day_of_week_month_offsets() -> List[int]:
+    """Offset of each month for the day of week formula of
+    day_of_week_model(). Solved using 2001, then verified for all years."""
+    offsets = []
+    for month in range(1, 13):
+        year_prime = 2001 - (1 if month <= 2 else 0)
+        dow = datetime.date(2001, month, 1).isoweekday() % 7  # Sun=0
+        offsets.append((dow - year_term(year_prime) - 1) % 7)
+    return offsets
+
+# -----------------------------------------------------------------------------
+
+
+def year_term(year_prime: int) -> int:
+    """The year part of the day of week sum, as calculated by the Z80 code
+    with 16-bit arithmetic: y/100 is calculated as (y/4)/25, and y/400 as
+    (y/100)/4."""
+    quarter = year_prime // 4
+    century = quarter // 25
+    return year_prime + quarter - century + century // 4
+
+
+def day_of_week_model(year: int, month: int, day: int) -> int:
+    """Model of dateToDayOfWeekNumber(). Return the ISO day of week
+    (Mon=1,Sun=7)."""
+    year_prime = year - (1 if month <= 2 else 0)
+    total = year_term(year_prime) + DAY_OF_WEEK_MONTH_OFFSETS[month - 1] + day
+    if total > 0xffff:
+        raise ValueError(f"{year}-{month}-{day}: overflow of u16")
+    dow = total % 7
+    return 7 if dow == 0 else dow
+
+
+def epoch_days_model(year: int, month: int, day: int) -> int:
+    """Model of dateToInternalEpochDays()."""
+    year_prime = year - (1 if month <= 2 else 0)
+    era, year_of_era = divmod(year_prime, 400)
+    month_prime = month - 3 if month >= 3 else month + 9
+    day_of_year_prime = DAYS_BEFORE_MONTH_PRIME[month_prime] + day - 1
+    day_of_era = (
+        365 * year_of_era + year_of_era // 4 - year_of_era // 100
+        + day_of_year_prime
+    )
+    return DAYS_PER_400_YEARS * era + day_of_era - INTERNAL_EPOCH_OFFSET
+
+
+def epoch_days_to_date_model(epoch_days: int) -> Tuple[int, int, int]:
+    """Model of internalEpochDaysToDate()."""
+    day_of_epoch_prime = epoch_days + INTERNAL_EPOCH_OFFSET
+    era, day_of_era = divmod(day_of_epoch_prime, DAYS_PER_400_YEARS)
+    year_of_era = (
+        day_of_era - day_of_era // (DAYS_PER_400_YEARS - 1)
+        + day_of_era // 36524 - day_of_era // 1460
+    ) // 365
+    year_prime = era * 400 + year_of_era
+    day_of_year_prime = (
+        day_of_era - 365 * year_of_era - year_of_era // 4
+        + year_of_era // 100
+    )
+    month_prime = (5 * day_of_year_prime + 2) // 153
+    day = day_of_year_prime - DAYS_BEFORE_MONTH_PRIME[month_prime] + 1
+    month = month_prime + 3 if month_prime < 10 else month_prime - 9
+    year = year_prime + (1 if month <= 2 else 0)
+    return year, month, day
+
+
+def verify(first_year: int, last_year: int) -> int:
+    """Verify the tables and the models against 'datetime' for every day from
+    the first_year to the last_year inclusive. Return the number of days
+    verified. Throws ValueError on failure."""
+    if MAX_DAYS_FOR_MONTH[1] != 29:
+        raise ValueError("maxDaysForMonth: Feb must have 29 days")
+    for leap in (False, True):
+        table = days_before_month(leap)
+        year = 2000 if leap else 2001
+        for m in range(1, 13):
+            days = (datetime.date(year + m // 12, m % 12 + 1, 1)
+                    - datetime.date(year, m, 1)).days
+            if table[m] - table[m - 1] != days:
+                raise ValueError(f"days_before_month({leap}): month {m}")
+
+    start = datetime.date(first_year, 1, 1).toordinal()
+    end = datetime.date(last_year, 12, 31).toordinal()
+    epoch = INTERNAL_EPOCH.toordinal()
+    for ordinal in range(start, end + 1):
+        date = datetime.date.fromordinal(ordinal)
+        y, m, d = date.year, date.month, date.day
+        if d > MAX_DAYS_FOR_MONTH[m - 1]:
+            raise ValueError(f"{date}: day > maxDaysForMonth")
+        if m == 2 and d == 29 and not is_leap(y):
+            raise ValueError(f"{date}: isLeapYear() failed")
+        expected = ordinal - epoch
+        epoch_days = epoch_days_model(y, m, d)
+        if epoch_days != expected:
+            raise ValueError(
+                f"{date}: epochDays: got {epoch_days}, expected {expected}")
+        if epoch_days_to_date_model(epoch_days) != (y, m, d):
+            raise ValueError(f"{date}: epochDays {epoch_days} to date failed")
+        dow = day_of_week_model(y, m, d)
+        if dow != date.isoweekday():
+            raise ValueError(
+                f"{date}: dayOfWeek: got {dow}, "
+                f"expected {date.isoweekday()}")
+    return end - start + 1
+
+
+DAYS_PER_400_YEARS = days_per_400_years()
+DAYS_BEFORE_MONTH_PRIME = days_before_month_prime()
+DAY_OF_WEEK_MONTH_OFFSETS = day_of_week_month_offsets()
+# Days from the start of the shifted year 0000-03-01 to the internal epoch.
+# The 'datetime' module does not support the year 0, so count from 0001-03-01
+# and add the 365 days of the shifted year 0000, whose Feb has 28 days.
+INTERNAL_EPOCH_OFFSET = (
+    INTERNAL_EPOCH.toordinal() - datetime.date(1, 3, 1).toordinal() + 365
+)
+MAX_DAYS_FOR_MONTH = max_days_for_month()
+
+# -----------------------------------------------------------------------------
+
+
+class CodeGenerator:
+    """Generate the Z80 assembly statements of the constants and tables."""
+
+    def generate(self, output: TextIO) -> None:
+        self.output = output
+
+        print("""\
+;-----------------------------------------------------------------------------
+; Calendar constants and lookup tables used by datevalidation2.asm,
+; epoch2.asm and dayofweek2.asm, generated by gencalendar.py.
+;
+; DO NOT EDIT: This file was autogenerated.
+;-----------------------------------------------------------------------------
+
+""", file=self.output, end='')
+        self.generate_constant(
+            'daysPer400Years', DAYS_PER_400_YEARS,
+            'Number of days in the 400-year cycle of the Gregorian calendar.')
+        self.generate_constant(
+            'internalEpochOffset', INTERNAL_EPOCH_OFFSET,
+            'Number of days from 0000-03-01 to the internal epoch '
+            + f'{INTERNAL_EPOCH.isoformat()}.')
+
+        print("""\
+; Maximum number of days of each month, indexed by month-1.
+maxDaysForMonth:
+""", file=self.output, end='')
+        for i, days in enumerate(MAX_DAYS_FOR_MONTH):
+            print(f"    .db {days} ; {MONTH_NAMES[i]}", file=self.output)
+
+        print("""
+; Number of days before each month of the shifted year which starts on Mar 1,
+; indexed by monthPrime=[0,11]. The leap day is the last day of the shifted
+; year, so this table is valid for both leap and non-leap years.
+daysBeforeMonthPrime:
+""", file=self.output, end='')
+        for mp, days in enumerate(DAYS_BEFORE_MONTH_PRIME):
+            print(
+                f"    .dw {days} ; {MONTH_NAMES[(mp + 2) % 12]}",
+                file=self.output)
+
+        print("""
+; Day of week offset of each month, indexed by month-1. The day of week
+; (Sun=0,Sat=6) is (y + y/4 - y/100 + y/400 + offset + day) % 7, where y is
+; the year, minus 1 for Jan and Feb.
+dayOfWeekMonthOffsets:
+""", file=self.output, end='')
+        for i, offset in enumerate(DAY_OF_WEEK_MONTH_OFFSETS):
+            print(f"    .db {offset} ; {MONTH_NAMES[i]}", file=self.output)
+
+    def generate_constant(self, name: str, value: int, comment: str) -> None:
+        """Generate the upper 8 bits and lower 16 bits of a 24-bit constant,
+        to be loaded into A and BC for setU40ToABC()."""
+        high, low = divmod(value, 65536)
+        print(f"""\
+; {comment}
+; {value} = {high}*65536 + {low}
+{name}High equ {high}
+{name}Low equ {low}
+
+""", file=self.output, end='')
+
+
+if __name__ == '__main__':
+    main()
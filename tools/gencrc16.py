@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 Brian T. Park
+# MIT License.
+
+"""
+Generate the lookup tables used by the table-driven variants of the
+CRC16-CCITT routine in crc1.asm, verify the Python models of all variants
+against the standard check value, and print a cycle-count estimate of each
+Z80 variant.
+
+Usage:
+$ gencrc16.py [--length N] [--output crc16table.asm]
+
+The CRC parameters are the same as the 'crc-16-ccitt' model of pycrc:
+
+Width   16
+Poly    0x1021
+Reflect In  False
+XOR In  0x1d0f
+Reflect Out False
+XOR Out 0x0000
+Check   0xe5cc
+
+There are 3 variants, selected by passing the appropriate `-D` flag to `spasm`:
+
+- (default) bit-by-bit, no table
+- USE_CRC16_TABLE16: processes a nibble at a time using a 16-entry table of
+  u16 (32 bytes)
+- USE_CRC16_TABLE256: processes a byte at a time using a 256-entry table of
+  u16 (512 bytes), split into a 256-byte table of high bytes followed by a
+  256-byte table of low bytes
+"""
+
+from typing import List
+from typing import TextIO
+from typing import Tuple
+
+import argparse
+import logging
+import sys
+
+CRC_POLY = 0x1021
+CRC_INIT = 0x1d0f
+CRC_CHECK_INPUT = b"123456789"
+CRC_CHECK = 0xe5cc
+
+
+def main() -> None:
+    # Configure command line flags.
+    parser = argparse.ArgumentParser(
+        description='Generate the CRC16-CCITT tables of the RPN83P'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        help='Assembly code output file',
+        required=False,
+    )
+    parser.add_argument(
+        '--length',
+        help='Length of the data used for the cycle-count estimate',
+        type=int,
+        default=256,
+    )
+    args = parser.parse_args()
+
+    # Configure logging. This should normally be executed after the
+    # parser.parse_args() because it allows us set the logging.level using a
+    # flag.
+    logging.basicConfig(level=logging.INFO)
+
+    table256 = generate_table256()
+    table16 = generate_table16()
+
+    logging.info("Verifying the CRC16-CCITT models")
+    verify(table256, table16)
+
+    # Determine the output file name.
+    if args.output:
+        outputname = args.output
+    else:
+        outputname = "crc16table.asm"
+    logging.info(f"Generating {outputname}")
+    with open(outputname, "w", encoding="utf-8") as file:
+        code_generator = CodeGenerator(table256, table16)
+        code_generator.generate(file)
+
+    print_cycle_estimates(args.length)
+
+# -----------------------------------------------------------------------------
+
+
+def crc16_bitwise(data: bytes, crc: int = CRC_INIT) -> int:
+    """The bit-by-bit reference model, same as the C code in crc1.asm."""
+    for c in data:
+        i = 0x80
+        while i > 0:
+            bit = (crc & 0x8000) ^ (0x8000 if (c & i) else 0)
+            crc = (crc << 1) & 0xffff
+            if bit:
+                crc ^= CRC_POLY
+            i >>= 1
+    return crc
+
+
+def generate_table256() -> List[int]:
+    """Return table[i] = CRC of the byte 'i' with a zero initial value."""
+    return [crc16_bitwise(bytes([i]), 0) for i in range(256)]
+
+
+def generate_table16() -> List[int]:
+    """Return table[i] = CRC of the nibble 'i' with a zero initial value."""
+    table: List[int] = []
+    for i in range(16):
+        crc = i << 12
+        for _ in range(4):
+            crc = ((crc << 1) ^ CRC_POLY) if crc & 0x8000 else (crc << 1)
+            crc &= 0xffff
+        table.append(crc)
+    return table
+
+
+def crc16_table256(
+    table: List[int], data: bytes, crc: int = CRC_INIT
+) -> int:
+    """Model of the USE_CRC16_TABLE256 variant."""
+    for c in data:
+        index = (crc >> 8) ^ c
+        crc = ((crc << 8) & 0xffff) ^ table[index]
+    return crc
+
+
+def crc16_table16(
+    table: List[int], data: bytes, crc: int = CRC_INIT
+) -> int:
+    """Model of the USE_CRC16_TABLE16 variant."""
+    for c in data:
+        index = (crc >> 12) ^ (c >> 4)
+        crc = ((crc << 4) & 0xffff) ^ table[index]
+        index = (crc >> 12) ^ (c & 0x0f)
+        crc = ((crc << 4) & 0xffff) ^ table[index]
+    return crc
+
+
+def verify(table256: List[int], table16: List[int]) -> None:
+    """Verify all variants against the check value, and against each other
+    for every single-byte input. Throws ValueError on failure."""
+    results = [
+        ('bitwise', crc16_bitwise(CRC_CHECK_INPUT)),
+        ('table256', crc16_table256(table256, CRC_CHECK_INPUT)),
+        ('table16', crc16_table16(table16, CRC_CHECK_INPUT)),
+    ]
+    for name, crc in results:
+        if crc != CRC_CHECK:
+            raise ValueError(
+                f"CRC16 '{name}' check failed: "
+                f"got 0x{crc:04x}, expected 0x{CRC_CHECK:04x}"
+            )
+        logging.info(f"  {name}: 0x{crc:04x} OK")
+
+    for i in range(256):
+        data = bytes([i, 255 - i])
+        expected = crc16_bitwise(data)
+        if crc16_table256(table256, data) != expected \
+                or crc16_table16(table16, data) != expected:
+            raise ValueError(f"CRC16 mismatch for input {data!r}")
+
+# -----------------------------------------------------------------------------
+
+
+class CodeGenerator:
+    """Generate the Z80 assembly statements of both tables, each guarded by
+    the flag which selects it."""
+
+    def __init__(self, table256: List[int], table16: List[int]):
+        self.table256 = table256
+        self.table16 = table16
+
+    def generate(self, output: TextIO) -> None:
+        self.output = output
+
+        print("""\
+;-----------------------------------------------------------------------------
+; Lookup tables of the CRC16-CCITT routine in crc1.asm, generated by
+; gencrc16.py. Each table is included only if the corresponding variant is
+; selected.
+;
+; DO NOT EDIT: This file was autogenerated.
+;-----------------------------------------------------------------------------
+
+""", file=self.output, end='')
+
+        logging.info("  Generating table256")
+        self.generate_table256()
+        logging.info("  Generating table16")
+        self.generate_table16()
+
+    def generate_table256(self) -> None:
+        print("""\
+#ifdef USE_CRC16_TABLE256
+; High bytes of the 256 entries, followed immediately by the low bytes, so that
+; 'inc h' moves from crc16TableHigh[i] to crc16TableLow[i]. Size: 512 bytes.
+crc16TableHigh:
+""", file=self.output, end='')
+        self.print_bytes([x >> 8 for x in self.table256])
+        print("crc16TableLow:", file=self.output)
+        self.print_bytes([x & 0xff for x in self.table256])
+        print("#endif\n", file=self.output)
+
+    def generate_table16(self) -> None:
+        print("""\
+#ifdef USE_CRC16_TABLE16
+; 16 entries of u16, one for each nibble. Size: 32 bytes.
+crc16NibbleTable:
+""", file=self.output, end='')
+        for i in range(0, 16, 8):
+            words = ", ".join(f"${x:04X}" for x in self.table16[i:i + 8])
+            print(f"    .dw {words}", file=self.output)
+        print("#endif", file=self.output)
+
+    def print_bytes(self, values: List[int]) -> None:
+        for i in range(0, len(values), 16):
+            line = ", ".join(f"${x:02X}" for x in values[i:i + 16])
+            print(f"    .db {line}", file=self.output)
+
+# -----------------------------------------------------------------------------
+
+
+# Estimated T-states of the instructions executed per data byte by each Z80
+# variant in crc1.asm, as (instruction, T-states, executions per byte). The
+# conditional jumps in the bitwise variant are taken half the time on average.
+Cycles = List[Tuple[str, float, float]]
+
+CYCLES_BITWISE: Cycles = [
+    ('ld a, (de)', 7, 1),
+    ('inc de', 6, 1),
+    ('push bc', 11, 1),
+    ('ld b, 8', 7, 1),
+    ('xor h', 4, 1),
+    ('ld h, a', 4, 1),
+    ('add hl, hl', 11, 8),
+    ('jr nc (taken)', 12, 4),
+    ('jr nc (not taken)', 7, 4),
+    ('xor $1021 (6 instructions)', 30, 4),
+    ('djnz (taken)', 13, 7),
+    ('djnz (not taken)', 8, 1),
+    ('pop bc', 10, 1),
+    ('dec bc', 6, 1),
+    ('ld a, b', 4, 1),
+    ('or c', 4, 1),
+    ('jr nz', 12, 1),
+]
+
+CYCLES_TABLE16: Cycles = [
+    ('ld a, (de)', 7, 1),
+    ('inc de', 6, 1),
+    ('push bc', 11, 1),
+    ('push de', 11, 1),
+    ('ld c, a', 4, 1),
+    ('xor h', 4, 1),
+    ('ld a, h', 4, 1),
+    ('rrca', 4, 8),
+    ('xor c', 4, 1),
+    ('and $0F', 7, 2),
+    ('add hl, hl', 11, 8),
+    ('ex de, hl', 4, 2),
+    ('index into crc16NibbleTable (6 instructions)', 30, 2),
+    ('ld a, (hl)', 7, 4),
+    ('xor e', 4, 2),
+    ('ld e, a', 4, 2),
+    ('inc hl', 6, 2),
+    ('xor d', 4, 2),
+    ('ld h, a', 4, 2),
+    ('ld l, e', 4, 2),
+    ('pop de', 10, 1),
+    ('pop bc', 10, 1),
+    ('dec bc', 6, 1),
+    ('ld a, b', 4, 1),
+    ('or c', 4, 1),
+    ('jr nz', 12, 1),
+]
+
+CYCLES_TABLE256: Cycles = [
+    ('ld a, (de)', 7, 1),
+    ('inc de', 6, 1),
+    ('push de', 11, 1),
+    ('xor h', 4, 1),
+    ('ld e, a', 4, 1),
+    ('ld d, 0', 7, 1),
+    ('ld a, l', 4, 1),
+    ('ld hl, crc16TableHigh', 10, 1),
+    ('add hl, de', 11, 1),
+    ('xor (hl)', 7, 1),
+    ('inc h', 4, 1),
+    ('ld l, (hl)', 7, 1),
+    ('ld h, a', 4, 1),
+    ('pop de', 10, 1),
+    ('dec bc', 6, 1),
+    ('ld a, b', 4, 1),
+    ('or c', 4, 1),
+    ('jr nz', 12, 1),
+]
+
+# Size of the lookup table of each variant.
+VARIANTS: List[Tuple[str, Cycles, int]] = [
+    ('bitwise (default)', CYCLES_BITWISE, 0),
+    ('USE_CRC16_TABLE16', CYCLES_TABLE16, 32),
+    ('USE_CRC16_TABLE256', CYCLES_TABLE256, 512),
+]
+
+# CPU clock of the TI-83 Plus SE and TI-84 Plus in fast mode.
+CPU_HZ = 15_000_000
+
+
+def cycles_per_byte(cycles: Cycles) -> float:
+    return sum(tstates * count for _, tstates, count in cycles)
+
+
+def print_cycle_estimates(length: int, output: TextIO = sys.stdout) -> None:
+    print(
+        f"Estimated cost of CRC16-CCITT over {length} bytes at 15 MHz:",
+        file=output)
+    baseline = cycles_per_byte(CYCLES_BITWISE)
+    for name, cycles, table_size in VARIANTS:
+        per_byte = cycles_per_byte(cycles)
+        total = per_byte * length
+        print(
+            f"  {name:20s}: {per_byte:6.1f} T-states/byte, "
+            f"{total / CPU_HZ * 1000:6.2f} ms, "
+            f"speedup {baseline / per_byte:4.2f}x, "
+            f"table {table_size} bytes",
+            file=output)
+
+# -----------------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main()
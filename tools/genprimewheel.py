@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 Brian T. Park
+# MIT License.
+
+"""
+Generate the wheel factorization tables used by the USE_PRIME_FACTOR_WHEEL
+variant of PrimeFactor() in prime2.asm, and print a model of the number of
+candidate divisions for each wheel size.
+
+Usage:
+$ genprimewheel.py [--wheel {6,30,210,2310}] [--output primewheel2.asm]
+    [--verify N]
+
+A wheel of size M=p1*p2*...*pk is generated by the first k primes. The trial
+divisors are the small primes themselves (the 'prefix' table), then only the
+numbers which are coprime to M, starting from the next prime after pk. The
+gaps between consecutive coprime numbers repeat every M, so they are stored
+in a table of 8-bit increments (terminated by a 0) which is cycled through by
+the Z80 loop. The existing 6k+/-1 loop of primeFactorMod() is the wheel of
+size 6.
+
+The model simulates the Z80 loop, including the 16-bit wrap around of the
+candidate, and the check for the terminating condition once per turn of the
+wheel. It is verified against a reference implementation for all inputs up to
+N, and the number of divisions and the estimated run time are printed for
+the slowest inputs.
+"""
+
+from typing import List
+from typing import TextIO
+from typing import Tuple
+
+import argparse
+import functools
+import logging
+import math
+import sys
+
+# Wheel sizes which can be selected, generated by the first k primes.
+WHEEL_PRIMES = {
+    6: [2, 3],
+    30: [2, 3, 5],
+    210: [2, 3, 5, 7],
+    2310: [2, 3, 5, 7, 11],
+}
+
+# Inputs used for the report. 65521 is the largest prime less than 2^16, so
+# 65521^2 is the slowest input below 2^32.
+REPORT_INPUTS = [19997 * 19997, 65521 * 65521, 4294967291]
+
+# Estimated T-states of one iteration of the loop, which is dominated by the
+# modDEIXByBC() division. Derived from the benchmark in prime2.asm: 3.8
+# seconds at 15 MHz for the 21840 candidates of 65521^2 using the 6k+/-1
+# loop.
+CYCLES_PER_DIVISION = 2610
+# Additional T-states per candidate of the table-driven wheel loop, compared
+# to the unrolled 6k+/-1 loop, for saving and loading the table pointer and
+# adding the 8-bit increment.
+CYCLES_WHEEL_OVERHEAD = 60
+CPU_HZ = 15_000_000
+
+
+def main() -> None:
+    # Configure command line flags.
+    parser = argparse.ArgumentParser(
+        description='Generate the prime factor wheel tables of the RPN83P'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        help='Assembly code output file',
+        required=False,
+    )
+    parser.add_argument(
+        '--wheel',
+        help='Size of the wheel',
+        type=int,
+        choices=sorted(WHEEL_PRIMES.keys()),
+        default=210,
+    )
+    parser.add_argument(
+        '--verify',
+        help='Verify the model against the reference for inputs up to N',
+        type=int,
+        default=20000,
+    )
+    args = parser.parse_args()
+
+    # Configure logging. This should normally be executed after the
+    # parser.parse_args() because it allows us set the logging.level using a
+    # flag.
+    logging.basicConfig(level=logging.INFO)
+
+    logging.info(f"Verifying the wheel models for inputs up to {args.verify}")
+    for size in sorted(WHEEL_PRIMES.keys()):
+        verify(WHEEL_PRIMES[size], args.verify)
+
+    primes = WHEEL_PRIMES[args.wheel]
+    first, increments = wheel_increments(primes)
+
+    # Determine the output file name.
+    if args.output:
+        outputname = args.output
+    else:
+        outputname = "primewheel2.asm"
+    logging.info(f"Generating {outputname}")
+    with open(outputname, "w", encoding="utf-8") as file:
+        code_generator = CodeGenerator(args.wheel, primes, first, increments)
+        code_generator.generate(file)
+
+    print_report()
+
+# -----------------------------------------------------------------------------
+
+
+def wheel_increments(primes: List[int]) -> Tuple[int, List[int]]:
+    """Return the first candidate after the primes, and the increments to the
+    following candidates for one turn of the wheel."""
+    first, increments = _wheel_increments(tuple(primes))
+    return first, list(increments)
+
+
+@functools.lru_cache
+def _wheel_increments(primes: Tuple[int, ...]) -> Tuple[int, Tuple[int, ...]]:
+    size = math.prod(primes)
+    first = primes[-1] + 1
+    while any(first % p == 0 for p in primes):
+        first += 1
+    candidates = [
+        n for n in range(first, first + size + 1)
+        if all(n % p != 0 for p in primes)
+    ]
+    increments = tuple(b - a for a, b in zip(candidates, candidates[1:]))
+    return first, increments
+
+
+def smallest_prime_factor(x: int) -> int:
+    """Reference implementation. Return 1 if x is prime."""
+    d = 2
+    while d * d <= x:
+        if x % d == 0:
+            return d
+        d += 1
+    return 1
+
+
+def prime_factor_wheel(x: int, primes: List[int]) -> Tuple[int, int]:
+    """Model of the Z80 loop of the wheel variant. Return the (result, number
+    of divisions)."""
+    limit = math.isqrt(x)
+    divisions = 0
+    for p in primes:
+        if x == p:
+            return 1, divisions
+        divisions += 1
+        if x % p == 0:
+            return p, divisions
+    candidate, increments = _wheel_increments(tuple(primes))
+    while True:
+        for increment in increments:
+            divisions += 1
+            if x % candidate == 0:
+                # The candidate wraps around to 1 after 65535, which divides
+                # every input, and means that no factor was found.
+                if candidate == x or candidate == 1:
+                    return 1, divisions
+                return candidate, divisions
+            candidate = (candidate + increment) & 0xffff
+        # Terminating condition, once per turn.
+        if candidate > limit:
+            return 1, divisions
+
+
+def verify(primes: List[int], n: int) -> None:
+    """Verify the model against the reference implementation, for all inputs
+    up to n and the inputs of the report. Throws ValueError on failure."""
+    for x in list(range(2, n + 1)) + REPORT_INPUTS:
+        expected = smallest_prime_factor(x) if x <= n else None
+        result, _ = prime_factor_wheel(x, primes)
+        if expected is not None and result != expected:
+            raise ValueError(
+                f"Wheel {math.prod(primes)}: input {x}: "
+                f"got {result}, expected {expected}"
+            )
+    # The inputs of the report are known.
+    if prime_factor_wheel(65521 * 65521, primes)[0] != 65521 \
+            or prime_factor_wheel(4294967291, primes)[0] != 1:
+        raise ValueError(f"Wheel {math.prod(primes)}: large input failed")
+    logging.info(f"  wheel {math.prod(primes)}: OK")
+
+# -----------------------------------------------------------------------------
+
+
+def table_size(primes: List[int]) -> int:
+    """Bytes used by the prefix table and increment table, including their
+    terminators. The 6k+/-1 loop is unrolled, and needs no table."""
+    if len(primes) <= 2:
+        return 0
+    _, increments = wheel_increments(primes)
+    return len(primes) + 1 + len(increments) + 1
+
+
+def print_report(output: TextIO = sys.stdout) -> None:
+    baseline = WHEEL_PRIMES[6]
+    for x in REPORT_INPUTS:
+        print(f"Input {x}:", file=output)
+        _, baseline_divisions = prime_factor_wheel(x, baseline)
+        for size, primes in sorted(WHEEL_PRIMES.items()):
+            _, divisions = prime_factor_wheel(x, primes)
+            cycles = divisions * CYCLES_PER_DIVISION
+            if size != 6:
+                cycles += divisions * CYCLES_WHEEL_OVERHEAD
+            print(
+                f"  wheel {size:4d}: {divisions:6d} divisions, "
+                f"{baseline_divisions / divisions:4.2f}x fewer, "
+                f"est {cycles / CPU_HZ:5.2f} s, "
+                f"table {table_size(primes):3d} bytes",
+                file=output)
+
+# -----------------------------------------------------------------------------
+
+
+class CodeGenerator:
+    """Generate the Z80 assembly statements of the prefix and increment tables,
+    guarded by USE_PRIME_FACTOR_WHEEL."""
+
+    def __init__(
+        self,
+        size: int,
+        primes: List[int],
+        first: int,
+        increments: List[int],
+    ):
+        self.size = size
+        self.primes = primes
+        self.first = first
+        self.increments = increments
+
+    def generate(self, output: TextIO) -> None:
+        self.output = output
+        primes = ", ".join(str(p) for p in self.primes)
+
+        print(f"""\
+;-----------------------------------------------------------------------------
+; Wheel factorization tables of the USE_PRIME_FACTOR_WHEEL variant of
+; PrimeFactor() in prime2.asm, generated by genprimewheel.py.
+;
+; DO NOT EDIT: This file was autogenerated.
+;-----------------------------------------------------------------------------
+
+#ifdef USE_PRIME_FACTOR_WHEEL
+
+primeWheelSize equ {self.size}
+
+; The primes which generate the wheel, checked before the wheel, terminated by
+; a 0.
+primeWheelPrimes:
+    .db {primes}, 0
+
+; First candidate after the primes of the wheel.
+primeWheelFirst equ {self.first}
+
+; Increments to the next candidate which is coprime to primeWheelSize, for one
+; turn of the wheel starting at primeWheelFirst, terminated by a 0.
+primeWheelIncrements:
+""", file=self.output, end='')
+        for i in range(0, len(self.increments), 16):
+            line = ", ".join(str(x) for x in self.increments[i:i + 16])
+            print(f"    .db {line}", file=self.output)
+        print("""\
+    .db 0
+
+#endif""", file=self.output)
+
+
+if __name__ == '__main__':
+    main()
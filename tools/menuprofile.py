@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 Brian T. Park
+# MIT License.
+
+"""
+Decode the menu usage counters saved by the USE_MENU_PROFILE variant of the
+RPN83P into a report ranked by the number of times each menu node was
+dispatched.
+
+Usage:
+$ menuprofile.py [--layout {padded,rowmask}] [-D SYMBOL ...] [--top N]
+    [--ignore-crc] menudef.txt RPN83PRF.8xv
+
+The counters are stored in the RPN83PRF AppVar by profile1.asm, indexed by
+menuId. The menu definition file is compiled in memory using compile_menu(),
+with the same '--layout' and '-D' flags as the ones used to build the app, to
+map each menuId back to the label and name of its menu node. The signature
+stored in the AppVar must match the signature of the compiled menu hierarchy.
+
+The input file can be the AppVar transferred to the host (a .8xv file), or the
+raw data of the AppVar, without its 2-byte size field.
+"""
+
+from typing import Dict
+from typing import List
+from typing import TextIO
+from typing import Tuple
+from typing import TypedDict
+
+import argparse
+import logging
+import struct
+import sys
+
+from compilemenu import CompileResult
+from compilemenu import MENU_LAYOUTS
+from compilemenu import MENU_TYPE_GROUP
+from compilemenu import MenuNode
+from compilemenu import compile_menu
+from gencrc16 import crc16_bitwise
+
+# Must match rpn83pAppId and rpnVarTypeMenuProfile of rpn83p.asm.
+RPN83P_APP_ID = 0x1E69
+RPN_VAR_TYPE_MENU_PROFILE = 3
+APPVAR_NAME = 'RPN83PRF'
+
+# The file format of the variables transferred from the calculator.
+TI8X_SIGNATURE = b'**TI83F*'
+TI8X_HEADER_SIZE = 55
+TI8X_TYPE_APPVAR = 0x15
+
+
+def main() -> None:
+    # Configure command line flags.
+    parser = argparse.ArgumentParser(
+        description='Decode the menu usage counters of the RPN83P'
+    )
+    parser.add_argument(
+        '--layout',
+        help='Layout of the menu nodes used to build the app',
+        choices=MENU_LAYOUTS,
+        default='padded',
+    )
+    parser.add_argument(
+        '--define', '-D',
+        help='Define the symbol used by the If blocks',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        '--top',
+        help='Print only the N most frequently used menu nodes',
+        type=int,
+        default=0,
+    )
+    parser.add_argument(
+        '--ignore-crc',
+        help='Decode the counters even if the CRC16 is invalid',
+        action='store_true',
+        default=False,
+    )
+    parser.add_argument(
+        'menudef',
+        help='Menu definition file',
+    )
+    parser.add_argument(
+        'filename',
+        help='AppVar file (.8xv) or raw AppVar data',
+    )
+    args = parser.parse_args()
+
+    # Configure logging. This should normally be executed after the
+    # parser.parse_args() because it allows us set the logging.level using a
+    # flag.
+    logging.basicConfig(level=logging.INFO)
+
+    logging.info(f"Reading {args.menudef}")
+    with open(args.menudef) as file:
+        result = compile_menu(file.read(), {
+            'filename': args.menudef,
+            'layout': args.layout,
+            'defines': args.define,
+        })
+
+    logging.info(f"Reading {args.filename}")
+    with open(args.filename, 'rb') as file:
+        data = file.read()
+    if data.startswith(TI8X_SIGNATURE):
+        name, data = read_8xv(data)
+        if name != APPVAR_NAME:
+            logging.warning(f"  Unexpected AppVar name '{name}'")
+
+    profile = decode_profile(data)
+    if not profile['crc_valid']:
+        message = "Invalid CRC16, the app may not have exited normally"
+        if not args.ignore_crc:
+            raise ValueError(message)
+        logging.warning(f"  {message}")
+    check_signature(profile, result)
+    print_report(rank(profile, result), args.top)
+
+# -----------------------------------------------------------------------------
+
+
+class MenuProfile(TypedDict):
+    """The content of the RPN83PRF AppVar. See profile1.asm."""
+    crc16: int
+    app_id: int
+    var_type: int
+    signature: int  # the schemaVersion field of the RpnVarHeader
+    counters: List[int]  # indexed by menuId
+    crc_valid: bool  # crc16 matches the content
+
+
+# struct RpnVarHeader, followed by the count of the counters
+HEADER_FORMAT = '<HHHHH'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+
+def read_8xv(data: bytes) -> Tuple[str, bytes]:
+    """Extract the name and the data of the first AppVar of a .8xv file,
+    without its 2-byte size field. Throws ValueError if the file is invalid."""
+    if len(data) < TI8X_HEADER_SIZE + 2:
+        raise ValueError("Truncated .8xv file")
+    (section_size,) = struct.unpack_from('<H', data, TI8X_HEADER_SIZE - 2)
+    section = data[TI8X_HEADER_SIZE:TI8X_HEADER_SIZE + section_size]
+    if len(section) != section_size:
+        raise ValueError("Truncated .8xv data section")
+    (checksum,) = struct.unpack_from(
+        '<H', data, TI8X_HEADER_SIZE + section_size)
+    if sum(section) & 0xffff != checksum:
+        raise ValueError("Invalid .8xv checksum")
+
+    header_size, var_size, var_type = struct.unpack_from('<HHB', section, 0)
+    if var_type != TI8X_TYPE_APPVAR:
+        raise ValueError(f"Not an AppVar: type ${var_type:02X}")
+    name = section[5:13].rstrip(b'\x00').decode('ascii', errors='replace')
+    var_data = section[header_size + 4:header_size + 4 + var_size]
+    (size,) = struct.unpack_from('<H', var_data, 0)
+    if size + 2 != len(var_data):
+        raise ValueError("Inconsistent AppVar size")
+    return name, var_data[2:]
+
+
+def decode_profile(data: bytes) -> MenuProfile:
+    """Decode the data of the RPN83PRF AppVar. Throws ValueError if it is not
+    a menu profile of the RPN83P."""
+    if len(data) < HEADER_SIZE:
+        raise ValueError("Truncated menu profile")
+    crc16, app_id, var_type, signature, count = struct.unpack_from(
+        HEADER_FORMAT, data, 0)
+    if app_id != RPN83P_APP_ID:
+        raise ValueError(f"Invalid appId ${app_id:04X}")
+    if var_type != RPN_VAR_TYPE_MENU_PROFILE:
+        raise ValueError(f"Invalid varType {var_type}")
+    if len(data) != HEADER_SIZE + 2 * count:
+        raise ValueError(
+            f"Invalid size {len(data)} for {count} counters")
+    counters = list(struct.unpack_from(f'<{count}H', data, HEADER_SIZE))
+    return {
+        'crc16': crc16,
+        'app_id': app_id,
+        'var_type': var_type,
+        'signature': signature,
+        'counters': counters,
+        'crc_valid': crc16_bitwise(data[2:]) == crc16,
+    }
+
+
+def encode_profile(signature: int, counters: List[int]) -> bytes:
+    """Encode the data of the RPN83PRF AppVar, as written by profile1.asm.
+    The inverse of decode_profile()."""
+    content = struct.pack(
+        f'<HHHH{len(counters)}H', RPN83P_APP_ID, RPN_VAR_TYPE_MENU_PROFILE,
+        signature, len(counters), *counters)
+    return struct.pack('<H', crc16_bitwise(content)) + content
+
+
+def check_signature(profile: MenuProfile, result: CompileResult) -> None:
+    """Throws ValueError if the profile was not saved by an app built from the
+    compiled menu hierarchy."""
+    expected = result['stats']['profile_signature']
+    if profile['signature'] != expected:
+        raise ValueError(
+            f"Signature ${profile['signature']:04X} does not match the menu "
+            f"definition (${expected:04X}), check the '--layout'")
+    if len(profile['counters']) != len(result['labels']):
+        raise ValueError(
+            f"{len(profile['counters'])} counters, expected "
+            f"{len(result['labels'])}")
+
+# -----------------------------------------------------------------------------
+
+
+class RankedNode(TypedDict):
+    count: int
+    id: int
+    label: str
+    name: str
+    group: bool  # MenuGroup, otherwise MenuItem
+
+
+def collect_nodes(node: MenuNode, nodes: Dict[str, MenuNode]) -> None:
+    nodes[node['label']] = node
+    for row in node.get('rows', []):
+        for slot in row:
+            collect_nodes(slot, nodes)
+
+
+def rank(profile: MenuProfile, result: CompileResult) -> List[RankedNode]:
+    """Return the menu nodes sorted by decreasing count, then by id. The mNull
+    node is not included."""
+    nodes: Dict[str, MenuNode] = {}
+    collect_nodes(result['root'], nodes)
+    ranked: List[RankedNode] = []
+    for id, count in enumerate(profile['counters']):
+        if id == 0:
+            continue
+        node = nodes[result['labels'][id]]
+        ranked.append({
+            'count': count,
+            'id': id,
+            'label': node['label'],
+            'name': node['name'],
+            'group': node['mtype'] == MENU_TYPE_GROUP,
+        })
+    ranked.sort(key=lambda x: (-x['count'], x['id']))
+    return ranked
+
+
+def print_report(
+    ranked: List[RankedNode], top: int = 0, output: TextIO = sys.stdout,
+) -> None:
+    total = sum(node['count'] for node in ranked)
+    unused = sum(
+        1 for node in ranked
+        if node['count'] == 0 and not node['group'] and node['name'] != '*')
+    print(
+        f"Total {total} dispatches, {unused} MenuItems never used",
+        file=output)
+    print(
+        f"{'rank':>4} {'count':>6} {'%':>6} {'cum%':>6} {'id':>4}  "
+        "label (name)",
+        file=output)
+    cumulative = 0
+    for i, node in enumerate(ranked):
+        if (top and i >= top) or node['count'] == 0:
+            break
+        cumulative += node['count']
+        kind = ' [group]' if node['group'] else ''
+        print(
+            f"{i + 1:4d} {node['count']:6d} "
+            f"{100 * node['count'] / total:6.2f} "
+            f"{100 * cumulative / total:6.2f} {node['id']:4d}  "
+            f"{node['label']} ({node['name']}){kind}",
+            file=output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 Brian T. Park
+# MIT License.
+
+"""
+Simulate the navigation of the menu hierarchy of the RPN83P on the host,
+using the same menu nodes as the ones generated by compilemenu.py.
+
+Usage:
+$ menusim.py [--replay 'KEY ...'] [--check] [--handlers file.asm] ...
+    [-D SYMBOL ...] menudef.txt
+
+The menu nodes are loaded into parallel arrays indexed by the menu id
+(parentId, numRows, rowBeginId, handler), in the same order as mMenuTable of
+the generated menudef.asm. The state of the menu is the tuple
+(currentMenuGroupId, currentMenuRowIndex, jumpBackMenuGroupId,
+jumpBackMenuRowIndex), and the following keys are modeled after the routines
+in handlers.asm, menu.asm and menu3.asm:
+
+- MENU1-MENU5: GetMenuIdOfButton(), then dispatchMenuNode(). A MenuItem
+  invokes its handler, a MenuGroup is entered at row 0 and clears the
+  jumpBack.
+- UP, DOWN: handleKeyUp() and handleKeyDown(), wrapping around.
+- EXIT: exitMenuGroup(), the ON/EXIT key, going back to the jumpBack menu
+  group if defined, otherwise to the parent menu group at the row containing
+  the child, or to row 0 of the root.
+- MATH, STAT: dispatchMenuNode() to mRoot and mStat.
+- MODE: dispatchMenuNodeWithJumpBack() to mMode, which saves the current menu
+  group into the jumpBack.
+
+The '--replay' flag prints the state and the invoked MenuItem handlers after
+each key. The '--check' flag traverses every menu state reachable from the
+initial state, and verifies that each state is valid, and that every
+non-blank button resolves to a MenuNode whose handler is defined in the
+assembly files given by '--handlers'. The '-D' flags select the If blocks of
+the menu definition file, as for compilemenu.py.
+"""
+
+from array import array
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import TextIO
+from typing import Tuple
+from typing import TypedDict
+
+import argparse
+import logging
+import re
+import time
+
+from compilemenu import Lexer
+from compilemenu import MENU_TYPE_GROUP
+from compilemenu import MenuConfig
+from compilemenu import MenuNode
+from compilemenu import MenuParser
+from compilemenu import SymbolGenerator
+from compilemenu import Validator
+from compilemenu import node_handler
+from compilemenu import prune_menu
+
+
+def main() -> None:
+    # Configure command line flags.
+    parser = argparse.ArgumentParser(
+        description='Simulate the menu navigation of the RPN83P'
+    )
+    parser.add_argument(
+        '--replay',
+        help='Space separated list of keys to replay',
+        required=False,
+    )
+    parser.add_argument(
+        '--check',
+        help='Check every reachable menu state',
+        action='store_true',
+        default=False,
+    )
+    parser.add_argument(
+        '--handlers',
+        help='Assembly file which defines some of the handlers',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        '--define', '-D',
+        help='Define the symbol used by the If blocks',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        'filename',
+        help='Menu definition file',
+    )
+    args = parser.parse_args()
+
+    # Configure logging. This should normally be executed after the
+    # parser.parse_args() because it allows us set the logging.level using a
+    # flag.
+    logging.basicConfig(level=logging.INFO)
+
+    logging.info(f"Reading {args.filename}")
+    with open(args.filename) as file:
+        model = load_model(file, args.define)
+    simulator = MenuSimulator(model)
+
+    if args.replay:
+        state = simulator.initial_state()
+        print(f"{'':8} {simulator.format_state(state)}")
+        for key in args.replay.split():
+            state, handler = simulator.step(state, key)
+            invoked = f" -> {handler}" if handler else ""
+            print(f"{key:8} {simulator.format_state(state)}{invoked}")
+
+    if args.check:
+        labels: Optional[Set[str]] = None
+        if args.handlers:
+            labels = set()
+            for filename in args.handlers:
+                with open(filename, encoding="utf-8", errors="replace") as f:
+                    labels |= read_labels(f)
+        start = time.perf_counter()
+        report = simulator.check(labels)
+        elapsed = time.perf_counter() - start
+        logging.info(
+            f"  {report['states']} states, {report['steps']} steps, "
+            f"{report['steps'] / max(elapsed, 1e-9):,.0f} steps/s"
+        )
+        for error in report['errors']:
+            logging.error(f"  {error}")
+        if report['errors']:
+            raise ValueError(f"{len(report['errors'])} errors found")
+        logging.info("  OK")
+
+# -----------------------------------------------------------------------------
+
+
+class MenuModel:
+    """The menu nodes as parallel arrays indexed by the menu id. Id 0 is the
+    mNull node."""
+
+    def __init__(self, count: int):
+        self.count = count
+        self.parent_ids = array('H', [0] * count)
+        self.num_rows = array('B', [0] * count)
+        self.row_begin_ids = array('H', [0] * count)
+        self.handlers: List[str] = ['mNullHandler'] * count
+        self.labels: List[str] = ['mNull'] * count
+        self.blank = array('B', [0] * count)
+        self.ids: Dict[str, int] = {'mNull': 0}  # {label -> id}
+
+
+def load_model(input: TextIO, defines: Iterable[str] = ()) -> MenuModel:
+    """Parse the menu definition file, and assign the menu ids using the
+    classes of compilemenu.py."""
+    config, root = MenuParser(Lexer(input)).parse()
+    root = prune_menu(root, defines)
+    Validator(root).validate()
+    symbols = SymbolGenerator(root)
+    symbols.generate()
+    return build_model(config, symbols)
+
+
+def build_model(config: MenuConfig, symbols: SymbolGenerator) -> MenuModel:
+    model = MenuModel(symbols.id_counter)
+    for id, node in symbols.id_map.items():
+        model.parent_ids[id] = node['parent_id']
+        model.handlers[id] = node_handler(config, node)
+        model.labels[id] = node['label']
+        model.blank[id] = 1 if node['name'] == '*' else 0
+        model.ids[node['label']] = id
+        if node['mtype'] == MENU_TYPE_GROUP:
+            model.num_rows[id] = len(node['rows'])
+            model.row_begin_ids[id] = first_child(node)['id']
+    return model
+
+
+def first_child(node: MenuNode) -> MenuNode:
+    return node['rows'][0][0]
+
+
+def read_labels(input: TextIO) -> Set[str]:
+    """Return the labels defined in the assembly file."""
+    pattern = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*):')
+    labels = set()
+    for line in input:
+        match = pattern.match(line)
+        if match:
+            labels.add(match.group(1))
+    return labels
+
+# -----------------------------------------------------------------------------
+
+
+# (currentMenuGroupId, currentMenuRowIndex, jumpBackMenuGroupId,
+# jumpBackMenuRowIndex)
+MenuState = Tuple[int, int, int, int]
+
+BUTTONS = {'MENU1': 0, 'MENU2': 1, 'MENU3': 2, 'MENU4': 3, 'MENU5': 4}
+
+# Keys which jump directly to a menu group: {key -> (label, saveJumpBack)}
+SHORTCUTS = {
+    'MATH': ('mRoot', False),
+    'MODE': ('mMode', True),
+    'STAT': ('mStat', False),
+}
+
+KEYS = list(BUTTONS.keys()) + ['UP', 'DOWN', 'EXIT'] + list(SHORTCUTS.keys())
+
+
+class CheckReport(TypedDict):
+    states: int  # number of reachable states
+    steps: int  # number of keys applied
+    errors: List[str]
+
+
+class MenuSimulator:
+    def __init__(self, model: MenuModel):
+        self.model = model
+        self.root_id = model.ids['mRoot']
+        # Resolve the shortcuts which exist in this menu hierarchy.
+        self.shortcuts: Dict[str, Tuple[int, bool]] = {
+            key: (model.ids[label], save)
+            for key, (label, save) in SHORTCUTS.items()
+            if label in model.ids
+        }
+        self.keys = [k for k in KEYS if k not in SHORTCUTS] \
+            + list(self.shortcuts.keys())
+
+    def initial_state(self) -> MenuState:
+        """ColdInitMenu()"""
+        return (self.root_id, 0, 0, 0)
+
+    def format_state(self, state: MenuState) -> str:
+        group, row, jump_back, jump_back_row = state
+        s = f"{self.model.labels[group]}[{row}]"
+        if jump_back:
+            s += f" (jumpBack {self.model.labels[jump_back]}[{jump_back_row}])"
+        return s
+
+    def menu_id_of_button(self, state: MenuState, button: int) -> int:
+        """GetMenuIdOfButton()"""
+        group, row, _, _ = state
+        return self.model.row_begin_ids[group] + 5 * row + button
+
+    def step(self, state: MenuState, key: str) -> Tuple[MenuState, str]:
+        """Apply the key to the state. Return the new state, and the handler
+        of the MenuItem which was invoked, or an empty string."""
+        model = self.model
+        group, row, jump_back, jump_back_row = state
+        button = BUTTONS.get(key)
+        if button is not None:
+            id = model.row_begin_ids[group] + 5 * row + button
+            if model.num_rows[id] == 0:
+                return state, model.handlers[id]
+            return (id, 0, 0, 0), ''
+        if key == 'UP' or key == 'DOWN':
+            num_rows = model.num_rows[group]
+            if num_rows < 2:
+                return state, ''
+            delta = -1 if key == 'UP' else 1
+            return (group, (row + delta) % num_rows, jump_back,
+                    jump_back_row), ''
+        if key == 'EXIT':
+            return self.exit_menu_group(state), ''
+        shortcut = self.shortcuts.get(key)
+        if shortcut is None:
+            raise ValueError(f"Unknown key '{key}'")
+        target, save = shortcut
+        if not save:
+            return (target, 0, 0, 0), ''
+        # dispatchMenuNodeWithJumpBack()
+        if target == group:
+            return (target, 0, jump_back, jump_back_row), ''
+        return (target, 0, group, row), ''
+
+    def exit_menu_group(self, state: MenuState) -> MenuState:
+        """exitMenuGroup()"""
+        model = self.model
+        group, row, jump_back, jump_back_row = state
+        if jump_back != 0:
+            return (jump_back, jump_back_row, 0, 0)
+        if group == self.root_id:
+            return (group, 0, 0, 0)
+        parent = model.parent_ids[group]
+        # deduceRowIndex()
+        offset = group - model.row_begin_ids[parent]
+        parent_row = offset // 5
+        if not 0 <= parent_row < model.num_rows[parent]:
+            parent_row = 0
+        return (parent, parent_row, 0, 0)
+
+    # -------------------------------------------------------------------------
+
+    def check_state(
+        self, state: MenuState, labels: Optional[Set[str]]
+    ) -> List[str]:
+        """Return the list of errors of the given state."""
+        model = self.model
+        errors: List[str] = []
+        group, row, jump_back, jump_back_row = state
+        where = self.format_state(state)
+        if not 0 < group < model.count or model.num_rows[group] == 0:
+            return [f"{where}: not a MenuGroup"]
+        if row >= model.num_rows[group]:
+            errors.append(f"{where}: rowIndex out of range")
+        if jump_back != 0 and jump_back_row >= model.num_rows[jump_back]:
+            errors.append(f"{where}: jumpBack rowIndex out of range")
+        for button in range(5):
+            id = self.menu_id_of_button(state, button)
+            if not 0 < id < model.count:
+                errors.append(f"{where}: button {button + 1}: invalid id {id}")
+                continue
+            if model.parent_ids[id] != group:
+                errors.append(
+                    f"{where}: button {button + 1}: {model.labels[id]} "
+                    "is not a child")
+            if model.blank[id]:
+                continue
+            handler = model.handlers[id]
+            if labels is not None and handler not in labels:
+                errors.append(
+                    f"{where}: button {button + 1}: {model.labels[id]}: "
+                    f"undefined handler '{handler}'")
+        return errors
+
+    def check(self, labels: Optional[Set[str]] = None) -> CheckReport:
+        """Traverse every state reachable from the initial state, and check
+        each state."""
+        initial = self.initial_state()
+        visited: Set[MenuState] = {initial}
+        pending = [initial]
+        steps = 0
+        errors: List[str] = []
+        step = self.step
+        keys = self.keys
+        while pending:
+            state = pending.pop()
+            errors.extend(self.check_state(state, labels))
+            for key in keys:
+                next_state, _ = step(state, key)
+                steps += 1
+                if next_state not in visited:
+                    visited.add(next_state)
+                    pending.append(next_state)
+        return {'states': len(visited), 'steps': steps, 'errors': errors}
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 Brian T. Park
+# MIT License.
+
+"""
+Propose an assignment of the source files to the flash pages of the RPN83P
+which reduces the number of bcall() between the pages, using the static call
+graph of the assembly files.
+
+Usage:
+$ pageplan.py [-D SYMBOL ...] [--listing rpn83p.lst] [--pin FILE=PAGE ...]
+    [--profile RPN83PRF.8xv [--menudef menudef.txt] [--layout rowmask]]
+    [--capacity 16384] rpn83p.asm
+
+The files and their current flash pages are read from the '#include' and
+'defpage()' statements of the main file. Each file is parsed by the Program
+of z80cost.py, and every 'call', 'jp', 'jr' or 'bcall()' whose target is
+defined by another file becomes a call site. A call site costs a bcall() if
+the two files are on different pages. The weight of each call site is 1,
+plus the number of dispatches of the menu handlers which reach the caller,
+if a menu usage profile of the USE_MENU_PROFILE variant is given (see
+menuprofile.py).
+
+The constraints are:
+
+- the size of each page, estimated statically by z80cost.py or taken from
+  the '--listing' of spasm-ng, must not exceed the '--capacity',
+- Flash Page 0 also contains the app header and the branch table, which has
+  3 bytes for each routine called across the pages,
+- the files which must reside on Flash Page 0 (PINNED_FILES), and the ones
+  given by '--pin', are not moved,
+- the files which refer to the labels of each other as data on the same page
+  (e.g. 'ld hl, table', or '.dw handler') are moved together,
+- the files which define a page-local routine (a label starting with a
+  lowercase letter, e.g. 'eVPutS' or 'getStringPageOne') called from another
+  file on the same page are not moved, nor are their callers. Those routines
+  have no entry in the branch table, and often receive a pointer into the
+  flash page of the caller (e.g. 'ld hl, helpPages; call eVPutS'), which
+  would not be mapped if the routine was reached through a bcall().
+
+Starting from the current assignment, the groups of files are moved, or
+swapped, between the pages while the weighted number of bcall() decreases.
+The proposed moves are printed, along with the predicted reduction of the
+bcall() sites and of the entries of the branch table. The branch table
+(branchtab.asm) is regenerated by genbranchtab.py after the files are moved,
+and the bcall() into the same page can be replaced by a 'call'.
+"""
+
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import TextIO
+from typing import Tuple
+from typing import TypedDict
+
+import argparse
+import bisect
+import fnmatch
+import logging
+import os
+import re
+import sys
+
+from asmlisting import label_sizes
+from compilemenu import MENU_LAYOUTS
+from compilemenu import MenuNode
+from compilemenu import compile_menu
+from compilemenu import node_handler
+from deadcode import CallGraph
+from deadcode import block_starts
+from genbranchtab import IncludeScanner
+from menuprofile import TI8X_SIGNATURE
+from menuprofile import check_signature
+from menuprofile import decode_profile
+from menuprofile import read_8xv
+from z80cost import Program
+
+# Size of a flash page.
+PAGE_CAPACITY = 16384
+
+# The app header (128 bytes), followed by the 'jp main' and the padding byte
+# before the branch table, on Flash Page 0.
+PAGE0_RESERVED = 132
+
+# Size of an entry of the branch table.
+BRANCH_ENTRY_SIZE = 3
+
+# The branch table is regenerated from the placement.
+BRANCH_TABLE_FILE = 'branchtab.asm'
+
+# Files which must reside on Flash Page 0. See the comments of rpn83p.asm.
+PINNED_FILES = [
+    'main.asm', 'handlers.asm', 'arghandlers.asm', 'input.asm', 'menu.asm',
+    '*menuhandlers.asm',
+]
+
+# Maximum number of passes of the optimizer.
+MAX_PASSES = 100
+
+
+def main() -> None:
+    # Configure command line flags.
+    parser = argparse.ArgumentParser(
+        description='Propose a flash page placement of the RPN83P files'
+    )
+    parser.add_argument(
+        '--define', '-D',
+        help='Define the symbol used by #ifdef and the If blocks',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        '--listing',
+        help='Listing of spasm-ng (rpn83p.lst) for the exact file sizes',
+        required=False,
+    )
+    parser.add_argument(
+        '--pin',
+        help='Keep the file (glob) on the flash page, FILE=PAGE',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        '--profile',
+        help='Menu usage profile (RPN83PRF.8xv) to weigh the call sites',
+        required=False,
+    )
+    parser.add_argument(
+        '--menudef',
+        help='Menu definition file of the profile (default: menudef.txt)',
+        required=False,
+    )
+    parser.add_argument(
+        '--layout',
+        help='Layout of the menu nodes used to build the profiled app',
+        choices=MENU_LAYOUTS,
+        default='padded',
+    )
+    parser.add_argument(
+        '--capacity',
+        help=f'Size of a flash page (default: {PAGE_CAPACITY})',
+        type=int,
+        default=PAGE_CAPACITY,
+    )
+    parser.add_argument(
+        'filename',
+        help='Main assembly file containing the #include statements',
+    )
+    args = parser.parse_args()
+
+    # Configure logging. This should normally be executed after the
+    # parser.parse_args() because it allows us set the logging.level using a
+    # flag.
+    logging.basicConfig(level=logging.INFO)
+
+    srcdir = os.path.dirname(args.filename)
+    logging.info(f"Reading {args.filename}")
+    with open(args.filename, encoding="utf-8") as file:
+        sources = IncludeScanner(file).scan()
+
+    model = PlacementModel(set(args.define))
+    for source in sources:
+        if not is_included(source['condition'], args.define):
+            continue
+        path = os.path.join(srcdir, source['filename'])
+        with open(path, encoding="utf-8", errors="replace") as file:
+            model.add_file(source['filename'], source['page'], file)
+    model.link()
+
+    if args.listing:
+        logging.info(f"Reading {args.listing}")
+        with open(args.listing, encoding="utf-8", errors="replace") as file:
+            model.set_listing_sizes(file)
+
+    if args.profile:
+        menudef = args.menudef or os.path.join(srcdir, 'menudef.txt')
+        logging.info(f"Reading {menudef}")
+        with open(menudef, encoding="utf-8") as file:
+            counts = handler_counts(
+                file.read(), args.profile, args.layout, args.define)
+        model.set_profile(counts)
+
+    pins = parse_pins(PINNED_FILES, args.pin)
+    planner = PagePlanner(model, pins, args.capacity)
+    proposed = planner.optimize()
+    print_report(model, planner, proposed)
+
+# -----------------------------------------------------------------------------
+
+
+IFDEF_PATTERN = re.compile(r'^#ifdef\s+(\S+)')
+
+
+def is_included(condition: str, defines: Iterable[str]) -> bool:
+    """Return True if the '#ifdef' condition of an '#include' is satisfied."""
+    if not condition:
+        return True
+    match = IFDEF_PATTERN.match(condition)
+    return match is not None and match.group(1) in defines
+
+
+def is_page_local(label: str) -> bool:
+    """Return True if the label is private to its flash page, by the naming
+    convention of the files (see rpn83p.asm)."""
+    return label[:1].islower()
+
+
+def parse_pins(defaults: List[str], pins: List[str]) -> Dict[str, int]:
+    """Parse the FILE=PAGE flags, on top of the files of Flash Page 0."""
+    result = {pattern: 0 for pattern in defaults}
+    for pin in pins:
+        pattern, _, page = pin.partition('=')
+        if not pattern or not page.isdigit():
+            raise ValueError(f"Invalid --pin '{pin}', must be FILE=PAGE")
+        result[pattern] = int(page)
+    return result
+
+
+def handler_counts(
+    menudef: str, profile_path: str, layout: str, defines: List[str],
+) -> Dict[str, int]:
+    """Return the number of dispatches of each menu handler recorded in the
+    menu usage profile, as {handler -> count}."""
+    result = compile_menu(menudef, {'layout': layout, 'defines': defines})
+    with open(profile_path, 'rb') as file:
+        data = file.read()
+    if data.startswith(TI8X_SIGNATURE):
+        _, data = read_8xv(data)
+    profile = decode_profile(data)
+    check_signature(profile, result)
+
+    nodes: Dict[str, MenuNode] = {}
+    stack = [result['root']]
+    while stack:
+        node = stack.pop()
+        nodes[node['label']] = node
+        for row in node.get('rows', []):
+            stack.extend(row)
+
+    counts: Dict[str, int] = {}
+    for id, count in enumerate(profile['counters']):
+        if count == 0:
+            continue
+        handler = node_handler(result['config'], nodes[result['labels'][id]])
+        counts[handler] = counts.get(handler, 0) + count
+    return counts
+
+# -----------------------------------------------------------------------------
+
+
+class Site(TypedDict):
+    """A 'call', 'jp', 'jr' or 'bcall()' into a label of another file."""
+    caller: str  # file of the instruction
+    callee: str  # file of the target
+    target: str  # label of the target
+    block: str  # first label of the block of the caller
+    bcall: bool  # currently a bcall()
+    weight: int
+
+
+class PlacementModel:
+    """The source files, their sizes and flash pages, and the call sites
+    between the files."""
+
+    IDENTIFIER_PATTERN = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+    def __init__(self, defines: Optional[Set[str]] = None):
+        self.defines: Set[str] = set() if defines is None else defines
+        self.files: List[str] = []  # in the order of the '#include'
+        self.pages: Dict[str, int] = {}  # {file -> current page}
+        self.sizes: Dict[str, int] = {}  # {file -> bytes}
+        self.unknown = 0  # instructions of unknown size
+        self.programs: Dict[str, Program] = {}
+        self.owners: Dict[str, str] = {}  # {label -> file}
+        self.graph = CallGraph(self.defines)
+        self.sites: List[Site] = []
+        self.data_links: Set[Tuple[str, str]] = set()  # same page data refs
+        self.page_local: Set[str] = set()  # files of the page-local routines
+
+    def add_file(self, filename: str, page: int, input: TextIO) -> None:
+        program = Program(self.defines)
+        program.read(input)
+        if filename == BRANCH_TABLE_FILE:
+            # Regenerated from the call sites, not a part of the graph.
+            return
+        self.files.append(filename)
+        self.pages[filename] = page
+        self.programs[filename] = program
+        self.sizes[filename] = sum(i['size'] for i in program.instructions)
+        self.unknown += sum(
+            1 for i in program.instructions
+            if i['size'] == 0 and not i['mnemonic'].startswith('.'))
+        for label in program.labels:
+            self.owners.setdefault(label, filename)
+        self.graph.add_program(filename, program)
+
+    def link(self) -> None:
+        """Collect the call sites and the data references between the files,
+        after all files were added."""
+        for filename in self.files:
+            program = self.programs[filename]
+            starts = block_starts(program)
+            indexes = sorted(starts)
+            for index, instruction in enumerate(program.instructions):
+                position = bisect.bisect_right(indexes, index) - 1
+                block = starts[indexes[position]][0] if position >= 0 else ''
+                target = instruction.get('target')
+                for operand in instruction['operands']:
+                    for name in self.IDENTIFIER_PATTERN.findall(operand):
+                        owner = self.owners.get(name)
+                        if name == target or owner is None \
+                                or owner == filename:
+                            continue
+                        if self.pages[owner] == self.pages[filename]:
+                            self.data_links.add((filename, owner))
+                if target is None:
+                    continue
+                callee = self.owners.get(target)
+                if callee is None or callee == filename:
+                    continue
+                bcall = instruction['mnemonic'].startswith('bcall')
+                if not bcall and is_page_local(target) \
+                        and self.pages[callee] == self.pages[filename]:
+                    self.data_links.add((filename, callee))
+                    self.page_local.add(callee)
+                self.sites.append({
+                    'caller': filename,
+                    'callee': callee,
+                    'target': target,
+                    'block': block,
+                    'bcall': bcall,
+                    'weight': 1,
+                })
+
+    def set_listing_sizes(self, input: TextIO) -> None:
+        """Replace the estimated sizes with the sizes of the labels of each
+        file in the listing of spasm-ng."""
+        sizes = {label: size for (_, label), size in label_sizes(input).items()}
+        for filename in self.files:
+            self.sizes[filename] = sum(
+                sizes.get(label, 0) for label in self.programs[filename].labels)
+        self.unknown = 0
+
+    def set_profile(self, counts: Dict[str, int]) -> None:
+        """Add the number of dispatches of the handlers which reach the block
+        of each call site to its weight."""
+        heat: Dict[str, int] = {}
+        for handler, count in counts.items():
+            for block in self.graph.reachable([handler]):
+                heat[block] = heat.get(block, 0) + count
+        for site in self.sites:
+            site['weight'] = 1 + heat.get(site['block'], 0)
+
+# -----------------------------------------------------------------------------
+
+
+class Placement(TypedDict):
+    """The predicted cost of an assignment of the files to the pages."""
+    sites: int  # number of call sites across the pages, i.e. bcall()
+    weight: int  # weighted number of call sites across the pages
+    entries: int  # number of entries of the branch table
+    loads: Dict[int, int]  # {page -> bytes}
+
+
+class PagePlanner:
+    """Move the groups of files between the pages to reduce the weighted
+    number of call sites across the pages."""
+
+    def __init__(
+        self, model: PlacementModel, pins: Dict[str, int], capacity: int,
+    ):
+        self.model = model
+        self.capacity = capacity
+        self.page_numbers = sorted(set(model.pages.values()))
+
+        # Group the files which refer to each other as data.
+        parents = {f: f for f in model.files}
+
+        def find(f: str) -> str:
+            while parents[f] != f:
+                parents[f] = parents[parents[f]]
+                f = parents[f]
+            return f
+
+        for a, b in sorted(model.data_links):
+            parents[find(a)] = find(b)
+        self.groups: Dict[str, List[str]] = {}  # {first file -> files}
+        self.group_of: Dict[str, str] = {}
+        roots: Dict[str, str] = {}
+        for f in model.files:
+            key = roots.setdefault(find(f), f)
+            self.groups.setdefault(key, []).append(f)
+            self.group_of[f] = key
+
+        # A group is pinned if any of its files is pinned. The groups of the
+        # page-local routines stay on their current page.
+        self.pinned: Dict[str, int] = {}
+        for f in sorted(model.page_local):
+            self.pinned[self.group_of[f]] = model.pages[f]
+        for f in model.files:
+            for pattern, page in pins.items():
+                if not fnmatch.fnmatch(f, pattern):
+                    continue
+                key = self.group_of[f]
+                if self.pinned.get(key, page) != page:
+                    raise ValueError(
+                        f"Conflicting pins for the group of '{f}'")
+                self.pinned[key] = page
+
+        # The call sites of each group, to compute the cost of a move.
+        self.incident: Dict[str, List[int]] = {k: [] for k in self.groups}
+        for i, site in enumerate(model.sites):
+            caller = self.group_of[site['caller']]
+            callee = self.group_of[site['callee']]
+            self.incident[caller].append(i)
+            if callee != caller:
+                self.incident[callee].append(i)
+
+    def evaluate(self, assignment: Dict[str, int]) -> Placement:
+        """Return the cost of the assignment of {file -> page}."""
+        sites = 0
+        weight = 0
+        targets: Set[str] = set()
+        for site in self.model.sites:
+            if assignment[site['caller']] != assignment[site['callee']]:
+                sites += 1
+                weight += site['weight']
+                targets.add(site['target'])
+        loads = {page: 0 for page in self.page_numbers}
+        for f in self.model.files:
+            loads[assignment[f]] += self.model.sizes[f]
+        loads[0] = loads.get(0, 0) + PAGE0_RESERVED \
+            + BRANCH_ENTRY_SIZE * len(targets)
+        return {
+            'sites': sites, 'weight': weight, 'entries': len(targets),
+            'loads': loads,
+        }
+
+    def delta(
+        self, assignment: Dict[str, int], moves: Dict[str, int],
+    ) -> int:
+        """Return the change of the weighted cost if the groups are moved to
+        the pages given by {group -> page}."""
+        def page_of(f: str) -> int:
+            return moves.get(self.group_of[f], assignment[f])
+
+        seen: Set[int] = set()
+        delta = 0
+        for key in moves:
+            for i in self.incident[key]:
+                if i in seen:
+                    continue
+                seen.add(i)
+                site = self.model.sites[i]
+                before = assignment[site['caller']] \
+                    != assignment[site['callee']]
+                after = page_of(site['caller']) != page_of(site['callee'])
+                delta += site['weight'] * (int(after) - int(before))
+        return delta
+
+    def fits(self, assignment: Dict[str, int]) -> bool:
+        loads = self.evaluate(assignment)['loads']
+        return all(load <= self.capacity for load in loads.values())
+
+    def apply(
+        self, assignment: Dict[str, int], moves: Dict[str, int],
+    ) -> Dict[str, int]:
+        result = dict(assignment)
+        for key, page in moves.items():
+            for f in self.groups[key]:
+                result[f] = page
+        return result
+
+    def candidates(
+        self, assignment: Dict[str, int],
+    ) -> Iterable[Dict[str, int]]:
+        """Generate the single moves, then the swaps of two groups."""
+        movable = [k for k in self.groups if k not in self.pinned]
+        for key in movable:
+            for page in self.page_numbers:
+                if page != assignment[key]:
+                    yield {key: page}
+        for i, a in enumerate(movable):
+            for b in movable[i + 1:]:
+                if assignment[a] != assignment[b]:
+                    yield {a: assignment[b], b: assignment[a]}
+
+    def optimize(self) -> Dict[str, int]:
+        """Return the proposed assignment of {file -> page}, starting from the
+        current one, applying the best improving move until none is left."""
+        assignment = dict(self.model.pages)
+        for _ in range(MAX_PASSES):
+            best: Optional[Tuple[int, Dict[str, int]]] = None
+            for moves in self.candidates(assignment):
+                delta = self.delta(assignment, moves)
+                if delta >= 0 or (best is not None and delta >= best[0]):
+                    continue
+                if not self.fits(self.apply(assignment, moves)):
+                    continue
+                best = (delta, moves)
+            if best is None:
+                break
+            assignment = self.apply(assignment, best[1])
+        return assignment
+
+# -----------------------------------------------------------------------------
+
+
+def print_report(
+    model: PlacementModel,
+    planner: PagePlanner,
+    proposed: Dict[str, int],
+    output: TextIO = sys.stdout,
+) -> None:
+    current = planner.evaluate(model.pages)
+    result = planner.evaluate(proposed)
+    same_page = sum(
+        1 for site in model.sites
+        if site['bcall'] and model.pages[site['caller']]
+        == model.pages[site['callee']])
+    print(
+        f"{len(model.files)} files, {len(planner.groups)} groups, "
+        f"{len(model.sites)} call sites between files", file=output)
+    print(
+        f"{len(model.page_local)} files with page-local routines are not "
+        "moved, with their callers", file=output)
+    if model.unknown:
+        print(
+            f"{model.unknown} instructions of unknown size (macros), "
+            "use --listing for the exact sizes", file=output)
+    if same_page:
+        print(
+            f"{same_page} bcall() into the same page could be a 'call'",
+            file=output)
+
+    print("Moves:", file=output)
+    moved = [f for f in model.files if proposed[f] != model.pages[f]]
+    for f in moved:
+        print(
+            f"  {f}: page {model.pages[f]} -> {proposed[f]} "
+            f"({model.sizes[f]} bytes)", file=output)
+    if not moved:
+        print("  (none)", file=output)
+
+    print("Pages:", file=output)
+    for page in planner.page_numbers:
+        print(
+            f"  page {page}: {current['loads'][page]} -> "
+            f"{result['loads'][page]} bytes, "
+            f"{planner.capacity - result['loads'][page]} free", file=output)
+
+    print(
+        f"bcall() sites: {current['sites']} -> {result['sites']} "
+        f"({result['sites'] - current['sites']:+d}), weighted "
+        f"{current['weight']} -> {result['weight']}", file=output)
+    print(
+        f"Branch table entries: {current['entries']} -> {result['entries']} "
+        f"({BRANCH_ENTRY_SIZE * (result['entries'] - current['entries']):+d}"
+        " bytes on Flash Page 0)", file=output)
+
+
+if __name__ == '__main__':
+    main()
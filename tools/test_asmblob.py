@@ -0,0 +1,36 @@
+import io
+import unittest
+
+from asmblob import Blob
+from asmblob import encode_chars
+from compilekeys import SymbolResolver
+
+
+def font_symbols() -> SymbolResolver:
+    symbols = SymbolResolver()
+    symbols.read(io.StringIO("Sdegree EQU 0Eh\nSspace equ $20\nSnull equ 0\n"))
+    return symbols
+
+
+class TestAsmBlob(unittest.TestCase):
+    def test_encode_chars(self) -> None:
+        symbols = font_symbols()
+        self.assertEqual(
+            b'\x0eF', encode_chars(['Sdegree', "'F'"], symbols))
+        self.assertEqual(
+            b'a b', encode_chars(["'a'", 'Sspace', "'b'"], symbols))
+        with self.assertRaises(ValueError):
+            encode_chars(['Scube'], symbols)
+        with self.assertRaises(ValueError):
+            encode_chars(['Snull'], symbols)
+
+    def test_blob(self) -> None:
+        blob = Blob('mBlob', 'm.bin', font_symbols())
+        self.assertEqual(0, blob.add('mNullName', b'\x00'))
+        self.assertEqual(1, blob.add_cstring('mDegName', ['Sdegree', "'F'"]))
+        self.assertEqual(b'\x00\x0eF\x00', bytes(blob.data))
+        self.assertEqual('mDegName equ mBlob+1', blob.equate('mDegName'))
+        output = io.StringIO()
+        blob.generate_import(output)
+        self.assertEqual(
+            'mBlob:\n#import "m.bin"\nmBlobSize equ 4\n', output.getvalue())
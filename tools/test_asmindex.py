@@ -0,0 +1,157 @@
+import os
+import tempfile
+import unittest
+
+from asmindex import SymbolIndex
+from asmindex import find_sources
+from asmindex import find_undefined
+from asmindex import load_index
+from asmindex import make_entry
+from asmindex import parse_file
+from asmindex import parse_symbols
+
+
+SOURCE = """\
+; comment: notALabel:
+mPiHandler:
+    ld a, 1 ; not a label
+localLabel: ; with a comment
+rpnVarSize equ 9
+menuNameAltFlag .EQU $8000
+skipSize = 2
+#define skipHL inc hl \\ inc hl
+#macro bcall(xxxx)
+  not: indented
+"""
+
+XREF = """\
+rpnObjectSize equ rpnRealSize + 2 ; comment rpnIgnored
+rpnRealSize equ 9
+mPiHandler:
+    ld hl, piConstant ; comment: notARef
+    ld a, ';' ; not a comment
+    ld bc, rpnObjectSize*2 + $1F + 0FFh
+    bcall(_PushRpnObject1) ; "quoted"
+    jr nz, mPiHandler
+piConstant:
+    .db "PI;notARef", 0
+#ifdef DEBUG
+    bjump(_DebugPrint)
+#endif
+"""
+
+
+class TestAsmIndex(unittest.TestCase):
+    def test_parse_symbols(self) -> None:
+        self.assertEqual([
+            ('mPiHandler', 2),
+            ('localLabel', 4),
+            ('rpnVarSize', 5),
+            ('menuNameAltFlag', 6),
+            ('skipSize', 7),
+            ('skipHL', 8),
+            ('bcall', 9),
+        ], parse_symbols(SOURCE.splitlines()))
+
+    def test_parse_file(self) -> None:
+        parsed = parse_file(XREF.splitlines())
+        self.assertEqual([
+            ('rpnObjectSize', 1),
+            ('rpnRealSize', 2),
+            ('mPiHandler', 3),
+            ('piConstant', 9),
+        ], parsed['symbols'])
+        self.assertEqual({
+            'rpnRealSize': [1],
+            'piConstant': [4],
+            'rpnObjectSize': [6],
+            'bcall': [7],
+            '_PushRpnObject1': [7],
+            'mPiHandler': [8],
+            'bjump': [12],
+            '_DebugPrint': [12],
+        }, parsed['references'])
+        self.assertEqual(
+            [('PushRpnObject1', 7), ('DebugPrint', 12)], parsed['bcalls'])
+        self.assertEqual(
+            {'rpnObjectSize': ['rpnRealSize'], 'rpnRealSize': []},
+            parsed['equs'])
+
+    def test_queries(self) -> None:
+        index = SymbolIndex()
+        index.files['a.asm'] = make_entry('', parse_file(XREF.splitlines()))
+        index.files['b.asm'] = make_entry('', parse_file([
+            'PushRpnObject1:',
+            '    ld de, rpnObjectSize',
+            '    bcall(_PushRpnObject1)',
+            'rpnComplexSize equ 2*rpnRealSize',
+        ]))
+        index.rebuild()
+        self.assertEqual(('b.asm', 1), index.lookup('PushRpnObject1'))
+        self.assertEqual(
+            [('a.asm', 6), ('b.asm', 2)], index.references('rpnObjectSize'))
+        self.assertEqual(
+            [('a.asm', 7), ('b.asm', 3)], index.bcall_sites('PushRpnObject1'))
+        self.assertEqual([], index.bcall_sites('unknown'))
+        self.assertEqual(['rpnRealSize'], index.dependencies('rpnObjectSize'))
+        self.assertEqual(
+            ['rpnObjectSize', 'rpnComplexSize'],
+            index.dependents('rpnRealSize'))
+
+    def test_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            def write(name: str, text: str) -> None:
+                with open(os.path.join(tmpdir, name), 'w') as file:
+                    file.write(text)
+
+            write('a.asm', SOURCE)
+            write('b.inc', 'bLabel:\n')
+            write('menudef.asm', 'mPiId equ 1\n')
+            write('notes.txt', 'txtLabel:\n')
+            cache = os.path.join(tmpdir, 'cache.json')
+
+            sources = find_sources([tmpdir], ['menudef.asm'])
+            self.assertEqual(
+                ['a.asm', 'b.inc'], [os.path.basename(s) for s in sources])
+
+            index = load_index([tmpdir], ['menudef.asm'], cache)
+            self.assertEqual(2, index.parsed_count)
+            self.assertEqual(
+                (os.path.join(tmpdir, 'b.inc'), 1), index.lookup('bLabel'))
+            self.assertIsNone(index.lookup('mPiId'))
+            self.assertIsNone(index.lookup('txtLabel'))
+
+            # Only the modified file is parsed again.
+            write('b.inc', '\nbLabel2:\n')
+            index = load_index([tmpdir], ['menudef.asm'], cache)
+            self.assertEqual(1, index.parsed_count)
+            self.assertIsNone(index.lookup('bLabel'))
+            self.assertEqual(
+                (os.path.join(tmpdir, 'b.inc'), 2), index.lookup('bLabel2'))
+            self.assertEqual(
+                (os.path.join(tmpdir, 'a.asm'), 2), index.lookup('mPiHandler'))
+            self.assertEqual(
+                [(os.path.join(tmpdir, 'a.asm'), 9)],
+                index.references('xxxx'))
+
+            # A corrupted cache file is ignored.
+            write('cache.json', '{')
+            index = load_index([tmpdir], ['menudef.asm'], cache)
+            self.assertEqual(2, index.parsed_count)
+
+    def test_find_undefined(self) -> None:
+        index = SymbolIndex()
+        index.files['a.asm'] = make_entry(
+            '', parse_file(SOURCE.splitlines()))
+        index.update([])  # drops the files, since none are given
+        self.assertIsNone(index.lookup('mPiHandler'))
+
+        index.definitions = {'mPiHandler': ('a.asm', 2)}
+        undefined = find_undefined([
+            {'symbol': 'mPiHandler', 'line': 3, 'context': 'Menu PI'},
+            {'symbol': 'mEHandler', 'line': 4, 'context': 'Menu E'},
+            {'symbol': 'mPiId', 'line': 3, 'context': 'Menu PI'},
+            {'symbol': 'mAHandler', 'line': 1, 'context': 'Menu A'},
+        ], index, 'mPi:\nmPiId equ 1\n')
+        self.assertEqual(
+            ['mAHandler', 'mEHandler'], [ref['symbol'] for ref in undefined])
@@ -0,0 +1,104 @@
+import io
+import os
+import tempfile
+import unittest
+
+from asmlisting import file_sizes
+from asmlisting import label_sizes
+from asmlisting import parse_line
+from asmlisting import print_report
+from asmlisting import ranked_changes
+from asmlisting import read_listing
+from asmlisting import summarize
+
+LISTING = """\
+    1 00:4000 -  -  -  -  ; header
+    5 00:4080 C3 00 41 -  \tjp main
+    6 00:4083 00 -  -  -  \t.db 0
+   10 00:4084 -  -  -  -  main:
+   11 00:4084 21 34 12 -  \tld hl, $1234
+   12 00:4087 C9 -  -  -  \tret
+   20 00:4088 01 02 03 04 table: .db 1, 2, 3, 4, 5, 6
+      00:408C 05 06 -  -
+   12 01:4000 -  -  -  -  other:
+   13 01:4000 3E 01 -  -  \tld a, 1
+rpn83p.asm:100: error: something
+"""
+
+
+class TestAsmListing(unittest.TestCase):
+    def test_parse_line(self) -> None:
+        line = parse_line("   11 00:4084 21 34 12 -  \tld hl, $1234\n")
+        self.assertIsNotNone(line)
+        assert line is not None
+        self.assertEqual(11, line['line'])
+        self.assertEqual(0, line['page'])
+        self.assertEqual(0x4084, line['address'])
+        self.assertEqual(3, line['size'])
+        self.assertEqual('\tld hl, $1234', line['source'])
+
+        line = parse_line("      00:408C 05 06 -  -")
+        assert line is not None
+        self.assertEqual(0, line['line'])
+        self.assertEqual(2, line['size'])
+
+        self.assertIsNone(parse_line("rpn83p.asm:100: error: something"))
+
+    def test_label_sizes(self) -> None:
+        self.assertEqual({
+            (0, ''): 4,
+            (0, 'main'): 4,
+            (0, 'table'): 6,
+            (1, 'other'): 2,
+        }, label_sizes(LISTING.splitlines()))
+
+    def test_summarize(self) -> None:
+        summary = summarize(LISTING.splitlines())
+        self.assertEqual({
+            0: {'size': 14, 'end': 0x408E},
+            1: {'size': 2, 'end': 0x4002},
+        }, summary['pages'])
+        files = {'main': 'main.asm', 'table': 'main.asm', 'other': 'b1.asm'}
+        self.assertEqual(
+            {'(unknown)': 4, 'main.asm': 10, 'b1.asm': 2},
+            file_sizes(summary, files))
+
+    def test_read_listing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'rpn83p.lst')
+            with open(path, 'w') as file:
+                file.write(LISTING)
+            self.assertEqual(
+                summarize(LISTING.splitlines()), read_listing(path))
+            with open(path, 'w') as file:
+                pass
+            self.assertEqual({'labels': {}, 'pages': {}}, read_listing(path))
+
+    def test_ranked_changes(self) -> None:
+        current = {'a': 10, 'b': 30, 'c': 20}
+        self.assertEqual(
+            [('b', 30, 0), ('c', 20, 0)], ranked_changes(current, None, 2))
+        previous = {'a': 10, 'b': 20, 'c': 25, 'd': 4}
+        self.assertEqual(
+            [('b', 30, 10), ('c', 20, -5), ('d', 0, -4)],
+            ranked_changes(current, previous, 0))
+
+    def test_print_report(self) -> None:
+        previous = summarize(LISTING.splitlines())
+        grown = LISTING.replace(
+            "   13 01:4000 3E 01 -  -  \tld a, 1\n",
+            "   13 01:4000 3E 01 -  -  \tld a, 1\n"
+            "   14 01:4002 C9 -  -  -  \tret\n")
+        output = io.StringIO()
+        print_report(
+            summarize(grown.splitlines()), previous, {'other': 'b1.asm'}, 5,
+            output)
+        self.assertEqual(
+            "Flash pages:\n"
+            "  page 0:    14 bytes, end $408E, 16242 free (+0)\n"
+            "  page 1:     3 bytes, end $4003, 16381 free (+1)\n"
+            "Files (changes):\n"
+            "       3 b1.asm (+1)\n"
+            "Labels (changes):\n"
+            "       3 other (+1)\n",
+            output.getvalue())
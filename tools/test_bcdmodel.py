@@ -0,0 +1,120 @@
+import decimal
+import importlib.util
+import io
+import unittest
+from fractions import Fraction
+from typing import List
+
+from compileunit import compile_unit
+
+# bcdmodel.py requires NumPy, which the other tools do not need.
+HAS_NUMPY = importlib.util.find_spec('numpy') is not None
+if HAS_NUMPY:
+    from bcdmodel import conversion_batch
+    from bcdmodel import convert
+    from bcdmodel import divide
+    from bcdmodel import from_fractions
+    from bcdmodel import multiply
+    from bcdmodel import print_report
+    from bcdmodel import random_values
+    from bcdmodel import to_decimals
+    from bcdmodel import ulp_errors
+
+UNITS = """\
+UnitTypes [
+  UnitType NullType nulltype NullUnit
+  UnitType Length length Meter
+  UnitType Temperature temperature Kelvin
+]
+
+Units [
+  Unit NullUnit nullunit NullType 1
+  Unit Meter meter Length 1
+  Unit Feet feet Length 0.3048
+  Unit Mile mile Length 1609.344
+  Unit Kelvin kelvin Temperature 1
+  Unit Celsius celsius Temperature 1
+]
+"""
+
+VALUES = [
+    Fraction(1), Fraction(3), Fraction(-7), Fraction(0),
+    Fraction(99999999999999, 10**13), Fraction(10000000000001, 10**13),
+    Fraction(1, 3), Fraction(2, 3), Fraction(123456789, 1000),
+    Fraction(-5, 10**20), Fraction(314159265358979, 10**14),
+]
+
+TIOS = decimal.Context(prec=14, rounding=decimal.ROUND_HALF_UP)
+
+
+def exact(values: List[Fraction]) -> List[decimal.Decimal]:
+    return to_decimals(from_fractions(values))
+
+
+@unittest.skipUnless(HAS_NUMPY, 'requires NumPy')
+class TestBcdModel(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        decimals = exact(VALUES)
+        self.assertEqual(decimal.Decimal(1), decimals[0])
+        self.assertEqual(decimal.Decimal(0), decimals[3])
+        self.assertEqual(decimal.Decimal('0.33333333333333'), decimals[6])
+        self.assertEqual(decimal.Decimal('-5E-20'), decimals[9])
+
+    def test_multiply(self) -> None:
+        a = [x for x in VALUES for _ in VALUES]
+        b = [y for _ in VALUES for y in VALUES]
+        expected = [
+            TIOS.multiply(x, y) for x, y in zip(exact(a), exact(b))]
+        result = to_decimals(multiply(from_fractions(a), from_fractions(b)))
+        self.assertEqual(expected, result)
+
+    def test_divide(self) -> None:
+        divisors = [y for y in VALUES if y != 0]
+        a = [x for x in VALUES for _ in divisors]
+        b = [y for _ in VALUES for y in divisors]
+        expected = [
+            TIOS.divide(x, y) for x, y in zip(exact(a), exact(b))]
+        result = to_decimals(divide(from_fractions(a), from_fractions(b)))
+        self.assertEqual(expected, result)
+        with self.assertRaises(ValueError):
+            divide(from_fractions([Fraction(1)]), from_fractions([Fraction(0)]))
+
+    def test_truncate(self) -> None:
+        third = from_fractions([Fraction(2, 3)])
+        one = from_fractions([Fraction(1)])
+        self.assertEqual(
+            [decimal.Decimal('0.66666666666667')],
+            to_decimals(multiply(third, one)))
+        self.assertEqual(
+            [decimal.Decimal('0.22222222222222')],
+            to_decimals(divide(third, from_fractions([Fraction(3)]), False)))
+
+    def test_conversions(self) -> None:
+        units = compile_unit(UNITS)['content']['units']
+        values = random_values(3, seed=1)
+        self.assertEqual(Fraction(1), values[0])
+        self.assertEqual(4, len(values))
+
+        batch = conversion_batch(units, values)
+        # NullType: 1 pair, Length: 9 pairs, Temperature is skipped.
+        self.assertEqual(10 * 4, len(batch['srcs']))
+        self.assertNotIn('Temperature', batch['unit_types'])
+        errors = ulp_errors(convert(batch), batch['exact'])
+        self.assertEqual(40, len(errors))
+        # Two roundings, each relative to its own 14th digit.
+        self.assertTrue(all(e < 10.0 for e in errors))
+
+        # 1 Mile -> Feet is exactly 5280.
+        index = [
+            i for i, (src, dst) in enumerate(zip(batch['srcs'], batch['dsts']))
+            if (src, dst) == ('Mile', 'Feet')][0]
+        self.assertEqual(
+            decimal.Decimal(5280), to_decimals(convert(batch))[index])
+        self.assertEqual(0.0, errors[index])
+
+        output = io.StringIO()
+        print_report(batch, errors, 3, output)
+        report = output.getvalue()
+        self.assertIn('Length', report)
+        self.assertIn('Total: 40 conversions', report)
+        self.assertIn('Worst 3 conversions:', report)
@@ -0,0 +1,89 @@
+import io
+import unittest
+
+from fractions import Fraction
+
+from compileconst import ConstParser
+from compileconst import FloatExploder
+from compileconst import Lexer
+from compileconst import Validator
+
+CONSTANTS = """\
+Constants [
+  Constant 0 0
+]
+
+Page {page} [
+  Load {register} 0
+]
+"""
+
+
+class TestFloatExploder(unittest.TestCase):
+    def test_parse_value(self) -> None:
+        self.assertEqual(Fraction(12), FloatExploder.parse_value("12"))
+        self.assertEqual(Fraction(-1), FloatExploder.parse_value("-1"))
+        self.assertEqual(
+            Fraction(1, 10**10), FloatExploder.parse_value("1E-10"))
+        self.assertEqual(Fraction(2**40), FloatExploder.parse_value("2^40"))
+        self.assertEqual(
+            Fraction(1000000, 1609344), FloatExploder.parse_value("1/1.609344"))
+        with self.assertRaises(ValueError):
+            FloatExploder.parse_value("1/0")
+        with self.assertRaises(ValueError):
+            FloatExploder.parse_value("abc")
+
+    def test_explode_fraction(self) -> None:
+        self.assertEqual(
+            "$00, $80, $00, $00, $00, $00, $00, $00, $00",
+            self.explode("0"))
+        self.assertEqual(
+            "$80, $80, $10, $00, $00, $00, $00, $00, $00",
+            self.explode("-1"))
+        self.assertEqual(
+            "$00, $8C, $10, $99, $51, $16, $27, $77, $60",
+            self.explode("2^40"))
+        # Rounded, not truncated.
+        self.assertEqual(
+            "$00, $80, $31, $41, $59, $26, $53, $58, $98",
+            self.explode("3.14159265358979323846"))
+        self.assertEqual(
+            "$00, $80, $27, $18, $28, $18, $28, $45, $90",
+            self.explode("2.71828182845904523536"))
+        # Rounding carries into the exponent.
+        self.assertEqual(
+            "$00, $81, $10, $00, $00, $00, $00, $00, $00",
+            self.explode("9.999999999999951"))
+        self.assertEqual(
+            "$00, $E3, $99, $99, $99, $99, $99, $99, $99",
+            self.explode("9.9999999999999E99"))
+        with self.assertRaises(ValueError):
+            self.explode("1E100")
+
+    @staticmethod
+    def explode(value: str) -> str:
+        fraction = FloatExploder.parse_value(value)
+        value_bytes = FloatExploder.explode_fraction(fraction)
+        return FloatExploder.convert_to_db_string(value_bytes)
+
+
+class TestValidator(unittest.TestCase):
+    def test_registers(self) -> None:
+        self.validate(0, 'OP4')
+        self.validate(1, 'OP4')
+        self.validate(2, 'OP3')
+        # No move9ToOp4PageTwo, move9ToOp4PageFour, or memory3.asm.
+        with self.assertRaises(ValueError):
+            self.validate(2, 'OP4')
+        with self.assertRaises(ValueError):
+            self.validate(4, 'OP4')
+        with self.assertRaises(ValueError):
+            self.validate(3, 'OP1')
+        with self.assertRaises(ValueError):
+            self.validate(0, 'OP5')
+
+    @staticmethod
+    def validate(page: int, register: str) -> None:
+        text = CONSTANTS.format(page=page, register=register)
+        content = ConstParser(Lexer(io.StringIO(text))).parse()
+        Validator(content).validate()
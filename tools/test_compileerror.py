@@ -0,0 +1,65 @@
+import io
+import unittest
+
+from compileerror import CodeGenerator
+from compileerror import ErrorConfig
+from compileerror import ErrorParser
+from compileerror import StringPool
+from compileerror import Validator
+from compileerror import error_code_count
+
+ERRORS = """\
+# comment
+Default Unknown "Err: UNKNOWN" # not known
+Error 0 Ok "OK"
+Reserved 1 # placeholder
+Error 3 Stat "Err: Stat"
+Error 5 Cleared "Stack Cleared"
+Error 6 Cleared2 "Cleared"
+"""
+
+
+def parse(text: str) -> ErrorConfig:
+    config = ErrorParser(io.StringIO(text)).parse()
+    Validator(config).validate()
+    return config
+
+
+class TestCompileError(unittest.TestCase):
+    def test_parse(self) -> None:
+        config = parse(ERRORS)
+        self.assertEqual('Unknown', config['default']['name'])
+        self.assertEqual('not known', config['default']['comment'])
+        self.assertEqual(4, len(config['errors']))
+        self.assertEqual(7, error_code_count(config))
+
+    def test_duplicate(self) -> None:
+        with self.assertRaises(ValueError):
+            parse(ERRORS + 'Error 3 Other "Other"\n')
+        with self.assertRaises(ValueError):
+            parse(ERRORS + 'Error 7 Stat "Other"\n')
+        with self.assertRaises(ValueError):
+            parse(ERRORS + 'Reserved 3\n')
+
+    def test_pool(self) -> None:
+        pool = StringPool(parse(ERRORS))
+        pool.build()
+        self.assertEqual({'Cleared2': ('Cleared', 6)}, pool.aliases)
+        self.assertEqual(pool.unpooled_size() - 8, pool.pool_size())
+
+    def test_reserved(self) -> None:
+        config = parse(ERRORS + 'Reserved 9\n')
+        self.assertEqual(10, error_code_count(config))
+        pool = StringPool(config)
+        pool.build()
+        output = io.StringIO()
+        CodeGenerator('errors.txt', config, pool).generate(output)
+        code = output.getvalue()
+        self.assertIn(
+            'errorCodeOk equ 0\n'
+            'errorCode1 equ 1                         ; placeholder\n'
+            'errorCodeStat equ 3\n', code)
+        self.assertIn('errorCode9 equ 9\nerrorCodeCount equ 10', code)
+        self.assertIn('    .dw errorStrUnknown ; 1\n', code)
+        self.assertIn('    .dw errorStrUnknown ; 9\n', code)
+        self.assertNotIn('errorStr1:', code)
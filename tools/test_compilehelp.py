@@ -0,0 +1,85 @@
+import io
+import unittest
+
+from typing import List
+
+from compilehelp import BODY_LINES
+from compilehelp import Compressor
+from compilehelp import HelpParser
+from compilehelp import Layout
+from compilehelp import Page
+from compilehelp import Phrase
+from compilehelp import Token
+from compilehelp import explode_str
+from compilehelp import page_lines
+from compilehelp import text_size
+
+HELP = """\
+# comment
+Page First
+2ND QUIT: Quit
+2ND OFF: Off
+
+Page Second
+2ND LEFT: Begin of line
+2ND RIGHT: End of line
+"""
+
+
+def parse(text: str) -> List[Page]:
+    pages = HelpParser(io.StringIO(text)).parse()
+    Layout(pages).layout()
+    return pages
+
+
+def expand(tokens: List[Token], dictionary: List[Phrase]) -> List[Token]:
+    expanded: List[Token] = []
+    for kind, value in tokens:
+        if kind == 'd':
+            expanded.extend(dictionary[int(value)])
+        else:
+            expanded.append((kind, value))
+    return expanded
+
+
+class TestCompileHelp(unittest.TestCase):
+    def test_explode_str(self) -> None:
+        self.assertEqual(
+            [('c', 'a'), ('s', 'Shyphen'), ('c', 'b')],
+            explode_str('a<Shyphen>b'))
+        with self.assertRaises(ValueError):
+            explode_str('a<Shyphen')
+
+    def test_layout(self) -> None:
+        pages = parse(HELP)
+        self.assertEqual(2, len(pages))
+        self.assertEqual(2, len(pages[0]['lines']))
+        lines = page_lines(pages[1], 2, 2)
+        self.assertEqual(BODY_LINES + 1, len(lines))
+        self.assertEqual(
+            explode_str('<SlBrack>2/2<SrBrack> Any key to return.'),
+            lines[-1])
+
+    def test_wrap(self) -> None:
+        lines = Layout.wrap(explode_str('word ' * 30))
+        self.assertTrue(len(lines) > 1)
+        self.assertEqual(explode_str('word'), lines[0][:4])
+
+    def test_too_many_lines(self) -> None:
+        with self.assertRaises(ValueError):
+            parse("Page Title\n" + "line\n" * (BODY_LINES + 1))
+
+    def test_compress(self) -> None:
+        expected = [
+            page_lines(page, i, 2) for i, page in enumerate(parse(HELP), 1)
+        ]
+        pages = parse(HELP)
+        size = text_size(pages, [])
+        dictionary = Compressor(pages).compress()
+        self.assertTrue(len(dictionary) > 0)
+        self.assertTrue(text_size(pages, dictionary) < size)
+        for i, page in enumerate(pages, start=1):
+            self.assertEqual(
+                expected[i - 1],
+                [expand(line, dictionary) for line in page_lines(page, i, 2)]
+            )
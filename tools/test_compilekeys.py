@@ -0,0 +1,77 @@
+import io
+import unittest
+
+from compilekeys import KeyParser
+from compilekeys import LayoutSelector
+from compilekeys import Lexer
+from compilekeys import SymbolResolver
+from compilekeys import Validator
+
+KEY_TABLE = """\
+KeyTable testTable testTableSize [
+  Key k0 handleKey0 # comment
+  Key k1 handleKey1
+  Key kOnExit handleKeyExit
+  Key keyMenu1 handleKeyMenu1
+]
+"""
+
+INCLUDE = """\
+k0\t\t.EQU\t8Eh
+k1 .equ $8F
+kYequ equ 49 ; comment
+keyMenu1 equ kYequ
+kOnExit equ 0
+"""
+
+
+def parse(text: str) -> LayoutSelector:
+    table = KeyParser(Lexer(io.StringIO(text))).parse()
+    Validator(table).validate()
+    resolver = SymbolResolver()
+    resolver.read(io.StringIO(INCLUDE))
+    resolver.resolve_table(table)
+    return LayoutSelector(table)
+
+
+class TestCompileKeys(unittest.TestCase):
+    def test_parse_number(self) -> None:
+        self.assertEqual(12, SymbolResolver.parse_number('12'))
+        self.assertEqual(12, SymbolResolver.parse_number('0Ch'))
+        self.assertEqual(12, SymbolResolver.parse_number('$0C'))
+        self.assertEqual(12, SymbolResolver.parse_number('0x0c'))
+        self.assertEqual(12, SymbolResolver.parse_number('%1100'))
+        self.assertIsNone(SymbolResolver.parse_number('kYequ'))
+
+    def test_resolve(self) -> None:
+        selector = parse(KEY_TABLE)
+        codes = [b['code'] for b in selector.table['bindings']]
+        self.assertEqual([0x8E, 0x8F, 0, 49], codes)
+
+    def test_layout(self) -> None:
+        selector = parse(KEY_TABLE)
+        self.assertEqual(4, selector.worst_case('linear'))
+        self.assertEqual(3, selector.worst_case('sorted'))
+        self.assertEqual(1, selector.worst_case('direct'))
+        self.assertEqual(12, selector.size('sorted'))
+        self.assertEqual(2 * 0x90, selector.size('direct'))
+        self.assertEqual('sorted', selector.select('auto'))
+
+    def test_duplicate_key(self) -> None:
+        with self.assertRaises(ValueError):
+            parse(KEY_TABLE.replace('k1 ', 'k0 '))
+
+    def test_duplicate_code(self) -> None:
+        with self.assertRaises(ValueError):
+            parse(KEY_TABLE.replace('kOnExit', 'kYequ'))
+
+    def test_scenarios(self) -> None:
+        selector = parse(KEY_TABLE)
+        self.assertEqual(4, len(selector.scenarios('linear')))
+        decisions = LayoutSelector.binary_search_decisions([1, 2, 3, 4], 1)
+        self.assertEqual([False] * 3, decisions['ret nc'])
+        self.assertEqual(
+            [False, False, True],
+            decisions['jr z, dispatchHandlerSortedMatched'])
+        self.assertEqual(
+            [True, True], decisions['jr c, dispatchHandlerSortedLower'])
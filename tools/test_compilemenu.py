@@ -1,6 +1,20 @@
+import io
 import unittest
+from typing import List
 
+from compilemenu import CodeGenerator
+from compilemenu import Lexer
+from compilemenu import MenuParser
+from compilemenu import compile_menu
+from compilemenu import compile_menu_tree
+from compilemenu import parse_menu
+from compilemenu import NAME_INDEX_BLOCK_SIZE
+from compilemenu import NameIndex
+from compilemenu import RowMaskLayout
 from compilemenu import StringExploder
+from compilemenu import SymbolGenerator
+from compilemenu import Validator
+from compilekeys import SymbolResolver
 
 
 class TestStringExploder(unittest.TestCase):
@@ -20,3 +34,294 @@ class TestStringExploder(unittest.TestCase):
         self.assertEqual(
             ["Sdegree", "'F'"],
             StringExploder.explode_str("<Sdegree>F"))
+
+
+MENU = """\
+MenuConfig [
+  ItemName mNullName
+  ItemHandler mNullHandler
+  GroupHandler mGroupHandler
+]
+
+MenuGroup root mRoot [
+  MenuRow [
+    MenuGroup MATH mMath [
+      MenuRow [
+        MenuItem CUBE mCube
+      ]
+    ]
+    MenuItem * *
+    MenuItem HELP mHelp
+  ]
+  MenuRow [
+    MenuItemAlt DEG RAD mDeg
+    MenuGroup MODE mMode [
+      MenuRow [
+        MenuItem FIX mFix
+      ]
+    ]
+  ]
+]
+"""
+
+
+def row_mask_layout(text: str) -> RowMaskLayout:
+    config, root = MenuParser(Lexer(io.StringIO(text))).parse()
+    Validator(root).validate()
+    symbols = SymbolGenerator(root)
+    symbols.generate()
+    layout = RowMaskLayout(config, symbols)
+    layout.generate()
+    return layout
+
+
+class TestRowMaskLayout(unittest.TestCase):
+    def test_generate(self) -> None:
+        layout = row_mask_layout(MENU)
+        layout.verify()
+        # 3+3 blanks of mRoot, 4 of mMath, 4 of mMode.
+        self.assertEqual(14, layout.blank_count)
+        # mNull, mRoot, mMath, mHelp, mDeg, mMode, mCube, mFix
+        self.assertEqual(8, layout.id_counter)
+        self.assertEqual([(0b00101, 0), (0b00011, 2)], layout.row_masks[1])
+        self.assertEqual(2, layout.row_begin_ids[1])
+        self.assertEqual(2 + 4 + 2 * 2 + 2 * 2, layout.row_masks_size())
+
+    def test_menu_id_of_button(self) -> None:
+        layout = row_mask_layout(MENU)
+        self.assertEqual(2, layout.menu_id_of_button(1, 0, 0))  # mMath
+        self.assertEqual(0, layout.menu_id_of_button(1, 0, 1))  # blank
+        self.assertEqual(3, layout.menu_id_of_button(1, 0, 2))  # mHelp
+        self.assertEqual(5, layout.menu_id_of_button(1, 1, 1))  # mMode
+        self.assertEqual(0, layout.menu_id_of_button(1, 1, 4))  # blank
+        self.assertEqual(1, layout.row_index_of_child(1, 5))
+
+    def test_config(self) -> None:
+        with self.assertRaises(ValueError):
+            row_mask_layout(MENU.replace('mNullHandler', 'mBlankHandler'))
+
+
+def generate(text: str, alt_table: bool) -> str:
+    config, root = MenuParser(Lexer(io.StringIO(text))).parse()
+    Validator(root).validate()
+    symbols = SymbolGenerator(root)
+    symbols.generate()
+    StringExploder(root).explode()
+    output = io.StringIO()
+    CodeGenerator('menu.txt', symbols, config, root, None, alt_table) \
+        .generate(output)
+    return output.getvalue()
+
+
+class TestAltTable(unittest.TestCase):
+    def test_generate(self) -> None:
+        padded = generate(MENU, alt_table=False)
+        self.assertIn('.dw mDegNameSelector ; nameSelector', padded)
+        self.assertNotIn('mMenuAltTable', padded)
+
+        code = generate(MENU, alt_table=True)
+        nodes = code.split('mMenuAltTable:')[0]
+        self.assertNotIn('; nameSelector', nodes)
+        self.assertIn('mMenuAltTableCount equ 1', code)
+        self.assertIn('.dw mDegName+menuNameAltFlag ; name', code)
+        self.assertIn(
+            'mMenuAltTable:\n'
+            '    .dw mDegId ; id\n'
+            '    .dw mDegAltName ; altName\n'
+            '    .dw mDegNameSelector ; nameSelector\n',
+            code)
+
+
+def name_index(names: List[str]) -> NameIndex:
+    symbols = SymbolResolver()
+    symbols.read(io.StringIO("Sroot equ 10h\nSpercent equ 25h\n"))
+    return NameIndex([
+        (StringExploder.explode_str(name), id, f"m{id}")
+        for id, name in enumerate(names, start=1)
+    ], symbols)
+
+
+class TestNameIndex(unittest.TestCase):
+    def test_index(self) -> None:
+        names = [
+            'SIN', 'SINH', 'COS', 'ABS', 'ASIN', 'X<Sroot>', 'COS',
+            '<Spercent>',
+        ]
+        index = name_index(names)
+        index.verify()
+        self.assertEqual(['m7'], index.duplicates)
+        self.assertEqual(
+            [b'%', b'ABS', b'ASIN', b'COS', b'COS', b'SIN', b'SINH',
+             b'X\x10'],
+            [e['name'] for e in index.entries])
+        self.assertEqual(
+            [8, 4, 5, 3, 7, 1, 2, 6], [e['id'] for e in index.entries])
+        self.assertEqual(
+            [0, 0, 1, 0, 3, 0, 3, 0],
+            [e['prefix_len'] for e in index.entries])
+        self.assertEqual(
+            [1, 2, 2, 0, 0, 0, 4, 1],
+            [e['unique_len'] for e in index.entries])
+        self.assertEqual([3, 7], index.search(b'COS'))
+        self.assertEqual([6], index.search(b'X\x10'))
+        self.assertEqual([], index.search(b'TAN'))
+        self.assertEqual(5, index.complete(b'AS'))
+        self.assertEqual(0, index.complete(b'SIN'))
+        self.assertEqual(0, index.complete(b'CO'))
+        with self.assertRaises(ValueError):
+            name_index(['X<Sdegree>'])
+
+    def test_blocks(self) -> None:
+        names = [f"F{i:02}" for i in range(NAME_INDEX_BLOCK_SIZE * 3 + 1)]
+        # A repeated name across the boundary of the blocks.
+        last = names[NAME_INDEX_BLOCK_SIZE - 1]
+        names.append(last)
+        index = name_index(names)
+        index.verify()
+        self.assertEqual(4, index.block_count())
+        self.assertEqual(0, index.entries[NAME_INDEX_BLOCK_SIZE]['prefix_len'])
+        self.assertEqual(
+            [name.encode() for name in names[
+                NAME_INDEX_BLOCK_SIZE - 1:2 * NAME_INDEX_BLOCK_SIZE - 1]],
+            [name for name, _ in index.decode_block(1)])
+        self.assertEqual(
+            [NAME_INDEX_BLOCK_SIZE, len(names)], index.search(last.encode()))
+
+    def test_generate(self) -> None:
+        result = compile_menu(MENU, {'name_index': True})
+        self.assertEqual(4, result['stats']['name_index_entries'])
+        self.assertIn(
+            "mNameIndexBlock0:\n"
+            "    .db 0, 4, 'C', 'U', 'B', 'E' ; mCube\n"
+            "    .dw mCubeId\n",
+            result['asm'])
+
+
+class TestCompileMenu(unittest.TestCase):
+    def test_compile(self) -> None:
+        result = compile_menu(MENU, {'filename': 'menu.txt'})
+        self.assertEqual(generate(MENU, alt_table=False), result['asm'])
+        self.assertEqual(1, result['ids']['mRoot'])
+        self.assertEqual(4, result['ids']['mHelp'])
+        self.assertEqual(22, result['stats']['nodes'])
+        self.assertEqual(22 * 13, result['stats']['table_size'])
+        self.assertEqual('mNullName', result['config']['item_name'])
+
+    def test_options(self) -> None:
+        result = compile_menu(
+            MENU, {'layout': 'rowmask', 'alt_table': True})
+        self.assertEqual(8, result['stats']['nodes'])
+        self.assertEqual(8 * 11, result['stats']['table_size'])
+        self.assertEqual(14, result['stats']['blank_nodes'])
+        self.assertEqual(14 * 11, result['stats']['elided_size'])
+        self.assertEqual(1, result['stats']['alt_nodes'])
+        self.assertEqual(3, result['ids']['mHelp'])
+        self.assertNotIn('mBlank003', result['ids'])
+        rowmask = compile_menu(MENU, {'layout': 'rowmask'})
+        self.assertEqual(14 * 13, rowmask['stats']['elided_size'])
+        with self.assertRaises(ValueError):
+            compile_menu(MENU, {'layout': 'sparse'})
+        with self.assertRaises(ValueError):
+            compile_menu(MENU.replace('mHelp', 'mCube'))
+
+    def test_blob(self) -> None:
+        padded = compile_menu(MENU)
+        self.assertEqual(b'', padded['blob'])
+        result = compile_menu(MENU, {'blob': 'menu.bin'})
+        blob = result['blob']
+        self.assertEqual(blob[:6], b'\x00root\x00')
+        self.assertIn(b'DEG\x00RAD\x00', blob)
+        self.assertEqual(len(blob), result['stats']['blob_size'])
+        self.assertEqual(
+            result['stats']['names_pool_size'] + 1, len(blob))
+        code = result['asm']
+        self.assertIn('#import "menu.bin"', code)
+        self.assertIn('mRootName equ mNamesBlob+1', code)
+        self.assertNotIn('mRootName:', code)
+        # The nodes are identical to the default output.
+        self.assertEqual(
+            padded['asm'].split('; Pool of menu names')[0],
+            code.split('; Pool of menu names')[0])
+        with self.assertRaises(ValueError):
+            compile_menu(MENU.replace('HELP', 'H<Sdegree>'), {'blob': 'm.bin'})
+
+    def test_references(self) -> None:
+        result = compile_menu(MENU)
+        references = {
+            ref['symbol']: (ref['line'], ref['context'])
+            for ref in result['references']
+        }
+        self.assertEqual((1, 'MenuConfig'), references['mNullHandler'])
+        self.assertEqual((1, 'MenuConfig'), references['mGroupHandler'])
+        self.assertEqual((11, "Menu 'CUBE'"), references['mCubeHandler'])
+        self.assertEqual((18, "Menu 'DEG'"), references['mDegNameSelector'])
+        self.assertEqual(7, len(references))
+        # The alt table removes the nameSelector fields.
+        result = compile_menu(MENU, {'alt_table': True})
+        self.assertNotIn(
+            'mDegNameSelector', [ref['symbol'] for ref in result['references']])
+
+
+CONDITIONAL_MENU = """\
+MenuConfig [
+  ItemName mNullName
+  ItemHandler mNullHandler
+  GroupHandler mGroupHandler
+]
+
+MenuGroup root mRoot [
+  MenuRow [
+    MenuItem PI mPi
+    If !LEAN [
+      MenuGroup CFIT mCfit [
+        MenuRow [
+          MenuItem FIT mFit
+          If DEBUG [ MenuItem DBG mFitDebug ]
+        ]
+      ]
+    ]
+    MenuItem E mE
+  ]
+  If DEBUG [
+    MenuRow [
+      MenuItem DBG mDebug
+    ]
+  ]
+]
+"""
+
+
+class TestConditional(unittest.TestCase):
+    def test_variants(self) -> None:
+        config, root = parse_menu(CONDITIONAL_MENU)
+        default = compile_menu_tree(config, root)
+        lean = compile_menu_tree(config, root, {'defines': ['LEAN']})
+        debug = compile_menu_tree(config, root, {'defines': ['DEBUG']})
+        # mRoot, 5 nodes of its row, 5 nodes of mCfit
+        self.assertEqual(12, default['stats']['nodes'])
+        self.assertEqual(
+            ['mPi', 'mCfit', 'mE'],
+            [slot['label'] for slot in default['root']['rows'][0][:3]])
+        # The ids remain dense, mE moves into the slot of mCfit.
+        self.assertEqual(7, lean['stats']['nodes'])
+        self.assertEqual(3, lean['ids']['mE'])
+        self.assertNotIn('mCfit', lean['ids'])
+        self.assertEqual(17, debug['stats']['nodes'])
+        self.assertIn('mDebug', debug['ids'])
+        self.assertIn('mFitDebug', debug['ids'])
+        # The parsed tree is not modified by the compilations.
+        self.assertEqual(2, len(root['rows']))
+        self.assertEqual(['!LEAN'], root['rows'][0][1]['conditions'])
+        self.assertEqual(compile_menu(CONDITIONAL_MENU), default)
+
+    def test_errors(self) -> None:
+        with self.assertRaises(ValueError):
+            parse_menu(CONDITIONAL_MENU.replace('If DEBUG', 'If DE-BUG'))
+        with self.assertRaises(ValueError):
+            parse_menu(CONDITIONAL_MENU.replace('If !LEAN [', 'If !LEAN'))
+        # A MenuGroup whose rows are all pruned is invalid.
+        config, root = parse_menu(CONDITIONAL_MENU.replace(
+            'MenuItem FIT mFit', 'If FIT [ MenuItem FIT mFit ]'))
+        with self.assertRaises(ValueError):
+            compile_menu_tree(config, root)
+        compile_menu_tree(config, root, {'defines': ['FIT']})
@@ -0,0 +1,130 @@
+import unittest
+from fractions import Fraction
+
+from compileunit import FloatExploder
+from compileunit import compile_unit
+
+
+UNITS = """\
+UnitTypes [
+  UnitType NullType nulltype NullUnit
+  UnitType Length length Meter
+]
+
+Units [
+  Unit NullUnit nullunit NullType 1
+  Unit Meter meter Length 1.0
+  Unit Feet feet Length 0.3048
+]
+"""
+
+
+class TestCompileUnit(unittest.TestCase):
+    def test_compile(self) -> None:
+        result = compile_unit(UNITS, {'filename': 'units.txt'})
+        self.assertIn('generated from units.txt', result['asm'])
+        self.assertEqual(2, result['unit_ids']['Feet'])
+        self.assertEqual(1, result['unit_type_ids']['Length'])
+        self.assertEqual(3, result['stats']['units'])
+        self.assertEqual(2, result['stats']['unit_types'])
+        self.assertEqual(3 * 12 + 2 * 3, result['stats']['table_size'])
+
+    def test_options(self) -> None:
+        aos = compile_unit(UNITS)
+        soa = compile_unit(UNITS, {'layout': 'soa'})
+        self.assertNotIn('UNIT_LAYOUT_SOA', aos['asm'])
+        self.assertIn('UNIT_LAYOUT_SOA', soa['asm'])
+        with self.assertRaises(ValueError):
+            compile_unit(UNITS, {'pad_scale': True})
+        with self.assertRaises(ValueError):
+            compile_unit(UNITS.replace('Feet feet', 'Meter feet'))
+
+    def test_soa(self) -> None:
+        code = compile_unit(UNITS, {'layout': 'soa'})['asm']
+        self.assertIn("""\
+unitTypeBaseUnitIdTable:
+    .db unitNullUnitId ; NullType
+    .db unitMeterId ; Length
+""", code)
+        self.assertIn("""\
+unitNameTable:
+    .dw unitNullUnitName
+    .dw unitMeterName
+    .dw unitFeetName
+
+unitTypeIdTable:
+    .db unitTypeNullTypeId ; NullUnit
+    .db unitTypeLengthId ; Meter
+    .db unitTypeLengthId ; Feet
+
+unitScaleTable:
+    .db $00, $80, $10, $00, $00, $00, $00, $00, $00 ; NullUnit=1
+""", code)
+        self.assertIn('unitScaleStride equ 9 ', code)
+        self.assertNotIn('UNIT_SCALE_STRIDE_16', code)
+        self.assertNotIn('unitTypeNameStride', code)
+
+    def test_pad_scale(self) -> None:
+        result = compile_unit(
+            UNITS, {'layout': 'soa', 'pad_scale': True, 'blob': 'units.bin'})
+        code = result['asm']
+        self.assertIn('#define UNIT_SCALE_STRIDE_16', code)
+        self.assertIn('unitScaleStride equ 16 ', code)
+        self.assertIn('unitScaleTable equ unitDefBlob+16', code)
+        self.assertIn('unitNullUnitName equ unitDefBlob+64', code)
+        blob = result['blob']
+        scales = [bytes.fromhex('008010'), bytes.fromhex('008010'),
+                  bytes.fromhex('007f3048')]
+        for id, scale in enumerate(scales):
+            offset = 16 + 16 * id
+            self.assertEqual(scale.ljust(16, b'\x00'),
+                             blob[offset:offset + 16])
+
+    def test_blob(self) -> None:
+        result = compile_unit(UNITS, {'layout': 'soa', 'blob': 'units.bin'})
+        blob = result['blob']
+        self.assertEqual(b'nulltype\x00length\x00', blob[:16])
+        self.assertEqual(16 + 3 * 9 + len(b'nullunit\x00meter\x00feet\x00'),
+                         len(blob))
+        code = result['asm']
+        self.assertIn('unitScaleTable equ unitDefBlob+16', code)
+        self.assertIn('unitFeetName equ unitDefBlob+58', code)
+        self.assertIn('#import "units.bin"', code)
+        self.assertNotIn('.db $', code)
+
+
+class TestFloatExploder(unittest.TestCase):
+    def test_evaluate(self) -> None:
+        exploder = FloatExploder({'units': []})
+        exploder.scales['Foot'] = Fraction('0.3048')
+        self.assertEqual(Fraction(1, 3), exploder.evaluate('1/3'))
+        self.assertEqual(Fraction('1e-3'), exploder.evaluate('1e-3'))
+        self.assertEqual(
+            Fraction('0.3048') ** 2 * 6, exploder.evaluate('Foot^2*6'))
+        self.assertEqual(Fraction(7, 2), exploder.evaluate('(3+4)/2'))
+        self.assertEqual(Fraction(1, 4), exploder.evaluate('2^-2'))
+        self.assertEqual(Fraction(-2), exploder.evaluate('-1-1'))
+        for invalid in ['Inch*12', '1/0', '(1', '2^x', '1 2', '1)']:
+            with self.assertRaises(ValueError):
+                exploder.evaluate(invalid)
+
+    def test_round_once(self) -> None:
+        units = UNITS.replace(
+            '0.3048\n',
+            '0.3048\n  Unit FootPound ftlb Length Feet*0.45359237*9.80665\n')
+        result = compile_unit(units)
+        unit = result['content']['units_by_label']['FootPound']
+        # 1.3558179483314004, rounded once to 14 digits
+        self.assertEqual(
+            '$00, $80, $13, $55, $81, $79, $48, $33, $14',
+            unit['scale_db_string'])
+        # 30856775814913673 is rounded up, not truncated
+        result = compile_unit(UNITS.replace('0.3048', '30856775814913673'))
+        unit = result['content']['units_by_label']['Feet']
+        self.assertEqual(
+            '$00, $90, $30, $85, $67, $75, $81, $49, $14',
+            unit['scale_db_string'])
+        with self.assertRaises(ValueError):
+            compile_unit(UNITS.replace('0.3048', 'Yard*3'))
+        with self.assertRaises(ValueError):
+            compile_unit(UNITS.replace('0.3048', '0'))
@@ -0,0 +1,112 @@
+import io
+import unittest
+
+from deadcode import CallGraph
+from deadcode import key_roots
+from deadcode import print_report
+
+
+SOURCE = """\
+mFooHandler:
+    call fooHelper
+    ret
+mBarHandler:
+mBazHandler:
+    call barHelper
+    jr barDone
+barDone:
+    ret
+fooHelper:
+    ld hl, fooTable
+    bcall(_SharedRoutine)
+    ret
+fooTable:
+    .dw 1, 2
+barHelper:
+    jr nc, barHelperSkip
+    inc a
+barHelperSkip:
+    ret
+#ifdef USE_EXTRA
+mExtraHandler:
+    ret
+#endif
+"""
+
+OTHER = """\
+    ld hl, cGetHandler ; mBarHandler in a comment
+    bcall(_SharedRoutine)
+"""
+
+OTHER_SOURCE = """\
+SharedRoutine:
+    ret
+cGetHandler:
+    ret
+"""
+
+
+def graph() -> CallGraph:
+    g = CallGraph({'USE_EXTRA'})
+    g.add_file('foomenuhandlers.asm', io.StringIO(SOURCE))
+    g.add_file('other.asm', io.StringIO(OTHER_SOURCE))
+    return g
+
+
+class TestDeadCode(unittest.TestCase):
+    def test_blocks(self) -> None:
+        g = graph()
+        block = g.blocks['mBarHandler']
+        self.assertEqual(['mBarHandler', 'mBazHandler'], block['labels'])
+        self.assertEqual(4, block['line'])
+        self.assertEqual(5, block['size'])
+        self.assertEqual({'barHelper', 'barDone'}, block['refs'])
+        self.assertIsNone(block['next'])
+        self.assertEqual('mBarHandler', g.owners['mBazHandler'])
+        self.assertEqual(
+            {'hl', 'fooTable', 'SharedRoutine'}, g.blocks['fooHelper']['refs'])
+        self.assertEqual(4, g.blocks['fooTable']['size'])
+        self.assertIsNone(g.blocks['fooTable']['next'])
+        self.assertEqual('barHelperSkip', g.blocks['barHelper']['next'])
+
+    def test_mentioned_labels(self) -> None:
+        self.assertEqual(
+            {'cGetHandler', 'SharedRoutine'},
+            graph().mentioned_labels(io.StringIO(OTHER)))
+
+    def test_find_dead(self) -> None:
+        g = graph()
+        routines = g.find_dead(['mFooHandler'])
+        self.assertEqual(
+            [
+                ('mBarHandler', 'handler', 5),
+                ('barDone', 'helper', 1),
+                ('barHelper', 'helper', 4),
+                ('mExtraHandler', 'handler', 1),
+                ('cGetHandler', 'handler', 1),
+            ],
+            [(r['labels'][0], r['kind'], r['size']) for r in routines])
+
+        g = graph()
+        routines = g.find_dead(['mBazHandler', 'mFooHandler', 'cGetHandler'])
+        self.assertEqual(['mExtraHandler'], [r['labels'][0] for r in routines])
+
+    def test_print_report(self) -> None:
+        output = io.StringIO()
+        print_report(
+            graph().find_dead(['mFooHandler', 'mBarHandler', 'cGetHandler']),
+            ['foomenuhandlers.asm', 'other.asm'],
+            output)
+        self.assertEqual(
+            "foomenuhandlers.asm: 1 bytes\n"
+            "  foomenuhandlers.asm:22: mExtraHandler: handler, 1 bytes\n"
+            "Total: 1 unreachable routines, 1 bytes\n",
+            output.getvalue())
+
+    def test_key_roots(self) -> None:
+        table = io.StringIO(
+            "KeyTable keyTable keyTableSize [\n"
+            "  Key k0 handleKey0\n"
+            "  Key kEnter handleKeyEnter # comment\n"
+            "]\n")
+        self.assertEqual(['handleKey0', 'handleKeyEnter'], key_roots(table))
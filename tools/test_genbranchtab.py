@@ -0,0 +1,157 @@
+import io
+import os
+import tempfile
+import unittest
+from typing import Dict
+from typing import List
+
+from genbranchtab import CodeGenerator
+from genbranchtab import Entry
+from genbranchtab import IncludeScanner
+from genbranchtab import SourceScanner
+from genbranchtab import print_report
+from genbranchtab import read_previous_entries
+
+MAIN = """\
+defpage(0, "RPN83P")
+#include "branchtab.asm"
+#include "main.asm"
+defpage(1)
+#include "getkey1.asm"
+#ifdef DEBUG
+#include "debug1.asm"
+#endif
+#include "vars1.asm"
+"""
+
+FILES = {
+    'branchtab.asm': """\
+_StaleLabel:
+_Stale equ _StaleLabel-branchTableBase
+    .dw Stale
+    .db 1
+""",
+    'main.asm': """\
+main:
+    bcall(_InitVars) ; comment bcall(_NotCalled)
+    bcall(_GetKey)
+    bcall(_ChkFindSym) ; TI-OS routine
+    ret
+""",
+    'getkey1.asm': """\
+GetKey:
+    ret
+NotCalled:
+    ret
+""",
+    'debug1.asm': """\
+DebugOP1:
+    ret
+debugHelper:
+    ret
+DebugHL:
+    ret
+""",
+    'vars1.asm': """\
+InitVars:
+    bcall(_GetKey)
+    ret
+Stale:
+    ret
+""",
+}
+
+
+def find_entries(files: Dict[str, str]) -> List[Entry]:
+    with tempfile.TemporaryDirectory() as srcdir:
+        for name, text in files.items():
+            with open(os.path.join(srcdir, name), 'w') as file:
+                file.write(text)
+        sources = IncludeScanner(io.StringIO(MAIN)).scan()
+        scanner = SourceScanner(srcdir, 'branchtab.asm')
+        for source in sources:
+            scanner.scan(source)
+        return scanner.find_entries(sources)
+
+
+def generate(entries: List[Entry]) -> str:
+    output = io.StringIO()
+    CodeGenerator('rpn83p.asm', entries).generate(output)
+    return output.getvalue()
+
+
+class TestIncludeScanner(unittest.TestCase):
+    def test_scan(self) -> None:
+        sources = IncludeScanner(io.StringIO(MAIN)).scan()
+        self.assertEqual(
+            [
+                ('branchtab.asm', 0, ''),
+                ('main.asm', 0, ''),
+                ('getkey1.asm', 1, ''),
+                ('debug1.asm', 1, '#ifdef DEBUG'),
+                ('vars1.asm', 1, ''),
+            ],
+            [(s['filename'], s['page'], s['condition']) for s in sources],
+        )
+
+
+class TestBranchTable(unittest.TestCase):
+    def test_entries(self) -> None:
+        entries = find_entries(FILES)
+        # NotCalled and Stale have no bcall() site, the bcall() of the
+        # previous branch table and of the comments are ignored.
+        self.assertEqual(
+            [
+                ('GetKey', 'getkey1.asm', ''),
+                ('DebugOP1', 'debug1.asm', '#ifdef DEBUG'),
+                ('DebugHL', 'debug1.asm', '#ifdef DEBUG'),
+                ('InitVars', 'vars1.asm', ''),
+            ],
+            [(e['name'], e['filename'], e['condition']) for e in entries])
+
+        with self.assertRaises(ValueError):
+            find_entries(dict(FILES, **{'debug1.asm': "GetKey:\n    ret\n"}))
+
+    def test_generate(self) -> None:
+        code = generate(find_entries(FILES))
+        # The conditional entries are grouped inside a single '#ifdef'.
+        self.assertEqual(1, code.count('#ifdef DEBUG'))
+        self.assertEqual(1, code.count('#endif'))
+        debug = code[code.index('#ifdef DEBUG'):code.index('#endif')]
+        self.assertIn('_DebugOP1Label:', debug)
+        self.assertIn('_DebugHLLabel:', debug)
+        self.assertNotIn('_InitVarsLabel:', debug)
+        self.assertIn("""\
+_GetKeyLabel:
+_GetKey equ _GetKeyLabel-branchTableBase
+    .dw GetKey
+    .db 1
+""", code)
+
+        # The output is stable, and has 3 bytes per entry.
+        self.assertEqual(code, generate(find_entries(FILES)))
+        self.assertEqual(
+            ['GetKey', 'DebugOP1', 'DebugHL', 'InitVars'],
+            read_previous_entries(io.StringIO(code)))
+        self.assertEqual(4, code.count('    .dw '))
+        self.assertEqual(4, code.count('    .db '))
+
+    def test_report(self) -> None:
+        previous = read_previous_entries(io.StringIO(FILES['branchtab.asm']))
+        self.assertEqual(['Stale'], previous)
+        entries = find_entries(FILES)
+        with self.assertLogs(level='INFO') as logs:
+            print_report(previous, entries[:1])
+        self.assertEqual(
+            [
+                'INFO:root:  Dropped _Stale: no bcall() site',
+                'INFO:root:  Added _GetKey',
+                'INFO:root:  Entries: 1 -> 1; Flash Page 0 reclaimed: '
+                '0 bytes',
+            ],
+            logs.output)
+        with self.assertLogs(level='INFO') as logs:
+            print_report(['GetKey', 'Stale', 'NotCalled'], entries[:1])
+        self.assertIn(
+            'INFO:root:  Entries: 3 -> 1; Flash Page 0 reclaimed: 6 bytes',
+            logs.output)
@@ -0,0 +1,32 @@
+import unittest
+
+from gencalendar import DAYS_BEFORE_MONTH_PRIME
+from gencalendar import DAYS_PER_400_YEARS
+from gencalendar import INTERNAL_EPOCH_OFFSET
+from gencalendar import day_of_week_model
+from gencalendar import days_before_month
+from gencalendar import epoch_days_model
+from gencalendar import verify
+
+
+class TestGenCalendar(unittest.TestCase):
+    def test_constants(self) -> None:
+        self.assertEqual(146097, DAYS_PER_400_YEARS)
+        self.assertEqual(730425, INTERNAL_EPOCH_OFFSET)
+        self.assertEqual(
+            [(153 * mp + 2) // 5 for mp in range(12)],
+            DAYS_BEFORE_MONTH_PRIME)
+
+    def test_days_before_month(self) -> None:
+        self.assertEqual(59, days_before_month(leap=False)[2])
+        self.assertEqual(60, days_before_month(leap=True)[2])
+        self.assertEqual(366, days_before_month(leap=True)[12])
+
+    def test_models(self) -> None:
+        self.assertEqual(0, epoch_days_model(2000, 1, 1))
+        self.assertEqual(6, day_of_week_model(2000, 1, 1))  # Sat
+        self.assertEqual(1, day_of_week_model(1, 1, 1))  # Mon
+
+    def test_verify(self) -> None:
+        for first, last in [(1, 2), (1899, 1901), (2399, 2401), (9998, 9999)]:
+            self.assertTrue(verify(first, last) > 0)
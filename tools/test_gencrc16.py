@@ -0,0 +1,32 @@
+import unittest
+
+from gencrc16 import CRC_CHECK
+from gencrc16 import CRC_CHECK_INPUT
+from gencrc16 import crc16_bitwise
+from gencrc16 import crc16_table16
+from gencrc16 import crc16_table256
+from gencrc16 import generate_table16
+from gencrc16 import generate_table256
+
+
+class TestCrc16(unittest.TestCase):
+    def test_check_value(self) -> None:
+        self.assertEqual(CRC_CHECK, crc16_bitwise(CRC_CHECK_INPUT))
+        self.assertEqual(
+            CRC_CHECK,
+            crc16_table256(generate_table256(), CRC_CHECK_INPUT))
+        self.assertEqual(
+            CRC_CHECK,
+            crc16_table16(generate_table16(), CRC_CHECK_INPUT))
+
+    def test_empty(self) -> None:
+        self.assertEqual(0x1d0f, crc16_bitwise(b""))
+        self.assertEqual(0x1d0f, crc16_table256(generate_table256(), b""))
+
+    def test_tables(self) -> None:
+        table256 = generate_table256()
+        table16 = generate_table16()
+        self.assertEqual(256, len(table256))
+        self.assertEqual(16, len(table16))
+        self.assertEqual(0x1021, table256[1])
+        self.assertEqual(table16, table256[0:16])
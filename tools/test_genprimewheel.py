@@ -0,0 +1,28 @@
+import unittest
+
+from genprimewheel import WHEEL_PRIMES
+from genprimewheel import prime_factor_wheel
+from genprimewheel import smallest_prime_factor
+from genprimewheel import wheel_increments
+
+
+class TestPrimeWheel(unittest.TestCase):
+    def test_increments(self) -> None:
+        self.assertEqual((5, [2, 4]), wheel_increments([2, 3]))
+        self.assertEqual(
+            (7, [4, 2, 4, 2, 4, 6, 2, 6]), wheel_increments([2, 3, 5]))
+        first, increments = wheel_increments([2, 3, 5, 7])
+        self.assertEqual(11, first)
+        self.assertEqual(48, len(increments))
+        self.assertEqual(210, sum(increments))
+
+    def test_prime_factor(self) -> None:
+        for primes in WHEEL_PRIMES.values():
+            for x in range(2, 1000):
+                self.assertEqual(
+                    smallest_prime_factor(x),
+                    prime_factor_wheel(x, primes)[0])
+            # Candidate wraps around to 1 after 65535.
+            self.assertEqual(1, prime_factor_wheel(4294967291, primes)[0])
+            self.assertEqual(
+                65521, prime_factor_wheel(65521 * 65521, primes)[0])
@@ -0,0 +1,70 @@
+import io
+import struct
+import unittest
+
+from compilemenu import compile_menu
+from menuprofile import check_signature
+from menuprofile import decode_profile
+from menuprofile import encode_profile
+from menuprofile import print_report
+from menuprofile import rank
+from menuprofile import read_8xv
+from test_compilemenu import MENU
+
+
+def make_8xv(name: str, data: bytes) -> bytes:
+    """Wrap the AppVar data into a .8xv file."""
+    var_data = struct.pack('<H', len(data)) + data
+    section = struct.pack(
+        '<HHB8sBBH', 13, len(var_data), 0x15, name.encode(), 0, 0,
+        len(var_data)) + var_data
+    header = b'**TI83F*\x1a\x0a\x00' + bytes(42) \
+        + struct.pack('<H', len(section))
+    return header + section + struct.pack('<H', sum(section) & 0xffff)
+
+
+class TestMenuProfile(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        data = encode_profile(0x1234, [0, 5, 65535])
+        profile = decode_profile(data)
+        self.assertEqual(0x1234, profile['signature'])
+        self.assertEqual([0, 5, 65535], profile['counters'])
+        self.assertTrue(profile['crc_valid'])
+        corrupted = data[:-1] + b'\x01'
+        self.assertFalse(decode_profile(corrupted)['crc_valid'])
+        with self.assertRaises(ValueError):
+            decode_profile(data[:-2])
+
+    def test_read_8xv(self) -> None:
+        data = encode_profile(0x1234, [1, 2])
+        name, content = read_8xv(make_8xv('RPN83PRF', data))
+        self.assertEqual('RPN83PRF', name)
+        self.assertEqual(data, content)
+
+    def test_rank(self) -> None:
+        result = compile_menu(MENU, {'layout': 'rowmask', 'profile': True})
+        ids = result['ids']
+        counters = [0] * len(result['labels'])
+        counters[ids['mHelp']] = 7
+        counters[ids['mMath']] = 2
+        counters[ids['mCube']] = 7
+        profile = decode_profile(
+            encode_profile(result['stats']['profile_signature'], counters))
+        check_signature(profile, result)
+        ranked = rank(profile, result)
+        self.assertEqual(
+            ['mHelp', 'mCube', 'mMath'],
+            [node['label'] for node in ranked[:3]])
+        self.assertTrue(ranked[2]['group'])
+        output = io.StringIO()
+        print_report(ranked, 2, output)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(
+            'Total 16 dispatches, 2 MenuItems never used', lines[0])
+        self.assertEqual(4, len(lines))
+        self.assertIn('mCube (CUBE)', lines[3])
+
+        # The padded layout has a different signature.
+        padded = compile_menu(MENU)
+        with self.assertRaises(ValueError):
+            check_signature(profile, padded)
@@ -0,0 +1,75 @@
+import io
+import unittest
+
+from menusim import MenuSimulator
+from menusim import load_model
+
+MENU = """\
+MenuConfig [
+  ItemName mNullName
+  ItemHandler mNullHandler
+  GroupHandler mGroupHandler
+]
+
+MenuGroup root mRoot [
+  MenuRow [
+    MenuGroup MATH mMath [
+      MenuRow [
+        MenuItem CUBE mCube
+      ]
+      MenuRow [
+        MenuItem ABS mAbs
+      ]
+    ]
+    MenuItem HELP mHelp
+  ]
+  MenuRow [
+    MenuGroup MODE mMode [
+      MenuRow [
+        MenuItem FIX mFix
+      ]
+    ]
+  ]
+]
+"""
+
+
+def simulator() -> MenuSimulator:
+    return MenuSimulator(load_model(io.StringIO(MENU)))
+
+
+def replay(sim: MenuSimulator, keys: str) -> str:
+    state = sim.initial_state()
+    for key in keys.split():
+        state, _ = sim.step(state, key)
+    return sim.format_state(state)
+
+
+class TestMenuSim(unittest.TestCase):
+    def test_navigation(self) -> None:
+        sim = simulator()
+        self.assertEqual('mMath[1]', replay(sim, 'MENU1 DOWN'))
+        self.assertEqual('mMath[1]', replay(sim, 'MENU1 UP'))
+        self.assertEqual('mRoot[0]', replay(sim, 'MENU1 EXIT'))
+        self.assertEqual('mRoot[1]', replay(sim, 'DOWN MENU1 EXIT'))
+        self.assertEqual('mRoot[0]', replay(sim, 'DOWN EXIT'))
+        state, handler = sim.step(sim.initial_state(), 'MENU2')
+        self.assertEqual('mHelpHandler', handler)
+        self.assertEqual(sim.initial_state(), state)
+
+    def test_jump_back(self) -> None:
+        sim = simulator()
+        self.assertEqual(
+            'mMode[0] (jumpBack mMath[1])', replay(sim, 'MENU1 DOWN MODE'))
+        self.assertEqual('mMath[1]', replay(sim, 'MENU1 DOWN MODE EXIT'))
+        self.assertEqual('mRoot[0]', replay(sim, 'MENU1 DOWN MODE MATH'))
+
+    def test_check(self) -> None:
+        sim = simulator()
+        report = sim.check()
+        self.assertEqual([], report['errors'])
+        self.assertTrue(report['states'] > 4)
+        report = sim.check({'mCubeHandler', 'mGroupHandler'})
+        self.assertTrue(
+            any("undefined handler 'mHelpHandler'" in e
+                for e in report['errors']))
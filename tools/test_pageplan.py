@@ -0,0 +1,170 @@
+import io
+import unittest
+
+from pageplan import PagePlanner
+from pageplan import PlacementModel
+from pageplan import is_included
+from pageplan import parse_pins
+
+MAIN = """\
+main:
+    bcall(_HotRoutine)
+    bcall(_HotRoutine)
+    bcall(_ColdRoutine)
+    ret
+"""
+
+HOT = """\
+HotRoutine:
+    ld hl, hotTable
+    call ColdRoutine
+    ret
+"""
+
+HOT_TABLE = """\
+hotTable:
+    .db 1, 2, 3, 4, 5, 6, 7, 8
+"""
+
+COLD = """\
+ColdRoutine:
+    bcall(_ChkFindSym)
+    ret
+"""
+
+
+# print1.asm is wanted on page 0 by main.asm, but its page-local eVPutS()
+# receives a pointer into the flash page of help1.asm.
+PRINT = """\
+PutMessage:
+    ret
+eVPutS:
+    ld a, (hl)
+    ret
+"""
+
+HELP = """\
+ShowHelp:
+    ld hl, helpPages
+    call eVPutS
+    ret
+"""
+
+HELP_PAGES = """\
+helpPages:
+    .db "HELP", 0
+"""
+
+
+def model() -> PlacementModel:
+    m = PlacementModel()
+    m.add_file('main.asm', 0, io.StringIO(MAIN))
+    m.add_file('branchtab.asm', 0, io.StringIO("    .dw HotRoutine\n"))
+    m.add_file('hot1.asm', 1, io.StringIO(HOT))
+    m.add_file('hottable1.asm', 1, io.StringIO(HOT_TABLE))
+    m.add_file('cold1.asm', 1, io.StringIO(COLD))
+    m.link()
+    return m
+
+
+class TestPagePlan(unittest.TestCase):
+    def test_model(self) -> None:
+        m = model()
+        self.assertEqual(
+            ['main.asm', 'hot1.asm', 'hottable1.asm', 'cold1.asm'], m.files)
+        self.assertEqual(
+            {'main.asm': 10, 'hot1.asm': 7, 'hottable1.asm': 8,
+             'cold1.asm': 4},
+            m.sizes)
+        self.assertEqual(
+            [('main.asm', 'HotRoutine', True),
+             ('main.asm', 'HotRoutine', True),
+             ('main.asm', 'ColdRoutine', True),
+             ('hot1.asm', 'ColdRoutine', False)],
+            [(s['caller'], s['target'], s['bcall']) for s in m.sites])
+        self.assertEqual({('hot1.asm', 'hottable1.asm')}, m.data_links)
+
+    def test_profile(self) -> None:
+        m = model()
+        m.set_profile({'main': 10})
+        self.assertEqual([11, 11, 11, 11], [s['weight'] for s in m.sites])
+
+    def test_listing_sizes(self) -> None:
+        m = model()
+        m.set_listing_sizes(io.StringIO(
+            "    1 01:4000 -  -  -  -  HotRoutine:\n"
+            "    2 01:4000 21 00 40 -  \tld hl, hotTable\n"))
+        self.assertEqual(3, m.sizes['hot1.asm'])
+        self.assertEqual(0, m.sizes['main.asm'])
+
+    def test_optimize(self) -> None:
+        m = model()
+        planner = PagePlanner(m, {'main.asm': 0}, 16384)
+        self.assertEqual(
+            {'main.asm': ['main.asm'],
+             'hot1.asm': ['hot1.asm', 'hottable1.asm'],
+             'cold1.asm': ['cold1.asm']},
+            planner.groups)
+        current = planner.evaluate(m.pages)
+        self.assertEqual(3, current['sites'])
+        self.assertEqual(2, current['entries'])
+        self.assertEqual(10 + 132 + 2 * 3, current['loads'][0])
+
+        proposed = planner.optimize()
+        self.assertEqual(
+            {'main.asm': 0, 'hot1.asm': 0, 'hottable1.asm': 0,
+             'cold1.asm': 0},
+            proposed)
+        self.assertEqual(0, planner.evaluate(proposed)['sites'])
+
+        # No room left on page 0.
+        planner = PagePlanner(m, {'main.asm': 0}, 10 + 132 + 2 * 3)
+        self.assertEqual(m.pages, planner.optimize())
+
+    def test_pins(self) -> None:
+        self.assertEqual(
+            {'main.asm': 0, 'cold*.asm': 1},
+            parse_pins(['main.asm'], ['cold*.asm=1']))
+        with self.assertRaises(ValueError):
+            parse_pins([], ['cold1.asm'])
+        planner = PagePlanner(model(), {'main.asm': 0, 'hot*.asm': 1}, 16384)
+        self.assertEqual(1, planner.optimize()['hottable1.asm'])
+
+    def test_page_local(self) -> None:
+        m = PlacementModel()
+        m.add_file('main.asm', 0, io.StringIO(
+            "main:\n" + "    bcall(_PutMessage)\n    bcall(_ShowHelp)\n" * 4))
+        m.add_file('print1.asm', 1, io.StringIO(PRINT))
+        m.add_file('help1.asm', 1, io.StringIO(HELP))
+        m.add_file('helpdef1.asm', 1, io.StringIO(HELP_PAGES))
+        m.link()
+        self.assertEqual({'print1.asm'}, m.page_local)
+        self.assertEqual(
+            {('help1.asm', 'print1.asm'), ('help1.asm', 'helpdef1.asm')},
+            m.data_links)
+
+        planner = PagePlanner(m, {'main.asm': 0}, 16384)
+        self.assertEqual(
+            {'print1.asm': 1}, {
+                f: page for f, page in planner.pinned.items()
+                if f != 'main.asm'})
+        proposed = planner.optimize()
+        self.assertEqual(m.pages, proposed)
+
+        # Without the call to eVPutS(), everything moves to page 0.
+        m = PlacementModel()
+        m.add_file('main.asm', 0, io.StringIO(
+            "main:\n" + "    bcall(_PutMessage)\n    bcall(_ShowHelp)\n" * 4))
+        m.add_file('print1.asm', 1, io.StringIO(PRINT))
+        m.add_file('help1.asm', 1, io.StringIO(
+            HELP.replace('call eVPutS', 'bcall(_PutMessage)')))
+        m.add_file('helpdef1.asm', 1, io.StringIO(HELP_PAGES))
+        m.link()
+        self.assertEqual(set(), m.page_local)
+        proposed = PagePlanner(m, {'main.asm': 0}, 16384).optimize()
+        self.assertEqual({0}, set(proposed.values()))
+
+    def test_is_included(self) -> None:
+        self.assertTrue(is_included('', []))
+        self.assertTrue(is_included('#ifdef DEBUG', ['DEBUG']))
+        self.assertFalse(is_included('#ifdef DEBUG', []))
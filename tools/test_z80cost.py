@@ -0,0 +1,121 @@
+import unittest
+
+from typing import Optional
+from typing import Set
+
+from z80cost import Program
+from z80cost import linear_decisions
+from z80cost import lookup_cost
+from z80cost import repeat_decisions
+
+SOURCE = """\
+; comment
+findNodeIX:
+    call calcOffset ; HL=offset
+    ex de, hl
+    ld ix, table
+    add ix, de
+    ret
+calcOffset:
+#ifdef STRIDE_2
+    add hl, hl
+#else
+    ld e, l
+    ld d, h
+    add hl, hl
+    add hl, de
+#endif
+    ret
+
+dispatch:
+    cp a, (hl)
+    inc hl
+    jr z, dispatchMatched
+    inc hl
+    inc hl
+    djnz dispatch
+    ret
+dispatchMatched:
+    ld e, (hl)
+    jp jumpDE
+
+copy:
+    ld bc, 9
+    ldir
+    ret
+"""
+
+
+def program(defines: Optional[Set[str]] = None) -> Program:
+    p = Program(defines)
+    p.read_text(SOURCE)
+    return p
+
+
+class TestZ80Cost(unittest.TestCase):
+    def test_parse(self) -> None:
+        p = program()
+        instruction = p.instructions[p.labels['dispatch']]
+        self.assertEqual('cp (hl)', instruction['text'])
+        self.assertEqual('cp (hl)', instruction['form'])
+        self.assertEqual(7, instruction['cycles'])
+
+    def test_straight_line(self) -> None:
+        trace = program().trace('findNodeIX', {})
+        self.assertEqual(17 + 4 + 4 + 11 + 11 + 10 + 4 + 14 + 15 + 10,
+                         trace['cycles'])
+        trace = program({'STRIDE_2'}).trace('findNodeIX', {})
+        self.assertEqual(17 + 11 + 10 + 4 + 14 + 15 + 10, trace['cycles'])
+
+    def test_branches(self) -> None:
+        p = program()
+        decisions = linear_decisions(
+            1, 'jr z, dispatchMatched', 'djnz dispatch')
+        trace = p.trace('dispatch', decisions)
+        self.assertEqual(
+            (7 + 6 + 7 + 6 + 6 + 13) + (7 + 6 + 12) + (7 + 10),
+            trace['cycles'])
+        self.assertEqual(['jumpDE'], trace['externals'])
+        with self.assertRaises(ValueError):
+            p.trace('dispatch', {})
+
+    def test_repeat(self) -> None:
+        trace = program().trace('copy', {'ldir': repeat_decisions(9)})
+        self.assertEqual(10 + 8 * 21 + 16 + 10, trace['cycles'])
+
+    def test_lookup_cost(self) -> None:
+        scenarios = [
+            linear_decisions(i, 'jr z, dispatchMatched', 'djnz dispatch')
+            for i in range(3)
+        ]
+        cost = lookup_cost(program(), 'dispatch', scenarios, 9)
+        self.assertEqual(9, cost['table_size'])
+        self.assertEqual(12, cost['code_size'])
+        self.assertEqual(cost['best'] + 2 * 45, cost['worst'])
+        self.assertEqual(cost['best'] + 45, cost['average'])
+
+    def test_pseudo(self) -> None:
+        p = Program()
+        p.read_text(
+            'data:\n'
+            '    .db "a,b", 0, 1\n'
+            '    .dw data, copy\n'
+            '    bcall(_PushRealO1)\n')
+        self.assertEqual(['"a,b"', '0', '1'], p.instructions[0]['operands'])
+        self.assertEqual(5, p.instructions[0]['size'])
+        self.assertEqual(4, p.instructions[1]['size'])
+        self.assertEqual(3, p.instructions[2]['size'])
+        self.assertEqual('PushRealO1', p.instructions[2]['target'])
+        self.assertEqual(1, p.label_lines['data'])
+        with self.assertRaises(ValueError):
+            p.trace('data', {})
+
+    def test_if(self) -> None:
+        p = Program()
+        p.read_text(
+            'start:\n'
+            '#if 0\n'
+            '    inc a\n'
+            '#endif\n'
+            '    ret\n')
+        self.assertEqual(['ret'], [i['text'] for i in p.instructions])
@@ -0,0 +1,572 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 Brian T. Park
+# MIT License.
+
+"""
+Static Z80 cycle and size cost model of the accessor routines of the generated
+tables, without an emulator.
+
+Usage:
+$ z80cost.py [-D SYMBOL] --label LABEL file.asm [file.asm ...]
+
+The assembly files are parsed into a list of instructions, honoring the
+'#ifdef', '#ifndef', '#if', '#else', '#endif' and '#define' directives of
+spasm-ng. The size and the T-states of each instruction are looked up in a
+per-opcode timing table. The data directives ('.db', '.dw') and the 'bcall()'
+macro have a size but no timing, so they cannot be traced. A routine is then
+traced from its label, following the jumps, calls and returns, until it
+returns to its caller or jumps outside of the parsed files (e.g. into a key
+handler).
+
+The outcome of each conditional branch is supplied by the caller as a list of
+decisions for each branch instruction, keyed by the normalized text of the
+instruction (e.g. 'jr z, dispatchHandlerMatched' or 'ret nc'). A repeating
+instruction like 'ldir' is treated as a branch back to itself. The
+compilemenu.py, compileunit.py and compilekeys.py scripts use a model of the
+lookup to generate the decisions of every entry of the table, then print the
+best, worst and average T-states of each table layout using the '--cost' flag.
+
+The command line version traces a single path through a routine which must
+not contain data-dependent branches (e.g. findMenuNodeIX). The cycles of the
+external routines called by the traced routine are not included, and their
+names are printed.
+"""
+
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import TextIO
+from typing import TypedDict
+
+import argparse
+import io
+import itertools
+import logging
+import re
+
+
+def main() -> None:
+    # Configure command line flags.
+    parser = argparse.ArgumentParser(
+        description='Print the static cost of a Z80 routine of the RPN83P'
+    )
+    parser.add_argument(
+        '--label', '-l',
+        help='Label of the routine',
+        required=True,
+    )
+    parser.add_argument(
+        '--define', '-D',
+        help='Symbol defined for #ifdef',
+        action='append',
+        default=[],
+    )
+    parser.add_argument(
+        'filenames',
+        help='Assembly files containing the routine and its callees',
+        nargs='+',
+    )
+    args = parser.parse_args()
+
+    # Configure logging. This should normally be executed after the
+    # parser.parse_args() because it allows us set the logging.level using a
+    # flag.
+    logging.basicConfig(level=logging.INFO)
+
+    program = Program(set(args.define))
+    for filename in args.filenames:
+        logging.info(f"Reading {filename}")
+        with open(filename, encoding="utf-8", errors="replace") as file:
+            program.read(file)
+
+    trace = program.trace(args.label, {})
+    size = sum(program.instructions[i]['size'] for i in trace['visited'])
+    print(f"{args.label}: {size} bytes, {trace['cycles']} T-states")
+    for external in trace['externals']:
+        print(f"  external: {external}")
+
+# -----------------------------------------------------------------------------
+
+
+class Timing(TypedDict):
+    size: int
+    cycles: int  # T-states when a conditional branch is not taken
+    taken: int  # T-states when a conditional branch is taken
+
+
+def _timing(size: int, cycles: int, taken: Optional[int] = None) -> Timing:
+    return {
+        'size': size,
+        'cycles': cycles,
+        'taken': cycles if taken is None else taken,
+    }
+
+
+def _build_timings() -> Dict[str, Timing]:
+    """Return the table of {form -> Timing}. The form of an instruction is its
+    mnemonic followed by the classified operands: 'r' for an 8-bit register,
+    'rr' for a 16-bit register pair, 'n' for an immediate value or address,
+    '(nn)' for an indirect address, '(ix+d)' for an indexed address, 'b' for
+    a bit number, and 'cc' for a condition."""
+    t: Dict[str, Timing] = {
+        'nop': _timing(1, 4),
+        'ld r,r': _timing(1, 4),
+        'ld r,n': _timing(2, 7),
+        'ld r,(hl)': _timing(1, 7),
+        'ld (hl),r': _timing(1, 7),
+        'ld (hl),n': _timing(2, 10),
+        'ld r,(ix+d)': _timing(3, 19),
+        'ld (ix+d),r': _timing(3, 19),
+        'ld (ix+d),n': _timing(4, 19),
+        'ld a,(bc)': _timing(1, 7),
+        'ld a,(de)': _timing(1, 7),
+        'ld (bc),a': _timing(1, 7),
+        'ld (de),a': _timing(1, 7),
+        'ld a,(nn)': _timing(3, 13),
+        'ld (nn),a': _timing(3, 13),
+        'ld rr,n': _timing(3, 10),
+        'ld ix,n': _timing(4, 14),
+        'ld hl,(nn)': _timing(3, 16),
+        'ld (nn),hl': _timing(3, 16),
+        'ld rr,(nn)': _timing(4, 20),
+        'ld (nn),rr': _timing(4, 20),
+        'ld ix,(nn)': _timing(4, 20),
+        'ld (nn),ix': _timing(4, 20),
+        'ld sp,hl': _timing(1, 6),
+        'ld sp,ix': _timing(2, 10),
+        'push rr': _timing(1, 11),
+        'push ix': _timing(2, 15),
+        'pop rr': _timing(1, 10),
+        'pop ix': _timing(2, 14),
+        'ex de,hl': _timing(1, 4),
+        "ex af,af'": _timing(1, 4),
+        'exx': _timing(1, 4),
+        'ex (sp),hl': _timing(1, 19),
+        'ex (sp),ix': _timing(2, 23),
+        'ldi': _timing(2, 16),
+        'ldd': _timing(2, 16),
+        'ldir': _timing(2, 16, 21),
+        'lddr': _timing(2, 16, 21),
+        'cpi': _timing(2, 16),
+        'cpir': _timing(2, 16, 21),
+        'inc r': _timing(1, 4),
+        'dec r': _timing(1, 4),
+        'inc (hl)': _timing(1, 11),
+        'dec (hl)': _timing(1, 11),
+        'inc (ix+d)': _timing(3, 23),
+        'dec (ix+d)': _timing(3, 23),
+        'inc rr': _timing(1, 6),
+        'dec rr': _timing(1, 6),
+        'inc ix': _timing(2, 10),
+        'dec ix': _timing(2, 10),
+        'add hl,rr': _timing(1, 11),
+        'adc hl,rr': _timing(2, 15),
+        'sbc hl,rr': _timing(2, 15),
+        'add ix,rr': _timing(2, 15),
+        'add ix,ix': _timing(2, 15),
+        'rlca': _timing(1, 4),
+        'rrca': _timing(1, 4),
+        'rla': _timing(1, 4),
+        'rra': _timing(1, 4),
+        'daa': _timing(1, 4),
+        'cpl': _timing(1, 4),
+        'scf': _timing(1, 4),
+        'ccf': _timing(1, 4),
+        'neg': _timing(2, 8),
+        'di': _timing(1, 4),
+        'ei': _timing(1, 4),
+        'jp n': _timing(3, 10),
+        'jp cc,n': _timing(3, 10, 10),
+        'jp (hl)': _timing(1, 4),
+        'jp (ix)': _timing(2, 8),
+        'jr n': _timing(2, 12),
+        'jr cc,n': _timing(2, 7, 12),
+        'djnz n': _timing(2, 8, 13),
+        'call n': _timing(3, 17),
+        'call cc,n': _timing(3, 10, 17),
+        'ret': _timing(1, 10),
+        'ret cc': _timing(1, 5, 11),
+        'rst n': _timing(1, 11),
+    }
+    # 8-bit arithmetic and logic. The 'a' operand is optional for the
+    # mnemonics which are normalized to the single operand form.
+    for m in ['sub', 'and', 'or', 'xor', 'cp']:
+        t[f'{m} r'] = _timing(1, 4)
+        t[f'{m} n'] = _timing(2, 7)
+        t[f'{m} (hl)'] = _timing(1, 7)
+        t[f'{m} (ix+d)'] = _timing(3, 19)
+    for m in ['add', 'adc', 'sbc']:
+        t[f'{m} a,r'] = _timing(1, 4)
+        t[f'{m} a,n'] = _timing(2, 7)
+        t[f'{m} a,(hl)'] = _timing(1, 7)
+        t[f'{m} a,(ix+d)'] = _timing(3, 19)
+    # Rotates and shifts.
+    for m in ['rlc', 'rrc', 'rl', 'rr', 'sla', 'sra', 'srl']:
+        t[f'{m} r'] = _timing(2, 8)
+        t[f'{m} (hl)'] = _timing(2, 15)
+        t[f'{m} (ix+d)'] = _timing(4, 23)
+    # Bit operations.
+    t['bit b,r'] = _timing(2, 8)
+    t['bit b,(hl)'] = _timing(2, 12)
+    t['bit b,(ix+d)'] = _timing(4, 20)
+    for m in ['set', 'res']:
+        t[f'{m} b,r'] = _timing(2, 8)
+        t[f'{m} b,(hl)'] = _timing(2, 15)
+        t[f'{m} b,(ix+d)'] = _timing(4, 23)
+    return t
+
+
+TIMINGS = _build_timings()
+
+REGISTERS_8 = {'a', 'b', 'c', 'd', 'e', 'h', 'l'}
+REGISTERS_16 = {'bc', 'de', 'hl', 'sp', 'af'}
+CONDITIONS = {'z', 'nz', 'c', 'nc', 'p', 'm', 'pe', 'po'}
+BRANCHES = {'jp', 'jr', 'call', 'ret', 'djnz'}
+SINGLE_OPERAND_ALU = {'sub', 'and', 'or', 'xor', 'cp'}
+
+
+def classify(
+    mnemonic: str, index: int, count: int, operand: str
+) -> List[str]:
+    """Return the possible forms of the operand at index (out of count
+    operands), from the most specific to the most generic."""
+    op = operand.lower().replace(' ', '')
+    if index == 0 and mnemonic in ('bit', 'set', 'res'):
+        return ['b']
+    if index == 0 and op in CONDITIONS and mnemonic in BRANCHES \
+            and (mnemonic == 'ret' or count == 2):
+        return ['cc']
+    if op in REGISTERS_8:
+        return [op, 'r']
+    if op in REGISTERS_16:
+        return [op, 'rr']
+    if op in ('ix', 'iy'):
+        return ['ix']
+    if op in ('(hl)', '(bc)', '(de)', '(sp)', '(c)'):
+        return [op]
+    if op.startswith('(ix') or op.startswith('(iy'):
+        return ['(ix+d)'] if op not in ('(ix)', '(iy)') else ['(ix)', '(ix+d)']
+    if op.startswith('(') and op.endswith(')'):
+        return ['(nn)']
+    if op == "af'":
+        return [op]
+    return ['n']
+
+
+# The operands of a data directive, which may be quoted strings containing
+# commas.
+DATA_PATTERN = re.compile(r'"[^"]*"|\'[^\']*\'|[^,]+')
+
+# The 'bcall(_Xxx)' macro of spasm-ng.
+BCALL_PATTERN = re.compile(r'^bcall\(\s*_([A-Za-z0-9_]+)\s*\)$')
+
+
+class Instruction(TypedDict, total=False):
+    text: str  # normalized text, used as the key of the decisions
+    mnemonic: str
+    operands: List[str]
+    form: str  # key into TIMINGS, empty if not an instruction
+    size: int
+    cycles: int
+    taken: int
+    target: str  # label of jumps, calls and bcall()
+    line: int  # line number in the source file, for error messages
+
+
+class Trace(TypedDict):
+    cycles: int
+    visited: Set[int]  # indexes of the instructions executed
+    externals: List[str]  # routines outside of the program
+
+
+class Program:
+    """The instructions of one or more assembly files, and their labels."""
+
+    LABEL_PATTERN = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*):(.*)$')
+    MAX_STEPS = 100000
+
+    def __init__(self, defines: Optional[Set[str]] = None):
+        self.defines: Set[str] = set() if defines is None else set(defines)
+        self.instructions: List[Instruction] = []
+        self.labels: Dict[str, int] = {}  # {label -> instruction index}
+        self.label_lines: Dict[str, int] = {}  # {label -> line number}
+
+    def read(self, input: TextIO) -> None:
+        # Stack of the active state of the enclosing #ifdef blocks.
+        active: List[bool] = []
+        for line_number, line in enumerate(input, start=1):
+            line = line.split(';', 1)[0].rstrip()
+            stripped = line.strip()
+            if stripped.startswith('#'):
+                self.process_directive(stripped, active)
+                continue
+            if not all(active):
+                continue
+            match = self.LABEL_PATTERN.match(line)
+            if match:
+                self.labels[match.group(1)] = len(self.instructions)
+                self.label_lines[match.group(1)] = line_number
+                line = match.group(2)
+                stripped = line.strip()
+            if not stripped or not line[0].isspace():
+                # Empty line, or a 'name equ value' statement.
+                continue
+            self.instructions.append(self.parse(stripped, line_number))
+
+    def read_text(self, text: str) -> None:
+        self.read(io.StringIO(text))
+
+    def process_directive(self, line: str, active: List[bool]) -> None:
+        words = line.split()
+        directive = words[0]
+        if directive == '#ifdef':
+            active.append(words[1] in self.defines)
+        elif directive == '#ifndef':
+            active.append(words[1] not in self.defines)
+        elif directive == '#if':
+            # Only '#if 0' and '#if 1' are used to comment out code.
+            expression = ' '.join(words[1:])
+            active.append(
+                expression != '0' if expression.isdigit()
+                else expression in self.defines)
+        elif directive == '#else':
+            active[-1] = not active[-1]
+        elif directive == '#endif':
+            active.pop()
+        elif directive == '#define' and all(active):
+            self.defines.add(words[1])
+
+    @staticmethod
+    def parse(text: str, line_number: int) -> Instruction:
+        words = text.split(None, 1)
+        mnemonic = words[0].lower()
+        if mnemonic.startswith('.') or mnemonic.startswith('bcall('):
+            return Program.parse_pseudo(words, line_number)
+        operands = []
+        if len(words) > 1:
+            operands = [op.strip() for op in words[1].split(',')]
+        # Normalize 'cp a, (hl)' to 'cp (hl)'.
+        if mnemonic in SINGLE_OPERAND_ALU and len(operands) == 2 \
+                and operands[0].lower() == 'a':
+            operands = operands[1:]
+        instruction: Instruction = {
+            'text': ' '.join([mnemonic, ', '.join(operands)]).strip(),
+            'mnemonic': mnemonic,
+            'operands': operands,
+            'form': '',
+            'size': 0,
+            'cycles': 0,
+            'taken': 0,
+            'line': line_number,
+        }
+        alternatives = [
+            classify(mnemonic, i, len(operands), op)
+            for i, op in enumerate(operands)
+        ]
+        for forms in itertools.product(*alternatives):
+            form = ' '.join([mnemonic, ','.join(forms)]).strip()
+            timing = TIMINGS.get(form)
+            if timing is not None:
+                instruction['form'] = form
+                instruction['size'] = timing['size']
+                instruction['cycles'] = timing['cycles']
+                instruction['taken'] = timing['taken']
+                break
+        if mnemonic in BRANCHES and operands \
+                and alternatives[-1] == ['n']:
+            instruction['target'] = operands[-1]
+        return instruction
+
+    @staticmethod
+    def parse_pseudo(words: List[str], line_number: int) -> Instruction:
+        """Parse a data directive ('.db', '.dw') or the 'bcall(_Xxx)' macro.
+        They have a size but no timing, so they cannot be traced. The target
+        of a bcall() is the label of the routine, without the '_' prefix."""
+        mnemonic = words[0].lower()
+        operands: List[str] = []
+        if len(words) > 1:
+            operands = [
+                op.strip() for op in DATA_PATTERN.findall(words[1])
+                if op.strip()]
+        size = 0
+        if mnemonic in ('.db', '.byte'):
+            for op in operands:
+                if op[0] in ('"', "'") and len(op) >= 2:
+                    size += len(op) - 2
+                else:
+                    size += 1
+        elif mnemonic in ('.dw', '.word'):
+            size = 2 * len(operands)
+        instruction: Instruction = {
+            'text': ' '.join([mnemonic, ', '.join(operands)]).strip(),
+            'mnemonic': mnemonic,
+            'operands': operands,
+            'form': '',
+            'size': size,
+            'cycles': 0,
+            'taken': 0,
+            'line': line_number,
+        }
+        match = BCALL_PATTERN.match(words[0])
+        if match:
+            instruction['size'] = 3  # rst 28h; .dw _Xxx
+            instruction['target'] = match.group(1)
+        return instruction
+
+    def trace(self, label: str, decisions: Dict[str, List[bool]]) -> Trace:
+        """Trace the routine at label, using the decisions for the conditional
+        branches. Throws ValueError if a decision is missing, or if the trace
+        reaches something which is not a known instruction."""
+        if label not in self.labels:
+            raise ValueError(f"Unknown label '{label}'")
+        used: Dict[str, int] = {}
+        trace: Trace = {'cycles': 0, 'visited': set(), 'externals': []}
+        stack: List[int] = []
+        pc = self.labels[label]
+        for _ in range(self.MAX_STEPS):
+            if pc >= len(self.instructions):
+                raise ValueError(f"Trace of '{label}' ran off the end")
+            instruction = self.instructions[pc]
+            if not instruction['form']:
+                raise ValueError(
+                    f"Unknown instruction '{instruction['text']}' "
+                    f"at line {instruction['line']}")
+            trace['visited'].add(pc)
+            form = instruction['form']
+            mnemonic = instruction['mnemonic']
+            conditional = 'cc' in form.split(' ', 1)[-1].split(',') \
+                or mnemonic in ('djnz', 'ldir', 'lddr', 'cpir')
+            taken = True
+            if conditional:
+                taken = self.decide(instruction['text'], decisions, used)
+            trace['cycles'] += (
+                instruction['taken'] if taken else instruction['cycles'])
+            if not taken:
+                pc += 1
+                continue
+
+            target = instruction.get('target')
+            if mnemonic in ('ldir', 'lddr', 'cpir'):
+                continue  # repeat the same instruction
+            if mnemonic in ('jp', 'jr', 'djnz'):
+                if target is None:
+                    return trace  # indirect jump, e.g. 'jp (hl)'
+                if target not in self.labels:
+                    trace['externals'].append(target)
+                    if stack:
+                        pc = stack.pop()
+                        continue
+                    return trace
+                pc = self.labels[target]
+            elif mnemonic == 'call' and target is not None:
+                if target not in self.labels:
+                    trace['externals'].append(target)
+                    pc += 1
+                else:
+                    stack.append(pc + 1)
+                    pc = self.labels[target]
+            elif mnemonic == 'ret':
+                if not stack:
+                    return trace
+                pc = stack.pop()
+            else:
+                pc += 1
+        raise ValueError(f"Trace of '{label}' did not terminate")
+
+    @staticmethod
+    def decide(
+        text: str,
+        decisions: Dict[str, List[bool]],
+        used: Dict[str, int],
+    ) -> bool:
+        outcomes = decisions.get(text)
+        if outcomes is None:
+            raise ValueError(f"No decision for '{text}'")
+        index = used.get(text, 0)
+        if index >= len(outcomes):
+            raise ValueError(f"Not enough decisions for '{text}'")
+        used[text] = index + 1
+        return outcomes[index]
+
+# -----------------------------------------------------------------------------
+
+
+class Cost(TypedDict):
+    table_size: int  # bytes of the data table
+    code_size: int  # bytes of the instructions executed by any lookup
+    best: int  # T-states
+    worst: int
+    average: float
+
+
+def lookup_cost(
+    program: Program,
+    label: str,
+    scenarios: Iterable[Dict[str, List[bool]]],
+    table_size: int,
+) -> Cost:
+    """Trace the lookup routine at label once for each scenario of the branch
+    decisions, each scenario being equally likely."""
+    cycles: List[int] = []
+    visited: Set[int] = set()
+    for decisions in scenarios:
+        trace = program.trace(label, decisions)
+        cycles.append(trace['cycles'])
+        visited |= trace['visited']
+    if not cycles:
+        raise ValueError(f"No scenarios for '{label}'")
+    return {
+        'table_size': table_size,
+        'code_size': sum(program.instructions[i]['size'] for i in visited),
+        'best': min(cycles),
+        'worst': max(cycles),
+        'average': sum(cycles) / len(cycles),
+    }
+
+
+def format_cost(name: str, cost: Cost) -> str:
+    return (
+        f"{name}: table {cost['table_size']} bytes, "
+        f"code {cost['code_size']} bytes, "
+        f"T-states best {cost['best']}, worst {cost['worst']}, "
+        f"avg {cost['average']:.1f}"
+    )
+
+
+def read_program(
+    filenames: List[str],
+    defines: Optional[Set[str]] = None,
+    texts: Optional[List[str]] = None,
+) -> Program:
+    """Create a Program from the assembly files and the generated texts."""
+    program = Program(defines)
+    for filename in filenames:
+        with open(filename, encoding="utf-8", errors="replace") as file:
+            program.read(file)
+    for text in texts or []:
+        program.read_text(text)
+    return program
+
+
+def linear_decisions(
+    position: int, match_branch: str, loop_branch: str
+) -> Dict[str, List[bool]]:
+    """Decisions of a linear scan which matches the entry at the 0-based
+    position, using 'match_branch' to exit on a match and 'loop_branch' to
+    continue with the next entry."""
+    return {
+        match_branch: [False] * position + [True],
+        loop_branch: [True] * position,
+    }
+
+
+def repeat_decisions(count: int) -> List[bool]:
+    """Decisions of a repeating instruction like 'ldir' for count bytes."""
+    return [True] * (count - 1) + [False]
+
+
+if __name__ == '__main__':
+    main()